@@ -1,8 +1,5 @@
 from flask import Flask, request, jsonify, render_template, redirect, session, url_for
 from flask_cors import CORS
-from app.infrastructure.auth.cafe24_oauth import Cafe24OAuth
-from app.infrastructure.external.cafe24.cafe24_reviews import Cafe24ReviewAPI
-from app.infrastructure.external.openai.review_analyzer import ReviewAnalyzer
 from app.shared.utils.notification import NotificationManager
 from app.api.v1.auth import auth_bp
 from app.api.v1.webhook import webhook_bp
@@ -12,19 +9,26 @@ from app.api.v1.monitoring import monitoring_bp
 from app.api.v1.notifications import notifications_bp
 from app.api.v1.config import config_bp
 from app.api.v1.main import main_bp
+from app.api.v1.metrics import metrics_bp
+from app.api.v1.debug import debug_bp
+from app.api.v1.health import health_bp
 from app.core.services.review_service import ReviewService
 from app.core.services.webhook_service import WebhookService
 from app.core.services.alert_service import AlertService
 from app.core.services.cafe24_service import Cafe24Service
 from app.core.services.oauth_service import OAuthService
+from app.shared.utils.logger import setup_logging
+from app.shared.utils.startup import startup_tracker
+from app.shared.utils.lazy_import import preload
+from app.shared.utils.warm_state import WarmStateStore
+from app.shared.utils.admission import admission_controller
+from app.infrastructure.external.cafe24.cafe24_reviews import export_review_boards, restore_review_boards
 from app.shared.utils.auth_utils import verify_credentials as auth_verify_credentials, verify_webhook_event_key as auth_verify_webhook_event_key
 import warnings
 import threading
 import time
 import json
 import os
-import requests
-import numpy as np
 from datetime import datetime
 from urllib.parse import parse_qs, urlparse
 from functools import wraps
@@ -33,6 +37,9 @@ from functools import wraps
 from config.settings import settings
 warnings.filterwarnings('ignore')
 
+# 구조화 로깅 (출력은 요청 스레드가 아닌 리스너 스레드에서 수행)
+setup_logging()
+
 app = Flask(__name__)
 CORS(app)
 
@@ -48,6 +55,9 @@ app.register_blueprint(reviews_bp)
 app.register_blueprint(monitoring_bp)
 app.register_blueprint(notifications_bp)
 app.register_blueprint(config_bp)
+app.register_blueprint(metrics_bp)
+app.register_blueprint(debug_bp)
+app.register_blueprint(health_bp)
 
 # 설정 및 관리자 초기화
 notification_manager = NotificationManager()
@@ -61,6 +71,13 @@ oauth_service = OAuthService()
 oauth_client = None
 review_api = None
 
+# Blueprint(webhook 등)가 공유하는 전역 객체 (웹훅에서 지연 초기화한 Review API도 여기에 저장됨)
+app_globals = {'oauth_client': None, 'review_api': None}
+
+def get_review_api():
+    """현재 사용할 Review API (직접 초기화 또는 웹훅 지연 초기화)"""
+    return review_api or app_globals.get('review_api')
+
 # ReviewService 관련 함수들을 전역 함수로 위임 (기존 코드 호환성 유지)
 def load_model():
     return review_service.load_model()
@@ -77,14 +94,17 @@ def load_review_cache():
 def save_review_cache():
     return review_service.save_review_cache()
 
+def load_search_index():
+    return review_service.load_search_index()
+
 def initialize_review_cache():
-    return review_service.initialize_review_cache(review_api)
+    return review_service.initialize_review_cache(get_review_api())
 
-def find_new_reviews():
-    return review_service.find_new_reviews(review_api)
+def find_new_reviews(backlog=0):
+    return review_service.find_new_reviews(get_review_api(), backlog)
 
-def analyze_review(review_text, rating=None):
-    return review_service.analyze_review(review_text, rating)
+def analyze_review(review_text, rating=None, **options):
+    return review_service.analyze_review(review_text, rating, **options)
 
 def send_notification(new_reviews, negative_reviews):
     return review_service.send_notification(new_reviews, negative_reviews)
@@ -92,11 +112,18 @@ def send_notification(new_reviews, negative_reviews):
 def send_negative_review_alert(content, analysis_result):
     return alert_service.send_negative_review_alert(content, analysis_result)
 
+def handle_refined_review(refined_review, content=None):
+    return alert_service.handle_refined_review(refined_review, review_service.ingest_reviews if content is None else None,
+                                               settings.notification_method, content)
+
 def trigger_review_collection():
-    return alert_service.trigger_review_collection(review_api, find_new_reviews, analyze_reviews_batch, settings)
+    return alert_service.trigger_review_collection(get_review_api(), find_new_reviews, analyze_reviews_batch, settings, review_service.ingest_reviews,
+                                                   review_service.triage_reviews)
 
 def enrich_reviews_with_product_names(reviews):
-    return cafe24_service.enrich_reviews_with_product_names(reviews, review_api)
+    # 저하 모드에서는 캐시에 없는 상품명 조회를 백그라운드로 미룸
+    return cafe24_service.enrich_reviews_with_product_names(reviews, get_review_api(),
+                                                            defer_missing=admission_controller.degraded)
 
 def extract_content_from_webhook(webhook_data):
     return webhook_service.extract_content_from_webhook(webhook_data)
@@ -104,6 +131,7 @@ def extract_content_from_webhook(webhook_data):
 def init_cafe24_client():
     global review_api
     review_api = cafe24_service.init_cafe24_client(oauth_client)
+    app_globals['review_api'] = review_api
     return review_api
 
 def process_cafe24_webhook(webhook_data):
@@ -127,6 +155,7 @@ WEBHOOK_ENABLED = True
 def get_or_create_oauth_client():
     global oauth_client
     oauth_client = oauth_service.get_or_create_oauth_client()
+    app_globals['oauth_client'] = oauth_client
     return oauth_client
 
 init_oauth_client = get_or_create_oauth_client
@@ -143,15 +172,53 @@ verify_webhook_event_key = lambda event_key: auth_verify_webhook_event_key(event
 # 리뷰 캐시 참조
 cached_reviews = review_service.cached_reviews
 
+# 콜드 스타트 워밍업 (포트를 연 뒤 백그라운드에서 작업별로 동시에 실행, 모두 끝나면 /readyz가 200)
+def warm_up_cafe24():
+    """리뷰 캐시/이미 수집한 리뷰/검색 인덱스 로드 → 토큰 읽기 + Review API 초기화(리뷰 게시판 목록 캐시) → 캐시가 비어 있으면 최신 리뷰로 초기화"""
+    load_review_cache()
+    load_known_reviews()
+    load_search_index()
+    init_oauth_client()
+    if init_cafe24_client() is None:
+        raise RuntimeError("카페24 Review API를 초기화하지 못했습니다 (토큰 없음)")
+    if not review_service.cached_reviews:
+        initialize_review_cache()
+
+WARMUP_TASKS = (
+    ('imports', lambda: preload('requests')),
+    ('model', load_model),
+    ('cafe24', warm_up_cafe24),
+)
+
+def start_warmup():
+    """백그라운드 워밍업 + 웜 스테이트 주기 저장 시작 (프로세스당 한 번, WARMUP_ENABLED=false면 작업 없이 바로 준비 완료)"""
+    if settings.warm_state_enabled:
+        warm_state_store.start()
+    return startup_tracker.start_warmup(WARMUP_TASKS if settings.warmup_enabled else ())
+
+# 웜 스테이트 스냅샷 (부팅 시 요청을 받기 전에 복원 → 워밍업의 카페24 호출 생략, 이후 주기적으로 저장)
+warm_state_store = WarmStateStore(settings.warm_state_path,
+                                  settings.warm_state_interval_seconds,
+                                  settings.warm_state_max_age_seconds)
+warm_state_store.register('review_boards', export_review_boards, lambda boards, age: restore_review_boards(boards))
+warm_state_store.register('product_names', cafe24_service.export_product_names,
+                          lambda entries, age: cafe24_service.restore_product_names(entries))
+warm_state_store.register('reviews', review_service.export_warm_state, review_service.restore_warm_state)
+
+if settings.warm_state_enabled:
+    warm_state_store.restore()
+
 
 
 # Blueprint에서 필요한 것들만 app.config에 등록
 app.config.update({
+    'app_globals': app_globals,
     'oauth_client': oauth_client,
     'review_api': review_api,
     'trigger_review_collection': trigger_review_collection,
     'analyze_review': analyze_review,
     'send_negative_review_alert': send_negative_review_alert,
+    'handle_refined_review': handle_refined_review,
     'initialize_review_cache': initialize_review_cache,
     'cached_reviews': cached_reviews,
     'analyze_reviews_batch': analyze_reviews_batch,
@@ -163,14 +230,18 @@ app.config.update({
     'alert_service': alert_service,
     'cafe24_service': cafe24_service,
     'notification_manager': notification_manager,
-    'monitoring_active': monitoring_active
+    'monitoring_active': monitoring_active,
+    'start_warmup': start_warmup,
+    'warm_state_store': warm_state_store
 })
 
+startup_tracker.mark_app_loaded()
+
 if __name__ == '__main__':
     print("서버 시작 중...")
     
-    # 메모리 절약을 위해 모델을 즉시 로드하지 않음 (lazy loading)
-    print("감정 분석 모델은 첫 번째 요청 시 로드됩니다.")
+    # 모델/토큰/게시판 목록/리뷰 캐시는 서버 시작 후 백그라운드에서 워밍업
+    print("감정 분석 모델은 서버 시작 후 백그라운드에서 로드됩니다 (/readyz로 확인).")
     
     # 설정 상태 출력 및 검증
     print("=== 설정 상태 ===")
@@ -209,31 +280,15 @@ if __name__ == '__main__':
     print(f"서비스 키: {'설정됨' if settings.SERVICE_KEY else '미설정'}")
     
     
-    # 카페24 OAuth 클라이언트 초기화
-    init_oauth_client()
-    
-    # 카페24 Review API 클라이언트 초기화
-    init_cafe24_client()
-    
-    # 리뷰 캐시 시스템 초기화
-    print("=== 리뷰 캐시 시스템 초기화 ===")
-    load_review_cache()
-    
-    # Review API가 있으면 캐시 초기화 또는 업데이트
-    if review_api:
-        if not cached_reviews:
-            print("캐시가 비어있어서 초기화를 시도합니다...")
-            initialize_review_cache()
-        else:
-            print(f"기존 캐시 {len(cached_reviews)}개를 사용합니다.")
+    # OAuth/Review API/리뷰 캐시/모델 초기화 (백그라운드)
+    start_warmup()
     print()
 
-    # 프로덕션에서는 Gunicorn이 앱을 실행하므로 app.run() 제거
-    # 개발환경에서만 직접 실행
-    if settings.debug and __name__ == '__main__':
-        port = int(os.environ.get('PORT', settings.port))
-        app.run(
-            debug=True, 
-            port=port,
-            host=settings.host
-        )
\ No newline at end of file
+    # 프로덕션에서는 Gunicorn이 앱을 실행 (gunicorn.conf.py 참고)
+    # 직접 실행하면 워밍업을 기다리지 않고 바로 개발 서버로 요청을 받음 (준비 상태는 /readyz)
+    port = int(os.environ.get('PORT', settings.port))
+    app.run(
+        debug=settings.debug, 
+        port=port,
+        host=settings.host
+    )
\ No newline at end of file
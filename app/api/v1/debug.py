@@ -0,0 +1,119 @@
+from flask import Blueprint, request, jsonify, current_app
+from app.shared.middlewares.auth import login_required
+from app.shared.utils.timing import timing_store
+from app.shared.utils.logger import logging_stats
+from app.shared.utils.circuit_breaker import circuit_breakers
+
+debug_bp = Blueprint('debug', __name__, url_prefix='/debug')
+
+@debug_bp.route('/slow')
+@login_required
+def slow_operations():
+    """최근 작업 중 가장 느린 작업과 단계별 소요시간 조회"""
+    try:
+        limit = min(request.args.get('limit', 20, type=int), 200)
+        operation = request.args.get('operation')
+        min_ms = request.args.get('min_ms', 0.0, type=float)
+        
+        return jsonify({
+            'slowest': timing_store.slowest(limit=limit, operation=operation, min_ms=min_ms),
+            'operations': timing_store.operation_stats(),
+            'stored': len(timing_store),
+            'capacity_per_operation': timing_store.capacity
+        })
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@debug_bp.route('/logging')
+@login_required
+def logging_status():
+    """로깅 큐 적재량, 버린 로그 수, 샘플링 키별 발생 건수 조회"""
+    try:
+        return jsonify(logging_stats())
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@debug_bp.route('/warm-state')
+@login_required
+def warm_state_status():
+    """웜 스테이트 스냅샷 경로, 마지막 저장 시각, 부팅 시 복원 결과 조회"""
+    try:
+        warm_state_store = current_app.config.get('warm_state_store')
+        if warm_state_store is None:
+            return jsonify({'error': '웜 스테이트 저장소가 초기화되지 않았습니다'}), 503
+        return jsonify(warm_state_store.status())
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@debug_bp.route('/inference-pool')
+@login_required
+def inference_pool_status():
+    """pkl 추론 프로세스 풀 설정과 처리한 배치 수 조회 (모델 로드 전이거나 사용하지 않으면 enabled=false)"""
+    try:
+        review_service = current_app.config.get('review_service')
+        analyzer = getattr(review_service, 'review_analyzer', None)
+        pool = getattr(analyzer, 'inference_pool', None)
+        if pool is None:
+            return jsonify({'enabled': False, 'model_loaded': analyzer is not None})
+        return jsonify(pool.status())
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@debug_bp.route('/pkl-cache')
+@login_required
+def pkl_cache_status():
+    """pkl 예측 메모 크기, 적중률, 모델 버전 조회 (모델 로드 전이면 model_loaded=false)"""
+    try:
+        review_service = current_app.config.get('review_service')
+        analyzer = getattr(review_service, 'review_analyzer', None)
+        cache = getattr(analyzer, 'prediction_cache', None)
+        if cache is None:
+            return jsonify({'model_loaded': analyzer is not None})
+        return jsonify(cache.status())
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@debug_bp.route('/gpt-routing')
+@login_required
+def gpt_routing_status():
+    """GPT 2차 분석 라우팅 정책, 시간당 예산 사용량, 지연시간 SLO 상태 조회 (모델 로드 전이면 model_loaded=false)"""
+    try:
+        review_service = current_app.config.get('review_service')
+        analyzer = getattr(review_service, 'review_analyzer', None)
+        policy = getattr(analyzer, 'routing_policy', None)
+        if policy is None:
+            return jsonify({'model_loaded': analyzer is not None})
+        return jsonify(policy.status())
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@debug_bp.route('/near-duplicates')
+@login_required
+def near_duplicate_status():
+    """유사 중복 리뷰 클러스터 수, 매칭/결과 재사용 횟수, 최근 리뷰가 몰린 클러스터(리뷰 스팸 의심) 조회"""
+    try:
+        review_service = current_app.config.get('review_service')
+        analyzer = getattr(review_service, 'review_analyzer', None)
+        index = getattr(analyzer, 'near_duplicates', None)
+        if index is None:
+            return jsonify({'model_loaded': analyzer is not None, 'enabled': False})
+        return jsonify(index.status())
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@debug_bp.route('/circuit-breakers')
+@login_required
+def circuit_breaker_status():
+    """외부 의존성(OpenAI, 카페24, 채널톡, 카카오톡)별 회로 상태와 최근 호출 실패/느린 호출 수 조회"""
+    try:
+        return jsonify(circuit_breakers.status())
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
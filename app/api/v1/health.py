@@ -0,0 +1,20 @@
+from flask import Blueprint, jsonify, current_app
+from app.shared.utils.startup import startup_tracker
+
+health_bp = Blueprint('health', __name__)
+
+@health_bp.route('/healthz')
+def healthz():
+    """생존 확인 (템플릿 렌더링/외부 호출 없음)"""
+    return jsonify({'status': 'ok'})
+
+@health_bp.route('/readyz')
+def readyz():
+    """준비 확인 - 워밍업(모델/토큰/게시판 목록/리뷰 캐시)이 끝나기 전에는 503"""
+    # gunicorn 훅 없이 실행된 경우 첫 프로브에서 워밍업 시작 (이미 시작했으면 무시)
+    start_warmup = current_app.config.get('start_warmup')
+    if start_warmup:
+        start_warmup()
+
+    status = startup_tracker.status()
+    return jsonify(status), 200 if status['ready'] else 503
@@ -0,0 +1,15 @@
+from flask import Blueprint, Response, jsonify
+from app.shared.utils.metrics import metrics
+from config.settings import settings
+
+metrics_bp = Blueprint('metrics', __name__)
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+@metrics_bp.route('/metrics')
+def prometheus_metrics():
+    """Prometheus 스크랩용 메트릭 (텍스트 포맷)"""
+    if not settings.metrics_enabled:
+        return jsonify({'error': '메트릭이 비활성화되었습니다.'}), 404
+    
+    return Response(metrics.render(), content_type=PROMETHEUS_CONTENT_TYPE)
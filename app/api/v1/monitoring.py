@@ -1,5 +1,6 @@
 from flask import Blueprint, request, jsonify
 from app.shared.middlewares.auth import login_required
+from app.shared.utils.detection_lag import detection_lag_tracker
 from config.settings import settings
 
 monitoring_bp = Blueprint('monitoring', __name__)
@@ -100,10 +101,28 @@ def monitoring_status():
             'active': monitoring_active,
             'type': 'webhook_based',
             'known_reviews_count': len(review_service.known_reviews) if review_service else 0,
+            'known_reviews': review_service.known_reviews.get_status() if review_service else None,
             'cached_reviews_count': len(review_service.cached_reviews) if review_service else 0,
             'webhook_enabled': True,
             'webhook_event_key_configured': bool(settings.WEBHOOK_EVENT_KEY)
         })
         
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
\ No newline at end of file
+        return jsonify({'error': str(e)}), 500
+
+@monitoring_bp.route('/api/detection-lag')
+@login_required
+def detection_lag():
+    """리뷰 작성 → 웹훅 수신 → 분석 완료 → 채널별 알림 전송까지의 지연 (최근 구간별 백분위수, 초 단위)"""
+    try:
+        limit = min(request.args.get('limit', 20, type=int), 200)
+        negative_only = request.args.get('negative_only', 'true').lower() == 'true'
+        
+        return jsonify({
+            'stages': detection_lag_tracker.percentiles(),
+            'recent_reviews': detection_lag_tracker.recent(limit=limit, negative_only=negative_only),
+            'window': detection_lag_tracker.window
+        })
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
@@ -1,5 +1,7 @@
 from flask import Blueprint, request, jsonify
 from app.shared.middlewares.auth import login_required, full_auth_required
+from app.shared.utils.timing import trace_operation, stage
+from config.settings import settings
 
 reviews_bp = Blueprint('reviews', __name__, url_prefix='/api')
 
@@ -8,6 +10,16 @@ def get_app_globals():
     from flask import current_app
     return current_app.config.get('app_globals', {})
 
+def timing_debug_requested():
+    """응답에 단계별 소요시간을 포함할지 여부 (TIMING_DEBUG 또는 ?debug=timing)"""
+    return settings.timing_debug or request.args.get('debug') == 'timing'
+
+def strip_timings(reviews):
+    """디버그 모드가 아니면 리뷰별 분석 소요시간(timings) 제거"""
+    if timing_debug_requested():
+        return reviews
+    return [{key: value for key, value in review.items() if key != 'timings'} for review in reviews]
+
 # ===== 카페24 API 리뷰 관련 엔드포인트 =====
 
 @reviews_bp.route('/reviews/latest')
@@ -25,35 +37,119 @@ def get_latest_reviews():
         days = request.args.get('days', 7, type=int)
         limit = request.args.get('limit', 50, type=int)
         
-        reviews = review_api.get_latest_reviews(days=days, limit=limit)
+        with trace_operation('api_reviews_latest', days=days, limit=limit) as trace:
+            response = _build_latest_reviews_response(review_api, days, limit)
         
-        # 감정 분석 수행 - app.py 함수들 사용
+        if timing_debug_requested():
+            response['timing'] = trace.summary()
+        return jsonify(response)
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+def _build_latest_reviews_response(review_api, days, limit):
+    """최신 리뷰 조회 → 감정 분석 → 상품명 추가 → 통계 (단계별 소요시간 기록)"""
+    from flask import current_app
+    
+    with stage('cafe24_fetch'):
+        reviews = review_api.get_latest_reviews(days=days, limit=limit)
+    
+    # 감정 분석 수행 - app.py 함수들 사용
+    analyze_reviews_batch = current_app.config.get('analyze_reviews_batch')
+    enrich_reviews_with_product_names = current_app.config.get('enrich_reviews_with_product_names')
+    get_review_statistics = current_app.config.get('get_review_statistics')
+    get_negative_reviews = current_app.config.get('get_negative_reviews')
+    
+    if not reviews:
+        return {
+            'reviews': [],
+            'statistics': get_review_statistics([]) if get_review_statistics else {},
+            'negative_reviews': [],
+            'count': 0
+        }
+    
+    with stage('analysis'):
+        analyzed_reviews = analyze_reviews_batch(reviews) if analyze_reviews_batch else reviews
+    # 상품명 추가
+    with stage('enrich'):
+        enriched_reviews = enrich_reviews_with_product_names(analyzed_reviews) if enrich_reviews_with_product_names else analyzed_reviews
+    with stage('statistics'):
+        statistics = get_review_statistics(enriched_reviews) if get_review_statistics else {}
+        negative_reviews = get_negative_reviews(enriched_reviews) if get_negative_reviews else []
+    
+    # 조회한 리뷰는 로컬 검색 인덱스에도 반영
+    review_service = current_app.config.get('review_service')
+    if review_service:
+        with stage('index'):
+            review_service.index_reviews(enriched_reviews)
+    
+    return {
+        'reviews': strip_timings(enriched_reviews),
+        'statistics': statistics,
+        'negative_reviews': strip_timings(negative_reviews[:10]),  # 상위 10개
+        'count': len(enriched_reviews)
+    }
+
+@reviews_bp.route('/reviews/search')
+@login_required
+def search_reviews():
+    """로컬 인덱스 기반 리뷰 키워드 검색 (카페24 API 호출 없음)"""
+    try:
         from flask import current_app
-        analyze_reviews_batch = current_app.config.get('analyze_reviews_batch')
-        enrich_reviews_with_product_names = current_app.config.get('enrich_reviews_with_product_names')
+        import time
+        
+        review_service = current_app.config.get('review_service')
         get_review_statistics = current_app.config.get('get_review_statistics')
         get_negative_reviews = current_app.config.get('get_negative_reviews')
         
-        if reviews:
-            analyzed_reviews = analyze_reviews_batch(reviews) if analyze_reviews_batch else reviews
-            # 상품명 추가
-            enriched_reviews = enrich_reviews_with_product_names(analyzed_reviews) if enrich_reviews_with_product_names else analyzed_reviews
-            statistics = get_review_statistics(enriched_reviews) if get_review_statistics else {}
-            negative_reviews = get_negative_reviews(enriched_reviews) if get_negative_reviews else []
-            
-            return jsonify({
-                'reviews': enriched_reviews,
-                'statistics': statistics,
-                'negative_reviews': negative_reviews[:10],  # 상위 10개
-                'count': len(enriched_reviews)
-            })
-        else:
-            return jsonify({
-                'reviews': [],
-                'statistics': get_review_statistics([]) if get_review_statistics else {},
-                'negative_reviews': [],
-                'count': 0
-            })
+        keyword = request.args.get('keyword', '').strip()
+        limit = request.args.get('limit', 50, type=int)
+        
+        started_at = time.perf_counter()
+        reviews = review_service.search_reviews(
+            keyword,
+            limit=limit,
+            sentiment=request.args.get('sentiment'),
+            rating=request.args.get('rating', type=int),
+            min_rating=request.args.get('min_rating', type=int),
+            max_rating=request.args.get('max_rating', type=int),
+            product_no=request.args.get('product_no'),
+            start_date=request.args.get('start_date'),
+            end_date=request.args.get('end_date')
+        )
+        took_ms = round((time.perf_counter() - started_at) * 1000, 3)
+        
+        return jsonify({
+            'reviews': reviews,
+            'statistics': get_review_statistics(reviews) if get_review_statistics else {},
+            'negative_reviews': (get_negative_reviews(reviews) if get_negative_reviews else [])[:10],
+            'count': len(reviews),
+            'keyword': keyword,
+            'took_ms': took_ms,
+            'index': review_service.search_index.get_status()
+        })
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@reviews_bp.route('/reviews/backfill', methods=['POST'])
+@full_auth_required
+def backfill_reviews():
+    """최근 N일 리뷰 전체를 일괄 분석해 부정 키워드/검색 인덱스에 반영 (pkl 추론은 프로세스 풀 사용)"""
+    try:
+        from flask import current_app
+        review_service = current_app.config.get('review_service')
+        review_api = get_app_globals().get('review_api')
+        
+        days = request.args.get('days', 30, type=int)
+        limit = request.args.get('limit', settings.review_backfill_max_reviews, type=int)
+        
+        with trace_operation('api_reviews_backfill', days=days, limit=limit) as trace:
+            summary = review_service.backfill_reviews(review_api, days=days, max_reviews=limit)
+        
+        if timing_debug_requested():
+            summary['timing'] = trace.summary()
+        return jsonify(summary)
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -76,4 +172,28 @@ def get_products():
         })
         
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
\ No newline at end of file
+        return jsonify({'error': str(e)}), 500
+
+@reviews_bp.route('/reviews/keywords')
+@login_required
+def get_negative_keywords():
+    """상품별 상위 부정 키워드 조회 (증분 추적기 기반)"""
+    try:
+        from flask import current_app
+        review_service = current_app.config.get('review_service')
+        
+        product_no = request.args.get('product_no')
+        window_hours = request.args.get('window_hours', type=float)
+        limit = request.args.get('limit', 10, type=int)
+        
+        keywords = review_service.get_negative_keywords(product_no=product_no, window_hours=window_hours, top_n=limit)
+        
+        return jsonify({
+            'keywords': keywords,
+            'product_no': product_no,
+            'window_hours': window_hours,
+            'tracker': review_service.keyword_tracker.get_status()
+        })
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
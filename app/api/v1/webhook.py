@@ -1,12 +1,25 @@
 from flask import Blueprint, request, jsonify, url_for, session
 from datetime import datetime
 from app.shared.utils.notification import notification_manager
+from app.shared.utils.webhook_trace import webhook_trace_recorder, detect_webhook_source
+from app.shared.utils.metrics import WEBHOOK_IN_FLIGHT, WEBHOOK_REQUEST_SECONDS
+from app.shared.utils.detection_lag import (
+    detection_lag_tracker, mark_webhook_received, clear_webhook_received, current_webhook_received_at
+)
+from app.shared.utils.admission import admission_controller
+from app.shared.utils.idempotency import (
+    webhook_idempotency, webhook_event_key, mark_current_event, clear_current_event
+)
+from app.shared.utils.logger import get_logger
+import logging
+import time
 from app.shared.middlewares.auth import login_required
 from config.settings import settings
 from app.infrastructure.auth.cafe24_oauth import Cafe24OAuth
 from app.infrastructure.external.cafe24.cafe24_reviews import Cafe24ReviewAPI
 
 webhook_bp = Blueprint('webhook', __name__, url_prefix='/webhook')
+log = get_logger(__name__)
 
 # 웹훅 설정 변수들
 WEBHOOK_EVENT_KEY = settings.WEBHOOK_EVENT_KEY
@@ -22,11 +35,11 @@ def process_cafe24_webhook(webhook_data):
     try:
         event_no = webhook_data.get('event_no')
         event_type = f"event_{event_no}" if event_no else webhook_data.get('event_type')
-        print(f"🔍 카페24 웹훅 처리 시작 - 이벤트 번호: {event_no}, 타입: {event_type}")
+        log.debug("🔍 카페24 웹훅 처리 시작", event_no=event_no, event_type=event_type)
         
         # 게시판 글 등록 이벤트 처리 (event_no: 90033)
         if event_no == 90033 or event_type in ['board.created', 'board_created']:
-            print(f"📝 카페24 게시판 글 등록 이벤트 수신 - 신규 리뷰 확인 시작!")
+            log.info("📝 카페24 게시판 글 등록 이벤트 수신 - 신규 리뷰 확인 시작", event_no=event_no)
             
             # 웹훅을 트리거로 사용해서 기존 리뷰 조회 로직 실행
             app_globals = get_app_globals()
@@ -34,7 +47,7 @@ def process_cafe24_webhook(webhook_data):
             oauth_client = app_globals.get('oauth_client')
             
             if not review_api:
-                print("⚠️ Review API가 초기화되지 않음. 자동 초기화 시도...")
+                log.warning("⚠️ Review API가 초기화되지 않음. 자동 초기화 시도...")
                 
                 # OAuth 클라이언트부터 초기화 (저장된 토큰 포함)
                 if not oauth_client:
@@ -45,31 +58,31 @@ def process_cafe24_webhook(webhook_data):
                             mall_id=settings.cafe24_id,
                             redirect_uri=settings.cafe24_redirect_uri
                         )
-                        print("✅ OAuth 클라이언트 초기화 완료")
+                        log.info("✅ OAuth 클라이언트 초기화 완료")
                         
                         # 저장된 토큰이 있는지 확인
                         token_status = oauth_client.get_token_status()
-                        if not token_status['has_token'] or not token_status['token_valid']:
-                            print(f"⚠️ 유효한 OAuth 토큰이 없습니다: {token_status['message']}")
+                        if not token_status['has_token'] or token_status.get('is_expired', True):
+                            log.warning("⚠️ 유효한 OAuth 토큰이 없습니다", reason=token_status['message'])
                             # 토큰이 없으면 채널톡으로 알림만 전송
                             webhook_message = f"🔔 카페24 웹훅 수신\n새로운 게시판 글이 등록되었습니다.\n\n이벤트: {event_type}\n시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n⚠️ OAuth 토큰이 만료되어 상세 분석을 수행할 수 없습니다.\n관리자가 OAuth 재인증을 해주세요."
                             notification_manager.send_simple_channel_talk_message(webhook_message)
                             return True
                             
                     except Exception as e:
-                        print(f"❌ OAuth 클라이언트 초기화 실패: {e}")
+                        log.error(f"❌ OAuth 클라이언트 초기화 실패: {e}")
                         return False
                 
                 # Review API 초기화 시도
                 try:
                     review_api = Cafe24ReviewAPI(oauth_client)
                     app_globals['review_api'] = review_api
-                    print("✅ Review API 자동 초기화 완료")
+                    log.info("✅ Review API 자동 초기화 완료")
                 except Exception as e:
-                    print(f"❌ Review API 자동 초기화 실패: {e}")
+                    log.error(f"❌ Review API 자동 초기화 실패: {e}")
                     return False
             
-            print("🔍 웹훅 트리거로 인한 신규 리뷰 조회 시작...")
+            log.debug("🔍 웹훅 트리거로 인한 신규 리뷰 조회 시작")
             # trigger_review_collection() 함수 호출 - app.py에서 import 필요
             from flask import current_app
             trigger_func = current_app.config.get('trigger_review_collection')
@@ -77,14 +90,12 @@ def process_cafe24_webhook(webhook_data):
                 trigger_func()
             return True
         else:
-            print(f"⏭️ 처리 대상이 아닌 이벤트: {event_type}")
+            log.debug("⏭️ 처리 대상이 아닌 이벤트", event_type=event_type)
         
         return False
         
     except Exception as e:
-        print(f"❌ 카페24 웹훅 처리 오류: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception(f"❌ 카페24 웹훅 처리 오류: {e}")
         return False
 
 def extract_content_from_cafe24_webhook(webhook_data):
@@ -103,38 +114,45 @@ def extract_content_from_cafe24_webhook(webhook_data):
         }
         
     except Exception as e:
-        print(f"카페24 웹훅 데이터 추출 오류: {e}")
+        log.error(f"카페24 웹훅 데이터 추출 오류: {e}")
         return None
 
 def process_channel_talk_webhook(webhook_data):
     """채널톡 웹훅 데이터 처리"""
     try:
         event_type = webhook_data.get('eventType')
-        print(f"🔍 웹훅 처리 시작 - 이벤트 타입: {event_type}")
+        log.debug("🔍 채널톡 웹훅 처리 시작", event_type=event_type)
         
         # 리뷰 관련 이벤트만 처리
         if event_type in ['review.created', 'review.updated', 'message.created']:
-            print(f"📝 채널톡 웹훅 이벤트 수신: {event_type}")
+            log.info("📝 채널톡 웹훅 이벤트 수신", event_type=event_type)
             
             # 웹훅 데이터에서 리뷰/메시지 내용 추출
             content = extract_content_from_webhook(webhook_data)
-            print(f"📄 추출된 내용: {content}")
+            log.debug("📄 추출된 내용", source=content.get('source') if content else None, length=len(content['text']) if content else 0)
             
             if content:
                 # 감정 분석 수행 (평점 정보 포함) - app.py에서 import 필요
                 from flask import current_app
                 analyze_review = current_app.config.get('analyze_review')
                 send_negative_review_alert = current_app.config.get('send_negative_review_alert')
+                handle_refined_review = current_app.config.get('handle_refined_review')
                 
                 data = webhook_data.get('data', {})
                 rating = data.get('rating', 0)
                 
                 if analyze_review:
-                    analysis_result = analyze_review(content['text'], rating)
-                    print(f"🤖 감정 분석 결과: {analysis_result} (평점: {rating}점)")
+                    # GPT 2차 분석은 GPT_DEADLINE_SECONDS까지만 기다림. 늦으면 1차 결과로 응답하고
+                    # 최종 결과는 백그라운드에서 handle_refined_review로 전달 (앱 컨텍스트 밖에서 호출되므로 미리 꺼내 둔 함수 사용)
+                    options = {}
+                    if settings.gpt_deadline_seconds and handle_refined_review:
+                        options = {'deadline_seconds': settings.gpt_deadline_seconds,
+                                   'on_refined': lambda refined: handle_refined_review(refined, content=content)}
+                    analysis_result = analyze_review(content['text'], rating, **options)
+                    log.debug("🤖 감정 분석 결과", label=analysis_result.get('label'), is_negative=analysis_result.get('is_negative'), confidence=analysis_result.get('confidence'), rating=rating, provisional=analysis_result.get('provisional', False))
                     
                     if analysis_result.get('is_negative', False):
-                        print("🚨 부정 리뷰 감지! 알림 발송 시작...")
+                        log.info("🚨 부정 리뷰 감지! 알림 발송 시작", rating=rating)
                         # 부정 리뷰 감지 - 알림 발송
                         if send_negative_review_alert:
                             send_negative_review_alert(content, analysis_result)
@@ -147,18 +165,18 @@ def process_channel_talk_webhook(webhook_data):
                             if trigger_func:
                                 trigger_func()
                     else:
-                        print("😊 긍정적/중성적 리뷰로 분류됨 - 알림 없음")
+                        log.debug("😊 긍정적/중성적 리뷰로 분류됨 - 알림 없음")
                 
                 return True
             else:
-                print("❌ 내용 추출 실패")
+                log.warning("❌ 내용 추출 실패", event_type=event_type)
         else:
-            print(f"⏭️ 처리 대상이 아닌 이벤트: {event_type}")
+            log.debug("⏭️ 처리 대상이 아닌 이벤트", event_type=event_type)
         
         return False
         
     except Exception as e:
-        print(f"❌ 채널톡 웹훅 처리 오류: {e}")
+        log.exception(f"❌ 채널톡 웹훅 처리 오류: {e}")
         return False
 
 def extract_content_from_webhook(webhook_data):
@@ -189,7 +207,7 @@ def extract_content_from_webhook(webhook_data):
         return None
         
     except Exception as e:
-        print(f"웹훅 데이터 추출 오류: {e}")
+        log.error(f"웹훅 데이터 추출 오류: {e}")
         return None
 
 # ===== 채널톡 웹훅 엔드포인트 =====
@@ -198,45 +216,102 @@ def extract_content_from_webhook(webhook_data):
 @webhook_bp.route('/channel-tal', methods=['POST'])
 def cafe24_webhook():
     """카페24 웹훅 수신"""
+    started_at = time.perf_counter()
+    # 처리 중인 웹훅이 한도에 닿으면 처리하지 않고 바로 429 (남은 스레드가 헬스 체크/대시보드와 다음 웹훅을 받도록)
+    if not admission_controller.try_enter('webhook'):
+        WEBHOOK_REQUEST_SECONDS.observe(time.perf_counter() - started_at, source='unknown', outcome='rejected')
+        response = jsonify({
+            'status': 'rejected',
+            'message': '처리 중인 웹훅이 많아 잠시 후 다시 시도해 주세요.',
+            'retry_after': admission_controller.retry_after()
+        })
+        response.headers['Retry-After'] = str(admission_controller.retry_after())
+        return response, 429
+
+    mark_webhook_received()  # 감지 지연 계산용 웹훅 수신 시각
+    try:
+        with WEBHOOK_IN_FLIGHT.track_inprogress():
+            response, status_code, source, outcome = _handle_webhook()
+    finally:
+        clear_webhook_received()
+        admission_controller.leave()
+    WEBHOOK_REQUEST_SECONDS.observe(time.perf_counter() - started_at, source=source, outcome=outcome)
+    return response, status_code
+
+def _handle_webhook():
+    """웹훅 처리 본문. (응답, 상태 코드, 출처, 처리 결과) 반환"""
+    source = 'unknown'
     try:
         # 웹훅 활성화 여부 확인
         if not WEBHOOK_ENABLED:
-            return jsonify({'error': '웹훅이 비활성화되었습니다.'}), 403
+            return jsonify({'error': '웹훅이 비활성화되었습니다.'}), 403, source, 'disabled'
         
         # 카페24 웹훅인지 확인 (헤더 또는 요청 내용으로 구분)
         user_agent = request.headers.get('User-Agent', '')
         
         # 카페24 웹훅은 이벤트 키 검증 대신 verification code 사용
         # 일단 모든 요청을 허용 (나중에 verification 추가 가능)
-        print(f"카페24 웹훅 수신 - User-Agent: {user_agent}")
-        print(f"요청 헤더들: {dict(request.headers)}")
+        if log.isEnabledFor(logging.DEBUG):  # 헤더 복사는 디버그 로그를 남길 때만
+            log.debug("웹훅 요청 헤더", user_agent=user_agent, headers=dict(request.headers))
         
         # 웹훅 데이터 파싱
         webhook_data = request.json
         
         if not webhook_data:
-            return jsonify({'error': '웹훅 데이터가 없습니다.'}), 400
+            return jsonify({'error': '웹훅 데이터가 없습니다.'}), 400, source, 'invalid'
         
-        print(f"카페24 웹훅 수신: {webhook_data}")
+        # 부하 테스트 재생용 트레이스 기록 (WEBHOOK_TRACE_FILE 설정 시)
+        source = detect_webhook_source(webhook_data)
+        log.info("웹훅 수신", source=source, event_no=webhook_data.get('event_no'), event_type=webhook_data.get('eventType'))
+        log.debug("웹훅 본문", payload=webhook_data)
+        webhook_trace_recorder.record(webhook_data, path=request.path, source=source)
         
-        # 카페24 웹훅 처리 (게시판 글 등록)
-        success = process_cafe24_webhook(webhook_data)
+        # 타임아웃 재전송 등 이미 처리했거나 처리 중인 이벤트는 수집/분석 없이 바로 응답
+        event_key = webhook_event_key(webhook_data, source)
+        if not webhook_idempotency.claim(event_key, source):
+            log.info("🔁 이미 받은 웹훅 이벤트 - 처리 없이 응답", source=source, event_key=event_key, sample='webhook_duplicate')
+            return jsonify({
+                'status': 'duplicate',
+                'message': '이미 받은 이벤트'
+            }), 200, source, 'duplicate'
+        # 페이로드에 글 번호가 있으면(카페24) 그 리뷰의 웹훅 수신 시각 기록 - 어느 수집 작업에서 분석되어도 같은 기준으로 감지 지연 계산
+        detection_lag_tracker.note_webhook(webhook_data.get('resource'), current_webhook_received_at())
+        
+        # 수집 요청이 키를 넘겨받으면 그 웹훅을 포함하는 수집이 끝날 때 완료/실패를 표시 (그때까지 처리 중)
+        mark_current_event(event_key)
+        try:
+            if source == 'channel_talk' and settings.webhook_channel_talk_dispatch:
+                # 채널톡 웹훅 처리 (리뷰/메시지 이벤트)
+                success = process_channel_talk_webhook(webhook_data)
+            else:
+                # 카페24 웹훅 처리 (게시판 글 등록)
+                success = process_cafe24_webhook(webhook_data)
+        except Exception:
+            webhook_idempotency.release(clear_current_event())  # 재전송 때 다시 처리
+            raise
+        event_key = clear_current_event()  # 수집에 넘겼으면 None (complete/release 모두 무시)
+        if success:
+            webhook_idempotency.complete(event_key)
+        else:
+            # 처리 함수는 예외를 잡아 False로 반환하므로(OAuth/Review API 초기화 실패 등) 처리 대상이 아닌 이벤트와 함께
+            # 키를 지워 재전송 때 다시 처리
+            webhook_idempotency.release(event_key)
         
         if success:
             return jsonify({
                 'status': 'success',
                 'message': '웹훅 처리 완료',
                 'processed_at': datetime.now().isoformat()
-            }), 200
+            }), 200, source, 'success'
         else:
             return jsonify({
                 'status': 'ignored',
                 'message': '처리 대상이 아닌 이벤트'
-            }), 200
+            }), 200, source, 'ignored'
         
     except Exception as e:
-        print(f"채널톡 웹훅 처리 중 오류: {e}")
-        return jsonify({'error': '웹훅 처리 중 오류가 발생했습니다.'}), 500
+        log.exception(f"웹훅 처리 중 오류: {e}")
+        return jsonify({'error': '웹훅 처리 중 오류가 발생했습니다.'}), 500, source, 'error'
 
 @webhook_bp.route('/test', methods=['POST'])
 @login_required
@@ -275,12 +350,20 @@ def test_webhook():
 def webhook_status():
     """웹훅 상태 조회"""
     try:
+        from flask import current_app
+        alert_service = current_app.config.get('alert_service')
         return jsonify({
             'enabled': WEBHOOK_ENABLED,
             'event_key_configured': bool(WEBHOOK_EVENT_KEY),
             'event_key_value': WEBHOOK_EVENT_KEY if WEBHOOK_EVENT_KEY else 'Not configured',
             'endpoint': url_for('webhook.cafe24_webhook', _external=True),
             'test_endpoint': url_for('webhook.test_webhook', _external=True),
+            'trace_enabled': webhook_trace_recorder.enabled,
+            'trace_recorded': webhook_trace_recorder.recorded,
+            'admission': admission_controller.status(),
+            'idempotency': webhook_idempotency.status(),
+            'collection': alert_service.collection_status() if alert_service else None,
+            'background_analysis': alert_service.background_status() if alert_service else None,
             'recent_notifications': notification_manager.get_recent_notifications(limit=5)
         })
         
@@ -1,8 +1,38 @@
+import atexit
+import threading
+import time
 from datetime import datetime
+from app.shared.utils.metrics import (
+    instrument, COLLECTION_SECONDS, COLLECTION_NEW_REVIEWS_TOTAL, COLLECTION_COALESCED_TOTAL, COLLECTION_PRIORITY_TOTAL
+)
+from app.shared.utils.admission import admission_controller
+from app.shared.utils.work_queue import PriorityWorkQueue
+from app.shared.utils.timing import trace_operation, stage
+from app.shared.utils.detection_lag import detection_lag_tracker, current_webhook_received_at
+from app.shared.utils.idempotency import webhook_idempotency, hand_off_current_event
+from app.shared.utils.logger import get_logger
+
+log = get_logger(__name__)
 
 class AlertService:
     def __init__(self, notification_manager=None):
         self.notification_manager = notification_manager
+        # 수집은 한 번에 하나만 실행하고, 실행 중 들어온 요청은 끝난 뒤 한 번 더 수집하는 것으로 합침
+        self._collection_lock = threading.Lock()
+        self._collection_running = False
+        self._collection_pending = 0  # 실행 중에 합쳐진 수집 요청 수 (대략 그만큼 신규 리뷰가 더 있음)
+        self._collection_received_at = None  # 합쳐진 수집 요청 중 가장 먼저 받은 웹훅의 수신 시각 (감지 지연 계산용)
+        self._collection_event_keys = []  # 다음 수집이 끝나면 완료/실패로 표시할 웹훅 이벤트 키
+        # 저하 모드에서 모아 보낼 알림 (신규 리뷰, 문제 리뷰)
+        self._digest_lock = threading.Lock()
+        self._digest_new_reviews = []
+        self._digest_problematic_reviews = []
+        self._digest_method = None
+        self._digest_timer = None
+        atexit.register(self.flush_digest)
+        # 수집 작업(웹훅 요청 스레드 밖에서 실행)과 긍정일 가능성이 높은 리뷰의 분석/알림 (처음 쓸 때 생성)
+        self._collection_queue = None
+        self._background_queue = None
     
     def send_negative_review_alert(self, content, analysis_result):
         """부정 리뷰 감지 시 즉시 알림 발송"""
@@ -17,7 +47,7 @@ class AlertService:
                 'detected_at': datetime.now().isoformat()
             }
             
-            print(f"📡 알림 데이터 생성: {alert_data}")
+            log.debug("📡 알림 데이터 생성", source=alert_data['source'], score=alert_data['score'])
             
             # 알림 매니저에 긴급 알림 추가
             notification_result = self.notification_manager.add_monitoring_notification(
@@ -26,61 +56,296 @@ class AlertService:
                 alert_data
             )
             
-            print(f"📢 알림 매니저 결과: {notification_result}")
-            print(f"✅ 부정 리뷰 긴급 알림 발송 완료: {content['text'][:50]}...")
+            log.info("✅ 부정 리뷰 긴급 알림 발송 완료", source=alert_data['source'], notification_added=bool(notification_result))
+            
+        except Exception as e:
+            log.exception(f"❌ 부정 리뷰 알림 발송 오류: {e}")
+
+    def handle_refined_review(self, refined_review, ingest_reviews_func=None, notification_method='both', content=None):
+        """마감 시간 이후 끝난 GPT 2차 분석 결과 반영 (저장된 결과 갱신, 라벨이 바뀐 경우에만 후속 알림)
+        
+        content가 있으면 웹훅으로 받은 리뷰(send_negative_review_alert 경로), 없으면 수집한 리뷰입니다.
+        """
+        try:
+            if ingest_reviews_func:
+                ingest_reviews_func([refined_review])
             
+            previous = refined_review.get('refined_from') or {}
+            if refined_review.get('sentiment') == previous.get('sentiment'):
+                log.debug("🔁 GPT 2차 분석 결과가 임시 결과와 같음 - 후속 알림 없음", label=refined_review.get('label'))
+                return False
+            
+            log.info("🔁 GPT 2차 분석으로 라벨 변경 - 후속 알림 발송",
+                     before=previous.get('label'), after=refined_review.get('label'))
+            if refined_review.get('is_negative', False) and not previous.get('is_negative', False):
+                if content is not None:
+                    self.send_negative_review_alert(content, refined_review)
+                else:
+                    self.notification_manager.send_notification_to_all([refined_review], [refined_review], notification_method)
+            else:
+                content_text = (content or {}).get('text') or refined_review.get('content', '') or refined_review.get('title', '')
+                webhook_message = f"🔁 리뷰 분석 결과 정정\n\n📝 내용: {content_text[:100]}{'...' if len(content_text) > 100 else ''}\n\n📊 {previous.get('label')} → {refined_review.get('label')} (GPT 2차 분석)\n\n⏰ {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+                self.notification_manager.send_simple_channel_talk_message(webhook_message)
+            return True
+        
         except Exception as e:
-            print(f"❌ 부정 리뷰 알림 발송 오류: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception(f"❌ GPT 2차 분석 결과 반영 오류: {e}")
+            return False
+
+    def trigger_review_collection(self, review_api, find_new_reviews_func, analyze_reviews_batch_func, settings, ingest_reviews_func=None,
+                                  triage_reviews_func=None):
+        """웹훅 트리거 시 신규 리뷰 수집/분석을 수집 작업 큐에 넘기고 바로 True를 반환 (단계별 소요시간은 timing_store에 기록)
+        
+        수집은 웹훅 요청 스레드가 아닌 수집 작업 스레드 하나에서 실행되므로, 웹훅이 계속 몰려도 웹훅 응답이 늦어지거나
+        gunicorn 스레드와 수락 제어 슬롯을 붙잡지 않습니다. 수집 중 들어온 요청은 합쳐져 실행 중인 수집이 끝난 뒤
+        한 번 더 수집하므로 그 사이 등록된 리뷰도 빠지지 않고, 같은 리뷰를 동시에 여러 번 분석하지 않습니다.
+        
+        triage_reviews_func가 있으면(REVIEW_PRIORITY_ENABLED) 부정일 가능성이 높은 리뷰만 여기서 분석/알림하고
+        나머지는 백그라운드 우선순위 큐로 넘깁니다.
+        """
+        # 웹훅 수신 시각은 요청 스레드에서 읽어 수집 작업에 넘김 (합쳐진 요청은 실행 중인 스레드가 대신 수집)
+        received_at = current_webhook_received_at()
+        # 웹훅 이벤트 키도 넘겨받아, 이 요청을 포함하는 수집이 끝날 때 완료/실패로 표시 (그때까지 재전송은 중복으로 응답)
+        event_key = hand_off_current_event()
+        with self._collection_lock:
+            if received_at is not None:
+                self._collection_received_at = min(self._collection_received_at or received_at, received_at)
+            if event_key:
+                self._collection_event_keys.append(event_key)
+            if self._collection_running:
+                self._collection_pending += 1
+                COLLECTION_COALESCED_TOTAL.inc()
+                log.debug("⏭️ 진행 중인 리뷰 수집에 합침")
+                return True
+            self._collection_running = True
+        
+        try:
+            self._get_collection_queue(settings).submit(
+                0, self._collect_until_idle, review_api, find_new_reviews_func, analyze_reviews_batch_func, settings,
+                ingest_reviews_func, triage_reviews_func)
+        except BaseException:
+            with self._collection_lock:
+                self._collection_running = False
+                event_keys, self._collection_event_keys = self._collection_event_keys, []
+            self._settle_event_keys(event_keys, False)
+            raise
+        return True
 
-    def trigger_review_collection(self, review_api, find_new_reviews_func, analyze_reviews_batch_func, settings):
-        """웹훅 트리거 시 신규 리뷰만 수집하고 분석"""
+    def _collect_until_idle(self, review_api, find_new_reviews_func, analyze_reviews_batch_func, settings,
+                            ingest_reviews_func=None, triage_reviews_func=None):
+        """수집 작업 스레드에서 실행 - 실행 중 합쳐진 요청이 없을 때까지 반복 수집"""
+        event_keys = []
+        try:
+            while True:
+                with self._collection_lock:
+                    backlog, self._collection_pending = self._collection_pending, 0
+                    received_at, self._collection_received_at = self._collection_received_at, None
+                    event_keys, self._collection_event_keys = self._collection_event_keys, []
+                result = self._run_collection(review_api, find_new_reviews_func, analyze_reviews_batch_func,
+                                              settings, ingest_reviews_func, triage_reviews_func, backlog, received_at)
+                self._settle_event_keys(event_keys, result)
+                event_keys = []
+                with self._collection_lock:
+                    if not self._collection_pending:
+                        self._collection_running = False
+                        return result
+        except BaseException:
+            with self._collection_lock:
+                self._collection_running = False
+                event_keys += self._collection_event_keys
+                self._collection_event_keys = []
+            self._settle_event_keys(event_keys, False)
+            raise
+
+    @staticmethod
+    def _settle_event_keys(event_keys, success):
+        """수집이 끝난 웹훅 이벤트 키 표시 - 성공하면 완료(TTL 동안 중복), 실패하면 지워 재전송 때 다시 수집"""
+        for event_key in event_keys:
+            if success:
+                webhook_idempotency.complete(event_key)
+            else:
+                webhook_idempotency.release(event_key)
+
+    @instrument(COLLECTION_SECONDS, outcome=lambda result, error: 'success' if result else 'failed')
+    def _run_collection(self, review_api, find_new_reviews_func, analyze_reviews_batch_func, settings, ingest_reviews_func=None,
+                        triage_reviews_func=None, backlog=0, received_at=None):
+        with trace_operation('review_collection') as trace:
+            return self._collect_new_reviews(trace, review_api, find_new_reviews_func, analyze_reviews_batch_func,
+                                             settings, ingest_reviews_func, triage_reviews_func, backlog, received_at)
+
+    def _collect_new_reviews(self, trace, review_api, find_new_reviews_func, analyze_reviews_batch_func, settings, ingest_reviews_func=None,
+                             triage_reviews_func=None, backlog=0, received_at=None):
         try:
             if not review_api:
-                print("❌ Review API가 없습니다.")
+                log.error("❌ Review API가 없습니다.")
                 return False
                 
-            print("🔍 웹훅 트리거로 인한 신규 리뷰 수집 시작...")
+            log.debug("🔍 웹훅 트리거로 인한 신규 리뷰 수집 시작")
             
             # 신규 리뷰만 찾기
-            new_reviews = find_new_reviews_func()
+            with stage('cafe24_fetch'):
+                new_reviews = find_new_reviews_func(backlog) if backlog else find_new_reviews_func()
+            trace.meta['new_reviews'] = len(new_reviews or [])
             
             if new_reviews:
-                print(f"📝 신규 리뷰 {len(new_reviews)}개에 대해 감정 분석 시작...")
-                
-                # 신규 리뷰들만 감정 분석 수행
-                analyzed_reviews = analyze_reviews_batch_func(new_reviews)
-                negative_reviews = [r for r in analyzed_reviews if r.get('is_negative', False)]
-                # 긍정이지만 신뢰도가 낮은 경우 (실제로는 부정일 가능성)
-                low_confidence_positive = [r for r in analyzed_reviews if not r.get('is_negative', False) and r.get('confidence', 0) < 60.0]
+                COLLECTION_NEW_REVIEWS_TOTAL.inc(len(new_reviews))
+                # 리뷰마다 웹훅 수신 시각 기록 (백그라운드 큐에서 분석되어도 감지 지연은 이 값 기준)
+                new_reviews = detection_lag_tracker.stamp_fetched(new_reviews, received_at)
+                log.debug("📝 신규 리뷰 감정 분석 시작", count=len(new_reviews))
                 
-                if negative_reviews or low_confidence_positive:
-                    print(f"🚨 신규 부정 리뷰 {len(negative_reviews)}개, 낮은 신뢰도 긍정 리뷰 {len(low_confidence_positive)}개 발견!")
-                    
-                    # 부정 + 낮은 신뢰도 긍정 리뷰 함께 전송
-                    problematic_reviews = negative_reviews + low_confidence_positive
-                    self.notification_manager.send_notification_to_all(new_reviews, problematic_reviews, settings.notification_method)
-                    
-                    # 웹훅 간단 알림 전송 (낮은 신뢰도 긍정 리뷰만)
-                    for review in low_confidence_positive:
-                        content_text = review.get('content', '') or review.get('title', '')
-                        confidence = review.get('confidence', 0)
-                        
-                        webhook_message = f"⚠️ 검토 필요한 긍정 리뷰\n\n📝 내용: {content_text[:100]}{'...' if len(content_text) > 100 else ''}\n\n📊 신뢰도: {confidence}% (낮음)\n🔍 분석: 긍정적이지만 확신도 낮음\n💡 실제로는 부정적일 수 있으니 확인 필요\n\n⏰ {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-                        
-                        self.notification_manager.send_simple_channel_talk_message(webhook_message)
-                else:
-                    print(f"📝 웹훅 트리거: 긍정 리뷰만 있음 ({len(new_reviews)}개)")
-                    
-                print(f"✅ 신규 리뷰 분석 완료: 총 {len(new_reviews)}개, 부정 {len(negative_reviews)}개")
+                # 부정일 가능성이 높은 리뷰(낮은 평점, 높은 pkl 부정 확률)부터 분석하고 바로 알림
+                # 긍정일 가능성이 높은 리뷰는 백그라운드 우선순위 큐에서 처리 (함께 들어온 긍정 리뷰 수가 부정 리뷰 알림을 늦추지 않도록)
+                (urgent_reviews, urgent_pkl_results, _), (background_reviews, background_pkl_results, background_priority) = \
+                    self._prioritize(new_reviews, triage_reviews_func, settings)
+                trace.meta['urgent_reviews'] = len(urgent_reviews)
+                if urgent_reviews:
+                    self._analyze_and_notify(urgent_reviews, urgent_pkl_results, new_reviews, analyze_reviews_batch_func,
+                                             settings, ingest_reviews_func)
+                if background_reviews:
+                    # 큐는 값이 작을수록 먼저 실행 - 부정 가능성이 가장 높은 리뷰 기준으로 배치 순서를 정함
+                    self._get_background_queue(settings).submit(
+                        1.0 - background_priority, self._analyze_in_background, background_reviews, background_pkl_results,
+                        analyze_reviews_batch_func, settings, ingest_reviews_func)
+                    log.debug("📥 긍정 가능성이 높은 리뷰는 백그라운드에서 분석", count=len(background_reviews))
             else:
-                print("📝 신규 리뷰가 없습니다.")
+                log.debug("📝 신규 리뷰가 없습니다.")
             
             return True
             
         except Exception as e:
-            print(f"❌ 웹훅 트리거 리뷰 수집 오류: {e}")
-            import traceback
-            traceback.print_exc()
-            return False
\ No newline at end of file
+            log.exception(f"❌ 웹훅 트리거 리뷰 수집 오류: {e}")
+            return False
+
+    def _prioritize(self, new_reviews, triage_reviews_func, settings):
+        """신규 리뷰를 (우선 처리, 백그라운드 처리)로 나눔. 각각 (우선순위 높은 순 리뷰, pkl 1차 결과, 최고 우선순위)"""
+        if not triage_reviews_func or not getattr(settings, 'review_priority_enabled', False):
+            return (new_reviews, None, 1.0), ([], None, 0.0)
+        
+        with stage('triage'):
+            triaged = triage_reviews_func(new_reviews)
+        order = sorted(range(len(new_reviews)), key=lambda i: triaged[i]['priority'], reverse=True)
+        threshold = settings.review_priority_threshold
+        tiers = []
+        for indices in ([i for i in order if triaged[i]['priority'] >= threshold],
+                        [i for i in order if triaged[i]['priority'] < threshold]):
+            tiers.append(([new_reviews[i] for i in indices], [triaged[i]['pkl_result'] for i in indices],
+                          triaged[indices[0]]['priority'] if indices else 0.0))
+        COLLECTION_PRIORITY_TOTAL.inc(len(tiers[0][0]), tier='urgent')
+        COLLECTION_PRIORITY_TOTAL.inc(len(tiers[1][0]), tier='background')
+        return tiers[0], tiers[1]
+
+    def _analyze_in_background(self, reviews, pkl_results, analyze_reviews_batch_func, settings, ingest_reviews_func=None):
+        with trace_operation('background_analysis', reviews=len(reviews)):
+            self._analyze_and_notify(reviews, pkl_results, reviews, analyze_reviews_batch_func, settings,
+                                     ingest_reviews_func)
+
+    def _analyze_and_notify(self, reviews, pkl_results, new_reviews, analyze_reviews_batch_func, settings, ingest_reviews_func=None):
+        """리뷰 분석 → 저장 결과 반영 → 부정/검토 필요 리뷰 알림 (new_reviews는 알림에 표시할 전체 신규 리뷰)"""
+        # GPT 2차 분석은 GPT_DEADLINE_SECONDS까지만 기다리고 늦은 결과는 handle_refined_review로 반영
+        options = {'pkl_results': pkl_results} if pkl_results is not None else {}
+        deadline_seconds = getattr(settings, 'gpt_deadline_seconds', 0) or None
+        if deadline_seconds:
+            options.update(deadline_seconds=deadline_seconds,
+                           on_refined=lambda refined: self.handle_refined_review(
+                               refined, ingest_reviews_func, settings.notification_method))
+        with stage('analysis'):
+            analyzed_reviews = analyze_reviews_batch_func(reviews, **options)
+        detection_lag_tracker.record_analyzed(analyzed_reviews)
+        if ingest_reviews_func:
+            with stage('ingest'):
+                ingest_reviews_func(analyzed_reviews)
+        negative_reviews = [r for r in analyzed_reviews if r.get('is_negative', False)]
+        # 부정이 아니지만 pkl 신뢰도가 60% 미만인 경우 (실제로는 부정일 가능성)
+        # GPT 결과나 재분석을 기다리는 임시 결과는 제외 - 라우팅 정책이 재분석하지 않은 리뷰만 남음
+        # (상위 두 클래스 확률 차이가 GPT_LOW_MARGIN_THRESHOLD 이상이거나 예산/SLO로 넘긴 경우)
+        low_confidence_positive = [r for r in analyzed_reviews if not r.get('is_negative', False)
+                                   and r.get('low_confidence', False) and not r.get('provisional', False)]
+        
+        if negative_reviews or low_confidence_positive:
+            log.info("🚨 신규 부정 리뷰 발견", negative=len(negative_reviews), low_confidence_positive=len(low_confidence_positive))
+            
+            # 부정 + 낮은 신뢰도 리뷰를 한 알림으로 전송 (낮은 신뢰도 리뷰도 신뢰도와 함께 이 알림에만 포함)
+            problematic_reviews = negative_reviews + low_confidence_positive
+            if admission_controller.degraded:
+                # 저하 모드: ADMISSION_DIGEST_SECONDS 동안 모아 한 번에 전송
+                self._add_to_digest(new_reviews, problematic_reviews, settings)
+                log.info("✅ 신규 리뷰 분석 완료 (알림은 묶음 전송 대기)", total=len(reviews), negative=len(negative_reviews))
+                return analyzed_reviews
+            with stage('notify'):
+                self.notification_manager.send_notification_to_all(new_reviews, problematic_reviews, settings.notification_method)
+        else:
+            log.debug("📝 웹훅 트리거: 긍정 리뷰만 있음", count=len(reviews))
+            
+        log.info("✅ 신규 리뷰 분석 완료", total=len(reviews), negative=len(negative_reviews))
+        return analyzed_reviews
+
+    def _get_collection_queue(self, settings):
+        with self._collection_lock:
+            if self._collection_queue is None:
+                self._collection_queue = PriorityWorkQueue('review_collection', workers=1)
+            return self._collection_queue
+
+    def _get_background_queue(self, settings):
+        with self._collection_lock:
+            if self._background_queue is None:
+                self._background_queue = PriorityWorkQueue('review_background',
+                                                           workers=getattr(settings, 'review_background_workers', 1))
+            return self._background_queue
+
+    def wait_for_background(self, timeout=None, review_analyzer=None):
+        """수집 작업과 백그라운드 분석이 모두 끝날 때까지 대기 (종료 전/부하 테스트용). 시간 안에 끝나면 True
+        
+        review_analyzer를 넘기면 마감 시간 후 백그라운드에서 계속되는 GPT 2차 분석(후속 알림 포함)까지 기다립니다.
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        # 수집이 백그라운드 분석을 넘기고, 두 작업 모두 GPT 2차 분석을 남길 수 있으므로 이 순서로 기다림
+        for queue in (self._collection_queue, self._background_queue):
+            if queue is None:
+                continue
+            remaining = max(0.0, deadline - time.monotonic()) if deadline is not None else None
+            if not queue.join(remaining):
+                return False
+        if review_analyzer is not None:
+            remaining = max(0.0, deadline - time.monotonic()) if deadline is not None else None
+            return review_analyzer.wait_for_refinements(remaining)
+        return True
+
+    def collection_status(self):
+        status = self._collection_queue.status() if self._collection_queue is not None else {}
+        with self._collection_lock:
+            return dict(status, running=self._collection_running, coalesced_pending=self._collection_pending)
+
+    def background_status(self):
+        return self._background_queue.status() if self._background_queue is not None else None
+
+    def _add_to_digest(self, new_reviews, problematic_reviews, settings):
+        with self._digest_lock:
+            self._digest_new_reviews.extend(new_reviews)
+            self._digest_problematic_reviews.extend(problematic_reviews)
+            self._digest_method = settings.notification_method
+            if self._digest_timer is None:
+                self._digest_timer = threading.Timer(settings.admission_digest_seconds, self.flush_digest)
+                self._digest_timer.daemon = True
+                self._digest_timer.start()
+            pending = len(self._digest_problematic_reviews)
+        log.debug("📦 알림 묶음에 추가", problematic=len(problematic_reviews), pending=pending)
+
+    def flush_digest(self):
+        """모아 둔 저하 모드 알림을 한 번에 전송 (타이머 만료 또는 종료 시)"""
+        with self._digest_lock:
+            new_reviews, self._digest_new_reviews = self._digest_new_reviews, []
+            problematic_reviews, self._digest_problematic_reviews = self._digest_problematic_reviews, []
+            method = self._digest_method
+            if self._digest_timer is not None:
+                self._digest_timer.cancel()
+                self._digest_timer = None
+        if not problematic_reviews:
+            return False
+        
+        log.info("📦 묶음 알림 전송", new_reviews=len(new_reviews), problematic=len(problematic_reviews))
+        try:
+            self.notification_manager.send_notification_to_all(new_reviews, problematic_reviews, method)
+            return True
+        except Exception as e:
+            log.exception(f"❌ 묶음 알림 전송 오류: {e}")
+            return False
@@ -1,15 +1,42 @@
+import threading
 from app.infrastructure.external.cafe24.cafe24_reviews import Cafe24ReviewAPI
+from app.shared.utils.metrics import CACHE_REQUESTS_TOTAL
+from app.shared.utils.logger import get_logger
+
+log = get_logger(__name__)
 
 class Cafe24Service:
     def __init__(self):
         self.product_cache = {}
+        # 저하 모드에서 나중에 조회할 상품 번호 (백그라운드 스레드 하나가 처리)
+        self._deferred_products = set()
+        self._deferred_lock = threading.Lock()
+        self._deferred_thread = None
+    
+    def export_product_names(self):
+        """상품명 캐시 (웜 스테이트 스냅샷용). 조회 실패 시 넣은 기본값('상품{번호}')은 제외"""
+        return [[product_no, name] for product_no, name in list(self.product_cache.items())
+                if name != f'상품{product_no}']
+    
+    def restore_product_names(self, entries):
+        """스냅샷의 상품명 캐시 복원 (이미 조회한 상품은 유지)"""
+        restored = 0
+        for product_no, name in entries or []:
+            if product_no not in self.product_cache:
+                self.product_cache[product_no] = name
+                restored += 1
+        return restored
     
-    def enrich_reviews_with_product_names(self, reviews, review_api):
-        """리뷰에 상품명 정보를 추가"""
+    def enrich_reviews_with_product_names(self, reviews, review_api, defer_missing=False):
+        """리뷰에 상품명 정보를 추가
+        
+        defer_missing=True(저하 모드)면 캐시에 없는 상품은 '상품{번호}'로 두고 백그라운드에서 조회해 캐시만 채웁니다.
+        """
         if not review_api:
             return reviews
         
         enriched_reviews = []
+        deferred = set()
         
         for review in reviews:
             enriched_review = review.copy()
@@ -17,6 +44,12 @@ class Cafe24Service:
             
             if product_no:
                 # 캐시 확인
+                CACHE_REQUESTS_TOTAL.inc(cache='product_name', result='hit' if product_no in self.product_cache else 'miss')
+                if product_no not in self.product_cache and defer_missing:
+                    deferred.add(product_no)
+                    enriched_review['product_name'] = f'상품{product_no}'
+                    enriched_reviews.append(enriched_review)
+                    continue
                 if product_no not in self.product_cache:
                     try:
                         product_info = review_api.get_product_info(product_no)
@@ -31,7 +64,35 @@ class Cafe24Service:
             
             enriched_reviews.append(enriched_review)
         
+        if deferred:
+            self._defer_product_lookups(deferred, review_api)
         return enriched_reviews
+    
+    def _defer_product_lookups(self, product_nos, review_api):
+        """상품명 조회를 백그라운드 스레드로 미룸 (이미 실행 중이면 대기 목록에만 추가)"""
+        with self._deferred_lock:
+            self._deferred_products.update(product_nos)
+            if self._deferred_thread is not None and self._deferred_thread.is_alive():
+                return
+            self._deferred_thread = threading.Thread(target=self._fill_deferred_products, args=(review_api,),
+                                                     name='product-name-fill', daemon=True)
+            self._deferred_thread.start()
+    
+    def _fill_deferred_products(self, review_api):
+        while True:
+            with self._deferred_lock:
+                pending = [product_no for product_no in self._deferred_products if product_no not in self.product_cache]
+                self._deferred_products.clear()
+                if not pending:
+                    self._deferred_thread = None
+                    return
+            for product_no in pending:
+                try:
+                    product_info = review_api.get_product_info(product_no)
+                    self.product_cache[product_no] = product_info.get('product_name', f'상품{product_no}')
+                except Exception as e:
+                    log.warning(f"⚠️ 상품 정보 조회 실패 (지연 조회): {e}", product_no=product_no)
+                    self.product_cache[product_no] = f'상품{product_no}'
 
     def init_cafe24_client(self, oauth_client):
         """카페24 API 클라이언트 초기화 (OAuth 클라이언트 사용)"""
@@ -50,7 +111,10 @@ class Cafe24Service:
                     print(f"   - Mall ID: {oauth_client.mall_id}")
                     print(f"   - 토큰 상태: {token_status['message']}")
                     
-                    # API 연결 테스트
+                    # API 연결 테스트 (웜 스테이트 스냅샷에서 게시판 목록을 복원했으면 생략하고 캐시 만료 후 다시 조회)
+                    if review_api.has_cached_review_boards():
+                        log.info("📝 스냅샷의 리뷰 게시판 목록 사용 - 연결 테스트 생략", mall_id=oauth_client.mall_id)
+                        return review_api
                     try:
                         boards = review_api.get_review_boards()
                         if boards:
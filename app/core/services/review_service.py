@@ -1,75 +1,130 @@
+import atexit
 import json
 import os
-import numpy as np
+import threading
+import time
 from datetime import datetime
-from app.infrastructure.external.openai.review_analyzer import ReviewAnalyzer
+from app.shared.utils.keyword_tracker import NegativeKeywordTracker
+from app.shared.utils.review_search_index import ReviewSearchIndex
+from app.shared.utils.known_reviews import KnownReviewSet
+from app.shared.utils.metrics import CACHE_REQUESTS_TOTAL
+from app.shared.utils.timing import stage
+from app.shared.utils.logger import get_logger
+from app.shared.utils.lazy_import import lazy_import
+from config.settings import settings
+
+np = lazy_import('numpy')
+log = get_logger(__name__)
 
 class ReviewService:
+    MAX_FETCH_LIMIT = 100  # 카페24 게시판 글 조회 한 번의 최대 건수
+    
     def __init__(self, notification_manager=None):
         self.notification_manager = notification_manager
         
         # 모니터링 관련 변수
         self.monitoring_active = False
         self.monitoring_thread = None
-        self.known_reviews = set()  # 이미 확인한 리뷰들 저장 (API용)
+        # 이미 수집한 리뷰 (보관 기간 동안만 유지하는 시간 구간별 집합, 바이너리로 저장)
+        self.known_reviews = KnownReviewSet(
+            bucket_seconds=settings.known_reviews_bucket_seconds,
+            max_buckets=settings.known_reviews_max_buckets,
+            max_keys=settings.known_reviews_max_keys
+        )
         self.pending_notifications = []  # 대기 중인 알림들
-        self.DATA_FILE = 'known_reviews.json'
+        self.DATA_FILE = 'known_reviews.bin'
+        self.LEGACY_DATA_FILE = 'known_reviews.json'  # 이전 형식 (전체 ID 목록 JSON)
         
         # 카페24 API 리뷰 캐시 시스템
         self.REVIEW_CACHE_FILE = 'review_cache.json'
         self.cached_reviews = []  # 최신 리뷰 10개 캐시
+        self._cache_lock = threading.Lock()  # 동시에 수집한 웹훅들이 같은 리뷰를 신규로 판단하지 않도록 비교+갱신을 묶음
+        self._cache_fetch_started_at = 0.0  # 마지막으로 캐시와 비교한 조회의 시작 시각 (time.monotonic 기준)
+        
+        # 부정 리뷰 키워드 증분 추적기 (상품별/시간대별)
+        self.keyword_tracker = NegativeKeywordTracker(
+            capacity=settings.keyword_tracker_capacity,
+            bucket_seconds=settings.keyword_tracker_bucket_seconds,
+            max_buckets=settings.keyword_tracker_max_buckets
+        )
+        
+        # 로컬 리뷰 검색 인덱스 (카페24 호출 없는 키워드 검색)
+        self.SEARCH_INDEX_FILE = 'review_search_index.json'
+        self.search_index = ReviewSearchIndex(max_documents=settings.search_index_max_documents)
+        self._search_index_save_timer = None  # 예약된 검색 인덱스 저장 (변경분을 모아 백그라운드에서 한 번 저장)
+        self._search_index_save_path = None  # 예약 시점의 저장 경로 (이후 작업 디렉토리가 바뀌어도 같은 파일에 저장)
+        self._search_index_save_lock = threading.Lock()
+        atexit.register(self.flush_search_index)
         
         # 모델 관련
         self.sentiment_analyzer = None
         self.review_analyzer = None
+        self._model_lock = threading.Lock()  # 워밍업 스레드와 첫 요청이 동시에 모델을 로드하지 않도록
         
     def load_model(self):
-        """모델 로드"""
+        """모델 로드 (이미 로드되었거나 다른 스레드가 로드 중이면 그 결과를 사용)"""
+        with self._model_lock:
+            if self.review_analyzer is None and self.sentiment_analyzer is None:
+                self._load_model()
+
+    def _load_model(self):
+        # 1. ReviewAnalyzer 초기화 (GPT + pkl 하이브리드, NumPy 엔진이면 sklearn import 없음)
+        try:
+            log.info("🚀 ReviewAnalyzer 초기화 시작...")
+            # numpy/모델 코드는 모델을 처음 로드할 때 import (콜드 스타트 시 포트를 먼저 열기 위해)
+            from app.infrastructure.external.openai.review_analyzer import ReviewAnalyzer
+            self.review_analyzer = ReviewAnalyzer()
+            log.info("✅ ReviewAnalyzer 초기화 완료!", backend=self.review_analyzer.pkl_backend)
+        except Exception as e:
+            log.error(f"❌ ReviewAnalyzer 초기화 실패: {e}")
+            self.review_analyzer = None
+        
+        if self.review_analyzer is not None:
+            return
+        
+        # 2. ReviewAnalyzer를 쓸 수 없을 때만 기존 경량 모델 로드 (백업용)
         try:
-            # 1. 기존 경량 모델 로드 (백업용)
             import joblib
-            model_path = 'final_svm_sentiment_model.pkl'
-            print(f"경량 감정 분석 모델 로드 시작: {model_path}")
+            model_path = settings.sentiment_pkl_path
+            log.info(f"경량 감정 분석 모델 로드 시작: {model_path}")
             
             self.sentiment_analyzer = joblib.load(model_path)
-            print(f"경량 감정 분석 모델 로드 완료: {model_path}")
-            print(f"모델 타입: {type(self.sentiment_analyzer)}")
-            
-            # 2. 새로운 ReviewAnalyzer 초기화 (GPT + pkl 하이브리드)
-            print("🚀 ReviewAnalyzer 초기화 시작...")
-            self.review_analyzer = ReviewAnalyzer()
-            print("✅ ReviewAnalyzer 초기화 완료!")
+            log.info(f"경량 감정 분석 모델 로드 완료: {model_path}")
+            log.debug("모델 타입", model_type=type(self.sentiment_analyzer).__name__)
             
         except Exception as e:
-            print(f"❌ 모델 로드 실패: {e}")
+            log.error(f"❌ 모델 로드 실패: {e}")
             self.sentiment_analyzer = None
-            self.review_analyzer = None
 
     def load_known_reviews(self):
-        """저장된 기존 리뷰 목록 로드"""
+        """저장된 기존 리뷰 목록 로드 (바이너리 파일이 없으면 이전 JSON 형식에서 옮겨 옴)"""
         try:
             if os.path.exists(self.DATA_FILE):
-                with open(self.DATA_FILE, 'r', encoding='utf-8') as f:
+                count = self.known_reviews.load(self.DATA_FILE)
+                log.info(f"기존 리뷰 {count}개 로드 완료")
+            elif os.path.exists(self.LEGACY_DATA_FILE):
+                with open(self.LEGACY_DATA_FILE, 'r', encoding='utf-8') as f:
                     data = json.load(f)
-                    self.known_reviews = set(data.get('reviews', []))
-                    print(f"기존 리뷰 {len(self.known_reviews)}개 로드 완료")
+                self.known_reviews.clear()
+                self.known_reviews.add_reviews(
+                    review if isinstance(review, dict) else {'article_no': review}
+                    for review in data.get('reviews', [])
+                )
+                self.save_known_reviews()
+                log.info(f"기존 리뷰 {len(self.known_reviews)}개를 이전 형식에서 옮김")
             else:
-                self.known_reviews = set()
-                print("새로운 모니터링 시작")
+                self.known_reviews.clear()
+                log.info("새로운 모니터링 시작")
         except Exception as e:
-            print(f"기존 리뷰 로드 오류: {e}")
-            self.known_reviews = set()
+            log.error(f"기존 리뷰 로드 오류: {e}")
+            self.known_reviews.clear()
 
     def save_known_reviews(self):
-        """현재 리뷰 목록 저장 (API용)"""
+        """이미 수집한 리뷰 키 저장 (보관 기간만큼의 고정 크기 바이너리)"""
         try:
-            with open(self.DATA_FILE, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'reviews': list(self.known_reviews),
-                    'last_updated': datetime.now().isoformat()
-                }, f, ensure_ascii=False, indent=2)
+            self.known_reviews.save(self.DATA_FILE)
         except Exception as e:
-            print(f"리뷰 저장 오류: {e}")
+            log.error(f"리뷰 저장 오류: {e}")
 
     def load_review_cache(self):
         """저장된 리뷰 캐시 로드"""
@@ -78,12 +133,15 @@ class ReviewService:
                 with open(self.REVIEW_CACHE_FILE, 'r', encoding='utf-8') as f:
                     data = json.load(f)
                     self.cached_reviews = data.get('reviews', [])
-                    print(f"리뷰 캐시 {len(self.cached_reviews)}개 로드 완료")
+                    log.info(f"리뷰 캐시 {len(self.cached_reviews)}개 로드 완료")
+            elif self.cached_reviews:
+                # 캐시 파일이 없는 새 인스턴스: 웜 스테이트 스냅샷에서 복원한 캐시 유지
+                log.info(f"스냅샷에서 복원한 리뷰 캐시 {len(self.cached_reviews)}개 사용")
             else:
                 self.cached_reviews = []
-                print("새로운 리뷰 캐시 시작")
+                log.info("새로운 리뷰 캐시 시작")
         except Exception as e:
-            print(f"리뷰 캐시 로드 오류: {e}")
+            log.error(f"리뷰 캐시 로드 오류: {e}")
             self.cached_reviews = []
 
     def save_review_cache(self):
@@ -95,83 +153,245 @@ class ReviewService:
                     'last_updated': datetime.now().isoformat(),
                     'count': len(self.cached_reviews)
                 }, f, ensure_ascii=False, indent=2)
-            print(f"리뷰 캐시 {len(self.cached_reviews)}개 저장 완료")
+            log.debug("리뷰 캐시 저장 완료", count=len(self.cached_reviews))
         except Exception as e:
-            print(f"리뷰 캐시 저장 오류: {e}")
+            log.error(f"리뷰 캐시 저장 오류: {e}")
+
+    def load_search_index(self):
+        """저장된 리뷰로 검색 인덱스 재구성"""
+        try:
+            count = self.search_index.load(self.SEARCH_INDEX_FILE)
+            log.info(f"리뷰 검색 인덱스 {count}개 로드 완료")
+        except Exception as e:
+            log.error(f"리뷰 검색 인덱스 로드 오류: {e}")
+
+    def save_search_index(self, filepath=None):
+        """검색 인덱스에 색인된 리뷰 저장"""
+        try:
+            self.search_index.save(filepath or self.SEARCH_INDEX_FILE)
+        except Exception as e:
+            log.error(f"리뷰 검색 인덱스 저장 오류: {e}")
+
+    def schedule_search_index_save(self):
+        """검색 인덱스 저장 예약 - SEARCH_INDEX_SAVE_DELAY_SECONDS 동안의 변경분을 모아 백그라운드 타이머에서 한 번 저장
+        
+        인덱스 전체(최대 SEARCH_INDEX_MAX_DOCUMENTS건)를 다시 쓰므로 수집할 때마다 웹훅/수집 스레드에서 저장하지 않습니다.
+        """
+        delay = settings.search_index_save_delay_seconds
+        if delay <= 0:
+            self.save_search_index()
+            return
+        with self._search_index_save_lock:
+            self._search_index_save_path = os.path.abspath(self.SEARCH_INDEX_FILE)
+            if self._search_index_save_timer is not None:
+                return
+            timer = threading.Timer(delay, self.flush_search_index)
+            timer.name = 'search-index-save'
+            timer.daemon = True
+            self._search_index_save_timer = timer
+            timer.start()
+
+    def flush_search_index(self):
+        """바뀐 내용이 있으면 검색 인덱스 저장 (예약 타이머, 프로세스 종료 시 호출)"""
+        with self._search_index_save_lock:
+            timer, self._search_index_save_timer = self._search_index_save_timer, None
+            filepath, self._search_index_save_path = self._search_index_save_path, None
+        if timer is not None and timer is not threading.current_thread():
+            timer.cancel()  # 직접 호출한 경우 예약된 저장은 취소 (작업 디렉토리를 지운 뒤 실행되지 않도록)
+        if self.search_index.dirty:
+            self.save_search_index(filepath)
+
+    def export_warm_state(self):
+        """신규 리뷰 비교 기준(리뷰 캐시)과 최근 분석 결과 (웜 스테이트 스냅샷용)"""
+        return {
+            'review_cache': list(self.cached_reviews),
+            'recent_reviews': self.search_index.recent(settings.warm_state_recent_reviews)
+        }
+
+    def restore_warm_state(self, state, age_seconds):
+        """스냅샷 복원 - 로컬 파일이나 처리 이력이 없는 새 인스턴스에서만 반영
+
+        리뷰 캐시는 오래될수록 그 사이 다른 인스턴스가 처리한 리뷰를 신규로 다시 판단하게 되므로
+        WARM_STATE_CURSOR_MAX_AGE_SECONDS 이내의 스냅샷만 사용합니다.
+        """
+        restored = {'review_cache': 0, 'recent_reviews': 0}
+        with self._cache_lock:
+            if (not self.cached_reviews and state.get('review_cache')
+                    and age_seconds <= settings.warm_state_cursor_max_age_seconds):
+                self.cached_reviews = list(state['review_cache'])[:10]
+                restored['review_cache'] = len(self.cached_reviews)
+        
+        recent_reviews = state.get('recent_reviews') or []
+        if recent_reviews and not len(self.search_index):
+            restored['recent_reviews'] = self.search_index.add_reviews(recent_reviews)
+            self.keyword_tracker.add_reviews(recent_reviews)
+        return restored
 
     def initialize_review_cache(self, review_api):
         """리뷰 캐시 초기화 - 최신 리뷰 10개로 캐시 설정"""
         if not review_api:
-            print("❌ Review API가 초기화되지 않았습니다.")
+            log.error("❌ Review API가 초기화되지 않았습니다.")
             return False
         
         try:
-            print("🔄 리뷰 캐시 초기화 중...")
+            log.info("🔄 리뷰 캐시 초기화 중...")
             latest_reviews = review_api.get_latest_reviews(limit=10)
             
             if latest_reviews:
                 self.cached_reviews = latest_reviews
                 self.save_review_cache()
-                print(f"✅ 리뷰 캐시 초기화 완료: {len(self.cached_reviews)}개")
+                log.info(f"✅ 리뷰 캐시 초기화 완료: {len(self.cached_reviews)}개")
                 return True
             else:
-                print("⚠️ 초기화할 리뷰가 없습니다.")
+                log.warning("⚠️ 초기화할 리뷰가 없습니다.")
                 return False
         except Exception as e:
-            print(f"❌ 리뷰 캐시 초기화 실패: {e}")
+            log.error(f"❌ 리뷰 캐시 초기화 실패: {e}")
             return False
 
-    def find_new_reviews(self, review_api):
-        """현재 최신 리뷰와 캐시 비교해서 신규 리뷰 찾기"""
+    def find_new_reviews(self, review_api, backlog=0):
+        """현재 최신 리뷰와 캐시 비교해서 신규 리뷰 찾기
+        
+        backlog는 진행 중인 수집에 합쳐진 웹훅 수(대략 그만큼 신규 리뷰가 더 있음)로, 그만큼 넓혀 조회합니다.
+        """
         if not review_api:
             return []
         
         try:
-            # 현재 최신 리뷰 10개 조회
-            current_reviews = review_api.get_latest_reviews(limit=10)
+            # 현재 최신 리뷰 10개 조회 (합쳐진 웹훅이 있으면 그만큼 더)
+            fetch_started_at = time.monotonic()
+            limit = min(self.MAX_FETCH_LIMIT, 10 + backlog)
+            current_reviews = review_api.get_latest_reviews(limit=limit)
             if not current_reviews:
                 return []
             
-            # 웹훅 기반 스마트 처리
-            if not self.cached_reviews:
-                # 캐시가 비어있으면 (컨테이너 재시작 후)
-                # 웹훅이 왔다는 건 신규 리뷰가 있다는 뜻이므로 최신 1개만 처리
-                new_reviews = current_reviews[:1]
-                print(f"🔄 컨테이너 재시작 후 웹훅 수신 - 최신 리뷰 1개 처리")
-            else:
-                # 캐시가 있으면 기존 로직으로 중복 체크
-                cached_article_nos = {str(review.get('article_no', '')) for review in self.cached_reviews}
+            # 캐시 비교와 갱신은 한 번에 (조회는 락 밖에서 동시에 수행)
+            with self._cache_lock:
+                # 나중에 시작한 조회가 먼저 캐시를 갱신했으면 이 조회 결과는 그보다 오래된 것이므로 비교하지 않음
+                # (최신 10개 밖으로 밀려나 캐시에서 빠진 리뷰를 신규로 다시 판단하는 중복 방지)
+                if fetch_started_at < self._cache_fetch_started_at:
+                    log.debug("⏭️ 더 최근 조회가 이미 반영됨 - 신규 리뷰 비교 생략")
+                    return []
+                self._cache_fetch_started_at = fetch_started_at
                 
-                new_reviews = []
-                for review in current_reviews:
-                    article_no = str(review.get('article_no', ''))
-                    if article_no and article_no not in cached_article_nos:
-                        new_reviews.append(review)
+                # 웹훅 기반 스마트 처리
+                if not self.cached_reviews:
+                    # 캐시가 비어있으면 (컨테이너 재시작 후)
+                    # 웹훅이 왔다는 건 신규 리뷰가 있다는 뜻이므로 최신 1개만 처리
+                    new_reviews = current_reviews[:1]
+                    log.info("🔄 컨테이너 재시작 후 웹훅 수신 - 최신 리뷰 1개 처리")
+                else:
+                    # 캐시가 있으면 기존 로직으로 중복 체크
+                    cached_article_nos = {str(review.get('article_no', '')) for review in self.cached_reviews}
+                
+                    new_reviews = []
+                    for review in current_reviews:
+                        article_no = str(review.get('article_no', ''))
+                        if article_no and article_no not in cached_article_nos:
+                            new_reviews.append(review)
+                    
+                    # 조회한 리뷰가 모두 신규면 직전 수집 이후 더 많이 쌓였을 수 있음 (웹훅이 몰려 수집이 합쳐진 경우 등)
+                    if new_reviews and len(new_reviews) == len(current_reviews) and limit < self.MAX_FETCH_LIMIT:
+                        log.info("📚 신규 리뷰가 조회 범위를 넘어 넓혀 조회", fetched=len(current_reviews))
+                        current_reviews = review_api.get_latest_reviews(limit=self.MAX_FETCH_LIMIT) or current_reviews
+                        limit = self.MAX_FETCH_LIMIT
+                    # 캐시(최신 10개)보다 넓게 조회하면 캐시에서 밀려난 예전 리뷰도 섞이므로 게시판별 마지막 글 번호로 판단
+                    if limit > 10:
+                        new_reviews = self._reviews_after_cache(current_reviews)
+                    CACHE_REQUESTS_TOTAL.inc(len(current_reviews) - len(new_reviews), cache='review_cache', result='hit')
+                    CACHE_REQUESTS_TOTAL.inc(len(new_reviews), cache='review_cache', result='miss')
             
-            if new_reviews:
-                print(f"🆕 신규 리뷰 {len(new_reviews)}개 발견!")
+                if new_reviews:
+                    log.info("🆕 신규 리뷰 발견", count=len(new_reviews))
                 
-                # 캐시 업데이트: 신규 리뷰 추가하고 최신 10개만 유지
-                all_reviews = new_reviews + self.cached_reviews
-                self.cached_reviews = all_reviews[:10]  # 최신 10개만 유지
-                self.save_review_cache()
+                    # 캐시 업데이트: 신규 리뷰 추가하고 최신 10개만 유지
+                    all_reviews = new_reviews + self.cached_reviews
+                    self.cached_reviews = all_reviews[:10]  # 최신 10개만 유지
+                    self.save_review_cache()
+                    
+                    # 보관 기간 안에 이미 수집한 리뷰는 다시 분석/알림하지 않음
+                    # (오래된 스냅샷에서 캐시를 복원했거나 재시작 직후 최신 리뷰를 신규로 판단한 경우)
+                    already_known = [review for review in new_reviews if review in self.known_reviews]
+                    if already_known:
+                        log.info("⏭️ 이미 수집한 리뷰 제외", count=len(already_known))
+                        new_reviews = [review for review in new_reviews if review not in self.known_reviews]
+                    self.known_reviews.add_reviews(new_reviews)
+                    if self.known_reviews.dirty:
+                        self.save_known_reviews()
                 
             return new_reviews
             
         except Exception as e:
-            print(f"신규 리뷰 찾기 오류: {e}")
+            log.error(f"신규 리뷰 찾기 오류: {e}")
             return []
 
-    def analyze_review(self, review_text, rating=None):
-        """단일 리뷰 감정 분석 (GPT+pkl 하이브리드)"""
+    def _reviews_after_cache(self, reviews):
+        """게시판별로 캐시에 있는 가장 큰 글 번호보다 큰 글만 반환 (캐시에 없는 게시판은 가장 오래된 캐시 리뷰 이후 글)"""
+        last_article_nos = {}
+        for review in self.cached_reviews:
+            try:
+                article_no = int(review.get('article_no'))
+            except (TypeError, ValueError):
+                continue
+            board_no = str(review.get('board_no'))
+            last_article_nos[board_no] = max(article_no, last_article_nos.get(board_no, article_no))
+        oldest_cached_date = min((review.get('created_date', '') for review in self.cached_reviews), default='')
+        
+        new_reviews = []
+        for review in reviews:
+            board_no = str(review.get('board_no'))
+            try:
+                article_no = int(review.get('article_no'))
+            except (TypeError, ValueError):
+                continue
+            if board_no in last_article_nos:
+                if article_no > last_article_nos[board_no]:
+                    new_reviews.append(review)
+            elif review.get('created_date', '') > oldest_cached_date:
+                new_reviews.append(review)
+        return new_reviews
+
+    def ingest_reviews(self, analyzed_reviews):
+        """분석이 끝난 신규 리뷰를 로컬 집계 구조에 반영"""
+        try:
+            added = self.keyword_tracker.add_reviews(analyzed_reviews)
+            if added:
+                log.debug("🔑 부정 키워드 추적기 반영", count=added)
+            
+            if self.index_reviews(analyzed_reviews):
+                self.schedule_search_index_save()
+        except Exception as e:
+            log.error(f"리뷰 반영 오류: {e}")
+
+    def index_reviews(self, analyzed_reviews):
+        """분석된 리뷰를 로컬 검색 인덱스에 반영"""
+        try:
+            return self.search_index.add_reviews(analyzed_reviews)
+        except Exception as e:
+            log.error(f"리뷰 색인 오류: {e}")
+            return 0
+
+    def search_reviews(self, keyword, limit=50, **filters):
+        """로컬 인덱스 기반 리뷰 검색 (카페24 API 호출 없음)"""
+        return self.search_index.search(keyword, limit=limit, **filters)
+
+    def get_negative_keywords(self, product_no=None, window_hours=None, top_n=10):
+        """상품별 상위 부정 키워드 조회 (리뷰 재스캔 없음)"""
+        window_seconds = int(window_hours * 3600) if window_hours else None
+        return self.keyword_tracker.top_keywords(product_no=product_no, window_seconds=window_seconds, top_n=top_n)
+
+    def analyze_review(self, review_text, rating=None, deadline_seconds=None, on_refined=None):
+        """단일 리뷰 감정 분석 (GPT+pkl 하이브리드, deadline_seconds를 넘기면 GPT 결과는 on_refined로 나중에 전달)"""
         try:
             # 모델 로드
             if self.review_analyzer is None and self.sentiment_analyzer is None:
-                self.load_model()
+                with stage('model_load'):
+                    self.load_model()
             
             # ReviewAnalyzer 우선 사용 (GPT 2차 분석 포함)
             if self.review_analyzer is not None:
-                return self.review_analyzer.analyze_single_review(review_text, rating)
+                return self.review_analyzer.analyze_single_review(review_text, rating, deadline_seconds=deadline_seconds,
+                                                                  on_refined=on_refined)
             
             # 폴백: 기존 pkl 모델 사용
             if self.sentiment_analyzer is None:
@@ -192,10 +412,6 @@ class ReviewService:
                     # 클래스 라벨 확인 (모델 학습 시 사용된 라벨)
                     classes = self.sentiment_analyzer.classes_ if hasattr(self.sentiment_analyzer, 'classes_') else ['negative', 'positive']
                     
-                    print(f"🔍 모델 클래스: {classes}")
-                    print(f"🔍 예측 결과: {predicted_class}")
-                    print(f"🔍 확률: {probabilities}")
-                    
                     # 알림 필요성 판단: negative와 neutral 모두 알림 대상
                     if predicted_class == 'negative':
                         is_negative = True
@@ -212,7 +428,7 @@ class ReviewService:
                         confidence = probabilities[max_prob_idx]
                         is_negative = max_prob_idx != list(classes).index('positive') if 'positive' in classes else True
                     
-                    print(f"🔍 경량 모델 결과: 예측={predicted_class}, 신뢰도={confidence:.3f}")
+                    log.debug("🔍 경량 모델 결과", predicted=predicted_class, confidence=round(float(confidence), 3), sample='pkl_prediction')
                     
                 elif hasattr(self.sentiment_analyzer, 'predict'):
                     # predict만 있는 경우
@@ -222,16 +438,14 @@ class ReviewService:
                     is_negative = predicted_class == 'negative' or predicted_class == 'neutral'
                     confidence = 0.8  # 기본값
                     
-                    print(f"🔍 경량 모델 결과 (predict only): 예측={predicted_class}")
+                    log.debug("🔍 경량 모델 결과 (predict only)", predicted=predicted_class, sample='pkl_prediction')
                     
                 else:
                     # 지원하지 않는 모델 형태
                     return {'is_negative': False, 'confidence': 0, 'error': '지원하지 않는 모델 형태입니다'}
                     
             except Exception as model_error:
-                print(f"모델 예측 오류: {model_error}")
-                import traceback
-                traceback.print_exc()
+                log.exception(f"모델 예측 오류: {model_error}")
                 return {'is_negative': False, 'confidence': 0, 'error': f'모델 예측 실패: {str(model_error)}'}
             
             # 라벨 설정
@@ -244,7 +458,7 @@ class ReviewService:
             else:
                 korean_label = '부정적' if is_negative else '긍정적'
             
-            print(f"🎯 최종 분류: {korean_label} (is_negative={is_negative}, confidence={confidence:.3f})")
+            log.debug("🎯 최종 분류", label=korean_label, is_negative=is_negative, confidence=round(float(confidence), 3), sample='pkl_final_label')
             
             return {
                 'is_negative': is_negative,
@@ -254,9 +468,7 @@ class ReviewService:
             }
             
         except Exception as e:
-            print(f"❌ 리뷰 분석 오류: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception(f"❌ 리뷰 분석 오류: {e}")
             return {'is_negative': False, 'confidence': 0, 'error': str(e)}
 
     def send_notification(self, new_reviews, negative_reviews):
@@ -309,8 +521,17 @@ class ReviewService:
         
         print("="*50 + "\n")
     
-    def analyze_reviews_batch(self, reviews):
-        """리뷰 목록 일괄 분석 (GPT+pkl 하이브리드)"""
+    def triage_reviews(self, reviews):
+        """리뷰별 처리 우선순위와 pkl 1차 분석 결과 ([{'priority', 'pkl_result'}], ReviewAnalyzer가 없으면 평점만으로 판단)"""
+        if self.review_analyzer is None and self.sentiment_analyzer is None:
+            with stage('model_load'):
+                self.load_model()
+        if self.review_analyzer is None:
+            return [{'priority': 1.0 if review.get('rating') in (1, 2) else 0.5, 'pkl_result': None} for review in reviews]
+        return self.review_analyzer.triage_reviews(reviews)
+
+    def analyze_reviews_batch(self, reviews, backfill=False, deadline_seconds=None, on_refined=None, pkl_results=None):
+        """리뷰 목록 일괄 분석 (GPT+pkl 하이브리드, backfill=True면 추론 프로세스 풀 사용, deadline_seconds는 analyze_review와 같음)"""
         # ReviewAnalyzer가 없으면 기존 방식으로 폴백
         if self.review_analyzer is None:
             analyzed_reviews = []
@@ -324,7 +545,41 @@ class ReviewService:
             return analyzed_reviews
         
         # ReviewAnalyzer 사용 (GPT 2차 분석 포함)
-        return self.review_analyzer.analyze_reviews_batch(reviews)
+        return self.review_analyzer.analyze_reviews_batch(reviews, backfill=backfill, deadline_seconds=deadline_seconds,
+                                                          on_refined=on_refined, pkl_results=pkl_results)
+
+    def backfill_reviews(self, review_api, days=30, max_reviews=None):
+        """최근 N일 리뷰를 모두 조회해 일괄 분석하고 부정 키워드 추적기/검색 인덱스에 반영 (새 인스턴스, 모델 교체 후 재집계용)
+        
+        배치가 커서 pkl 1차 분석은 추론 프로세스 풀(backfill=True)에서 수행합니다. 이미 반영된 리뷰는 다시 집계하지 않습니다.
+        """
+        max_reviews = min(max_reviews or settings.review_backfill_max_reviews, settings.review_backfill_max_reviews)
+        started_at = time.perf_counter()
+        
+        with stage('cafe24_fetch'):
+            reviews = review_api.get_reviews_since(days=days, max_reviews=max_reviews)
+        if not reviews:
+            return {'fetched': 0, 'analyzed': 0, 'negative': 0, 'indexed': 0, 'took_s': round(time.perf_counter() - started_at, 3)}
+        
+        if self.review_analyzer is None and self.sentiment_analyzer is None:
+            with stage('model_load'):
+                self.load_model()
+        with stage('analysis'):
+            analyzed_reviews = self.analyze_reviews_batch(reviews, backfill=True)
+        
+        indexed_before = len(self.search_index)
+        with stage('ingest'):
+            self.ingest_reviews(analyzed_reviews)
+        
+        summary = {
+            'fetched': len(reviews),
+            'analyzed': len(analyzed_reviews),
+            'negative': sum(1 for review in analyzed_reviews if review.get('is_negative')),
+            'indexed': len(self.search_index) - indexed_before,
+            'took_s': round(time.perf_counter() - started_at, 3)
+        }
+        log.info("📥 리뷰 백필 완료", days=days, **summary)
+        return summary
 
     def get_review_statistics(self, reviews):
         """리뷰 통계 정보 (경량 버전)"""
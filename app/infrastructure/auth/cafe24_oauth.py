@@ -1,20 +1,29 @@
-import requests
 import base64
 import json
 import os
 from urllib.parse import urlencode, parse_qs, urlparse
 from datetime import datetime, timedelta
 import secrets
+from config.settings import settings
+from app.shared.utils.metrics import CAFE24_TOKEN_REFRESHES_TOTAL
+from app.shared.utils.lazy_import import lazy_import
+
+requests = lazy_import('requests')
 
 class Cafe24OAuth:
     """카페24 OAuth 인증 관리 클래스"""
     
-    def __init__(self, client_id: str, client_secret: str, mall_id: str, redirect_uri: str):
+    def __init__(self, client_id: str, client_secret: str, mall_id: str, redirect_uri: str, base_url: str = None):
+        """
+        Args:
+            base_url: API 주소 재정의 (기본값: CAFE24_API_BASE_URL 환경변수, 없으면 실제 카페24 주소)
+        """
         self.client_id = client_id
         self.client_secret = client_secret
         self.mall_id = mall_id
         self.redirect_uri = redirect_uri
-        self.base_url = f"https://{mall_id}.cafe24api.com/api/v2"
+        base_url = base_url or settings.cafe24_api_base_url or "https://{mall_id}.cafe24api.com/api/v2"
+        self.base_url = base_url.replace('{mall_id}', str(mall_id)).rstrip('/')
         self.token_file = f"cafe24_tokens_{mall_id}.json"
         
     def get_authorization_url(self, scope: str = "mall.read_product,mall.read_category") -> tuple:
@@ -115,10 +124,12 @@ class Cafe24OAuth:
             
             # 토큰 저장
             self.save_tokens(token_data)
+            CAFE24_TOKEN_REFRESHES_TOTAL.inc(outcome='success')
             
             return token_data
             
         except requests.exceptions.RequestException as e:
+            CAFE24_TOKEN_REFRESHES_TOTAL.inc(outcome='failed')
             print(f"토큰 갱신 실패: {e}")
             if hasattr(e.response, 'text'):
                 print(f"응답 내용: {e.response.text}")
@@ -2,7 +2,14 @@
 API 관련 모듈
 """
 
-from .cafe24_reviews import Cafe24ReviewAPI
-from .review_analyzer import ReviewAnalyzer
+from .cafe24.cafe24_reviews import Cafe24ReviewAPI
 
-__all__ = ['Cafe24ReviewAPI', 'ReviewAnalyzer']
\ No newline at end of file
+__all__ = ['Cafe24ReviewAPI', 'ReviewAnalyzer']
+
+
+def __getattr__(name):
+    # ReviewAnalyzer는 numpy/모델 코드를 함께 import하므로 처음 사용할 때 로드 (콜드 스타트 단축)
+    if name == 'ReviewAnalyzer':
+        from .openai.review_analyzer import ReviewAnalyzer
+        return ReviewAnalyzer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
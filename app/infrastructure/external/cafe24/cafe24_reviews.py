@@ -2,10 +2,37 @@
 카페24 리뷰 API 클래스
 """
 
-import requests
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import time
+from config.settings import settings
+from app.shared.utils.metrics import normalize_endpoint, CAFE24_REQUEST_SECONDS, CAFE24_REQUESTS_TOTAL, CACHE_REQUESTS_TOTAL
+from app.shared.utils.timing import stage
+from app.shared.utils.circuit_breaker import circuit_breakers, CircuitOpenError
+from app.shared.utils.logger import get_logger
+from app.shared.utils.lazy_import import lazy_import
+
+requests = lazy_import('requests')
+log = get_logger(__name__)
+
+# 리뷰 게시판 목록 캐시 (API 주소 → (조회 시각, 게시판 목록))
+# 웹훅 지연 초기화 등으로 Review API 객체가 새로 만들어져도 공유하며, 웜 스테이트 스냅샷으로 저장/복원
+_review_boards_cache = {}
+
+
+def export_review_boards() -> Dict[str, List[Dict]]:
+    """캐시된 리뷰 게시판 목록 (웜 스테이트 스냅샷용)"""
+    return {base_url: list(boards) for base_url, (_, boards) in list(_review_boards_cache.items())}
+
+
+def restore_review_boards(boards_by_url: Dict[str, List[Dict]]) -> int:
+    """스냅샷의 리뷰 게시판 목록 복원. 복원 시점부터 캐시 시간 동안 사용하고 이후 다시 조회"""
+    restored = 0
+    for base_url, boards in (boards_by_url or {}).items():
+        if boards and base_url not in _review_boards_cache:
+            _review_boards_cache[base_url] = (time.monotonic(), list(boards))
+            restored += 1
+    return restored
 
 
 class Cafe24ReviewAPI:
@@ -18,7 +45,13 @@ class Cafe24ReviewAPI:
         """
         self.oauth = oauth_client
         self.base_url = oauth_client.base_url
-        self.rate_limit_delay = 0.5  # API 호출 간격 (초)
+        self.rate_limit_delay = settings.cafe24_rate_limit_delay  # API 호출 간격 (초)
+        self.max_retries = settings.cafe24_max_retries  # 429 응답 시 재시도 횟수
+        self.last_call_limit = None  # 마지막 응답의 X-Api-Call-Limit (예: "3/40")
+        self._next_call_at = 0.0  # 다음 호출 가능 시각 (time.monotonic 기준)
+        self.board_cache_seconds = settings.cafe24_board_cache_seconds  # 리뷰 게시판 목록 캐시 시간
+        self.request_timeout = settings.cafe24_request_timeout
+        self.breaker = circuit_breakers.get('cafe24', settings.cafe24_slow_call_seconds)
         
     def _get_headers(self) -> dict:
         """API 호출용 헤더 생성"""
@@ -30,25 +63,64 @@ class Cafe24ReviewAPI:
         }
     
     def _make_request(self, method: str, endpoint: str, **kwargs) -> dict:
-        """API 요청 공통 함수"""
+        """API 요청 공통 함수 (카페24 회로가 열려 있으면 요청 없이 CircuitOpenError)"""
         url = f"{self.base_url}/{endpoint}"
+        kwargs.setdefault('timeout', self.request_timeout)
         headers = self._get_headers()
+        if not self.breaker.allow_request():
+            log.warning("⚡ 카페24 회로 차단 중 - 요청 생략", method=method, endpoint=endpoint)
+            raise CircuitOpenError('cafe24', self.breaker.retry_after())
+        
+        # Rate limiting: 직전 응답 후 rate_limit_delay가 지나지 않았으면 남은 시간만 대기
+        # (응답마다 고정 대기하던 방식과 호출 간격은 같고, 마지막 호출 뒤에는 기다리지 않음)
+        wait = self._next_call_at - time.monotonic()
+        if wait > 0:
+            with stage('cafe24_rate_limit_wait'):
+                time.sleep(wait)
         
         try:
-            response = requests.request(method, url, headers=headers, **kwargs)
-            response.raise_for_status()
+            for attempt in range(self.max_retries + 1):
+                started_at = time.perf_counter()
+                try:
+                    with stage('cafe24_http'):
+                        response = requests.request(method, url, headers=headers, **kwargs)
+                except requests.exceptions.RequestException:
+                    self._record_request(method, endpoint, 'error', started_at)
+                    self.breaker.record_failure(time.perf_counter() - started_at)
+                    raise
+                self._record_request(method, endpoint, str(response.status_code), started_at)
+                # 5xx만 장애로 기록 (429/4xx는 카페24가 정상 응답한 것)
+                if response.status_code >= 500:
+                    self.breaker.record_failure(time.perf_counter() - started_at)
+                else:
+                    self.breaker.record_success(time.perf_counter() - started_at)
+                self.last_call_limit = response.headers.get('X-Api-Call-Limit', self.last_call_limit)
+                
+                # 호출 한도 초과 시 Retry-After 만큼 대기 후 재시도
+                if response.status_code == 429 and attempt < self.max_retries:
+                    retry_after = float(response.headers.get('Retry-After', 1) or 1)
+                    log.warning("⏳ 카페24 API 호출 한도 초과 - 재시도 대기", method=method, endpoint=endpoint, retry_after=retry_after, attempt=attempt + 1, max_retries=self.max_retries)
+                    with stage('cafe24_retry_wait'):
+                        time.sleep(retry_after)
+                    continue
+                break
             
-            # Rate limiting
-            time.sleep(self.rate_limit_delay)
+            self._next_call_at = time.monotonic() + self.rate_limit_delay
+            response.raise_for_status()
             
             return response.json()
             
         except requests.exceptions.RequestException as e:
-            print(f"API 요청 실패 [{method} {endpoint}]: {e}")
-            if hasattr(e, 'response') and e.response is not None:
-                print(f"응답 내용: {e.response.text}")
+            response_text = e.response.text[:500] if getattr(e, 'response', None) is not None else None
+            log.error(f"API 요청 실패 [{method} {endpoint}]: {e}", response=response_text)
             raise
     
+    def _record_request(self, method: str, endpoint: str, status: str, started_at: float):
+        """카페24 API 요청 시간/상태 메트릭 기록 (엔드포인트의 숫자 ID는 {id}로 묶음)"""
+        labels = {'method': method, 'endpoint': normalize_endpoint(endpoint), 'status': status}
+        CAFE24_REQUEST_SECONDS.observe(time.perf_counter() - started_at, **labels)
+        CAFE24_REQUESTS_TOTAL.inc(**labels)
+    
     def get_boards(self, board_type: str = None) -> List[Dict]:
         """
         게시판 목록 조회
@@ -66,8 +138,14 @@ class Cafe24ReviewAPI:
         result = self._make_request('GET', 'admin/boards', params=params)
         return result.get('boards', [])
     
-    def get_review_boards(self) -> List[Dict]:
-        """리뷰 게시판만 필터링하여 조회"""
+    def get_review_boards(self, refresh: bool = False) -> List[Dict]:
+        """리뷰 게시판만 필터링하여 조회 (게시판 목록은 거의 바뀌지 않으므로 board_cache_seconds 동안 캐시)"""
+        cached = _review_boards_cache.get(self.base_url)
+        if not refresh and cached is not None and time.monotonic() - cached[0] < self.board_cache_seconds:
+            CACHE_REQUESTS_TOTAL.inc(cache='review_boards', result='hit')
+            return list(cached[1])
+        CACHE_REQUESTS_TOTAL.inc(cache='review_boards', result='miss')
+        
         boards = self.get_boards()
         review_boards = []
         
@@ -75,8 +153,16 @@ class Cafe24ReviewAPI:
             board_name = board.get('board_name', '').lower()
             if any(keyword in board_name for keyword in ['review', '리뷰', '후기', '평가']):
                 review_boards.append(board)
-                
-        return review_boards
+        
+        # 빈 결과는 캐시하지 않음 (게시판 생성 직후 등 다음 호출에서 다시 조회)
+        if review_boards:
+            _review_boards_cache[self.base_url] = (time.monotonic(), review_boards)
+        return list(review_boards)
+    
+    def has_cached_review_boards(self) -> bool:
+        """유효한 리뷰 게시판 목록 캐시가 있는지 (스냅샷 복원 포함)"""
+        cached = _review_boards_cache.get(self.base_url)
+        return cached is not None and time.monotonic() - cached[0] < self.board_cache_seconds
     
     def get_board_articles(self, board_no: int, limit: int = 100, offset: int = 0, 
                           start_date: str = None, end_date: str = None) -> List[Dict]:
@@ -124,6 +210,41 @@ class Cafe24ReviewAPI:
         result = self._make_request('GET', f'admin/boards/{board_no}/articles/{article_no}', params=params)
         return result.get('article', {})
     
+    def get_products(self, limit: int = 100, offset: int = 0) -> List[Dict]:
+        """
+        상품 목록 조회
+        
+        Args:
+            limit: 조회할 상품 수
+            offset: 시작 위치
+            
+        Returns:
+            상품 목록
+        """
+        params = {
+            'limit': limit,
+            'offset': offset,
+            'fields': 'product_no,product_name,price,display,selling'
+        }
+        result = self._make_request('GET', 'admin/products', params=params)
+        return result.get('products', [])
+    
+    def get_product_info(self, product_no: int) -> Dict:
+        """
+        상품 상세 조회
+        
+        Args:
+            product_no: 상품 번호
+            
+        Returns:
+            상품 정보 (product_name 포함)
+        """
+        params = {
+            'fields': 'product_no,product_name,price'
+        }
+        result = self._make_request('GET', f'admin/products/{product_no}', params=params)
+        return result.get('product', {})
+    
     def get_product_reviews(self, product_no: int = None, limit: int = 100) -> List[Dict]:
         """
         특정 상품의 리뷰 수집
@@ -142,13 +263,13 @@ class Cafe24ReviewAPI:
             review_boards = self.get_review_boards()
             
             if not review_boards:
-                print("리뷰 게시판을 찾을 수 없습니다.")
+                log.warning("리뷰 게시판을 찾을 수 없습니다.")
                 return reviews
             
             # 각 리뷰 게시판에서 리뷰 수집
             for board in review_boards:
                 board_no = board['board_no']
-                print(f"게시판 '{board['board_name']}' (번호: {board_no})에서 리뷰 수집 중...")
+                log.debug("게시판 리뷰 수집 중", board_name=board['board_name'], board_no=board_no)
                 
                 # 게시글 목록 조회
                 articles = self.get_board_articles(board_no, limit=limit)
@@ -181,10 +302,10 @@ class Cafe24ReviewAPI:
                 if len(reviews) >= limit:
                     break
             
-            print(f"총 {len(reviews)}개의 리뷰를 수집했습니다.")
+            log.info("리뷰 수집 완료", count=len(reviews))
             
         except Exception as e:
-            print(f"리뷰 수집 중 오류 발생: {e}")
+            log.error(f"리뷰 수집 중 오류 발생: {e}")
         
         return reviews[:limit]
     
@@ -199,13 +320,7 @@ class Cafe24ReviewAPI:
         Returns:
             최신 리뷰 목록
         """
-        from datetime import datetime, timedelta
-        
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
-        
-        start_date_str = start_date.strftime('%Y-%m-%d')
-        end_date_str = end_date.strftime('%Y-%m-%d')
+        start_date_str, end_date_str = self._kst_date_range(days)
         
         reviews = []
         review_boards = self.get_review_boards()
@@ -220,29 +335,77 @@ class Cafe24ReviewAPI:
             )
             
             for article in articles:
-                # HTML 태그 정리
-                content = article.get('content', '').replace('<br>:', '\n').replace('<br>', '\n')
-                
-                review = {
-                    'board_no': board_no,
-                    'board_name': board['board_name'],
-                    'article_no': article['article_no'],
-                    'product_no': article.get('product_no'),
-                    'title': article.get('title', ''),
-                    'content': content,
-                    'writer': article.get('writer', ''),
-                    'rating': article.get('rating', 0),
-                    'created_date': article.get('created_date', ''),
-                    'view_count': article.get('view_count', 0)
-                }
-                
-                reviews.append(review)
+                reviews.append(self._article_to_review(board, article))
         
         # 날짜순 정렬 (최신순)
         reviews.sort(key=lambda x: x['created_date'], reverse=True)
         
         return reviews[:limit]
     
+    def get_reviews_since(self, days: int = 30, max_reviews: int = 2000, page_size: int = 100) -> List[Dict]:
+        """
+        최근 N일간의 리뷰를 게시판별로 페이지를 넘기며 모두 조회 (백필용)
+        
+        Args:
+            days: 조회할 일수
+            max_reviews: 최대 조회 수 (게시판 전체 합계)
+            page_size: 한 번에 조회할 게시글 수 (카페24 최대 100)
+            
+        Returns:
+            리뷰 목록 (최신순)
+        """
+        start_date_str, end_date_str = self._kst_date_range(days)
+        
+        reviews = []
+        for board in self.get_review_boards():
+            offset = 0
+            while len(reviews) < max_reviews:
+                articles = self.get_board_articles(
+                    board['board_no'],
+                    limit=page_size,
+                    offset=offset,
+                    start_date=start_date_str,
+                    end_date=end_date_str
+                )
+                reviews.extend(self._article_to_review(board, article) for article in articles)
+                if len(articles) < page_size:
+                    break
+                offset += page_size
+            log.debug("백필 게시판 조회 완료", board_no=board['board_no'], total=len(reviews))
+        
+        reviews.sort(key=lambda x: x['created_date'], reverse=True)
+        return reviews[:max_reviews]
+    
+    @staticmethod
+    def _kst_date_range(days: int):
+        """최근 N일 조회 기간 (시작일, 종료일) 문자열"""
+        from datetime import datetime, timedelta, timezone
+        
+        # 카페24 created_date는 KST 기준이므로 서버가 UTC여도 KST 날짜로 조회
+        # (UTC 15시~24시에는 KST 날짜가 하루 앞서 있어 방금 작성된 리뷰가 조회에서 빠짐)
+        end_date = datetime.now(timezone(timedelta(hours=9)))
+        start_date = end_date - timedelta(days=days)
+        return start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')
+    
+    @staticmethod
+    def _article_to_review(board: Dict, article: Dict) -> Dict:
+        """게시글 목록 항목 → 리뷰 데이터"""
+        # HTML 태그 정리
+        content = article.get('content', '').replace('<br>:', '\n').replace('<br>', '\n')
+        
+        return {
+            'board_no': board['board_no'],
+            'board_name': board['board_name'],
+            'article_no': article['article_no'],
+            'product_no': article.get('product_no'),
+            'title': article.get('title', ''),
+            'content': content,
+            'writer': article.get('writer', ''),
+            'rating': article.get('rating', 0),
+            'created_date': article.get('created_date', ''),
+            'view_count': article.get('view_count', 0)
+        }
+    
     def search_reviews(self, keyword: str, limit: int = 50) -> List[Dict]:
         """
         키워드로 리뷰 검색
@@ -292,7 +455,7 @@ class Cafe24ReviewAPI:
                     reviews.append(review)
                     
             except Exception as e:
-                print(f"게시판 {board_no} 검색 중 오류: {e}")
+                log.error(f"게시판 {board_no} 검색 중 오류: {e}")
                 continue
         
         return reviews[:limit]
\ No newline at end of file
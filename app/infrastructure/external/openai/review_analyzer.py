@@ -3,54 +3,246 @@
 """
 
 import os
-import pickle
 import json
 import warnings
-from typing import List, Dict, Any
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import List, Dict, Any, Callable, Optional
 import re
+import time
+import numpy as np
 from config.settings import settings
+from app.shared.utils.metrics import (
+    instrument, result_outcome, PKL_INFERENCE_SECONDS, GPT_REQUEST_SECONDS, GPT_REQUESTS_TOTAL,
+    GPT_REFINEMENTS_TOTAL, GPT_ROUTING_TOTAL, NEAR_DUPLICATE_REUSED_TOTAL
+)
+from app.shared.utils.circuit_breaker import circuit_breakers, OPEN
+from app.shared.utils.admission import admission_controller
+from app.shared.utils.timing import trace_operation, stage
+from app.shared.utils.logger import get_logger
+from app.infrastructure.ml.numpy_svm import NumpySvmModel
+from app.infrastructure.external.openai.routing_policy import create_routing_policy, detect_rating_conflict, LOW_MARGIN
+from app.infrastructure.ml.inference_pool import create_inference_pool, load_sentiment_model, predict_probabilities
+from app.infrastructure.ml.near_duplicate import create_near_duplicate_index
+from app.infrastructure.ml.prediction_cache import create_prediction_cache, model_version
 
 warnings.filterwarnings('ignore')
 
+log = get_logger(__name__)
+
+GPT_SENTIMENTS = ('positive', 'negative', 'neutral')
+
+# 묶음 2차 분석: 공통 지시문은 한 번만 보내고 리뷰는 JSON 목록으로 전달
+PACKED_SECOND_STAGE_PROMPT = """
+다음은 1차 AI 모델의 판단과 평점이 서로 모순되거나 1차 모델이 확신하지 못한 리뷰 {count}건입니다.
+정확한 판단을 위해 리뷰마다 재분석이 필요합니다.
+
+재분석 사유 (conflict):
+- negative_with_5stars: 5점을 받았지만 1차 모델은 부정으로 분류 → 반어법이나 아이러니 사용 여부, 전반적인 만족도와 추천 의도를 고려
+- positive_with_low_rating: 낮은 평점(1~3점)이지만 1차 모델은 긍정으로 분류 → 비꼬기나 간접적 불만 표현 여부, 낮은 평점의 이유가 내용에 반영되어 있는지 고려
+- low_margin: 1차 모델이 여러 감정 사이에서 확신하지 못함 → 칭찬과 불만이 섞였는지, 실제로 강조하는 내용이 무엇인지 고려
+
+모든 리뷰에 대해 평점(rating, 5점 만점)과 한국어의 미묘한 표현과 문맥을 함께 고려해주세요.
+
+리뷰 목록 (JSON):
+{reviews}
+
+각 리뷰를 다음 중 하나로 분류해주세요:
+- positive: 긍정적인 리뷰 (만족, 좋음, 추천 등)
+- negative: 부정적인 리뷰 (불만, 나쁨, 비추천 등)
+- neutral: 중립적인 리뷰 (단순 설명, 객관적 정보 등)
+
+리뷰마다 하나씩, id를 그대로 사용한 JSON 배열로만 답변해주세요:
+[
+    {{"id": "r1", "sentiment": "positive|negative|neutral", "confidence": 0.0~1.0, "reasoning": "분석 근거"}}
+]
+"""
+PACKED_MAX_TOKENS_BASE = 50
+PACKED_MAX_TOKENS_PER_REVIEW = 150
+
+_CODE_FENCE = re.compile(r'^```(?:json)?\s*|\s*```$')
+
+
+def parse_packed_verdicts(result_text: str):
+    """묶음 응답 → 판정 목록 (JSON 배열 또는 {"results": [...]}, 코드 블록 허용). 해석할 수 없으면 None"""
+    try:
+        data = json.loads(_CODE_FENCE.sub('', result_text.strip()))
+    except json.JSONDecodeError:
+        return None
+    if isinstance(data, dict):
+        data = data.get('results')
+    return data if isinstance(data, list) else None
+
+
+def _usage(response) -> Optional[Dict[str, int]]:
+    """응답의 토큰 사용량 (없으면 None)"""
+    usage = getattr(response, 'usage', None)
+    if usage is None:
+        return None
+    return {'prompt_tokens': getattr(usage, 'prompt_tokens', 0) or 0,
+            'completion_tokens': getattr(usage, 'completion_tokens', 0) or 0}
+
+
+def _fan_out(pack_future: Future, review_futures: Dict[int, Future]):
+    """묶음 2차 분석 결과 {리뷰 인덱스: 결과}를 리뷰별 Future로 나눔 (묶음 오류 시 모두 None)"""
+    try:
+        resolved = pack_future.result()
+    except Exception as e:
+        log.error(f"❌ 묶음 GPT 2차 분석 작업 오류: {e}")
+        resolved = {}
+    for i, review_future in review_futures.items():
+        review_future.set_result(resolved.get(i))
+
+
+def review_priority(pkl_result: Optional[Dict[str, Any]], rating: int = None) -> float:
+    """부정 리뷰일 가능성 (0~1, 클수록 먼저 분석/알림). pkl 결과가 없으면 평점만으로 판단"""
+    if rating in (1, 2):
+        return 1.0
+    if not pkl_result:
+        return 0.5
+    priority = pkl_result.get('negative_probability', 0.0)
+    if pkl_result.get('is_negative') or rating == 3:
+        priority = max(priority, 0.5)
+    return round(float(priority), 4)
+
+
+def is_valid_verdict(verdict: Dict[str, Any]) -> bool:
+    """판정 항목 검증: sentiment가 세 가지 중 하나이고 confidence가 0~1 숫자"""
+    if verdict.get('sentiment') not in GPT_SENTIMENTS:
+        return False
+    try:
+        confidence = float(verdict.get('confidence', 0.5))
+    except (TypeError, ValueError):
+        return False
+    return 0.0 <= confidence <= 1.0
+
 
 class ReviewAnalyzer:
     """리뷰 감정 분석 클래스 - GPT-4o-mini 우선, pkl/transformers 폴백"""
     
-    def __init__(self):
+    def __init__(self, enable_gpt: bool = True):
+        """
+        Args:
+            enable_gpt: False면 충돌이 감지되어도 GPT 2차 분석 없이 pkl 결과 사용
+        """
         self.openai_client = None
         self.pkl_model = None
+        self.pkl_backend = None  # 'numpy' 또는 'sklearn'
+        self.inference_pool = None  # 큰 배치용 프로세스 풀 (INFERENCE_POOL_*)
+        self.model_path = None  # 로드한 pkl/NumPy 모델 경로 (파일 변경 확인용)
+        self._model_checked_at = time.monotonic()
+        self._model_reload_lock = threading.Lock()
+        self.prediction_cache = create_prediction_cache(settings)  # 전처리한 텍스트별 pkl 예측 메모 (PKL_CACHE_*)
+        self.near_duplicates = create_near_duplicate_index(settings)  # 복사/템플릿 리뷰 분석 결과 재사용 (NEAR_DUPLICATE_*)
+        self.enable_gpt = enable_gpt
+        self.routing_policy = create_routing_policy(settings)  # GPT 2차 분석 여부 결정 (GPT_ROUTING_POLICY)
+        self.gpt_breaker = circuit_breakers.get('openai', settings.openai_slow_call_seconds)
+        self._refine_executor = None  # 마감 시간이 있는 GPT 2차 분석용 스레드 풀 (마감 후에도 백그라운드에서 계속)
+        self._refine_executor_lock = threading.Lock()
+        self._refinements_pending = 0  # 임시 결과를 반환하고 아직 on_refined까지 끝나지 않은 GPT 2차 분석 수
+        self._refinements_done = threading.Condition()
         self.load_models()
         
     def load_models(self):
         """감정 분석 모델 로드 - pkl만 (GPT는 필요시 로드)"""
         # pkl 모델만 먼저 로드
         self._load_pkl_model()
+        if self.pkl_model is not None:
+            model_path = settings.sentiment_numpy_model_path if self.pkl_backend == 'numpy' else settings.sentiment_pkl_path
+            self.model_path = model_path
+            self.prediction_cache.set_model_version(model_version(self.pkl_backend, model_path))
+            self.inference_pool = create_inference_pool(self.pkl_backend, model_path, settings)
+    
+    def reload_models_if_changed(self) -> bool:
+        """PKL_MODEL_RELOAD_CHECK_SECONDS마다 모델 파일(크기/수정 시각)을 확인해 바뀌었으면 다시 로드 (예측 메모도 초기화)
+        
+        배포 중 모델 파일만 교체해도 재시작 없이 새 모델로 분석하고, 이전 모델의 예측을 메모에서 쓰지 않습니다.
+        다시 로드에 실패하면(파일을 쓰는 중 등) 이전 모델을 계속 쓰고 다음 확인 때 다시 시도합니다.
+        """
+        interval = settings.pkl_model_reload_check_seconds
+        if self.pkl_model is None or interval <= 0:
+            return False
+        now = time.monotonic()
+        if now - self._model_checked_at < interval or not self._model_reload_lock.acquire(blocking=False):
+            return False
+        try:
+            self._model_checked_at = now
+            version = model_version(self.pkl_backend, self.model_path)
+            if version == self.prediction_cache.model_version:
+                return False
+            
+            try:
+                model = load_sentiment_model(self.pkl_backend, self.model_path)
+            except Exception as e:
+                log.warning(f"⚠️ 변경된 모델 다시 로드 실패 - 이전 모델 계속 사용: {e}", path=self.model_path)
+                return False
+            
+            previous_pool = self.inference_pool
+            self.pkl_model = model
+            self.prediction_cache.set_model_version(version)
+            self.inference_pool = create_inference_pool(self.pkl_backend, self.model_path, settings)
+            if previous_pool is not None:
+                previous_pool.shutdown()  # 진행 중인 배치는 풀 오류로 현재 프로세스에서 다시 추론
+            log.info("♻️ 모델 파일 변경 감지 - 감정 분석 모델 다시 로드", backend=self.pkl_backend, path=self.model_path)
+            return True
+        finally:
+            self._model_reload_lock.release()
     
     def _load_openai_client(self):
         """OpenAI 클라이언트 초기화"""
-        if settings.openai_api_key:
+        # 스탠드인 서버(OPENAI_BASE_URL)를 쓰는 경우 API 키 없이도 초기화
+        if settings.openai_api_key or settings.openai_base_url:
             try:
                 import openai
-                self.openai_client = openai.OpenAI(api_key=settings.openai_api_key)
-                print("✅ OpenAI GPT-4o-mini 클라이언트 초기화 완료")
+                self.openai_client = openai.OpenAI(
+                    api_key=settings.openai_api_key or 'standin',
+                    base_url=settings.openai_base_url or None,
+                    timeout=settings.openai_timeout,
+                    max_retries=settings.openai_max_retries
+                )
+                log.info("✅ OpenAI GPT-4o-mini 클라이언트 초기화 완료")
             except Exception as e:
-                print(f"⚠️ OpenAI 클라이언트 초기화 실패: {e}")
+                log.warning(f"⚠️ OpenAI 클라이언트 초기화 실패: {e}")
     
     def _load_pkl_model(self):
-        """pkl 감정 분석 모델 로드"""
-        model_path = "final_svm_sentiment_model.pkl"
+        """pkl 감정 분석 모델 로드 (SENTIMENT_BACKEND에 따라 NumPy 엔진 우선)"""
+        if settings.sentiment_backend in ('auto', 'numpy') and self._load_numpy_model():
+            return
+        
+        model_path = settings.sentiment_pkl_path
         
         if os.path.exists(model_path):
             try:
-                print(f"경량 감정 분석 모델 로드 시작: {model_path}")
-                with open(model_path, 'rb') as f:
-                    self.pkl_model = pickle.load(f)
-                print("✅ 경량 감정 분석 모델 로드 완료")
+                log.info(f"경량 감정 분석 모델 로드 시작: {model_path}")
+                # joblib 압축 포맷으로 저장된 모델이므로 pickle.load가 아닌 joblib.load 사용
+                import joblib
+                self.pkl_model = joblib.load(model_path)
+                self.pkl_backend = 'sklearn'
+                log.info("✅ 경량 감정 분석 모델 로드 완료", backend=self.pkl_backend)
             except Exception as e:
-                print(f"❌ 경량 모델 로드 실패: {e}")
+                log.error(f"❌ 경량 모델 로드 실패: {e}")
                 self.pkl_model = None
         else:
-            print(f"⚠️ 모델 파일을 찾을 수 없음: {model_path}")
+            log.warning(f"⚠️ 모델 파일을 찾을 수 없음: {model_path}")
+    
+    def _load_numpy_model(self) -> bool:
+        """NumPy로 내보낸 모델 로드 - sklearn import 없이 같은 결과 (npy 디렉토리는 읽기 전용 mmap)"""
+        model_path = settings.sentiment_numpy_model_path
+        if not os.path.exists(model_path):
+            if settings.sentiment_backend == 'numpy':
+                log.warning(f"⚠️ NumPy 모델 파일을 찾을 수 없어 sklearn 모델 사용: {model_path}")
+            return False
+        
+        try:
+            self.pkl_model = NumpySvmModel.load(model_path)
+            self.pkl_backend = 'numpy'
+            log.info("✅ 경량 감정 분석 모델 로드 완료", backend=self.pkl_backend, path=model_path,
+                     memory_mapped=self.pkl_model.memory_mapped)
+            return True
+        except Exception as e:
+            log.error(f"❌ NumPy 모델 로드 실패, sklearn 모델 사용: {e}")
+            self.pkl_model = None
+            return False
     
     
     def clean_text(self, text: str) -> str:
@@ -69,8 +261,79 @@ class ReviewAnalyzer:
         
         return text.strip()
     
-    def analyze_single_review(self, review_text: str, rating: int = None) -> Dict[str, Any]:
-        """단일 리뷰 감정 분석 - pkl 1차, 충돌 시 GPT 2차"""
+    def analyze_single_review(self, review_text: str, rating: int = None, pkl_result: Dict[str, Any] = None,
+                              gpt_result=None, deadline_seconds: float = None,
+                              on_refined: Callable[[Dict[str, Any]], Any] = None,
+                              deadline_at: float = None, escalation: str = None) -> Dict[str, Any]:
+        """단일 리뷰 감정 분석 - pkl 1차, 충돌 시 GPT 2차 (결과의 timings에 단계별 소요시간 포함)
+        
+        pkl_result를 넘기면 (일괄 분석에서 미리 계산한 1차 결과) pkl 추론을 다시 하지 않고,
+        gpt_result를 넘기면 (일괄 분석에서 여러 충돌 리뷰를 한 번에 재분석한 결과 또는 그 Future) GPT를 다시 호출하지 않습니다.
+        
+        deadline_seconds(또는 절대 시각 deadline_at, time.monotonic 기준)가 있으면 GPT 2차 분석을 그때까지만 기다리고,
+        늦으면 pkl 결과를 provisional=True로 바로 반환합니다. GPT 분석은 백그라운드에서 계속되며 끝나면
+        최종 결과(refined_from에 임시 결과 요약)로 on_refined를 호출합니다.
+        
+        escalation을 넘기면 (일괄 분석에서 미리 라우팅한 GPT 2차 분석 사유, 빈 문자열이면 pkl 결과 유지)
+        라우팅 정책을 다시 거치지 않습니다.
+        
+        미리 계산한 결과 없이 호출하면 유사 중복 리뷰 클러스터에 저장된 같은 평점의 결과를 재사용합니다 (결과에 cluster_id 포함).
+        """
+        if deadline_at is None and deadline_seconds is not None:
+            deadline_at = time.monotonic() + deadline_seconds
+        with trace_operation('analyze_single_review', rating=rating, text_length=len(review_text or '')) as trace:
+            duplicate = None
+            if pkl_result is None and gpt_result is None and escalation is None:
+                duplicate = self._match_duplicate(review_text)
+            result = self._reuse_duplicate_result(duplicate, rating)
+            if result is None:
+                if duplicate is not None:
+                    on_refined = self._remembering(duplicate, rating, on_refined)
+                result = self._analyze_single_review(review_text, rating, pkl_result, gpt_result, deadline_at, on_refined,
+                                                     escalation)
+                self._remember_result(duplicate, rating, result)
+        result['timings'] = trace.summary()
+        return result
+    
+    def _match_duplicate(self, review_text: str) -> Optional[Dict[str, Any]]:
+        """유사 중복 리뷰 클러스터 대응 (사용하지 않거나 텍스트가 없으면 None)"""
+        if self.near_duplicates is None or not review_text:
+            return None
+        with stage('near_duplicate'):
+            return self.near_duplicates.match(review_text)
+    
+    def _reuse_duplicate_result(self, duplicate: Optional[Dict[str, Any]], rating: int = None) -> Optional[Dict[str, Any]]:
+        """클러스터에 같은 평점의 분석 결과가 있으면 복사해 반환 (near_duplicate에 대응 방식 표시)"""
+        if duplicate is None:
+            return None
+        result = self.near_duplicates.cached_result(duplicate['cluster_id'], rating)
+        if result is None:
+            return None
+        NEAR_DUPLICATE_REUSED_TOTAL.inc()
+        result.update(cluster_id=duplicate['cluster_id'], near_duplicate=duplicate['match'],
+                      similarity=duplicate['similarity'])
+        return result
+    
+    def _remember_result(self, duplicate: Optional[Dict[str, Any]], rating: int, result: Dict[str, Any]):
+        """분석 결과에 클러스터 ID를 붙이고, 최종 결과면 클러스터에 저장"""
+        if duplicate is None:
+            return
+        result['cluster_id'] = duplicate['cluster_id']
+        self.near_duplicates.store_result(duplicate['cluster_id'], rating, result)
+    
+    def _remembering(self, duplicate: Dict[str, Any], rating: int,
+                     on_refined: Optional[Callable[[Dict[str, Any]], Any]]) -> Callable[[Dict[str, Any]], Any]:
+        """마감 후 끝난 GPT 2차 분석의 최종 결과도 클러스터에 저장하도록 on_refined를 감쌈"""
+        def remember_refined(final: Dict[str, Any]):
+            self._remember_result(duplicate, rating, final)
+            if on_refined:
+                return on_refined(final)
+        return remember_refined
+    
+    def _analyze_single_review(self, review_text: str, rating: int = None, pkl_result: Dict[str, Any] = None,
+                               gpt_result=None, deadline_at: float = None,
+                               on_refined: Callable[[Dict[str, Any]], Any] = None,
+                               escalation: str = None) -> Dict[str, Any]:
         if not review_text or not review_text.strip():
             return {
                 'is_negative': False,
@@ -82,7 +345,8 @@ class ReviewAnalyzer:
             }
         
         # 1차 분석: pkl 모델 사용
-        pkl_result = self._analyze_with_pkl(review_text)
+        if pkl_result is None:
+            pkl_result = self._analyze_with_pkl(review_text)
         if not pkl_result:
             return {
                 'is_negative': False,
@@ -93,46 +357,140 @@ class ReviewAnalyzer:
                 'error': 'pkl 모델 분석 실패'
             }
         
-        # 2차 분석: 판단과 평점이 모순되는 경우 GPT로 재검증
-        conflict_detected = False
-        conflict_type = ""
+        # 2차 분석: 라우팅 정책이 고른 리뷰(평점 모순, 확신 부족)만 GPT로 재검증 (예산/지연시간 SLO 초과 시 pkl 결과 유지)
+        conflict_type = escalation if escalation is not None else self.route(pkl_result, rating, review_text)
         
-        # Case 1: 부정 판단 + 5점 평점
-        if pkl_result.get('is_negative') and rating == 5:
-            conflict_detected = True
-            conflict_type = "negative_with_5stars"
-            print(f"🔄 충돌 감지: 부정 판단 + 5점 평점 → GPT 2차 분석 시작")
-        
-        # Case 2: 긍정 판단 + 낮은 평점 (1-3점)
-        elif pkl_result.get('is_positive') and rating in [1, 2, 3]:
-            conflict_detected = True
-            conflict_type = "positive_with_low_rating"
-            print(f"🔄 충돌 감지: 긍정 판단 + {rating}점 평점 → GPT 2차 분석 시작")
-        
-        if conflict_detected:
+        if conflict_type and self.enable_gpt and isinstance(gpt_result, dict):
+            log.debug("🎯 묶음 GPT 2차 분석 결과 사용", conflict_type=conflict_type)
+        elif conflict_type and self.enable_gpt and gpt_result is None:
+            if conflict_type == "negative_with_5stars":
+                log.info("🔄 충돌 감지: 부정 판단 + 5점 평점 → GPT 2차 분석 시작", conflict_type=conflict_type, rating=rating)
+            elif conflict_type == LOW_MARGIN:
+                log.info("🔄 1차 판단 확신 부족 → GPT 2차 분석 시작", conflict_type=conflict_type, margin=pkl_result.get('margin'))
+            else:
+                log.info("🔄 충돌 감지: 긍정 판단 + 낮은 평점 → GPT 2차 분석 시작", conflict_type=conflict_type, rating=rating)
+            
             # GPT 클라이언트가 없으면 이때 로드
             if self.openai_client is None:
-                print("🔄 GPT 클라이언트 초기화 중...")
-                self._load_openai_client()
+                log.info("🔄 GPT 클라이언트 초기화 중...")
+                with stage('gpt_client_init'):
+                    self._load_openai_client()
             
-            gpt_result = self._analyze_with_gpt(review_text, is_second_stage=True, conflict_type=conflict_type, rating=rating)
-            if gpt_result:
-                # GPT 결과를 우선 채택하되, pkl 결과도 기록
-                gpt_result['first_stage_result'] = pkl_result
-                gpt_result['conflict_resolved'] = True
-                gpt_result['conflict_type'] = conflict_type
-                print(f"🎯 GPT 2차 분석 완료: {gpt_result.get('label')} (1차: {pkl_result.get('label')} → 2차: {gpt_result.get('label')})")
-                return gpt_result
+            if deadline_at is None:
+                gpt_result = self._analyze_with_gpt(review_text, is_second_stage=True, conflict_type=conflict_type, rating=rating)
             else:
-                print(f"⚠️ GPT 2차 분석 실패, 1차 결과 유지")
+                gpt_result = self._get_refine_executor().submit(
+                    self._analyze_with_gpt, review_text, True, conflict_type, rating)
+        
+        if conflict_type and self.enable_gpt and isinstance(gpt_result, Future):
+            try:
+                with stage('gpt_wait'):
+                    gpt_result = gpt_result.result(
+                        timeout=None if deadline_at is None else max(0.0, deadline_at - time.monotonic()))
+            except FutureTimeoutError:
+                return self._provisional_result(pkl_result, conflict_type, gpt_result, on_refined)
+        
+        if conflict_type and self.enable_gpt:
+            return self._resolve_conflict(pkl_result, gpt_result, conflict_type)
+        
+        return pkl_result
+    
+    def _resolve_conflict(self, pkl_result: Dict[str, Any], gpt_result: Optional[Dict[str, Any]], conflict_type: str) -> Dict[str, Any]:
+        """GPT 2차 분석 결과가 있으면 채택(1차 결과 기록), 없으면 1차 결과 유지"""
+        if gpt_result:
+            # GPT 결과를 우선 채택하되, pkl 결과도 기록
+            gpt_result['first_stage_result'] = pkl_result
+            gpt_result['conflict_resolved'] = True
+            gpt_result['conflict_type'] = conflict_type
+            log.info("🎯 GPT 2차 분석 완료", first_stage=pkl_result.get('label'), second_stage=gpt_result.get('label'))
+            return gpt_result
         
+        log.warning("⚠️ GPT 2차 분석 실패, 1차 결과 유지", conflict_type=conflict_type)
         return pkl_result
     
+    def _provisional_result(self, pkl_result: Dict[str, Any], conflict_type: str, future: Future,
+                            on_refined: Callable[[Dict[str, Any]], Any] = None) -> Dict[str, Any]:
+        """마감 시간 안에 GPT 2차 분석이 끝나지 않음: pkl 결과를 임시로 반환하고 GPT 완료 시 on_refined 호출"""
+        log.info("⏱️ GPT 2차 분석 마감 시간 초과 - 1차 결과를 임시로 반환하고 백그라운드에서 계속",
+                 conflict_type=conflict_type, label=pkl_result.get('label'))
+        provisional = dict(pkl_result)
+        provisional.update({'provisional': True, 'conflict_type': conflict_type})
+        refined_from = {key: pkl_result.get(key) for key in ('sentiment', 'label', 'is_negative', 'confidence')}
+        
+        def finish(done_future: Future):
+            try:
+                self._finish_refinement(done_future, pkl_result, conflict_type, refined_from, on_refined)
+            finally:
+                with self._refinements_done:
+                    self._refinements_pending -= 1
+                    self._refinements_done.notify_all()
+        
+        with self._refinements_done:
+            self._refinements_pending += 1
+        future.add_done_callback(finish)
+        return provisional
+    
+    def _finish_refinement(self, future: Future, pkl_result: Dict[str, Any], conflict_type: str,
+                           refined_from: Dict[str, Any], on_refined: Callable[[Dict[str, Any]], Any] = None):
+        """백그라운드 GPT 2차 분석 완료: 최종 결과를 만들어 on_refined 호출"""
+        try:
+            gpt_result = future.result()
+        except Exception as e:
+            log.error(f"❌ 백그라운드 GPT 2차 분석 오류: {e}")
+            gpt_result = None
+        final = self._resolve_conflict(dict(pkl_result), gpt_result, conflict_type)
+        final['refined_from'] = refined_from
+        if not gpt_result:
+            outcome = 'failed'
+        elif final.get('sentiment') != refined_from['sentiment']:
+            outcome = 'label_changed'
+        else:
+            outcome = 'unchanged'
+        GPT_REFINEMENTS_TOTAL.inc(outcome=outcome)
+        log.info("🔁 백그라운드 GPT 2차 분석 완료", outcome=outcome,
+                 first_stage=refined_from['label'], second_stage=final.get('label'))
+        if on_refined:
+            try:
+                on_refined(final)
+            except Exception as e:
+                log.exception(f"❌ 2차 분석 결과 반영 오류: {e}")
+    
+    def wait_for_refinements(self, timeout: float = None) -> bool:
+        """백그라운드 GPT 2차 분석이 on_refined(후속 알림, 저장된 결과 갱신)까지 모두 끝날 때까지 대기. 시간 안에 끝나면 True"""
+        with self._refinements_done:
+            return self._refinements_done.wait_for(lambda: self._refinements_pending == 0, timeout)
+    
+    def _get_refine_executor(self) -> ThreadPoolExecutor:
+        with self._refine_executor_lock:
+            if self._refine_executor is None:
+                self._refine_executor = ThreadPoolExecutor(max_workers=settings.gpt_refine_workers,
+                                                           thread_name_prefix='gpt-refine')
+            return self._refine_executor
+    
+    def detect_conflict(self, pkl_result: Dict[str, Any], rating: int = None) -> str:
+        """pkl 판단과 평점의 모순 유형 반환 (모순이 없으면 빈 문자열)"""
+        return detect_rating_conflict(pkl_result, rating)
+    
+    def route(self, pkl_result: Dict[str, Any], rating: int = None, review_text: str = '') -> str:
+        """라우팅 정책에 따른 GPT 2차 분석 사유 (빈 문자열이면 pkl 결과 유지, 예산/SLO 초과 포함)"""
+        if not self.enable_gpt or not pkl_result:
+            return ""
+        if self.gpt_breaker.state == OPEN:
+            # OpenAI 회로가 열려 있으면 예산을 쓰지 않고 pkl 결과 유지
+            GPT_ROUTING_TOTAL.inc(decision='skipped_circuit_open')
+            return ""
+        if admission_controller.degraded:
+            # 웹훅이 몰린 저하 모드에서는 GPT 대기 없이 pkl 결과만 사용
+            GPT_ROUTING_TOTAL.inc(decision='skipped_degraded')
+            return ""
+        return self.routing_policy.decide(pkl_result, rating, review_text)
+    
     def _analyze_with_gpt(self, review_text: str, is_second_stage: bool = False, conflict_type: str = None, rating: int = None) -> Dict[str, Any]:
         """GPT-4o-mini를 이용한 감정 분석"""
-        if not self.openai_client:
+        if not self.openai_client or self._gpt_circuit_open(is_second_stage):
             return None
         
+        started_at = time.perf_counter()
         try:
             if is_second_stage:
                 if conflict_type == "negative_with_5stars":
@@ -182,6 +540,30 @@ JSON 형태로만 답변해주세요:
 - negative: 부정적인 리뷰 (불만, 나쁨, 비추천 등)  
 - neutral: 중립적인 리뷰 (단순 설명, 객관적 정보 등)
 
+JSON 형태로만 답변해주세요:
+{{
+    "sentiment": "positive|negative|neutral",
+    "confidence": 0.0~1.0,
+    "reasoning": "분석 근거"
+}}
+"""
+                else:
+                    rating_line = f"평점: {rating}/5점\n" if rating else ""
+                    prompt = f"""
+다음 리뷰는 1차 AI 모델이 감정을 확신하지 못해 재분석이 필요합니다.
+
+리뷰 내용: "{review_text}"
+{rating_line}
+다음을 고려하여 분석해주세요:
+1. 칭찬과 불만이 섞여 있는지
+2. 한국어의 미묘한 표현과 문맥
+3. 작성자가 실제로 강조하는 내용
+
+다음 중 하나로 분류해주세요:
+- positive: 긍정적인 리뷰 (만족, 좋음, 추천 등)
+- negative: 부정적인 리뷰 (불만, 나쁨, 비추천 등)  
+- neutral: 중립적인 리뷰 (단순 설명, 객관적 정보 등)
+
 JSON 형태로만 답변해주세요:
 {{
     "sentiment": "positive|negative|neutral",
@@ -208,58 +590,219 @@ JSON 형태로만 답변해주세요:
 }}
 """
             
-            response = self.openai_client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "당신은 한국어 리뷰 감정 분석 전문가입니다. JSON 형태로만 답변하세요."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=200,
-                temperature=0.1
-            )
+            with stage('gpt_request'):
+                response = self.openai_client.chat.completions.create(
+                    model="gpt-4o-mini",
+                    messages=[
+                        {"role": "system", "content": "당신은 한국어 리뷰 감정 분석 전문가입니다. JSON 형태로만 답변하세요."},
+                        {"role": "user", "content": prompt}
+                    ],
+                    max_tokens=200,
+                    temperature=0.1
+                )
             
             result_text = response.choices[0].message.content.strip()
             
             # JSON 파싱
             try:
                 gpt_result = json.loads(result_text)
-                is_negative = gpt_result.get('sentiment') == 'negative'
-                confidence = float(gpt_result.get('confidence', 0.5))
-                
-                # 3가지 카테고리 분류
-                sentiment = gpt_result.get('sentiment')
-                is_negative = (sentiment == 'negative')
-                is_positive = (sentiment == 'positive')
-                is_neutral = (sentiment == 'neutral')
-                
-                # 라벨 결정
-                if sentiment == 'negative':
-                    label = '부정적'
-                elif sentiment == 'positive':
-                    label = '긍정적'
-                else:
-                    label = '중립적'
-                
-                return {
-                    'is_negative': is_negative,
-                    'is_positive': is_positive,
-                    'is_neutral': is_neutral,
-                    'confidence': confidence,
-                    'label': label,
-                    'score': round(confidence * 100, 2),
-                    'method': 'gpt-4o-mini-2nd' if is_second_stage else 'gpt-4o-mini',
-                    'reasoning': gpt_result.get('reasoning', ''),
-                    'sentiment': sentiment,
-                    'original_result': gpt_result
-                }
+                result = self._gpt_result(gpt_result, is_second_stage)
+                self._record_gpt_call(started_at, is_second_stage, 'success', usage=_usage(response))
+                return result
             except json.JSONDecodeError:
-                print(f"❌ GPT-4o-mini JSON 파싱 실패: {result_text}")
+                log.error("❌ GPT-4o-mini JSON 파싱 실패", response_preview=result_text[:200])
+                self._record_gpt_call(started_at, is_second_stage, 'invalid_response', usage=_usage(response))
                 return None
                 
         except Exception as e:
-            print(f"❌ GPT-4o-mini 분석 실패: {e}")
+            log.error(f"❌ GPT-4o-mini 분석 실패: {e}")
+            self._record_gpt_call(started_at, is_second_stage, 'error')
             return None
     
+    def _gpt_result(self, gpt_result: Dict[str, Any], is_second_stage: bool) -> Dict[str, Any]:
+        """GPT 응답 JSON → 표준 분석 결과"""
+        confidence = float(gpt_result.get('confidence', 0.5))
+        
+        # 3가지 카테고리 분류
+        sentiment = gpt_result.get('sentiment')
+        is_negative = (sentiment == 'negative')
+        is_positive = (sentiment == 'positive')
+        is_neutral = (sentiment == 'neutral')
+        
+        # 라벨 결정
+        if sentiment == 'negative':
+            label = '부정적'
+        elif sentiment == 'positive':
+            label = '긍정적'
+        else:
+            label = '중립적'
+        
+        return {
+            'is_negative': is_negative,
+            'is_positive': is_positive,
+            'is_neutral': is_neutral,
+            'confidence': confidence,
+            'label': label,
+            'score': round(confidence * 100, 2),
+            'method': 'gpt-4o-mini-2nd' if is_second_stage else 'gpt-4o-mini',
+            'reasoning': gpt_result.get('reasoning', ''),
+            'sentiment': sentiment,
+            'original_result': gpt_result
+        }
+    
+    def _analyze_with_gpt_packed(self, items: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """충돌 리뷰 여러 건을 GPT 요청 한 번으로 2차 분석
+        
+        Args:
+            items: [{'id', 'text', 'rating', 'conflict_type'}, ...]
+        Returns:
+            {id: 분석 결과} - 형식 검증을 통과한 항목만 포함 (빠진 항목은 호출한 쪽에서 단건 재분석)
+        """
+        if not self.openai_client or not items or self._gpt_circuit_open(True, packed=True):
+            return {}
+        
+        reviews = [{'id': item['id'], 'rating': item['rating'], 'conflict': item['conflict_type'], 'text': item['text']}
+                   for item in items]
+        prompt = PACKED_SECOND_STAGE_PROMPT.format(
+            count=len(items), reviews=json.dumps(reviews, ensure_ascii=False))
+        
+        started_at = time.perf_counter()
+        try:
+            with stage('gpt_request'):
+                response = self.openai_client.chat.completions.create(
+                    model="gpt-4o-mini",
+                    messages=[
+                        {"role": "system", "content": "당신은 한국어 리뷰 감정 분석 전문가입니다. JSON 형태로만 답변하세요."},
+                        {"role": "user", "content": prompt}
+                    ],
+                    max_tokens=PACKED_MAX_TOKENS_BASE + PACKED_MAX_TOKENS_PER_REVIEW * len(items),
+                    temperature=0.1
+                )
+            result_text = response.choices[0].message.content.strip()
+        except Exception as e:
+            log.error(f"❌ GPT-4o-mini 묶음 분석 실패: {e}", reviews=len(items))
+            self._record_gpt_call(started_at, True, 'error', packed=True)
+            return {}
+        
+        verdicts = parse_packed_verdicts(result_text)
+        if verdicts is None:
+            log.error("❌ GPT-4o-mini 묶음 응답 JSON 파싱 실패", reviews=len(items), response_preview=result_text[:200])
+            self._record_gpt_call(started_at, True, 'invalid_response', packed=True, usage=_usage(response))
+            return {}
+        
+        expected_ids = {item['id'] for item in items}
+        results = {}
+        for verdict in verdicts:
+            item_id = str(verdict.get('id')) if isinstance(verdict, dict) else None
+            if item_id in expected_ids and item_id not in results and is_valid_verdict(verdict):
+                results[item_id] = self._gpt_result(verdict, is_second_stage=True)
+                results[item_id]['packed'] = True
+        
+        outcome = 'success' if len(results) == len(items) else ('partial' if results else 'invalid_response')
+        self._record_gpt_call(started_at, True, outcome, packed=True, usage=_usage(response))
+        if len(results) < len(items):
+            log.warning("⚠️ 묶음 GPT 응답 일부 항목 누락/형식 오류 - 해당 리뷰만 단건 재분석",
+                        reviews=len(items), valid=len(results))
+        return results
+    
+    def _resolve_conflicts_packed(self, review_texts: List[str], ratings: List[Any],
+                                  conflicts: List[tuple]) -> Dict[int, Dict[str, Any]]:
+        """일괄 분석의 충돌 리뷰를 GPT_PACK_SIZE건씩 묶어 2차 분석 ({리뷰 인덱스: GPT 결과})"""
+        pack_size = settings.gpt_pack_size
+        if not self.enable_gpt or pack_size < 2:
+            return {}
+        
+        if len(conflicts) < 2:
+            return {}
+        
+        if self.openai_client is None:
+            with stage('gpt_client_init'):
+                self._load_openai_client()
+        
+        resolved = {}
+        for start in range(0, len(conflicts), pack_size):
+            pack = conflicts[start:start + pack_size]
+            if len(pack) < 2:
+                break  # 남은 1건은 단건 분석
+            resolved.update(self._resolve_pack(pack, review_texts, ratings))
+        return resolved
+    
+    def _submit_conflict_resolution(self, review_texts: List[str], ratings: List[Any],
+                                    conflicts: List[tuple]) -> Dict[int, Future]:
+        """충돌 리뷰 2차 분석을 백그라운드로 시작 ({리뷰 인덱스: GPT 결과 Future}, 실패한 항목은 Future 안에서 단건 재분석)"""
+        if not self.enable_gpt or not conflicts:
+            return {}
+        
+        if self.openai_client is None:
+            with stage('gpt_client_init'):
+                self._load_openai_client()
+        
+        executor = self._get_refine_executor()
+        pack_size = max(1, settings.gpt_pack_size)
+        futures = {}
+        for start in range(0, len(conflicts), pack_size):
+            pack = conflicts[start:start + pack_size]
+            review_futures = {i: Future() for i, _ in pack}
+            futures.update(review_futures)
+            pack_future = executor.submit(self._resolve_pack, pack, review_texts, ratings, True)
+            pack_future.add_done_callback(lambda done, review_futures=review_futures: _fan_out(done, review_futures))
+        return futures
+    
+    def _find_conflicts(self, pkl_results: List[Dict[str, Any]], ratings: List[Any],
+                        review_texts: List[str], indices: List[int] = None) -> List[tuple]:
+        """라우팅 정책이 GPT 2차 분석을 허용한 리뷰 [(리뷰 인덱스, 사유)] (indices가 있으면 그 리뷰만)"""
+        conflicts = []
+        for i in (indices if indices is not None else range(len(pkl_results))):
+            pkl_result = pkl_results[i]
+            conflict_type = self.route(pkl_result, ratings[i], review_texts[i])
+            if conflict_type:
+                conflicts.append((i, conflict_type))
+        return conflicts
+    
+    def _resolve_pack(self, pack: List[tuple], review_texts: List[str], ratings: List[Any],
+                      single_fallback: bool = False) -> Dict[int, Dict[str, Any]]:
+        """충돌 리뷰 묶음 2차 분석 ({리뷰 인덱스: GPT 결과}). single_fallback이면 빠진 항목을 단건으로 재분석"""
+        resolved = {}
+        if len(pack) >= 2:
+            log.info("🔄 충돌 리뷰 묶음 GPT 2차 분석 시작", reviews=len(pack))
+            items = [{'id': f"r{n}", 'text': review_texts[i], 'rating': ratings[i], 'conflict_type': conflict_type}
+                     for n, (i, conflict_type) in enumerate(pack, start=1)]
+            verdicts = self._analyze_with_gpt_packed(items)
+            for item, (i, _) in zip(items, pack):
+                if item['id'] in verdicts:
+                    resolved[i] = verdicts[item['id']]
+        
+        if single_fallback:
+            for i, conflict_type in pack:
+                if i not in resolved:
+                    resolved[i] = self._analyze_with_gpt(review_texts[i], is_second_stage=True,
+                                                         conflict_type=conflict_type, rating=ratings[i])
+        return resolved
+    
+    def _gpt_circuit_open(self, is_second_stage: bool, packed: bool = False) -> bool:
+        """OpenAI 회로가 열려 있으면 호출하지 않고 True (호출한 쪽은 GPT 실패와 같이 pkl 결과 유지)"""
+        if self.gpt_breaker.allow_request():
+            return False
+        log.warning("⚡ OpenAI 회로 차단 중 - GPT 분석 생략", retry_after_s=round(self.gpt_breaker.retry_after(), 1))
+        stage = 'second_packed' if packed else ('second' if is_second_stage else 'first')
+        GPT_REQUESTS_TOTAL.inc(stage=stage, outcome='circuit_open')
+        return True
+    
+    def _record_gpt_call(self, started_at: float, is_second_stage: bool, outcome: str, packed: bool = False,
+                         usage: Dict[str, int] = None):
+        """GPT 호출 시간/결과 메트릭 기록 (묶음 2차 분석은 stage='second_packed'), 라우팅 정책에 지연시간/토큰 사용량,
+        회로 차단기에 성공/실패 전달 (응답은 왔지만 형식이 잘못된 경우는 OpenAI 장애가 아니므로 성공)"""
+        stage = 'second_packed' if packed else ('second' if is_second_stage else 'first')
+        duration = time.perf_counter() - started_at
+        self.routing_policy.observe_gpt_call(duration, usage)
+        if outcome == 'error':
+            self.gpt_breaker.record_failure(duration)
+        else:
+            self.gpt_breaker.record_success(duration)
+        GPT_REQUEST_SECONDS.observe(duration, stage=stage, outcome=outcome)
+        GPT_REQUESTS_TOTAL.inc(stage=stage, outcome=outcome)
+    
+    @instrument(PKL_INFERENCE_SECONDS, outcome=result_outcome)
     def _analyze_with_pkl(self, review_text: str) -> Dict[str, Any]:
         """pkl 모델을 이용한 감정 분석"""
         if not self.pkl_model:
@@ -267,85 +810,243 @@ JSON 형태로만 답변해주세요:
         
         try:
             # 텍스트 전처리
-            clean_text = self.clean_text(review_text)
+            with stage('clean_text'):
+                clean_text = self.clean_text(review_text)
             if not clean_text:
                 return None
             
-            # pkl 모델로 예측
-            prediction = self.pkl_model.predict([clean_text])[0]
-            probabilities = self.pkl_model.predict_proba([clean_text])[0]
-            confidence = probabilities[prediction]  # 예측된 클래스의 실제 확률
-            
-            # 예측 결과를 표준 형태로 변환
-            sentiment_map = {0: 'negative', 1: 'neutral', 2: 'positive'}
-            sentiment = sentiment_map.get(prediction, 'neutral')
+            # pkl 모델로 예측 (확률 최대 클래스 = 예측 클래스)
+            with stage('pkl_predict'):
+                probabilities = self._predict_cached([clean_text], self._predict_pkl_probabilities)[0]
+            return self._pkl_result(probabilities)
             
-            # 3가지 카테고리 분류
-            is_negative = (sentiment == 'negative')
-            is_positive = (sentiment == 'positive')
-            is_neutral = (sentiment == 'neutral')
-            
-            # 신뢰도를 백분율로 변환 (0~100% 범위로 제한)
-            confidence_percent = round(max(0.0, min(confidence * 100, 100.0)), 2)
-            
-            # 낮은 신뢰도 체크 (60% 이하)
-            low_confidence = confidence < 0.6
+        except Exception as e:
+            log.error(f"❌ pkl 모델 분석 실패: {e}")
+            return None
+    
+    def _analyze_with_pkl_batch(self, review_texts: List[str], backfill: bool = False) -> List[Dict[str, Any]]:
+        """여러 리뷰의 pkl 1차 분석을 한 번의 추론 호출로 수행 (리뷰별 결과는 _analyze_with_pkl과 동일, 실패/빈 텍스트는 None)
+        
+        배치가 크거나 백필이면 프로세스 풀에서 나눠 추론합니다.
+        """
+        results = [None] * len(review_texts)
+        if not self.pkl_model or not review_texts:
+            return results
+        
+        try:
+            with stage('clean_text'):
+                clean_texts = [self.clean_text(text) for text in review_texts]
+            targets = [i for i, text in enumerate(clean_texts) if text]
+            if not targets:
+                return results
             
-            # 라벨 결정
-            if low_confidence:
-                if sentiment == 'negative':
-                    label = "부정적 (확인 필요)"
-                elif sentiment == 'positive':
-                    label = "긍정적 (확인 필요)"
-                else:
-                    label = "중립적 (확인 필요)"
-            else:
-                if sentiment == 'negative':
-                    label = '부정적'
-                elif sentiment == 'positive':
-                    label = '긍정적'
-                else:
-                    label = '중립적'
+            started_at = time.perf_counter()
+            with stage('pkl_predict'):
+                probabilities = self._predict_cached(
+                    [clean_texts[i] for i in targets],
+                    lambda texts: self._predict_pkl_probabilities_batch(texts, backfill))
+            per_review_seconds = (time.perf_counter() - started_at) / len(targets)
             
-            return {
-                'is_negative': is_negative,
-                'is_positive': is_positive,
-                'is_neutral': is_neutral,
-                'sentiment': sentiment,
-                'confidence': confidence_percent,
-                'label': label,
-                'score': confidence_percent,
-                'method': 'pkl_model',
-                'original_prediction': prediction,
-                'low_confidence': low_confidence,
-                'confidence_raw': float(confidence)
-            }
+            for i, review_probabilities in zip(targets, probabilities):
+                results[i] = self._pkl_result(review_probabilities)
+                PKL_INFERENCE_SECONDS.observe(per_review_seconds, outcome=result_outcome(results[i], None))
+            return results
             
         except Exception as e:
-            print(f"❌ pkl 모델 분석 실패: {e}")
-            return None
+            log.error(f"❌ pkl 모델 일괄 분석 실패: {e}")
+            return [None] * len(review_texts)
+    
+    def _pkl_result(self, probabilities: np.ndarray) -> Dict[str, Any]:
+        """클래스별 확률 → 표준 분석 결과"""
+        predicted_index = int(np.argmax(probabilities))
+        classes = getattr(self.pkl_model, 'classes_', [0, 1, 2])
+        prediction = classes[predicted_index]
+        prediction = prediction.item() if hasattr(prediction, 'item') else prediction
+        confidence = probabilities[predicted_index]  # 예측된 클래스의 실제 확률
+        ranked = np.sort(probabilities)
+        margin = float(ranked[-1] - ranked[-2]) if len(ranked) > 1 else 1.0  # 상위 두 클래스 확률 차이
+        negative_index = next((i for i, label in enumerate(classes) if label in (0, 'negative')), None)
+        negative_probability = float(probabilities[negative_index]) if negative_index is not None else 0.0
+        
+        # 예측 결과를 표준 형태로 변환 (정수/문자열 라벨 모두 지원)
+        sentiment_map = {0: 'negative', 1: 'neutral', 2: 'positive'}
+        if isinstance(prediction, str):
+            sentiment = prediction if prediction in sentiment_map.values() else 'neutral'
+        else:
+            sentiment = sentiment_map.get(prediction, 'neutral')
+        
+        # 3가지 카테고리 분류
+        is_negative = (sentiment == 'negative')
+        is_positive = (sentiment == 'positive')
+        is_neutral = (sentiment == 'neutral')
+        
+        # 신뢰도를 백분율로 변환 (0~100% 범위로 제한)
+        confidence_percent = round(max(0.0, min(confidence * 100, 100.0)), 2)
+        
+        # 낮은 신뢰도 체크 (60% 이하)
+        low_confidence = confidence < 0.6
+        
+        # 라벨 결정
+        if low_confidence:
+            if sentiment == 'negative':
+                label = "부정적 (확인 필요)"
+            elif sentiment == 'positive':
+                label = "긍정적 (확인 필요)"
+            else:
+                label = "중립적 (확인 필요)"
+        else:
+            if sentiment == 'negative':
+                label = '부정적'
+            elif sentiment == 'positive':
+                label = '긍정적'
+            else:
+                label = '중립적'
+        
+        return {
+            'is_negative': is_negative,
+            'is_positive': is_positive,
+            'is_neutral': is_neutral,
+            'sentiment': sentiment,
+            'confidence': confidence_percent,
+            'label': label,
+            'score': confidence_percent,
+            'method': 'pkl_model',
+            'original_prediction': prediction,
+            'low_confidence': low_confidence,
+            'confidence_raw': float(confidence),
+            'margin': round(margin, 4),
+            'negative_probability': round(negative_probability, 4)
+        }
     
     
     
-    def analyze_reviews_batch(self, reviews: List[Dict]) -> List[Dict]:
-        """리뷰 목록 일괄 분석"""
+    def _predict_cached(self, texts: List[str], predict: Callable[[List[str]], np.ndarray]) -> List[np.ndarray]:
+        """예측 메모에 없는 텍스트만 (배치 안 중복은 한 번) predict로 추론하고 메모에 저장"""
+        self.reload_models_if_changed()
+        probabilities = self.prediction_cache.lookup(texts)
+        missing = list(dict.fromkeys(text for text, found in zip(texts, probabilities) if found is None))
+        if missing:
+            predicted = predict(missing)
+            self.prediction_cache.store(missing, predicted)
+            by_text = dict(zip(missing, predicted))
+            probabilities = [found if found is not None else by_text[text] for text, found in zip(texts, probabilities)]
+        return probabilities
+    
+    def _predict_pkl_probabilities(self, texts: List[str]) -> np.ndarray:
+        """pkl 모델 클래스별 확률 (현재 프로세스에서 추론)"""
+        return predict_probabilities(self.pkl_model, texts)
+    
+    def _predict_pkl_probabilities_batch(self, texts: List[str], backfill: bool = False) -> np.ndarray:
+        """큰 배치는 프로세스 풀에서 추론, 풀 오류 시 현재 프로세스에서 추론"""
+        pool = self.inference_pool
+        if pool is not None and pool.should_use(len(texts), backfill):
+            try:
+                with stage('inference_pool'):
+                    return pool.predict_probabilities(texts)
+            except Exception as e:
+                log.warning(f"⚠️ 추론 프로세스 풀 실패, 현재 프로세스에서 추론: {e}", batch_size=len(texts))
+        return self._predict_pkl_probabilities(texts)
+    
+    def analyze_reviews_batch(self, reviews: List[Dict], backfill: bool = False, deadline_seconds: float = None,
+                              on_refined: Callable[[Dict], Any] = None,
+                              pkl_results: List[Optional[Dict[str, Any]]] = None) -> List[Dict]:
+        """리뷰 목록 일괄 분석 (backfill=True면 배치 크기와 관계없이 추론 프로세스 풀 사용)
+        
+        deadline_seconds가 있으면 배치 전체의 GPT 2차 분석을 그 시간까지만 기다리고, 끝나지 않은 리뷰는
+        1차 결과(provisional=True)로 반환합니다. 해당 리뷰의 GPT 분석이 끝나면 원본 리뷰와 최종 결과를 합친
+        리뷰로 on_refined를 호출합니다. pkl_results가 있으면(triage_reviews 결과 등) 1차 분석을 다시 하지 않습니다.
+        """
+        with trace_operation('analyze_reviews_batch', reviews=len(reviews), backfill=backfill):
+            return self._analyze_reviews_batch(reviews, backfill, deadline_seconds, on_refined, pkl_results)
+    
+    @staticmethod
+    def _review_text(review: Dict) -> str:
+        if 'content' in review:
+            return review['content']
+        if 'text' in review:
+            return review['text']
+        if 'title' in review:
+            return review['title']
+        return ""
+    
+    def triage_reviews(self, reviews: List[Dict]) -> List[Dict[str, Any]]:
+        """리뷰별 처리 우선순위 (GPT 없이 pkl 1차 분석과 평점만 사용)
+        
+        priority는 review_priority 값(0~1, 클수록 부정일 가능성이 높음)이고, pkl_result는 analyze_reviews_batch에
+        그대로 넘겨 1차 분석을 다시 하지 않습니다.
+        """
+        with trace_operation('triage_reviews', reviews=len(reviews)):
+            pkl_results = self._analyze_with_pkl_batch([self._review_text(review) for review in reviews])
+            triaged = []
+            for review, pkl_result in zip(reviews, pkl_results):
+                triaged.append({'priority': review_priority(pkl_result, review.get('rating')), 'pkl_result': pkl_result})
+            return triaged
+    
+    def _analyze_reviews_batch(self, reviews: List[Dict], backfill: bool = False, deadline_seconds: float = None,
+                               on_refined: Callable[[Dict], Any] = None,
+                               pkl_results: List[Optional[Dict[str, Any]]] = None) -> List[Dict]:
+        deadline_at = time.monotonic() + deadline_seconds if deadline_seconds is not None else None
         analyzed_reviews = []
         
+        # 리뷰 텍스트 추출
+        review_texts = [self._review_text(review) for review in reviews]
+        ratings = [review.get('rating', 0) for review in reviews]
+        
+        # 유사 중복 리뷰: 클러스터에 같은 평점의 결과가 있으면 재사용하고, 배치 안에서 같은 클러스터+평점은 처음 리뷰만 분석
+        duplicates = [self._match_duplicate(text) for text in review_texts]
+        reused = {}
+        leaders = {}
+        followers = {}
+        for i, duplicate in enumerate(duplicates):
+            result = self._reuse_duplicate_result(duplicate, ratings[i])
+            if result is not None:
+                reused[i] = result
+            elif duplicate is not None:
+                leader = leaders.setdefault((duplicate['cluster_id'], ratings[i]), i)
+                if leader != i:
+                    followers[i] = leader
+        targets = [i for i in range(len(reviews)) if i not in reused and i not in followers]
+        target_set = set(targets)
+        
+        # 1차 분석은 분석할 리뷰 전체를 한 번에 추론
+        if pkl_results is None or len(pkl_results) != len(reviews):
+            pkl_results = [None] * len(reviews)
+            target_results = self._analyze_with_pkl_batch([review_texts[i] for i in targets], backfill)
+            for i, pkl_result in zip(targets, target_results):
+                pkl_results[i] = pkl_result
+        
+        # 충돌 리뷰는 여러 건을 GPT 요청 한 번으로 재분석 (실패한 항목만 단건으로 GPT 재호출)
+        # 마감 시간이 있으면 백그라운드에서 시작하고 아래에서 남은 시간만큼만 기다림
+        conflicts = self._find_conflicts(pkl_results, ratings, review_texts, targets)
+        escalations = dict(conflicts)
+        if deadline_at is None:
+            gpt_results = self._resolve_conflicts_packed(review_texts, ratings, conflicts)
+        else:
+            gpt_results = self._submit_conflict_resolution(review_texts, ratings, conflicts)
+        
         for i, review in enumerate(reviews):
-            print(f"리뷰 분석 진행 중... ({i+1}/{len(reviews)})")
-            
-            # 리뷰 텍스트 추출
-            review_text = ""
-            if 'content' in review:
-                review_text = review['content']
-            elif 'text' in review:
-                review_text = review['text']
-            elif 'title' in review:
-                review_text = review['title']
+            log.debug("리뷰 분석 진행 중", index=i + 1, total=len(reviews), sample='batch_progress')
             
             # 감정 분석 수행 (평점 정보 포함)
-            rating = review.get('rating', 0)
-            analysis_result = self.analyze_single_review(review_text, rating)
+            rating = ratings[i]
+            analysis_result = reused.get(i)
+            if analysis_result is None and i in followers:
+                analysis_result = self._reuse_duplicate_result(duplicates[i], rating)
+            if analysis_result is None:
+                refined_callback = None
+                if on_refined:
+                    refined_callback = lambda final, review=review: on_refined(dict(review, **final))
+                if duplicates[i] is not None:
+                    refined_callback = self._remembering(duplicates[i], rating, refined_callback)
+                pkl_result = pkl_results[i]
+                if i not in target_set:
+                    # 같은 클러스터의 첫 리뷰가 임시 결과뿐이면 이 리뷰는 따로 분석 (pkl 1차 분석은 이때 수행)
+                    pkl_result = self._analyze_with_pkl(review_texts[i])
+                analysis_result = self.analyze_single_review(review_texts[i], rating, pkl_result=pkl_result,
+                                                             gpt_result=gpt_results.get(i), deadline_at=deadline_at,
+                                                             on_refined=refined_callback,
+                                                             escalation=escalations.get(i, "") if i in target_set else None)
+                self._remember_result(duplicates[i], rating, analysis_result)
             
             # 원본 리뷰 데이터와 분석 결과 병합
             analyzed_review = review.copy()
@@ -421,7 +1122,7 @@ JSON 형태로만 답변해주세요:
                     daily_sentiments[date_key]['positive'] += 1
                     
             except Exception as e:
-                print(f"날짜 파싱 오류: {e}")
+                log.warning(f"날짜 파싱 오류: {e}")
                 continue
         
         # 정렬된 결과 반환
@@ -434,30 +1135,19 @@ JSON 형태로만 답변해주세요:
         }
     
     def find_common_negative_keywords(self, negative_reviews: List[Dict], top_n: int = 10) -> List[Dict]:
-        """부정 리뷰에서 자주 나오는 키워드 추출"""
+        """부정 리뷰에서 자주 나오는 키워드 추출
+
+        주어진 목록을 한 번에 집계합니다. 수집 중 누적 집계는
+        NegativeKeywordTracker(app.shared.utils.keyword_tracker)를 사용하세요.
+        """
         from collections import Counter
-        import re
-        
-        # 한국어 불용어
-        stopwords = {
-            '이', '그', '저', '것', '들', '의', '가', '을', '를', '에', '와', '과', 
-            '도', '만', '하다', '되다', '있다', '없다', '같다', '다', '네', '요',
-            '입니다', '습니다', '해요', '해서', '하고', '해도', '했다', '됩니다'
-        }
+        from app.shared.utils.keyword_tracker import extract_keywords
         
         all_words = []
         
         for review in negative_reviews:
             text = review.get('content', '') + ' ' + review.get('title', '')
-            
-            # 한글만 추출
-            words = re.findall(r'[가-힣]+', text)
-            
-            # 불용어 제거 및 길이 필터링
-            filtered_words = [word for word in words 
-                            if len(word) >= 2 and word not in stopwords]
-            
-            all_words.extend(filtered_words)
+            all_words.extend(extract_keywords(text))
         
         # 빈도 계산
         word_counts = Counter(all_words)
@@ -0,0 +1,271 @@
+"""
+GPT 2차 분석 라우팅 정책
+
+pkl 1차 결과를 GPT로 재분석할지(에스컬레이션) 결정합니다. 정책은 GPT_ROUTING_POLICY로 고르며,
+등록된 이름('conflict', 'adaptive') 또는 '모듈:클래스' 경로로 직접 만든 정책을 지정할 수 있습니다.
+정책 클래스는 from_settings(settings)로 생성하고 decide()가 에스컬레이션 사유(빈 문자열이면 pkl 결과 유지)를 반환합니다.
+
+- conflict: 기존 규칙 (pkl 판단과 평점이 모순될 때만, 예산 제한 없음)
+- adaptive: 평점 모순 + pkl 확신 부족(상위 두 클래스 확률 차이가 GPT_LOW_MARGIN_THRESHOLD 미만이고
+  텍스트가 GPT_MIN_TEXT_LENGTH자 이상). 시간당 GPT 예산(GPT_HOURLY_BUDGET, 재분석 리뷰 수)과
+  지연시간 SLO(GPT_LATENCY_SLO_SECONDS)를 넘으면 pkl 결과만 사용합니다.
+  확신 부족 리뷰는 예산의 GPT_LOW_MARGIN_BUDGET_SHARE까지만 사용해 나머지는 평점 모순 리뷰 몫으로 남깁니다.
+"""
+
+import importlib
+import threading
+import time
+from collections import deque
+from typing import Dict, Any, Optional
+
+from app.shared.utils.logger import get_logger
+from app.shared.utils.metrics import GPT_ROUTING_TOTAL, GPT_TOKENS_TOTAL
+
+log = get_logger(__name__)
+
+LOW_MARGIN = 'low_margin'
+
+
+def detect_rating_conflict(pkl_result: Dict[str, Any], rating: int = None) -> str:
+    """pkl 판단과 평점의 모순 유형 반환 (모순이 없으면 빈 문자열)"""
+    # Case 1: 부정 판단 + 5점 평점
+    if pkl_result.get('is_negative') and rating == 5:
+        return "negative_with_5stars"
+
+    # Case 2: 긍정 판단 + 낮은 평점 (1-3점)
+    if pkl_result.get('is_positive') and rating in [1, 2, 3]:
+        return "positive_with_low_rating"
+
+    return ""
+
+
+class GptBudget:
+    """최근 1시간 동안 GPT로 재분석한 리뷰 수 제한 (limit=0이면 무제한) + 토큰 사용량 집계"""
+
+    WINDOW_SECONDS = 3600.0
+
+    def __init__(self, hourly_limit: int = 0):
+        self.hourly_limit = hourly_limit
+        self._spent = deque()  # 재분석 허용 시각 (time.monotonic 기준)
+        self._tokens = deque()  # (시각, 토큰 수)
+        self._lock = threading.Lock()
+        self.rejected = 0
+
+    def _expire(self, now: float):
+        while self._spent and now - self._spent[0] > self.WINDOW_SECONDS:
+            self._spent.popleft()
+        while self._tokens and now - self._tokens[0][0] > self.WINDOW_SECONDS:
+            self._tokens.popleft()
+
+    def used(self) -> int:
+        with self._lock:
+            self._expire(time.monotonic())
+            return len(self._spent)
+
+    def usage_ratio(self) -> float:
+        """예산 대비 최근 1시간 사용 비율 (무제한이면 0)"""
+        if not self.hourly_limit:
+            return 0.0
+        return self.used() / self.hourly_limit
+
+    def try_spend(self) -> bool:
+        """예산이 남아 있으면 1건 사용하고 True"""
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            if self.hourly_limit and len(self._spent) >= self.hourly_limit:
+                self.rejected += 1
+                return False
+            self._spent.append(now)
+            return True
+
+    def record_tokens(self, usage: Optional[Dict[str, int]]):
+        if not usage:
+            return
+        prompt_tokens = int(usage.get('prompt_tokens') or 0)
+        completion_tokens = int(usage.get('completion_tokens') or 0)
+        GPT_TOKENS_TOTAL.inc(prompt_tokens, kind='prompt')
+        GPT_TOKENS_TOTAL.inc(completion_tokens, kind='completion')
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            self._tokens.append((now, prompt_tokens + completion_tokens))
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            self._expire(time.monotonic())
+            used = len(self._spent)
+            tokens = sum(tokens for _, tokens in self._tokens)
+        return {
+            'hourly_limit': self.hourly_limit,
+            'used_last_hour': used,
+            'remaining': max(0, self.hourly_limit - used) if self.hourly_limit else None,
+            'tokens_last_hour': tokens,
+            'rejected': self.rejected
+        }
+
+
+class LatencySlo:
+    """최근 GPT 호출 지연시간의 p90이 SLO를 넘으면 cooldown_seconds 동안 GPT 재분석 중단 (slo_seconds=0이면 사용 안 함)"""
+
+    def __init__(self, slo_seconds: float = 0.0, window: int = 20, min_samples: int = 5,
+                 cooldown_seconds: float = 60.0):
+        self.slo_seconds = slo_seconds
+        self.window = window
+        self.min_samples = min_samples
+        self.cooldown_seconds = cooldown_seconds
+        self._samples = deque(maxlen=window)
+        self._degraded_until = 0.0
+        self._lock = threading.Lock()
+        self.trips = 0
+
+    @property
+    def degraded(self) -> bool:
+        return time.monotonic() < self._degraded_until
+
+    def observe(self, seconds: float):
+        if not self.slo_seconds:
+            return
+        with self._lock:
+            self._samples.append(seconds)
+            if len(self._samples) < self.min_samples:
+                return
+            ordered = sorted(self._samples)
+            p90 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.9))]
+            if p90 <= self.slo_seconds:
+                return
+            # 중단 후에는 새로 쌓인 표본으로 다시 판단
+            self._samples.clear()
+            self._degraded_until = time.monotonic() + self.cooldown_seconds
+            self.trips += 1
+        log.warning("⚠️ GPT 지연시간 SLO 초과 - 일정 시간 pkl 결과만 사용",
+                    p90_s=round(p90, 3), slo_s=self.slo_seconds, cooldown_s=self.cooldown_seconds)
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            samples = list(self._samples)
+        return {
+            'slo_seconds': self.slo_seconds,
+            'degraded': self.degraded,
+            'degraded_for_s': round(max(0.0, self._degraded_until - time.monotonic()), 1),
+            'recent_samples': len(samples),
+            'trips': self.trips
+        }
+
+
+class RoutingPolicy:
+    """GPT 2차 분석 라우팅 정책 기본 클래스"""
+
+    name = 'base'
+
+    @classmethod
+    def from_settings(cls, settings):
+        return cls()
+
+    def decide(self, pkl_result: Dict[str, Any], rating: int = None, review_text: str = '') -> str:
+        """에스컬레이션 사유 (빈 문자열이면 pkl 결과 유지)"""
+        raise NotImplementedError
+
+    def observe_gpt_call(self, seconds: float, usage: Optional[Dict[str, int]] = None):
+        """GPT 호출 1회 완료 (지연시간, 토큰 사용량)"""
+
+    def status(self) -> Dict[str, Any]:
+        return {'policy': self.name}
+
+
+class ConflictRoutingPolicy(RoutingPolicy):
+    """평점 모순만 에스컬레이션 (예산 제한 없음)"""
+
+    name = 'conflict'
+
+    def decide(self, pkl_result: Dict[str, Any], rating: int = None, review_text: str = '') -> str:
+        reason = detect_rating_conflict(pkl_result, rating)
+        GPT_ROUTING_TOTAL.inc(decision=reason or 'pkl_only')
+        return reason
+
+
+class AdaptiveRoutingPolicy(RoutingPolicy):
+    """평점 모순 + pkl 확신 부족을 예산과 지연시간 SLO 안에서 에스컬레이션"""
+
+    name = 'adaptive'
+
+    def __init__(self, budget: GptBudget, latency_slo: LatencySlo, low_margin_threshold: float = 0.1,
+                 min_text_length: int = 10, low_margin_budget_share: float = 0.5):
+        self.budget = budget
+        self.latency_slo = latency_slo
+        self.low_margin_threshold = low_margin_threshold
+        self.min_text_length = min_text_length
+        self.low_margin_budget_share = low_margin_budget_share
+
+    @classmethod
+    def from_settings(cls, settings):
+        return cls(GptBudget(settings.gpt_hourly_budget),
+                   LatencySlo(settings.gpt_latency_slo_seconds,
+                              cooldown_seconds=settings.gpt_latency_slo_cooldown_seconds),
+                   low_margin_threshold=settings.gpt_low_margin_threshold,
+                   min_text_length=settings.gpt_min_text_length,
+                   low_margin_budget_share=settings.gpt_low_margin_budget_share)
+
+    def decide(self, pkl_result: Dict[str, Any], rating: int = None, review_text: str = '') -> str:
+        reason = detect_rating_conflict(pkl_result, rating)
+        if not reason and self._is_low_margin(pkl_result, review_text):
+            reason = LOW_MARGIN
+        if not reason:
+            GPT_ROUTING_TOTAL.inc(decision='pkl_only')
+            return ""
+
+        if self.latency_slo.degraded:
+            GPT_ROUTING_TOTAL.inc(decision='skipped_latency')
+            return ""
+        if reason == LOW_MARGIN and self.budget.hourly_limit and \
+                self.budget.usage_ratio() >= self.low_margin_budget_share:
+            GPT_ROUTING_TOTAL.inc(decision='skipped_budget')
+            return ""
+        if not self.budget.try_spend():
+            GPT_ROUTING_TOTAL.inc(decision='skipped_budget')
+            return ""
+
+        GPT_ROUTING_TOTAL.inc(decision=reason)
+        return reason
+
+    def _is_low_margin(self, pkl_result: Dict[str, Any], review_text: str) -> bool:
+        margin = pkl_result.get('margin')
+        if margin is None or margin >= self.low_margin_threshold:
+            return False
+        return len((review_text or '').strip()) >= self.min_text_length
+
+    def observe_gpt_call(self, seconds: float, usage: Optional[Dict[str, int]] = None):
+        self.budget.record_tokens(usage)
+        self.latency_slo.observe(seconds)
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            'policy': self.name,
+            'low_margin_threshold': self.low_margin_threshold,
+            'min_text_length': self.min_text_length,
+            'low_margin_budget_share': self.low_margin_budget_share,
+            'budget': self.budget.status(),
+            'latency_slo': self.latency_slo.status()
+        }
+
+
+ROUTING_POLICIES = {
+    ConflictRoutingPolicy.name: ConflictRoutingPolicy,
+    AdaptiveRoutingPolicy.name: AdaptiveRoutingPolicy
+}
+
+
+def create_routing_policy(settings) -> RoutingPolicy:
+    """GPT_ROUTING_POLICY 이름 또는 '모듈:클래스' 경로로 정책 생성 (알 수 없는 이름이면 adaptive)"""
+    name = settings.gpt_routing_policy
+    policy_class = ROUTING_POLICIES.get(name)
+    if policy_class is None and ':' in name:
+        module_name, class_name = name.split(':', 1)
+        try:
+            policy_class = getattr(importlib.import_module(module_name), class_name)
+        except (ImportError, AttributeError) as e:
+            log.error(f"❌ GPT 라우팅 정책 로드 실패: {name} ({e})")
+    if policy_class is None:
+        log.warning("⚠️ 알 수 없는 GPT 라우팅 정책 - adaptive 사용", policy=name)
+        policy_class = AdaptiveRoutingPolicy
+    return policy_class.from_settings(settings)
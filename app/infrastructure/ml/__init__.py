@@ -0,0 +1,7 @@
+"""
+머신러닝 추론 모듈
+"""
+
+from .numpy_svm import NumpySvmModel
+
+__all__ = ['NumpySvmModel']
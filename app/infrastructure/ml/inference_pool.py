@@ -0,0 +1,187 @@
+"""
+pkl 1차 분석 프로세스 풀 추론
+
+TF-IDF 변환과 SVM 점수 계산은 파이썬 코드와 NumPy 연산이 섞여 있어 요청 스레드에서 실행하면 큰 배치 동안
+GIL을 잡고 있고, 같은 gunicorn 워커의 다른 요청 스레드(웹훅 등)가 그동안 멈춥니다. 배치가
+INFERENCE_POOL_MIN_BATCH 이상이거나 백필(backfill=True)인 경우 텍스트를 워커 수만큼 나눠 자식 프로세스에서
+추론하고, 요청 스레드는 결과를 기다리는 동안 GIL을 놓습니다.
+
+- 각 자식 프로세스는 시작할 때 모델을 한 번 로드합니다 (npy 디렉토리는 mmap이라 물리 메모리는 공유).
+- 풀은 처음 필요할 때 만들고 프로세스(gunicorn 워커)마다 따로 둡니다. 포크 이후 상속된 풀은 쓰지 않습니다.
+- 자식 프로세스가 죽는 등 풀 오류가 나면 풀을 정리하고 예외를 올려, 호출한 쪽이 현재 프로세스에서 추론합니다.
+  오류 후 retry_after_seconds 동안은 풀을 쓰지 않습니다 (모델 경로 오류 등으로 매 배치마다 프로세스를 띄우지 않도록).
+- 기본 시작 방식은 spawn (스레드가 있는 프로세스에서 fork하지 않음). `python app.py`로 실행하면 spawn된
+  자식이 app.py를 다시 import하므로 풀 시작이 느려집니다 (gunicorn 실행에는 해당 없음).
+"""
+
+import atexit
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional
+
+import numpy as np
+
+from app.shared.utils.logger import get_logger
+from app.shared.utils.metrics import INFERENCE_POOL_BATCH_SECONDS
+
+log = get_logger(__name__)
+
+# 자식 프로세스에서 사용할 모델 (initializer에서 로드)
+_worker_model = None
+
+
+def load_sentiment_model(backend: str, path: str):
+    """추론 엔진별 모델 로드 ('numpy': NumpySvmModel, 'sklearn': joblib pkl)"""
+    if backend == 'numpy':
+        from app.infrastructure.ml.numpy_svm import NumpySvmModel
+        return NumpySvmModel.load(path)
+    import joblib
+    return joblib.load(path)
+
+
+def predict_probabilities(model, texts: List[str]) -> np.ndarray:
+    """클래스별 확률
+
+    LinearSVC처럼 predict_proba가 없는 모델은 decision_function 점수에 softmax를 적용합니다.
+    """
+    if hasattr(model, 'predict_proba'):
+        return np.asarray(model.predict_proba(texts))
+
+    scores = np.atleast_2d(np.asarray(model.decision_function(texts), dtype=np.float64))
+    scores = scores - scores.max(axis=1, keepdims=True)
+    exp_scores = np.exp(scores)
+    return exp_scores / exp_scores.sum(axis=1, keepdims=True)
+
+
+def _init_worker(backend: str, path: str):
+    global _worker_model
+    _worker_model = load_sentiment_model(backend, path)
+
+
+def _predict_shard(texts: List[str]) -> np.ndarray:
+    return predict_probabilities(_worker_model, texts)
+
+
+def _worker_pid(_) -> int:
+    return os.getpid()
+
+
+class InferencePool:
+    """모델을 미리 로드한 자식 프로세스들에 큰 배치를 나눠 추론"""
+
+    def __init__(self, backend: str, model_path: str, workers: int, min_batch: int = 512,
+                 min_shard: int = 64, start_method: str = 'spawn', retry_after_seconds: float = 60.0):
+        self.backend = backend
+        self.model_path = model_path
+        self.workers = workers
+        self.min_batch = min_batch
+        self.min_shard = min_shard
+        self.start_method = start_method
+        self.retry_after_seconds = retry_after_seconds
+        self._retry_at = 0.0  # 오류 후 다시 사용할 수 있는 시각 (time.monotonic 기준)
+        self._executor = None
+        self._pid = None
+        self._lock = threading.Lock()
+        self.batches = 0
+        self.failures = 0
+
+    @property
+    def enabled(self) -> bool:
+        """워커가 2개 이상일 때만 사용 (1코어 인스턴스에서는 프로세스 간 전송 비용만 늘어남)"""
+        return self.workers >= 2
+
+    def should_use(self, batch_size: int, backfill: bool = False) -> bool:
+        if not self.enabled or time.monotonic() < self._retry_at:
+            return False
+        return batch_size >= (self.min_shard * 2 if backfill else self.min_batch)
+
+    def start(self) -> ProcessPoolExecutor:
+        """풀 생성 후 모든 워커가 모델을 로드할 때까지 대기 (프로세스당 한 번)"""
+        with self._lock:
+            if self._executor is not None and self._pid == os.getpid():
+                return self._executor
+
+            started_at = time.perf_counter()
+            executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context(self.start_method),
+                initializer=_init_worker,
+                initargs=(self.backend, self.model_path)
+            )
+            try:
+                worker_pids = set(executor.map(_worker_pid, range(self.workers * 2)))
+            except Exception:
+                # 모델 로드 실패 등으로 워커가 뜨지 못함
+                executor.shutdown(wait=False, cancel_futures=True)
+                self.failures += 1
+                self._retry_at = time.monotonic() + self.retry_after_seconds
+                raise
+            self._executor = executor
+            self._pid = os.getpid()
+            log.info("✅ 추론 프로세스 풀 시작", workers=self.workers, started_workers=len(worker_pids),
+                     backend=self.backend, start_method=self.start_method,
+                     duration_ms=round((time.perf_counter() - started_at) * 1000, 1))
+        atexit.register(self.shutdown)
+        return executor
+
+    def predict_probabilities(self, texts: List[str]) -> np.ndarray:
+        """텍스트를 워커 수만큼 나눠 추론하고 원래 순서대로 합침"""
+        executor = self.start()
+        shard_count = max(1, min(self.workers, len(texts) // self.min_shard))
+        shard_size = -(-len(texts) // shard_count)
+        shards = [texts[i:i + shard_size] for i in range(0, len(texts), shard_size)]
+
+        started_at = time.perf_counter()
+        try:
+            probabilities = np.concatenate(list(executor.map(_predict_shard, shards)))
+        except Exception:
+            INFERENCE_POOL_BATCH_SECONDS.observe(time.perf_counter() - started_at, outcome='error')
+            self.failures += 1
+            self._retry_at = time.monotonic() + self.retry_after_seconds
+            self.shutdown()
+            raise
+        INFERENCE_POOL_BATCH_SECONDS.observe(time.perf_counter() - started_at, outcome='success')
+        self.batches += 1
+        return probabilities
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+            owned = self._pid == os.getpid()
+        if executor is not None and owned:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            'enabled': self.enabled,
+            'running': self._executor is not None and self._pid == os.getpid(),
+            'workers': self.workers,
+            'min_batch': self.min_batch,
+            'start_method': self.start_method,
+            'backend': self.backend,
+            'batches': self.batches,
+            'failures': self.failures
+        }
+
+
+def resolve_workers(configured: int) -> int:
+    """INFERENCE_POOL_WORKERS=0이면 사용 가능한 CPU 수"""
+    if configured > 0:
+        return configured
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def create_inference_pool(backend: str, model_path: str, settings) -> Optional[InferencePool]:
+    """설정에 따라 풀 객체 생성 (실제 프로세스는 첫 사용 시 시작). 사용하지 않으면 None"""
+    if not settings.inference_pool_enabled:
+        return None
+    pool = InferencePool(backend, model_path, resolve_workers(settings.inference_pool_workers),
+                         min_batch=settings.inference_pool_min_batch,
+                         start_method=settings.inference_pool_start_method)
+    return pool if pool.enabled else None
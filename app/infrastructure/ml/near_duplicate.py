@@ -0,0 +1,240 @@
+"""
+유사 중복 리뷰 클러스터 (정규화 해시 + MinHash/LSH)
+
+복사해 붙인 리뷰나 "배송 빨라요 좋아요" 같은 템플릿 리뷰가 계속 들어올 때마다 전처리·pkl 추론·GPT 2차 분석을
+다시 하지 않도록, 들어온 리뷰를 기존 클러스터에 대응시키고 그 클러스터의 분석 결과를 재사용합니다.
+
+- 1단계: 정규화(소문자, 문장부호/공백 제거)한 텍스트가 완전히 같으면 같은 클러스터
+- 2단계: 글자 shingle_size-gram 집합의 MinHash 서명을 bands개 구간으로 나눈 LSH 버킷에서 후보를 찾고,
+  서명으로 추정한 Jaccard 유사도가 threshold 이상인 가장 비슷한 클러스터에 대응
+- 분석 결과는 평점별로 저장합니다 (같은 텍스트라도 평점에 따라 GPT 2차 분석 여부와 결과가 달라지므로)
+- 클러스터는 max_clusters개까지 최근 사용 순으로 유지합니다.
+- 한 클러스터에 burst_window_seconds 안에 burst_threshold건 이상 들어오면 리뷰 스팸 몰림으로 기록합니다.
+"""
+
+import hashlib
+import re
+import threading
+import time
+import zlib
+from collections import OrderedDict, deque
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+from app.shared.utils.logger import get_logger
+from app.shared.utils.metrics import NEAR_DUPLICATE_TOTAL, REVIEW_SPAM_BURSTS_TOTAL
+
+log = get_logger(__name__)
+
+# 정규화: 한글/영문/숫자만 남김 (공백, 문장부호, 이모지, HTML 태그 제거)
+_HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+_NON_WORD_PATTERN = re.compile(r'[^0-9a-z가-힣]+')
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_MAX_EXACT_HASHES = 64  # 클러스터마다 기억하는 변형 텍스트 해시 수 (조금씩 바꾼 스팸이 몰려도 색인이 커지지 않도록)
+
+# 분석 결과 중 리뷰마다 다른 값이라 저장하지 않는 필드
+_PER_REVIEW_FIELDS = ('timings', 'provisional', 'refined_from', 'cluster_id', 'near_duplicate', 'similarity')
+
+
+def normalize_text(text: str) -> str:
+    if not text:
+        return ""
+    return _NON_WORD_PATTERN.sub('', _HTML_TAG_PATTERN.sub('', text).lower())
+
+
+def is_reusable(result: Optional[Dict[str, Any]]) -> bool:
+    """다른 리뷰에 재사용할 수 있는 최종 분석 결과인지 (분석 실패/임시 결과 제외)"""
+    return bool(result) and not result.get('provisional') and not result.get('error') \
+        and result.get('method') not in ('none', 'pkl_failed')
+
+
+class _Cluster:
+    __slots__ = ('cluster_id', 'exact_hashes', 'signature', 'band_keys', 'results', 'size', 'recent', 'burst_logged_at')
+
+    def __init__(self, cluster_id: str, exact_hash: str, signature, band_keys):
+        self.cluster_id = cluster_id
+        self.exact_hashes = [exact_hash]  # 이 클러스터에 대응된 정규화 텍스트 해시
+        self.signature = signature
+        self.band_keys = band_keys
+        self.results = {}  # 평점 -> 분석 결과
+        self.size = 0
+        self.recent = deque()  # 최근 대응 시각 (스팸 몰림 판단)
+        self.burst_logged_at = 0.0
+
+
+class NearDuplicateIndex:
+    """유사 중복 리뷰 클러스터 색인 (스레드 안전)"""
+
+    def __init__(self, threshold: float = 0.85, num_perm: int = 64, bands: int = 16, shingle_size: int = 3,
+                 max_clusters: int = 5000, burst_window_seconds: float = 600.0, burst_threshold: int = 5,
+                 seed: int = 1):
+        if num_perm % bands:
+            raise ValueError('num_perm은 bands의 배수여야 합니다')
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.max_clusters = max(1, max_clusters)
+        self.burst_window_seconds = burst_window_seconds
+        self.burst_threshold = burst_threshold
+        # (a * x + b) mod p 해시 함수 num_perm개. a, b, x가 모두 32비트라 uint64에서 넘치지 않음
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, _MAX_HASH, size=(num_perm, 1), dtype=np.uint64)
+        self._b = rng.randint(0, _MAX_HASH, size=(num_perm, 1), dtype=np.uint64)
+        self._clusters = OrderedDict()  # 클러스터 ID -> _Cluster (최근 사용 순)
+        self._exact = {}  # 정규화 텍스트 해시 -> 클러스터 ID
+        self._bands = {}  # (구간 번호, 구간 서명) -> 클러스터 ID set
+        self._lock = threading.Lock()
+        self.matches = {'exact': 0, 'similar': 0, 'new': 0}
+        self.reused = 0
+        self.bursts = 0
+
+    def signature(self, normalized: str) -> Optional[np.ndarray]:
+        """글자 shingle 집합의 MinHash 서명 (shingle을 만들 수 없을 만큼 짧으면 None)"""
+        if len(normalized) < self.shingle_size:
+            return None
+        shingles = {normalized[i:i + self.shingle_size] for i in range(len(normalized) - self.shingle_size + 1)}
+        hashes = np.fromiter((zlib.crc32(shingle.encode('utf-8')) for shingle in shingles),
+                             dtype=np.uint64, count=len(shingles))
+        permuted = (self._a * hashes[None, :] + self._b) % np.uint64(_MERSENNE_PRIME)
+        return (permuted & np.uint64(_MAX_HASH)).min(axis=1)
+
+    def _band_keys(self, signature) -> List[Tuple[int, bytes]]:
+        if signature is None:
+            return []
+        return [(band, signature[band * self.rows:(band + 1) * self.rows].tobytes()) for band in range(self.bands)]
+
+    def match(self, text: str) -> Optional[Dict[str, Any]]:
+        """리뷰를 클러스터에 대응 (없으면 새 클러스터). {'cluster_id', 'match': exact/similar/new, 'similarity'}
+
+        정규화한 텍스트가 비어 있으면 None
+        """
+        normalized = normalize_text(text)
+        if not normalized:
+            return None
+        exact_hash = hashlib.blake2b(normalized.encode('utf-8'), digest_size=8).hexdigest()
+        now = time.monotonic()
+        with self._lock:
+            cluster_id = self._exact.get(exact_hash)
+            if cluster_id is not None:
+                return self._hit(self._clusters[cluster_id], 'exact', 1.0, now)
+
+        signature = self.signature(normalized)
+        band_keys = self._band_keys(signature)
+        with self._lock:
+            cluster_id = self._exact.get(exact_hash)  # 서명을 계산하는 동안 다른 스레드가 같은 텍스트를 등록한 경우
+            if cluster_id is not None:
+                return self._hit(self._clusters[cluster_id], 'exact', 1.0, now)
+            best, best_similarity = None, 0.0
+            candidates = set()
+            for band_key in band_keys:
+                candidates.update(self._bands.get(band_key, ()))
+            if candidates:
+                # 템플릿 리뷰는 후보가 수백 개일 수 있어 서명 비교를 한 번에 계산
+                candidates = [self._clusters[candidate_id] for candidate_id in candidates]
+                similarities = (np.stack([candidate.signature for candidate in candidates]) == signature).mean(axis=1)
+                best_index = int(np.argmax(similarities))
+                best, best_similarity = candidates[best_index], float(similarities[best_index])
+            if best is not None and best_similarity >= self.threshold:
+                if len(best.exact_hashes) < _MAX_EXACT_HASHES:
+                    self._exact[exact_hash] = best.cluster_id
+                    best.exact_hashes.append(exact_hash)
+                return self._hit(best, 'similar', best_similarity, now)
+
+            cluster = _Cluster(f"c{exact_hash}", exact_hash, signature, band_keys)
+            self._clusters[cluster.cluster_id] = cluster
+            self._exact[exact_hash] = cluster.cluster_id
+            for band_key in band_keys:
+                self._bands.setdefault(band_key, set()).add(cluster.cluster_id)
+            self._evict()
+            return self._hit(cluster, 'new', 1.0, now)
+
+    def _hit(self, cluster: _Cluster, match: str, similarity: float, now: float) -> Dict[str, Any]:
+        """락 안에서 호출"""
+        self._clusters.move_to_end(cluster.cluster_id)
+        cluster.size += 1
+        cluster.recent.append(now)
+        while cluster.recent and now - cluster.recent[0] > self.burst_window_seconds:
+            cluster.recent.popleft()
+        self.matches[match] += 1
+        NEAR_DUPLICATE_TOTAL.inc(match=match)
+        if self.burst_threshold and len(cluster.recent) >= self.burst_threshold and \
+                now - cluster.burst_logged_at > self.burst_window_seconds:
+            cluster.burst_logged_at = now
+            self.bursts += 1
+            REVIEW_SPAM_BURSTS_TOTAL.inc()
+            log.warning("📛 같은 내용의 리뷰가 몰림 (리뷰 스팸 의심)", cluster_id=cluster.cluster_id,
+                        reviews=len(cluster.recent), window_s=self.burst_window_seconds)
+        return {'cluster_id': cluster.cluster_id, 'match': match, 'similarity': round(similarity, 3)}
+
+    def _evict(self):
+        """락 안에서 호출. 가장 오래 쓰지 않은 클러스터부터 삭제"""
+        while len(self._clusters) > self.max_clusters:
+            _, cluster = self._clusters.popitem(last=False)
+            for exact_hash in cluster.exact_hashes:
+                self._exact.pop(exact_hash, None)
+            for band_key in cluster.band_keys:
+                members = self._bands.get(band_key)
+                if members is not None:
+                    members.discard(cluster.cluster_id)
+                    if not members:
+                        del self._bands[band_key]
+
+    def cached_result(self, cluster_id: str, rating: Any = None) -> Optional[Dict[str, Any]]:
+        """클러스터에 저장된 같은 평점의 분석 결과 (없으면 None)"""
+        with self._lock:
+            cluster = self._clusters.get(cluster_id)
+            result = cluster.results.get(rating) if cluster is not None else None
+            if result is not None:
+                self.reused += 1
+            return dict(result) if result is not None else None
+
+    def store_result(self, cluster_id: str, rating: Any, result: Dict[str, Any]):
+        """최종 분석 결과를 클러스터에 저장 (임시/실패 결과는 저장하지 않음)"""
+        if not is_reusable(result):
+            return
+        stored = {key: value for key, value in result.items() if key not in _PER_REVIEW_FIELDS}
+        with self._lock:
+            cluster = self._clusters.get(cluster_id)
+            if cluster is not None:
+                cluster.results[rating] = stored
+
+    def bursting_clusters(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """최근 burst_window_seconds 동안 리뷰가 많이 들어온 클러스터"""
+        now = time.monotonic()
+        with self._lock:
+            recent = [(sum(1 for seen_at in cluster.recent if now - seen_at <= self.burst_window_seconds), cluster)
+                      for cluster in self._clusters.values()]
+        recent = sorted((item for item in recent if item[0] > 1), key=lambda item: item[0], reverse=True)[:limit]
+        return [{'cluster_id': cluster.cluster_id, 'recent_reviews': count, 'total_reviews': cluster.size,
+                 'spam_suspected': bool(self.burst_threshold) and count >= self.burst_threshold}
+                for count, cluster in recent]
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            clusters = len(self._clusters)
+            matches = dict(self.matches)
+        return {
+            'threshold': self.threshold,
+            'num_perm': self.num_perm,
+            'bands': self.bands,
+            'clusters': clusters,
+            'max_clusters': self.max_clusters,
+            'matches': matches,
+            'reused_results': self.reused,
+            'spam_bursts': self.bursts,
+            'bursting_clusters': self.bursting_clusters()
+        }
+
+
+def create_near_duplicate_index(settings) -> Optional[NearDuplicateIndex]:
+    """설정에 따라 색인 생성. 사용하지 않으면 None"""
+    if not settings.near_duplicate_enabled:
+        return None
+    return NearDuplicateIndex(threshold=settings.near_duplicate_threshold,
+                              max_clusters=settings.near_duplicate_max_clusters,
+                              burst_window_seconds=settings.review_spam_burst_window_seconds,
+                              burst_threshold=settings.review_spam_burst_threshold)
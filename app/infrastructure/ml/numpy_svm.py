@@ -0,0 +1,309 @@
+"""
+scikit-learn 없이 동작하는 NumPy 감정 분석 추론 엔진
+
+final_svm_sentiment_model.pkl (TfidfVectorizer + LinearSVC 파이프라인)을 NumPy 배열로 내보내고,
+같은 토큰화/TF-IDF/선형 점수 계산을 NumPy만으로 수행합니다. 런타임에는 sklearn과 joblib을 import하지 않으며,
+여러 문서는 (문서 × 어휘) 희소 행렬과 (어휘 × 클래스) 가중치의 곱 한 번으로 점수를 계산합니다.
+
+내보내기 (sklearn 필요, 빌드 시 1회):
+    python -m app.infrastructure.ml.numpy_svm export --pkl final_svm_sentiment_model.pkl --output final_svm_sentiment_model_npy
+
+npy 형식 (기본값, 디렉토리): 모든 배열을 읽기 전용 mmap으로 열기 때문에 여러 gunicorn 워커가
+페이지 캐시의 같은 물리 메모리를 공유합니다. 어휘도 파이썬 dict가 아닌 정렬된 고정폭 바이트 배열로 두고
+np.searchsorted로 찾으므로 워커마다 어휘 객체를 만들지 않습니다.
+    config.json         토큰화/정규화 설정, 클래스 라벨, 확률 보정 방식
+    idf.npy             IDF 가중치 (어휘 수)
+    coef_by_term.npy    어휘별 클래스 가중치 (어휘 수 × 클래스 수, 행 우선)
+    intercept.npy       클래스별 절편
+    vocab_terms.npy     UTF-8 어휘를 바이트 순으로 정렬한 고정폭 배열 (S<최대 길이>)
+    vocab_columns.npy   정렬된 어휘의 원래 열 번호
+
+npz 형식 (--format npz, 단일 파일): 로드 시 메모리로 읽고 어휘는 dict로 만듭니다.
+
+LinearSVC는 확률을 제공하지 않으므로 ReviewAnalyzer와 동일하게 decision_function 점수에 softmax를 적용합니다.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from typing import Dict, Any, List, Sequence
+
+import numpy as np
+
+FORMAT_VERSION = 1
+
+# 내보내기 검증용 문장 (부정/중립/긍정, 어휘 밖 단어, 빈 문자열 포함)
+VERIFICATION_TEXTS = [
+    '배송이 너무 늦고 포장도 엉망이라 실망했어요',
+    '그냥 무난해요 가격 대비 보통입니다',
+    '향이 좋고 피부가 촉촉해져서 재구매 의사 있어요',
+    '사용감 좋다고 하네요 동생이 좋아합니다',
+    '환불 요청했는데 답변이 없네요 최악입니다',
+    'qwerty asdf 12345',
+    ''
+]
+
+
+class DictVocabulary:
+    """파이썬 dict 어휘 (npz 형식)"""
+
+    def __init__(self, terms: Sequence[str]):
+        self._index = {term: index for index, term in enumerate(terms)}
+
+    def __len__(self):
+        return len(self._index)
+
+    def lookup(self, ngrams: List[str]) -> np.ndarray:
+        """n-gram별 열 번호 (어휘에 없으면 -1)"""
+        get = self._index.get
+        return np.fromiter((get(ngram, -1) for ngram in ngrams), dtype=np.int64, count=len(ngrams))
+
+
+class SortedVocabulary:
+    """정렬된 고정폭 바이트 배열 어휘 (mmap 공유 가능, 이진 탐색)"""
+
+    def __init__(self, terms: np.ndarray, columns: np.ndarray):
+        self.terms = terms
+        self.columns = columns
+        self.width = terms.dtype.itemsize
+
+    def __len__(self):
+        return len(self.terms)
+
+    def lookup(self, ngrams: List[str]) -> np.ndarray:
+        """n-gram별 열 번호 (어휘에 없으면 -1)"""
+        result = np.full(len(ngrams), -1, dtype=np.int64)
+        encoded = [ngram.encode('utf-8') for ngram in ngrams]
+        # 고정폭보다 긴 n-gram은 잘려서 다른 어휘와 잘못 일치할 수 있으므로 제외 (어휘에 있을 수 없음)
+        candidates = [i for i, ngram in enumerate(encoded) if len(ngram) <= self.width]
+        if not candidates or not len(self.terms):
+            return result
+
+        queries = np.array([encoded[i] for i in candidates], dtype=self.terms.dtype)
+        positions = np.minimum(np.searchsorted(self.terms, queries), len(self.terms) - 1)
+        matched = self.terms[positions] == queries
+        result[np.asarray(candidates)[matched]] = self.columns[positions[matched]]
+        return result
+
+
+class NumpySvmModel:
+    """TF-IDF + 선형 SVM 추론 (sklearn Pipeline의 decision_function/predict와 같은 결과)"""
+
+    def __init__(self, vocabulary, idf: np.ndarray, coef_by_term: np.ndarray, intercept: np.ndarray,
+                 classes: Sequence[str], config: Dict[str, Any]):
+        self.vocabulary = vocabulary
+        # mmap 배열은 dtype/배치가 이미 맞으므로 복사 없이 그대로 사용
+        self.idf = np.asarray(idf, dtype=np.float64)
+        self.coef_by_term = np.ascontiguousarray(coef_by_term, dtype=np.float64)
+        self.intercept = np.asarray(intercept, dtype=np.float64)
+        self.classes_ = np.asarray(classes)
+        self.config = config
+
+        self._token_pattern = re.compile(config['token_pattern'])
+        self._min_n, self._max_n = config['ngram_range']
+        self._lowercase = config['lowercase']
+        self._sublinear_tf = config['sublinear_tf']
+        self._norm = config['norm']
+
+    @classmethod
+    def load(cls, path: str) -> 'NumpySvmModel':
+        """npy 디렉토리는 읽기 전용 mmap으로, npz 파일은 메모리로 로드"""
+        if os.path.isdir(path):
+            return cls._load_npy(path)
+        return cls._load_npz(path)
+
+    @classmethod
+    def _load_npy(cls, path: str) -> 'NumpySvmModel':
+        with open(os.path.join(path, 'config.json'), 'r', encoding='utf-8') as f:
+            config = json.load(f)
+        _check_format(config)
+
+        def array(name):
+            return np.load(os.path.join(path, f"{name}.npy"), mmap_mode='r', allow_pickle=False)
+
+        vocabulary = SortedVocabulary(array('vocab_terms'), array('vocab_columns'))
+        return cls(vocabulary, array('idf'), array('coef_by_term'), array('intercept'), config['classes'], config)
+
+    @classmethod
+    def _load_npz(cls, path: str) -> 'NumpySvmModel':
+        with np.load(path, allow_pickle=False) as data:
+            config = json.loads(str(data['config']))
+            _check_format(config)
+            return cls(DictVocabulary(data['terms'].tolist()), data['idf'], np.asarray(data['coef']).T,
+                       data['intercept'], data['classes'].tolist(), config)
+
+    @property
+    def memory_mapped(self) -> bool:
+        return isinstance(self.coef_by_term, np.memmap) or isinstance(self.coef_by_term.base, np.memmap)
+
+    def _ngrams(self, text: str) -> List[str]:
+        """sklearn word analyzer와 같은 규칙의 토큰/n-gram"""
+        if self._lowercase:
+            text = text.lower()
+        tokens = self._token_pattern.findall(text)
+        if self._max_n == 1:
+            return tokens
+
+        ngrams = list(tokens) if self._min_n == 1 else []
+        for n in range(max(self._min_n, 2), self._max_n + 1):
+            ngrams.extend(' '.join(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+        return ngrams
+
+    def _features(self, texts: Sequence[str]):
+        """문서별 TF-IDF 희소 표현 (행 번호, 어휘 번호, 가중치). 행 번호는 오름차순으로 연속"""
+        rows, ngrams = [], []
+        for row, text in enumerate(texts):
+            doc_ngrams = self._ngrams(text)
+            rows.extend([row] * len(doc_ngrams))
+            ngrams.extend(doc_ngrams)
+
+        columns = self.vocabulary.lookup(ngrams)
+        found = columns >= 0
+        rows = np.asarray(rows, dtype=np.int64)[found]
+        columns = columns[found]
+
+        # (문서, 어휘) 쌍별 등장 횟수
+        n_terms = len(self.vocabulary)
+        keys, counts = np.unique(rows * n_terms + columns, return_counts=True)
+        rows, columns = np.divmod(keys, n_terms)
+
+        tf = counts.astype(np.float64)
+        if self._sublinear_tf:
+            tf = np.log(tf) + 1.0
+        values = tf * self.idf[columns]
+
+        if self._norm and len(values):
+            if self._norm == 'l2':
+                norms = np.sqrt(np.bincount(rows, weights=values * values, minlength=len(texts)))
+            else:
+                norms = np.bincount(rows, weights=np.abs(values), minlength=len(texts))
+            values /= norms[rows]
+        return rows, columns, values
+
+    def decision_function(self, texts: Sequence[str]) -> np.ndarray:
+        """클래스별 결정 점수 (문서 수 × 클래스 수)"""
+        rows, columns, values = self._features(texts)
+        scores = np.zeros((len(texts), len(self.classes_)), dtype=np.float64)
+        if len(values):
+            # 희소 행렬 × 가중치: 비영 원소의 기여분을 문서(연속 구간)별로 한 번에 합산
+            contributions = self.coef_by_term[columns] * values[:, None]
+            doc_rows, starts = np.unique(rows, return_index=True)
+            scores[doc_rows] = np.add.reduceat(contributions, starts, axis=0)
+        return scores + self.intercept
+
+    def predict(self, texts: Sequence[str]) -> np.ndarray:
+        return self.classes_[np.argmax(self.decision_function(texts), axis=1)]
+
+    def predict_proba(self, texts: Sequence[str]) -> np.ndarray:
+        """결정 점수의 softmax (ReviewAnalyzer의 LinearSVC 확률 계산과 동일)"""
+        scores = self.decision_function(texts)
+        scores = scores - scores.max(axis=1, keepdims=True)
+        exp_scores = np.exp(scores)
+        return exp_scores / exp_scores.sum(axis=1, keepdims=True)
+
+
+def _check_format(config: Dict[str, Any]):
+    if config.get('format_version') != FORMAT_VERSION:
+        raise ValueError(f"지원하지 않는 모델 형식입니다: {config.get('format_version')}")
+
+
+def _write_npy(output_path: str, terms: List[str], idf: np.ndarray, coef: np.ndarray, intercept: np.ndarray,
+               config: Dict[str, Any]):
+    os.makedirs(output_path, exist_ok=True)
+
+    encoded = [term.encode('utf-8') for term in terms]
+    order = sorted(range(len(encoded)), key=encoded.__getitem__)
+    width = max((len(term) for term in encoded), default=1)
+
+    arrays = {
+        'idf': np.asarray(idf, dtype=np.float64),
+        'coef_by_term': np.ascontiguousarray(np.asarray(coef, dtype=np.float64).T),
+        'intercept': np.asarray(intercept, dtype=np.float64),
+        'vocab_terms': np.array([encoded[i] for i in order], dtype=f'S{width}'),
+        'vocab_columns': np.asarray(order, dtype=np.int32)
+    }
+    for name, array in arrays.items():
+        np.save(os.path.join(output_path, f"{name}.npy"), array, allow_pickle=False)
+    with open(os.path.join(output_path, 'config.json'), 'w', encoding='utf-8') as f:
+        json.dump(config, f, ensure_ascii=False, indent=2)
+
+
+def export_pipeline(pkl_path: str, output_path: str, output_format: str = 'npy') -> Dict[str, Any]:
+    """sklearn 파이프라인(pkl)을 NumPy 배열로 내보내고 원본과 결과가 같은지 검증"""
+    import joblib
+
+    pipeline = joblib.load(pkl_path)
+    vectorizer = pipeline.steps[0][1]
+    classifier = pipeline.steps[-1][1]
+
+    if vectorizer.analyzer != 'word' or vectorizer.tokenizer is not None or vectorizer.preprocessor is not None:
+        raise ValueError("word analyzer + 기본 토큰화 TfidfVectorizer만 내보낼 수 있습니다.")
+    if vectorizer.stop_words is not None or vectorizer.strip_accents is not None or vectorizer.binary:
+        raise ValueError("stop_words/strip_accents/binary 설정은 지원하지 않습니다.")
+
+    terms = [None] * len(vectorizer.vocabulary_)
+    for term, index in vectorizer.vocabulary_.items():
+        terms[index] = term
+    idf = vectorizer.idf_ if vectorizer.use_idf else np.ones(len(terms))
+    classes = np.asarray(classifier.classes_).astype(str)
+    config = {
+        'format_version': FORMAT_VERSION,
+        'token_pattern': vectorizer.token_pattern,
+        'ngram_range': list(vectorizer.ngram_range),
+        'lowercase': bool(vectorizer.lowercase),
+        'sublinear_tf': bool(vectorizer.sublinear_tf),
+        'norm': vectorizer.norm,
+        'calibration': 'softmax(decision_function)',
+        'classes': classes.tolist(),
+        'source': pkl_path
+    }
+
+    if output_format == 'npy':
+        _write_npy(output_path, terms, idf, classifier.coef_, classifier.intercept_, config)
+    else:
+        np.savez(output_path, terms=np.asarray(terms, dtype=str), idf=np.asarray(idf, dtype=np.float64),
+                 coef=np.asarray(classifier.coef_, dtype=np.float64),
+                 intercept=np.asarray(classifier.intercept_, dtype=np.float64),
+                 classes=classes, config=np.array(json.dumps(config)))
+        if not output_path.endswith('.npz'):
+            output_path += '.npz'
+
+    model = NumpySvmModel.load(output_path)
+    expected = np.atleast_2d(pipeline.decision_function(VERIFICATION_TEXTS))
+    actual = model.decision_function(VERIFICATION_TEXTS)
+    max_diff = float(np.max(np.abs(expected - actual)))
+    if max_diff > 1e-9 or not np.array_equal(pipeline.predict(VERIFICATION_TEXTS), model.predict(VERIFICATION_TEXTS)):
+        raise ValueError(f"내보낸 모델 결과가 원본과 다릅니다 (최대 점수 차이 {max_diff})")
+
+    return {
+        'output': output_path,
+        'format': output_format,
+        'terms': len(terms),
+        'classes': model.classes_.tolist(),
+        'max_score_diff': max_diff
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='SVM 감정 분석 모델 NumPy 내보내기')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    export_parser = subparsers.add_parser('export', help='pkl 파이프라인을 NumPy 배열로 내보내기')
+    export_parser.add_argument('--pkl', default='final_svm_sentiment_model.pkl')
+    export_parser.add_argument('--output', default='final_svm_sentiment_model_npy')
+    export_parser.add_argument('--format', choices=['npy', 'npz'], default='npy',
+                               help='npy: mmap 공유용 디렉토리 (기본값), npz: 단일 파일')
+
+    args = parser.parse_args(argv)
+    if args.command == 'export':
+        started_at = time.perf_counter()
+        summary = export_pipeline(args.pkl, args.output, args.format)
+        summary['elapsed_s'] = round(time.perf_counter() - started_at, 3)
+        print(json.dumps(summary, ensure_ascii=False))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,136 @@
+"""
+pkl 1차 분석 예측 메모 (전처리한 텍스트 → 클래스별 확률, LRU)
+
+"배송 빨라요", "좋아요" 같은 짧은 리뷰는 같은 텍스트가 반복되고, 대시보드를 다시 열 때마다 같은 리뷰를 다시 분석하므로
+clean_text 결과가 같으면 TF-IDF 변환과 SVM 점수 계산을 다시 하지 않고 기억해 둔 확률을 씁니다.
+
+- 키는 clean_text 결과 문자열, 값은 클래스별 확률 배열 (읽기 전용). 결과 dict는 호출할 때마다 새로 만듭니다.
+- max_entries개까지 최근 사용 순으로 유지하고, max_text_length자를 넘는 텍스트는 반복될 일이 드물어 저장하지 않습니다.
+- 모델 버전(백엔드 + 모델 파일 크기/수정 시각)이 바뀌면 모두 지웁니다. 분석기가 PKL_MODEL_RELOAD_CHECK_SECONDS마다
+  모델 파일을 확인해 바뀌었으면 모델을 다시 로드하면서 set_model_version을 호출합니다.
+- 적중률은 cache_requests_total{cache="pkl_prediction"}, cache_hit_ratio{cache="pkl_prediction"} 지표로 확인합니다.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+from app.shared.utils.logger import get_logger
+from app.shared.utils.metrics import CACHE_REQUESTS_TOTAL
+
+log = get_logger(__name__)
+
+CACHE_NAME = 'pkl_prediction'
+
+
+def model_version(backend: str, model_path: str) -> str:
+    """모델 버전 문자열 (백엔드 + 모델 파일/디렉토리 안 파일들의 크기·수정 시각 해시)"""
+    if os.path.isdir(model_path):
+        paths = sorted(os.path.join(model_path, name) for name in os.listdir(model_path))
+    else:
+        paths = [model_path]
+    parts = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        parts.append(f"{os.path.basename(path)}:{stat.st_size}:{stat.st_mtime_ns}")
+    digest = hashlib.blake2b('|'.join(parts).encode('utf-8'), digest_size=6).hexdigest()
+    return f"{backend or 'none'}:{digest}"
+
+
+class PredictionCache:
+    """전처리한 텍스트별 pkl 예측 확률 LRU 메모 (스레드 안전)"""
+
+    def __init__(self, max_entries: int = 10000, max_text_length: int = 300, enabled: bool = True):
+        self.max_entries = max(1, max_entries)
+        self.max_text_length = max_text_length
+        self.enabled = enabled
+        self.model_version = None
+        self._entries = OrderedDict()  # 텍스트 -> 확률 배열, 오래 사용하지 않은 순
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+        self.invalidations = 0
+
+    def set_model_version(self, version: str):
+        """모델을 (다시) 로드할 때 호출. 버전이 바뀌었으면 저장된 예측을 모두 지움"""
+        with self._lock:
+            if version == self.model_version:
+                return
+            changed = self.model_version is not None
+            self.model_version = version
+            if changed or self._entries:
+                self._entries.clear()
+                self.invalidations += 1
+        if changed:
+            log.info("♻️ 모델 버전 변경 - pkl 예측 메모 초기화", cache=CACHE_NAME)
+
+    def lookup(self, texts: List[str]) -> List[Optional[np.ndarray]]:
+        """텍스트별 저장된 확률 (없으면 None)"""
+        if not self.enabled:
+            return [None] * len(texts)
+        with self._lock:
+            found = []
+            for text in texts:
+                probabilities = self._entries.get(text)
+                if probabilities is not None:
+                    self._entries.move_to_end(text)
+                found.append(probabilities)
+            hits = sum(1 for probabilities in found if probabilities is not None)
+            misses = len(texts) - hits
+            self.hits += hits
+            self.misses += misses
+        if hits:
+            CACHE_REQUESTS_TOTAL.inc(hits, cache=CACHE_NAME, result='hit')
+        if misses:
+            CACHE_REQUESTS_TOTAL.inc(misses, cache=CACHE_NAME, result='miss')
+        return found
+
+    def store(self, texts: List[str], probabilities: np.ndarray):
+        if not self.enabled:
+            return
+        with self._lock:
+            for text, row in zip(texts, probabilities):
+                if len(text) > self.max_text_length:
+                    continue
+                row = np.array(row, dtype=np.float64)
+                row.setflags(write=False)
+                self._entries[text] = row
+                self._entries.move_to_end(text)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evicted += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            entries = len(self._entries)
+        requests = self.hits + self.misses
+        return {
+            'enabled': self.enabled,
+            'entries': entries,
+            'max_entries': self.max_entries,
+            'max_text_length': self.max_text_length,
+            'model_version': self.model_version,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': round(self.hits / requests, 4) if requests else 0.0,
+            'evicted': self.evicted,
+            'invalidations': self.invalidations
+        }
+
+
+def create_prediction_cache(settings) -> PredictionCache:
+    return PredictionCache(max_entries=settings.pkl_cache_max_entries,
+                           max_text_length=settings.pkl_cache_max_text_length,
+                           enabled=settings.pkl_cache_enabled)
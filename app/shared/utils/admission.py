@@ -0,0 +1,149 @@
+"""
+웹훅 수락 제어 (부하 차단 + 저하 모드)
+
+gunicorn 스레드가 모두 웹훅 처리에 묶이면 이후 요청은 gunicorn 대기열에 쌓이고 헬스 체크와 대시보드까지 멈춥니다.
+처리 중인 웹훅 수(in-flight)를 세어 다음 두 단계로 대응합니다.
+
+- 포화: 처리 중인 웹훅이 ADMISSION_MAX_IN_FLIGHT 이상이면 새 웹훅을 처리하지 않고 429 + Retry-After로 바로 응답
+  (기본값은 GUNICORN_THREADS - 1, 스레드 하나는 헬스 체크/대시보드 몫으로 남김). 거절된 카페24 웹훅의 신규 리뷰는
+  이후 수집에서 최신 리뷰 비교로 함께 처리됩니다.
+- 저하 모드: 처리 중인 웹훅이 ADMISSION_DEGRADE_IN_FLIGHT 이상인 상태가 ADMISSION_DEGRADE_AFTER_SECONDS 넘게 이어지거나
+  429로 거절한 요청이 있으면 저하 모드로 전환하고, 압력이 내려간 뒤에도 ADMISSION_DEGRADE_HOLD_SECONDS 동안 유지합니다
+  (콜드 스타트의 모델 로드 같은 짧은 몰림이나 잦은 모드 전환을 피하도록). 저하 모드에서는
+  GPT 2차 분석 없이 pkl 결과만 사용하고, 수집 알림을 모아 ADMISSION_DIGEST_SECONDS마다 한 번에 보내며,
+  캐시에 없는 상품명 조회는 백그라운드로 미룹니다.
+"""
+
+import threading
+import time
+from typing import Dict, Any
+
+from app.shared.utils.logger import get_logger
+from app.shared.utils.metrics import ADMISSION_MODE, ADMISSION_REJECTED_TOTAL
+
+log = get_logger(__name__)
+
+NORMAL = 'normal'
+DEGRADED = 'degraded'
+_MODE_VALUES = {NORMAL: 0, DEGRADED: 1}
+
+
+class AdmissionController:
+    """처리 중인 요청 수 기반 수락/거절과 저하 모드 판단"""
+
+    def __init__(self, max_in_flight: int, degrade_in_flight: int, degrade_after_seconds: float = 1.0,
+                 degrade_hold_seconds: float = 15.0, retry_after_seconds: float = 2.0, enabled: bool = True):
+        self.max_in_flight = max(1, max_in_flight)
+        self.degrade_in_flight = max(1, degrade_in_flight)
+        self.degrade_after_seconds = degrade_after_seconds
+        self.degrade_hold_seconds = degrade_hold_seconds
+        self.retry_after_seconds = retry_after_seconds
+        self.enabled = enabled
+        self._in_flight = 0
+        self._pressure_since = None  # 처리 중인 웹훅이 저하 기준 이상이 된 시각 (time.monotonic 기준)
+        self._pressure_seen_at = None  # 마지막으로 저하 조건을 만족한 시각
+        self._mode = NORMAL
+        self._lock = threading.Lock()
+        self.admitted = 0
+        self.rejected = 0
+        ADMISSION_MODE.set(_MODE_VALUES[NORMAL])
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def degraded(self) -> bool:
+        """저하 모드 여부 (압력이 내려간 뒤에도 degrade_hold_seconds 동안 유지)"""
+        if not self.enabled:
+            return False
+        with self._lock:
+            self._update_mode()
+            return self._mode == DEGRADED
+
+    def _update_mode(self):
+        """락 안에서 호출"""
+        now = time.monotonic()
+        if self._in_flight < self.degrade_in_flight:
+            self._pressure_since = None
+        elif self._pressure_since is None:
+            self._pressure_since = now
+        elif now - self._pressure_since >= self.degrade_after_seconds:
+            self._pressure_seen_at = now
+        held = self._pressure_seen_at is not None and now - self._pressure_seen_at < self.degrade_hold_seconds
+        mode = DEGRADED if held else NORMAL
+        if mode != self._mode:
+            self._mode = mode
+            ADMISSION_MODE.set(_MODE_VALUES[mode])
+            if mode == DEGRADED:
+                log.warning("🐢 웹훅 부하 증가 - 저하 모드 전환 (pkl 분석만, 알림 묶음 전송, 상품명 조회 지연)",
+                            in_flight=self._in_flight)
+            else:
+                log.info("✅ 웹훅 부하 해소 - 정상 모드 복귀")
+
+    def try_enter(self, route: str = 'webhook') -> bool:
+        """요청 수락 (True면 처리 후 반드시 leave 호출). 포화 상태면 False"""
+        if not self.enabled:
+            return True
+        with self._lock:
+            if self._in_flight >= self.max_in_flight:
+                self.rejected += 1
+                self._pressure_seen_at = time.monotonic()
+                self._update_mode()
+                rejected = True
+            else:
+                self._in_flight += 1
+                self.admitted += 1
+                self._update_mode()
+                rejected = False
+        if rejected:
+            ADMISSION_REJECTED_TOTAL.inc(route=route)
+            log.warning("⛔ 웹훅 처리 한도 초과 - 429 응답", route=route, in_flight=self._in_flight,
+                        max_in_flight=self.max_in_flight, sample='admission_rejected')
+        return not rejected
+
+    def leave(self):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - 1)
+            self._update_mode()
+
+    def retry_after(self) -> int:
+        """429 응답의 Retry-After (초, 정수)"""
+        return max(1, int(round(self.retry_after_seconds)))
+
+    def status(self) -> Dict[str, Any]:
+        degraded = self.degraded
+        return {
+            'enabled': self.enabled,
+            'mode': DEGRADED if degraded else NORMAL,
+            'in_flight': self._in_flight,
+            'max_in_flight': self.max_in_flight,
+            'degrade_in_flight': self.degrade_in_flight,
+            'degrade_after_seconds': self.degrade_after_seconds,
+            'degrade_hold_seconds': self.degrade_hold_seconds,
+            'retry_after_seconds': self.retry_after(),
+            'admitted': self.admitted,
+            'rejected': self.rejected
+        }
+
+
+def create_admission_controller(settings) -> AdmissionController:
+    """ADMISSION_MAX_IN_FLIGHT가 0이면 GUNICORN_THREADS - 1, ADMISSION_DEGRADE_IN_FLIGHT가 0이면 처리 한도와 같은 값"""
+    max_in_flight = settings.admission_max_in_flight or max(1, settings.gunicorn_threads - 1)
+    degrade_in_flight = settings.admission_degrade_in_flight or max_in_flight
+    return AdmissionController(max_in_flight, degrade_in_flight,
+                               degrade_after_seconds=settings.admission_degrade_after_seconds,
+                               degrade_hold_seconds=settings.admission_degrade_hold_seconds,
+                               retry_after_seconds=settings.admission_retry_after_seconds,
+                               enabled=settings.admission_enabled)
+
+
+def _create_default():
+    from config.settings import settings
+    return create_admission_controller(settings)
+
+
+# 전역 수락 제어기 (웹훅 엔드포인트, 분석/알림 경로에서 공유)
+admission_controller = _create_default()
@@ -0,0 +1,233 @@
+"""
+외부 의존성 회로 차단기 (OpenAI, 카페24, 채널톡/카카오톡)
+
+의존성이 느리거나 죽었을 때 호출마다 타임아웃까지 기다렸다 실패하지 않도록, 최근 호출의 실패율 또는
+느린 호출 비율이 기준을 넘으면 회로를 열고(open) CIRCUIT_BREAKER_OPEN_SECONDS 동안 호출 없이 바로 실패합니다.
+그 뒤에는 반열림(half_open) 상태로 시험 호출 몇 건만 보내 모두 성공하면 닫고(closed), 하나라도 실패하면 다시 엽니다.
+
+- 실패: 연결 오류/타임아웃/5xx 등 의존성 장애 (4xx처럼 요청 쪽 문제는 호출한 쪽에서 성공으로 기록)
+- 느린 호출: slow_call_seconds 이상 걸린 호출 (성공이어도 느린 호출 비율에 포함)
+- 상태는 circuit_breaker_state 지표(0 닫힘, 1 반열림, 2 열림)와 /debug/circuit-breakers로 확인합니다.
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Any
+
+from app.shared.utils.logger import get_logger
+from app.shared.utils.metrics import (
+    CIRCUIT_BREAKER_STATE, CIRCUIT_BREAKER_TRANSITIONS_TOTAL, CIRCUIT_BREAKER_REJECTED_TOTAL
+)
+
+log = get_logger(__name__)
+
+CLOSED = 'closed'
+HALF_OPEN = 'half_open'
+OPEN = 'open'
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitOpenError(Exception):
+    """회로가 열려 있어 호출하지 않음"""
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(f"{name} 회로 차단 중 ({retry_after:.1f}초 후 재시도)")
+        self.name = name
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """최근 window건의 실패율/느린 호출 비율로 여닫는 회로 차단기"""
+
+    def __init__(self, name: str, window: int = 20, min_calls: int = 5, failure_rate: float = 0.5,
+                 slow_call_seconds: float = 0.0, slow_call_rate: float = 0.8, open_seconds: float = 30.0,
+                 half_open_calls: int = 1, enabled: bool = True):
+        self.name = name
+        self.window = window
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.slow_call_seconds = slow_call_seconds  # 0이면 느린 호출 기준 사용 안 함
+        self.slow_call_rate = slow_call_rate
+        self.open_seconds = open_seconds
+        self.half_open_calls = half_open_calls
+        self.enabled = enabled
+        self._calls = deque(maxlen=window)  # (실패 여부, 느린 호출 여부)
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._half_open_in_flight = 0
+        self._half_open_successes = 0
+        self._probe_started_at = 0.0
+        self._lock = threading.Lock()
+        self.rejected = 0
+        self.trips = 0
+        CIRCUIT_BREAKER_STATE.set(_STATE_VALUES[CLOSED], name=name)
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._refresh()
+            return self._state
+
+    def _refresh(self):
+        """열린 지 open_seconds가 지나면 반열림으로 전환 (락 안에서 호출)"""
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.open_seconds:
+            self._transition(HALF_OPEN)
+
+    def _transition(self, state: str):
+        previous, self._state = self._state, state
+        if state == OPEN:
+            self._opened_at = time.monotonic()
+            self.trips += 1
+        if state != CLOSED:
+            self._half_open_in_flight = 0
+            self._half_open_successes = 0
+        if state == CLOSED:
+            self._calls.clear()
+        CIRCUIT_BREAKER_STATE.set(_STATE_VALUES[state], name=self.name)
+        CIRCUIT_BREAKER_TRANSITIONS_TOTAL.inc(name=self.name, state=state)
+        if state == OPEN:
+            log.warning(f"⚡ {self.name} 회로 열림 - {self.open_seconds:.0f}초 동안 호출 없이 바로 실패",
+                        breaker=self.name, previous=previous)
+        else:
+            log.info(f"🔌 {self.name} 회로 상태 변경", breaker=self.name, previous=previous, state=state)
+
+    def allow_request(self) -> bool:
+        """호출해도 되면 True (반열림이면 시험 호출 자리를 하나 차지). False면 바로 실패 처리"""
+        if not self.enabled:
+            return True
+        with self._lock:
+            self._refresh()
+            if self._state == CLOSED:
+                return True
+            if self._state == HALF_OPEN:
+                # 결과가 기록되지 않은 시험 호출(호출 전 다른 오류 등)이 자리를 계속 차지하지 않도록
+                if time.monotonic() - self._probe_started_at >= self.open_seconds:
+                    self._half_open_in_flight = 0
+                if self._half_open_in_flight < self.half_open_calls:
+                    self._half_open_in_flight += 1
+                    self._probe_started_at = time.monotonic()
+                    return True
+            self.rejected += 1
+        CIRCUIT_BREAKER_REJECTED_TOTAL.inc(name=self.name)
+        return False
+
+    def retry_after(self) -> float:
+        """다시 시험 호출할 수 있을 때까지 남은 시간(초)"""
+        with self._lock:
+            if self._state != OPEN:
+                return 0.0
+            return max(0.0, self.open_seconds - (time.monotonic() - self._opened_at))
+
+    def record_success(self, seconds: float = 0.0):
+        self._record(False, seconds)
+
+    def record_failure(self, seconds: float = 0.0):
+        self._record(True, seconds)
+
+    def _record(self, failed: bool, seconds: float):
+        if not self.enabled:
+            return
+        slow = bool(self.slow_call_seconds) and seconds >= self.slow_call_seconds
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+                if failed or slow:
+                    self._transition(OPEN)
+                else:
+                    self._half_open_successes += 1
+                    if self._half_open_successes >= self.half_open_calls:
+                        self._transition(CLOSED)
+                return
+            if self._state == OPEN:
+                return  # 열리기 전에 시작된 호출의 결과
+
+            self._calls.append((failed, slow))
+            if len(self._calls) < self.min_calls:
+                return
+            failures = sum(1 for call_failed, _ in self._calls if call_failed)
+            slow_calls = sum(1 for _, call_slow in self._calls if call_slow)
+            if failures / len(self._calls) >= self.failure_rate or \
+                    (self.slow_call_seconds and slow_calls / len(self._calls) >= self.slow_call_rate):
+                self._transition(OPEN)
+
+    @contextmanager
+    def guard(self):
+        """with 블록을 회로 차단기로 보호 (열려 있으면 CircuitOpenError, 예외가 나면 실패로 기록)"""
+        if not self.allow_request():
+            raise CircuitOpenError(self.name, self.retry_after())
+        started_at = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.record_failure(time.perf_counter() - started_at)
+            raise
+        self.record_success(time.perf_counter() - started_at)
+
+    def reset(self):
+        with self._lock:
+            if self._state != CLOSED:
+                self._transition(CLOSED)
+            self._calls.clear()
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            self._refresh()
+            calls = list(self._calls)
+            status = {
+                'state': self._state,
+                'enabled': self.enabled,
+                'recent_calls': len(calls),
+                'recent_failures': sum(1 for failed, _ in calls if failed),
+                'recent_slow_calls': sum(1 for _, slow in calls if slow),
+                'failure_rate_threshold': self.failure_rate,
+                'slow_call_seconds': self.slow_call_seconds,
+                'open_seconds': self.open_seconds,
+                'trips': self.trips,
+                'rejected': self.rejected
+            }
+        status['retry_after_s'] = round(self.retry_after(), 1)
+        return status
+
+
+class CircuitBreakerRegistry:
+    """의존성 이름별 회로 차단기 (처음 요청할 때 설정값으로 생성)"""
+
+    def __init__(self):
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str, slow_call_seconds: float = None) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(name)
+            if breaker is None:
+                from config.settings import settings
+                breaker = CircuitBreaker(
+                    name,
+                    window=settings.circuit_breaker_window,
+                    min_calls=settings.circuit_breaker_min_calls,
+                    failure_rate=settings.circuit_breaker_failure_rate,
+                    slow_call_seconds=slow_call_seconds or 0.0,
+                    slow_call_rate=settings.circuit_breaker_slow_call_rate,
+                    open_seconds=settings.circuit_breaker_open_seconds,
+                    half_open_calls=settings.circuit_breaker_half_open_calls,
+                    enabled=settings.circuit_breaker_enabled
+                )
+                self._breakers[name] = breaker
+            return breaker
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {name: breaker.status() for name, breaker in sorted(breakers.items())}
+
+    def reset(self):
+        with self._lock:
+            breakers = list(self._breakers.values())
+        for breaker in breakers:
+            breaker.reset()
+
+
+# 전역 회로 차단기 레지스트리
+circuit_breakers = CircuitBreakerRegistry()
@@ -0,0 +1,233 @@
+"""
+부정 리뷰 감지 지연(detection lag) 추적 유틸리티
+
+고객이 리뷰를 작성한 시각(카페24 created_date)부터 웹훅 수신, 분석 완료, 채널별 알림 전송 성공까지
+리뷰마다 경과 시간을 기록하고, 구간별 최근 N건의 백분위수를 제공합니다.
+
+구간:
+    created_to_webhook            작성 → 웹훅 수신
+    webhook_to_analyzed           웹훅 수신 → 분석 완료
+    created_to_analyzed           작성 → 분석 완료
+    analyzed_to_sent:<channel>    분석 완료 → 채널 전송 성공
+    created_to_sent:<channel>     작성 → 채널 전송 성공 (운영 SLO)
+
+웹훅 수신 시각은 수집할 때 리뷰마다 'webhook_received_at' 필드로 붙여 두고 분석 완료 시 그 값을 읽습니다
+(분석이 백그라운드 큐나 다른 웹훅의 수집 스레드에서 끝나도 리뷰 자신의 웹훅 기준으로 계산). 카페24 웹훅처럼 페이로드에
+게시판/글 번호가 있으면 그 리뷰의 웹훅 수신 시각을, 없으면 수집을 일으킨 웹훅 중 가장 먼저 받은 웹훅의 수신 시각을 씁니다.
+"""
+
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+from app.shared.utils.metrics import metrics
+
+DETECTION_LAG_SECONDS = metrics.histogram(
+    'review_detection_lag_seconds', '리뷰 작성부터 구간별 경과 시간', ['stage'],
+    buckets=(1, 5, 15, 30, 60, 120, 300, 600, 1800, 3600, 7200, 21600, 86400))
+
+_local = threading.local()
+
+
+def parse_created_at(value) -> Optional[float]:
+    """카페24 created_date (예: 2025-09-01T12:00:00+09:00) → epoch 초"""
+    if not value:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return datetime.fromisoformat(str(value).replace('Z', '+00:00')).timestamp()
+    except ValueError:
+        return None
+
+
+def review_key(review: Dict) -> Optional[str]:
+    article_no = review.get('article_no')
+    if article_no in (None, ''):
+        return None
+    return f"{review.get('board_no', '')}:{article_no}"
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = max(0, math.ceil(pct / 100 * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+def mark_webhook_received(received_at: float = None):
+    """현재 스레드에서 처리 중인 웹훅의 수신 시각 기록 (같은 스레드의 수집/분석에서 참조)"""
+    _local.webhook_received_at = received_at or time.time()
+
+
+def clear_webhook_received():
+    _local.webhook_received_at = None
+
+
+def current_webhook_received_at() -> Optional[float]:
+    """현재 스레드에서 처리 중인 웹훅의 수신 시각 (수집 요청을 받는 시점에 읽어 수집 작업에 넘김)"""
+    return getattr(_local, 'webhook_received_at', None)
+
+
+class DetectionLagTracker:
+    """리뷰별 감지 지연 기록과 구간별 백분위수"""
+
+    def __init__(self, window: int = 1000, max_reviews: int = 500):
+        self.window = window
+        self.max_reviews = max_reviews
+        self._samples = {}
+        self._reviews = OrderedDict()
+        self._webhooks = OrderedDict()  # 리뷰 키 -> 그 리뷰의 웹훅 수신 시각 (페이로드에 글 번호가 있는 웹훅)
+        self._lock = threading.Lock()
+
+    def _observe(self, stage: str, seconds: float):
+        # 서버/카페24 시계 차이로 음수가 나오는 경우는 0으로 취급
+        seconds = max(0.0, seconds)
+        self._samples.setdefault(stage, deque(maxlen=self.window)).append(seconds)
+        DETECTION_LAG_SECONDS.observe(seconds, stage=stage)
+
+    def note_webhook(self, review: Optional[Dict], received_at: float = None):
+        """웹훅 페이로드의 리뷰(게시판/글 번호)별 수신 시각 기록 (재전송은 처음 받은 시각 유지)"""
+        key = review_key(review) if isinstance(review, dict) else None
+        if key is None:
+            return
+        with self._lock:
+            self._webhooks.setdefault(key, received_at or time.time())
+            while len(self._webhooks) > self.max_reviews:
+                self._webhooks.popitem(last=False)
+
+    def stamp_fetched(self, reviews: List[Dict], received_at: float = None) -> List[Dict]:
+        """수집한 리뷰에 웹훅 수신 시각(webhook_received_at)을 붙인 복사본 (리뷰 캐시에 저장된 원본은 그대로)
+
+        리뷰 자신의 웹훅 수신 시각이 있으면 그 값, 없으면 received_at(수집을 일으킨 웹훅의 수신 시각)을 씁니다.
+        """
+        stamped = []
+        with self._lock:
+            for review in reviews:
+                noted_at = self._webhooks.pop(review_key(review) or '', None)
+                stamped_at = review.get('webhook_received_at') or noted_at or received_at
+                stamped.append(dict(review, webhook_received_at=stamped_at) if stamped_at is not None else review)
+        return stamped
+
+    def record_analyzed(self, reviews: List[Dict], analyzed_at: float = None,
+                        webhook_received_at: float = None) -> int:
+        """분석이 끝난 리뷰 기록. 웹훅 수신 시각은 리뷰의 webhook_received_at (없으면 webhook_received_at 인자)"""
+        analyzed_at = analyzed_at or time.time()
+        recorded = 0
+
+        with self._lock:
+            for review in reviews:
+                key = review_key(review)
+                if key is None or key in self._reviews:
+                    continue
+
+                created_at = parse_created_at(review.get('created_date'))
+                received_at = review.get('webhook_received_at') or webhook_received_at
+                entry = {
+                    'review_key': key,
+                    'product_no': review.get('product_no'),
+                    'is_negative': bool(review.get('is_negative')),
+                    'created_at': created_at,
+                    'webhook_received_at': received_at,
+                    'analyzed_at': analyzed_at,
+                    'sent_at': {}
+                }
+                self._reviews[key] = entry
+                recorded += 1
+
+                if created_at is not None:
+                    self._observe('created_to_analyzed', analyzed_at - created_at)
+                    if received_at is not None:
+                        self._observe('created_to_webhook', received_at - created_at)
+                if received_at is not None:
+                    self._observe('webhook_to_analyzed', analyzed_at - received_at)
+
+            while len(self._reviews) > self.max_reviews:
+                self._reviews.popitem(last=False)
+
+        return recorded
+
+    def record_delivery(self, reviews: List[Dict], channel: str, sent_at: float = None) -> int:
+        """채널 알림 전송 성공 기록 (리뷰·채널당 첫 전송만 반영)"""
+        sent_at = sent_at or time.time()
+        recorded = 0
+
+        with self._lock:
+            for review in reviews:
+                entry = self._reviews.get(review_key(review) or '')
+                if entry is None or channel in entry['sent_at']:
+                    continue
+
+                entry['sent_at'][channel] = sent_at
+                recorded += 1
+                self._observe(f"analyzed_to_sent:{channel}", sent_at - entry['analyzed_at'])
+                if entry['created_at'] is not None:
+                    self._observe(f"created_to_sent:{channel}", sent_at - entry['created_at'])
+
+        return recorded
+
+    def percentiles(self) -> Dict[str, Dict[str, Any]]:
+        """구간별 최근 window건의 건수/평균/백분위수 (초)"""
+        with self._lock:
+            samples = {stage: sorted(values) for stage, values in self._samples.items()}
+
+        result = {}
+        for stage, values in sorted(samples.items()):
+            result[stage] = {
+                'count': len(values),
+                'mean_s': round(sum(values) / len(values), 3) if values else 0.0,
+                'p50_s': round(_percentile(values, 50), 3),
+                'p90_s': round(_percentile(values, 90), 3),
+                'p95_s': round(_percentile(values, 95), 3),
+                'p99_s': round(_percentile(values, 99), 3),
+                'max_s': round(values[-1], 3) if values else 0.0
+            }
+        return result
+
+    def recent(self, limit: int = 20, negative_only: bool = False) -> List[Dict[str, Any]]:
+        """최근 분석된 리뷰별 구간 지연 (초)"""
+        with self._lock:
+            entries = [dict(entry, sent_at=dict(entry['sent_at'])) for entry in reversed(self._reviews.values())]
+
+        if negative_only:
+            entries = [entry for entry in entries if entry['is_negative']]
+
+        recent = []
+        for entry in entries[:limit]:
+            created_at = entry['created_at']
+            lags = {}
+            if created_at is not None and entry['webhook_received_at'] is not None:
+                lags['created_to_webhook'] = round(entry['webhook_received_at'] - created_at, 3)
+            if created_at is not None:
+                lags['created_to_analyzed'] = round(entry['analyzed_at'] - created_at, 3)
+            for channel, sent_at in entry['sent_at'].items():
+                lags[f"analyzed_to_sent:{channel}"] = round(sent_at - entry['analyzed_at'], 3)
+                if created_at is not None:
+                    lags[f"created_to_sent:{channel}"] = round(sent_at - created_at, 3)
+            recent.append({
+                'review_key': entry['review_key'],
+                'product_no': entry['product_no'],
+                'is_negative': entry['is_negative'],
+                'analyzed_at': datetime.fromtimestamp(entry['analyzed_at']).isoformat(),
+                'channels_sent': sorted(entry['sent_at']),
+                'lags_s': lags
+            })
+        return recent
+
+    def clear(self):
+        with self._lock:
+            self._samples.clear()
+            self._reviews.clear()
+            self._webhooks.clear()
+
+
+def _create_default_tracker() -> DetectionLagTracker:
+    from config.settings import settings
+    return DetectionLagTracker(settings.detection_lag_window, settings.detection_lag_max_reviews)
+
+
+# 전역 감지 지연 추적기
+detection_lag_tracker = _create_default_tracker()
@@ -0,0 +1,160 @@
+"""
+웹훅 중복 수신 처리 (멱등성 키 저장소)
+
+카페24와 채널톡은 응답이 늦으면 같은 웹훅을 다시 보내므로, 처리가 느려질수록 같은 이벤트의 수집/분석/알림이 반복되어
+부하가 더 커집니다. 웹훅마다 이벤트 키를 만들어 WEBHOOK_IDEMPOTENCY_TTL_SECONDS 동안 보관하고, 이미 처리했거나
+처리 중인 키로 다시 들어온 웹훅은 처리 없이 바로 응답합니다.
+
+- 이벤트 키: 페이로드의 이벤트 ID가 있으면 그 값, 카페24는 (event_no, mall_id, board_no, article_no),
+  그 밖에는 본문 해시 (재전송은 본문이 같음)
+- 처리에 실패(예외 또는 처리 함수가 False 반환)하면 키를 지워 다음 재전송 때 다시 처리합니다.
+- 카페24 웹훅은 수집을 작업 큐에 넘기고 바로 응답하므로, 수집 요청이 키를 넘겨받아(hand_off_current_event)
+  그 웹훅을 포함하는 수집이 끝날 때 완료/실패를 표시합니다. 그때까지 키는 처리 중으로 남아 재전송은 중복으로 응답하고,
+  수집이 실패하면 키를 지워 다음 재전송 때 다시 수집합니다.
+- 키는 최대 WEBHOOK_IDEMPOTENCY_MAX_KEYS개까지만 보관하고, 넘으면 가장 오래된 키부터 지웁니다 (프로세스별 메모리 저장소).
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+from app.shared.utils.metrics import WEBHOOK_DUPLICATES_TOTAL, WEBHOOK_IDEMPOTENCY_KEYS
+
+PROCESSING = 'processing'
+DONE = 'done'
+
+_local = threading.local()
+
+# 페이로드 최상위/data에서 이벤트 ID로 쓰는 필드
+_EVENT_ID_FIELDS = ('event_id', 'eventId', 'trace_id', 'id')
+
+
+def webhook_event_key(payload: Dict[str, Any], source: str = None) -> Optional[str]:
+    """웹훅 이벤트 키 (페이로드가 dict가 아니면 None)"""
+    if not isinstance(payload, dict):
+        return None
+    source = source or 'unknown'
+
+    for container in (payload, payload.get('data')):
+        if not isinstance(container, dict):
+            continue
+        for field in _EVENT_ID_FIELDS:
+            if container.get(field):
+                return f"{source}:id:{container[field]}"
+
+    resource = payload.get('resource')
+    if isinstance(resource, dict) and resource.get('article_no') is not None:
+        return (f"{source}:{payload.get('event_no')}:{resource.get('mall_id')}:"
+                f"{resource.get('board_no')}:{resource.get('article_no')}")
+
+    body = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return f"{source}:sha1:{hashlib.sha1(body.encode('utf-8')).hexdigest()}"
+
+
+def mark_current_event(key: Optional[str]):
+    """현재 스레드에서 처리 중인 웹훅의 이벤트 키 기록 (같은 스레드의 수집 요청에서 넘겨받음)"""
+    _local.event_key = key
+
+
+def hand_off_current_event() -> Optional[str]:
+    """현재 웹훅의 이벤트 키를 넘겨받음. 넘겨받은 쪽이 complete/release를 호출하고, 웹훅 처리 함수는 더 이상 표시하지 않음"""
+    key = getattr(_local, 'event_key', None)
+    _local.event_key = None
+    return key
+
+
+def clear_current_event() -> Optional[str]:
+    """웹훅 처리를 마칠 때 호출. 넘겨받은 쪽이 없으면 그 키를, 넘겨줬으면 None 반환"""
+    return hand_off_current_event()
+
+
+class IdempotencyStore:
+    """이벤트 키별 처리 상태를 TTL 동안 보관하는 크기 제한 저장소 (스레드 안전)"""
+
+    def __init__(self, ttl_seconds: float = 3600.0, max_keys: int = 10000, enabled: bool = True):
+        self.ttl_seconds = ttl_seconds
+        self.max_keys = max(1, max_keys)
+        self.enabled = enabled
+        self._entries = OrderedDict()  # 키 -> (상태, 만료 시각), 만료 시각 오름차순
+        self._lock = threading.Lock()
+        self.duplicates = 0
+        self.evicted = 0
+
+    def _expire(self, now: float):
+        """락 안에서 호출"""
+        while self._entries:
+            key, (_, expires_at) = next(iter(self._entries.items()))
+            if expires_at > now:
+                break
+            self._entries.popitem(last=False)
+        while len(self._entries) > self.max_keys:
+            self._entries.popitem(last=False)
+            self.evicted += 1
+
+    def _set(self, key: str, state: str, now: float):
+        """락 안에서 호출. 만료 시각 순서를 유지하도록 맨 뒤로 옮김"""
+        self._entries.pop(key, None)
+        self._entries[key] = (state, now + self.ttl_seconds)
+        self._expire(now)
+        WEBHOOK_IDEMPOTENCY_KEYS.set(len(self._entries))
+
+    def claim(self, key: Optional[str], source: str = 'unknown') -> bool:
+        """처음 받은 이벤트면 처리 중으로 표시하고 True. 이미 처리했거나 처리 중이면 False"""
+        if not self.enabled or not key:
+            return True
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            if key in self._entries:
+                self.duplicates += 1
+                duplicate = True
+            else:
+                self._set(key, PROCESSING, now)
+                duplicate = False
+        if duplicate:
+            WEBHOOK_DUPLICATES_TOTAL.inc(source=source)
+        return not duplicate
+
+    def complete(self, key: Optional[str]):
+        """처리 완료 (TTL 동안 같은 이벤트는 중복으로 응답)"""
+        if not self.enabled or not key:
+            return
+        with self._lock:
+            self._set(key, DONE, time.monotonic())
+
+    def release(self, key: Optional[str]):
+        """처리 실패 - 키를 지워 재전송 때 다시 처리"""
+        if not self.enabled or not key:
+            return
+        with self._lock:
+            self._entries.pop(key, None)
+            WEBHOOK_IDEMPOTENCY_KEYS.set(len(self._entries))
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            self._expire(time.monotonic())
+            processing = sum(1 for state, _ in self._entries.values() if state == PROCESSING)
+            keys = len(self._entries)
+        return {
+            'enabled': self.enabled,
+            'ttl_seconds': self.ttl_seconds,
+            'max_keys': self.max_keys,
+            'keys': keys,
+            'processing': processing,
+            'duplicates': self.duplicates,
+            'evicted': self.evicted
+        }
+
+
+def _create_default():
+    from config.settings import settings
+    return IdempotencyStore(ttl_seconds=settings.webhook_idempotency_ttl_seconds,
+                            max_keys=settings.webhook_idempotency_max_keys,
+                            enabled=settings.webhook_idempotency_enabled)
+
+
+# 전역 웹훅 멱등성 저장소 (웹훅 엔드포인트에서 사용)
+webhook_idempotency = _create_default()
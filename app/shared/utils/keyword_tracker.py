@@ -0,0 +1,267 @@
+"""
+부정 리뷰 키워드 실시간 추적기 - Space-Saving 기반 heavy hitter 스케치
+"""
+
+import heapq
+import re
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import List, Dict, Any, Iterable, Optional
+
+
+# 한글 단어 추출 패턴 (매 호출마다 컴파일하지 않도록 모듈 로드 시 1회 컴파일)
+KOREAN_WORD_PATTERN = re.compile(r'[가-힣]+')
+
+# 한국어 불용어
+STOPWORDS = frozenset({
+    '이', '그', '저', '것', '들', '의', '가', '을', '를', '에', '와', '과',
+    '도', '만', '하다', '되다', '있다', '없다', '같다', '다', '네', '요',
+    '입니다', '습니다', '해요', '해서', '하고', '해도', '했다', '됩니다'
+})
+
+# 상품 번호가 없는 리뷰 및 전체 집계용 키
+ALL_PRODUCTS = '__all__'
+
+
+def extract_keywords(text: str) -> List[str]:
+    """리뷰 텍스트에서 키워드 후보 추출 (한글 2자 이상, 불용어 제외)"""
+    if not text:
+        return []
+    return [word for word in KOREAN_WORD_PATTERN.findall(text)
+            if len(word) >= 2 and word not in STOPWORDS]
+
+
+class SpaceSavingSketch:
+    """고정 크기 heavy hitter 스케치 (Space-Saving 알고리즘)
+
+    최대 capacity개의 키워드만 유지하며, 가득 찬 상태에서 새 키워드가 들어오면
+    최소 빈도 항목을 교체하고 그 빈도를 오차(error)로 기록합니다.
+    """
+
+    def __init__(self, capacity: int = 200):
+        self.capacity = capacity
+        self.counts = {}
+        self.errors = {}
+        self.total = 0
+        # (count, item) 최소 힙 - 갱신된 항목의 이전 엔트리는 lazy하게 무시
+        self._heap = []
+
+    def add(self, item: str, count: int = 1):
+        """항목 빈도 증가"""
+        self.total += count
+
+        if item in self.counts:
+            self.counts[item] += count
+        elif len(self.counts) < self.capacity:
+            self.counts[item] = count
+            self.errors[item] = 0
+        else:
+            min_item, min_count = self._pop_min()
+            del self.counts[min_item]
+            del self.errors[min_item]
+            self.counts[item] = min_count + count
+            self.errors[item] = min_count
+
+        heapq.heappush(self._heap, (self.counts[item], item))
+
+        # 오래된 힙 엔트리가 쌓이면 재구성
+        if len(self._heap) > self.capacity * 4:
+            self._heap = [(c, i) for i, c in self.counts.items()]
+            heapq.heapify(self._heap)
+
+    def _pop_min(self):
+        """현재 최소 빈도 항목 반환 (힙에서 제거)"""
+        while self._heap:
+            count, item = heapq.heappop(self._heap)
+            if self.counts.get(item) == count:
+                return item, count
+        # 힙이 비어있는 경우는 없어야 하지만 방어적으로 재구성
+        item = min(self.counts, key=self.counts.get)
+        return item, self.counts[item]
+
+    def top(self, n: int = 10) -> List[tuple]:
+        """상위 n개 (항목, 빈도, 오차) 반환"""
+        ranked = heapq.nlargest(n, self.counts.items(), key=lambda x: x[1])
+        return [(item, count, self.errors.get(item, 0)) for item, count in ranked]
+
+    def __len__(self):
+        return len(self.counts)
+
+
+class _KeywordBuckets:
+    """상품 하나의 전체 기간 스케치 + 시간 버킷별 스케치"""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.all_time = SpaceSavingSketch(capacity)
+        self.review_count = 0
+        # bucket_start -> [SpaceSavingSketch, review_count]
+        self.buckets = OrderedDict()
+
+    def add(self, keywords: List[str], bucket_start: int):
+        self.review_count += 1
+
+        bucket = self.buckets.get(bucket_start)
+        if bucket is None:
+            out_of_order = bool(self.buckets) and bucket_start < next(reversed(self.buckets))
+            bucket = [SpaceSavingSketch(self.capacity), 0]
+            self.buckets[bucket_start] = bucket
+            # 과거 리뷰가 늦게 들어와도 시간순 유지
+            if out_of_order:
+                self.buckets = OrderedDict(sorted(self.buckets.items()))
+        bucket[1] += 1
+
+        for keyword in keywords:
+            self.all_time.add(keyword)
+            bucket[0].add(keyword)
+
+    def expire(self, oldest_bucket: int):
+        """보존 기간이 지난 버킷 제거"""
+        while self.buckets:
+            bucket_start = next(iter(self.buckets))
+            if bucket_start >= oldest_bucket:
+                break
+            del self.buckets[bucket_start]
+
+
+class NegativeKeywordTracker:
+    """부정 리뷰 키워드 증분 추적기
+
+    부정 리뷰가 들어올 때마다 상품별·시간 버킷별 Space-Saving 스케치를 갱신하므로
+    리뷰 텍스트를 다시 스캔하지 않고도 상품별 상위 불만 키워드를 즉시 조회할 수 있습니다.
+    메모리는 (상품 수 × 버킷 수 × capacity)로 상한이 고정됩니다.
+    """
+
+    def __init__(self, capacity: int = 200, bucket_seconds: int = 3600,
+                 max_buckets: int = 168, max_products: int = 500, max_seen_reviews: int = 10000):
+        self.capacity = capacity
+        self.bucket_seconds = bucket_seconds
+        self.max_buckets = max_buckets
+        self.max_products = max_products
+        self.max_seen_reviews = max_seen_reviews
+
+        self._products = OrderedDict()
+        self._seen_reviews = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _bucket_start(self, timestamp: float) -> int:
+        return int(timestamp // self.bucket_seconds) * self.bucket_seconds
+
+    def _review_timestamp(self, review: Dict) -> float:
+        """리뷰 작성 시각 (파싱 실패 시 현재 시각)"""
+        created_date = review.get('created_date') or review.get('created_at')
+        if created_date:
+            try:
+                return datetime.fromisoformat(str(created_date).replace('Z', '+00:00')).timestamp()
+            except ValueError:
+                pass
+        return time.time()
+
+    def _get_buckets(self, product_key: str) -> _KeywordBuckets:
+        buckets = self._products.get(product_key)
+        if buckets is None:
+            buckets = _KeywordBuckets(self.capacity)
+            self._products[product_key] = buckets
+            # 상품 수 상한 초과 시 가장 오래 갱신되지 않은 상품 제거 (전체 집계는 유지)
+            while len(self._products) > self.max_products:
+                for key in self._products:
+                    if key != ALL_PRODUCTS:
+                        del self._products[key]
+                        break
+        else:
+            self._products.move_to_end(product_key)
+        return buckets
+
+    def add_review(self, review: Dict, timestamp: float = None) -> bool:
+        """부정 리뷰 1건 반영 (이미 반영된 리뷰는 무시)"""
+        review_id = review.get('article_no')
+        text = (review.get('content', '') or review.get('text', '')) + ' ' + review.get('title', '')
+        keywords = extract_keywords(text)
+
+        if timestamp is None:
+            timestamp = self._review_timestamp(review)
+        bucket_start = self._bucket_start(timestamp)
+
+        with self._lock:
+            if review_id is not None:
+                seen_key = (review.get('board_no'), str(review_id))
+                if seen_key in self._seen_reviews:
+                    return False
+                self._seen_reviews[seen_key] = True
+                if len(self._seen_reviews) > self.max_seen_reviews:
+                    self._seen_reviews.popitem(last=False)
+
+            product_keys = [ALL_PRODUCTS]
+            if review.get('product_no') not in (None, ''):
+                product_keys.append(str(review['product_no']))
+
+            oldest_bucket = self._bucket_start(time.time()) - self.bucket_seconds * (self.max_buckets - 1)
+            for product_key in product_keys:
+                buckets = self._get_buckets(product_key)
+                buckets.add(keywords, bucket_start)
+                buckets.expire(oldest_bucket)
+
+        return True
+
+    def add_reviews(self, reviews: Iterable[Dict]) -> int:
+        """부정 리뷰만 골라 반영, 새로 반영된 건수 반환"""
+        added = 0
+        for review in reviews:
+            if review.get('is_negative', False) and self.add_review(review):
+                added += 1
+        return added
+
+    def top_keywords(self, product_no: Any = None, window_seconds: Optional[int] = None,
+                     top_n: int = 10) -> List[Dict[str, Any]]:
+        """상위 불만 키워드 조회
+
+        Args:
+            product_no: 상품 번호 (None이면 전체)
+            window_seconds: 최근 N초 구간만 집계 (None이면 전체 기간)
+            top_n: 반환할 키워드 수
+        """
+        product_key = str(product_no) if product_no not in (None, '') else ALL_PRODUCTS
+
+        with self._lock:
+            buckets = self._products.get(product_key)
+            if buckets is None:
+                return []
+
+            if window_seconds is None:
+                review_count = buckets.review_count
+                ranked = buckets.all_time.top(top_n)
+            else:
+                since = self._bucket_start(time.time() - window_seconds)
+                merged_counts = {}
+                merged_errors = {}
+                review_count = 0
+                for bucket_start, (sketch, count) in buckets.buckets.items():
+                    if bucket_start < since:
+                        continue
+                    review_count += count
+                    for item, item_count in sketch.counts.items():
+                        merged_counts[item] = merged_counts.get(item, 0) + item_count
+                        merged_errors[item] = merged_errors.get(item, 0) + sketch.errors.get(item, 0)
+                top_items = heapq.nlargest(top_n, merged_counts.items(), key=lambda x: x[1])
+                ranked = [(item, count, merged_errors[item]) for item, count in top_items]
+
+        return [{
+            'keyword': keyword,
+            'count': count,
+            'frequency': round(count / review_count, 2) if review_count else 0,
+            'max_error': error
+        } for keyword, count, error in ranked]
+
+    def get_status(self) -> Dict[str, Any]:
+        """추적기 상태 정보"""
+        with self._lock:
+            overall = self._products.get(ALL_PRODUCTS)
+            return {
+                'products': len([key for key in self._products if key != ALL_PRODUCTS]),
+                'negative_reviews': overall.review_count if overall else 0,
+                'capacity': self.capacity,
+                'bucket_seconds': self.bucket_seconds,
+                'max_buckets': self.max_buckets
+            }
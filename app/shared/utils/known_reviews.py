@@ -0,0 +1,170 @@
+"""
+이미 수집한 리뷰 집합 (시간 구간별, 크기 제한)
+
+리뷰 키(게시판 번호 + 글 번호)를 수집한 시각의 구간(bucket_seconds)별 set에 넣고, max_buckets 구간이 지난
+구간은 통째로 버립니다. 키가 max_keys를 넘으면 가장 오래된 구간부터 버리므로 몇 년치 리뷰가 쌓여도 메모리와
+저장 파일 크기는 보관 기간(또는 max_keys) 만큼으로 고정됩니다.
+
+- 키는 (게시판 번호 << 32 | 글 번호) 정수 하나 (숫자가 아니면 해시값). 같은 키는 최근 구간에만 남음
+- 포함 여부 확인은 구간 수(상수)만큼 set 조회
+- 저장 형식은 헤더 + 구간별 (시작 시각, 키 수) + int64 키 배열의 바이너리 (JSON 직렬화 없이 한 번에 읽고 씀)
+- Bloom 필터와 달리 거짓 양성이 없어, 신규 리뷰를 이미 본 리뷰로 잘못 판단해 알림을 놓치는 일이 없음
+"""
+
+import hashlib
+import os
+import struct
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from typing import Dict, Any, Iterable, Optional
+
+_MAGIC = b'KRV1'
+_HEADER = struct.Struct('<4sqI')  # 매직, 구간 길이(초), 구간 수
+_BUCKET = struct.Struct('<qI')  # 구간 시작 시각, 키 수
+
+
+def review_key(review: Dict) -> Optional[int]:
+    """리뷰 키 (게시판 번호 << 32 | 글 번호). 글 번호가 없으면 None"""
+    article_no = review.get('article_no')
+    if article_no in (None, ''):
+        return None
+    try:
+        return (int(review.get('board_no') or 0) << 32) | int(article_no)
+    except (TypeError, ValueError):
+        digest = hashlib.blake2b(f"{review.get('board_no')}:{article_no}".encode('utf-8'), digest_size=8).digest()
+        return struct.unpack('<q', digest)[0]
+
+
+class KnownReviewSet:
+    """보관 기간 동안 이미 수집한 리뷰 키 집합 (스레드 안전)"""
+
+    def __init__(self, bucket_seconds: int = 86400, max_buckets: int = 30, max_keys: int = 200000):
+        self.bucket_seconds = max(1, bucket_seconds)
+        self.max_buckets = max(1, max_buckets)
+        self.max_keys = max(1, max_keys)
+        self._buckets = OrderedDict()  # 구간 시작 시각 -> 키 set (오래된 순)
+        self._size = 0
+        self._lock = threading.Lock()
+        self.dirty = False
+
+    @property
+    def retention_seconds(self) -> int:
+        return self.bucket_seconds * self.max_buckets
+
+    def _bucket_start(self, timestamp: float) -> int:
+        return int(timestamp // self.bucket_seconds) * self.bucket_seconds
+
+    def _expire(self, now: float):
+        """락 안에서 호출. 보관 기간이 지났거나 max_keys를 넘으면 오래된 구간부터 삭제"""
+        oldest = self._bucket_start(now) - (self.max_buckets - 1) * self.bucket_seconds
+        while self._buckets:
+            start, keys = next(iter(self._buckets.items()))
+            if start >= oldest and self._size <= self.max_keys:
+                break
+            self._buckets.popitem(last=False)
+            self._size -= len(keys)
+            self.dirty = True
+
+    def _contains(self, key: int) -> bool:
+        return any(key in keys for keys in self._buckets.values())
+
+    def __contains__(self, review: Dict) -> bool:
+        key = review_key(review)
+        if key is None:
+            return False
+        with self._lock:
+            return self._contains(key)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add_reviews(self, reviews: Iterable[Dict], timestamp: float = None) -> int:
+        """리뷰 키 추가 (이미 있으면 최근 구간으로 옮김). 새로 추가한 수 반환"""
+        now = timestamp if timestamp is not None else time.time()
+        start = self._bucket_start(now)
+        added = 0
+        with self._lock:
+            bucket = self._buckets.get(start)
+            if bucket is None:
+                bucket = self._buckets[start] = set()
+            for review in reviews:
+                key = review_key(review)
+                if key is None or key in bucket:
+                    continue
+                for keys in self._buckets.values():
+                    if key in keys:
+                        keys.discard(key)
+                        self._size -= 1
+                        break
+                else:
+                    added += 1
+                bucket.add(key)
+                self._size += 1
+                self.dirty = True
+            self._expire(now)
+        return added
+
+    def clear(self):
+        with self._lock:
+            self._buckets.clear()
+            self._size = 0
+            self.dirty = True
+
+    def to_bytes(self) -> bytes:
+        with self._lock:
+            self._expire(time.time())
+            buckets = [(start, array('q', keys)) for start, keys in self._buckets.items()]
+        parts = [_HEADER.pack(_MAGIC, self.bucket_seconds, len(buckets))]
+        for start, keys in buckets:
+            parts.append(_BUCKET.pack(start, len(keys)))
+            parts.append(keys.tobytes())
+        return b''.join(parts)
+
+    def load_bytes(self, data: bytes) -> int:
+        """저장된 바이트에서 복원 (구간 길이가 달라졌으면 각 구간을 새 구간 길이에 맞춰 합침). 복원한 키 수 반환"""
+        magic, bucket_seconds, bucket_count = _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC:
+            raise ValueError('알 수 없는 리뷰 키 파일 형식')
+        offset = _HEADER.size
+        buckets = OrderedDict()
+        for _ in range(bucket_count):
+            start, count = _BUCKET.unpack_from(data, offset)
+            offset += _BUCKET.size
+            keys = array('q')
+            keys.frombytes(data[offset:offset + count * keys.itemsize])
+            offset += count * keys.itemsize
+            buckets.setdefault(self._bucket_start(start), set()).update(keys)
+
+        with self._lock:
+            self._buckets = OrderedDict(sorted(buckets.items()))
+            self._size = sum(len(keys) for keys in self._buckets.values())
+            self._expire(time.time())
+            self.dirty = False
+            return self._size
+
+    def save(self, filepath: str):
+        """바이너리 파일로 저장 (임시 파일에 쓴 뒤 교체)"""
+        data = self.to_bytes()
+        temp_path = f"{filepath}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, filepath)
+        self.dirty = False
+
+    def load(self, filepath: str) -> int:
+        if not os.path.exists(filepath):
+            return 0
+        with open(filepath, 'rb') as f:
+            return self.load_bytes(f.read())
+
+    def get_status(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'keys': self._size,
+                'buckets': len(self._buckets),
+                'bucket_seconds': self.bucket_seconds,
+                'retention_seconds': self.retention_seconds,
+                'max_keys': self.max_keys
+            }
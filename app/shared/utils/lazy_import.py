@@ -0,0 +1,57 @@
+"""
+지연 import 유틸리티
+
+무거운 모듈을 모듈 최상단에서는 이름만 잡아두고, 처음 속성에 접근할 때 실제로 import합니다.
+콜드 스타트 시 포트를 여는 데 필요 없는 import(requests 등)를 워밍업 스레드나 첫 사용 시점으로 미룹니다.
+
+사용 예:
+    requests = lazy_import('requests')
+    requests.get(url)   # 여기서 처음 import
+"""
+
+import importlib
+import sys
+import threading
+import types
+
+
+class LazyModule(types.ModuleType):
+    """첫 속성 접근 시 실제 모듈을 import하고 이후 속성 조회를 위임하는 프록시"""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self._lazy_lock = threading.Lock()
+        self._lazy_target = None
+
+    def _load(self) -> types.ModuleType:
+        target = self._lazy_target
+        if target is None:
+            with self._lazy_lock:
+                if self._lazy_target is None:
+                    self._lazy_target = importlib.import_module(self.__name__)
+                target = self._lazy_target
+        return target
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = 'loaded' if self._lazy_target is not None else 'not loaded'
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+def lazy_import(name: str):
+    """이미 import된 모듈이면 그대로, 아니면 첫 사용 시 import하는 프록시 반환"""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return LazyModule(name)
+
+
+def preload(*names: str):
+    """지연 import 대상 모듈을 미리 import (워밍업용)"""
+    for name in names:
+        importlib.import_module(name)
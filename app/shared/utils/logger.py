@@ -0,0 +1,208 @@
+"""
+구조화 로깅 유틸리티
+
+요청 스레드에서는 로그 레코드를 큐에 넣기만 하고, 포맷팅과 stdout 출력은 별도 리스너 스레드에서 수행합니다.
+큐가 가득 차면 요청 스레드를 막지 않고 해당 레코드를 버립니다 (버린 건수는 logging_stats()로 확인).
+
+사용 예:
+    log = get_logger(__name__)
+    log.info("🆕 신규 리뷰 발견", count=3)                      # 키워드 인자는 구조화 필드로 기록
+    log.debug("리뷰 분석 진행", sample='analysis_progress', index=i)  # 같은 키는 N건 중 1건만 기록
+    log.exception("❌ 웹훅 처리 오류")                           # 예외 traceback 포함
+
+LOG_FORMAT=json(기본값)이면 Cloud Logging이 읽는 severity/message 필드를 가진 JSON 한 줄로 출력합니다.
+"""
+
+import atexit
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional
+
+ROOT_LOGGER_NAME = 'app'
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄 JSON 포맷 (Cloud Logging 구조화 로그)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'severity': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage()
+        }
+        entry.update(getattr(record, 'fields', None) or {})
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry['exception'] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """로컬 개발용 텍스트 포맷 (구조화 필드는 key=value로 뒤에 붙임)"""
+
+    def __init__(self):
+        super().__init__('%(asctime)s %(levelname)s %(name)s: %(message)s')
+
+    def format(self, record: logging.LogRecord) -> str:
+        text = super().format(record)
+        fields = getattr(record, 'fields', None)
+        if fields:
+            text += ' ' + ' '.join(f"{key}={value}" for key, value in fields.items())
+        return text
+
+
+class LogSampler:
+    """대량 로그 샘플링 (키별로 첫 건과 이후 every건마다 1건만 통과)"""
+
+    def __init__(self, every: int = 100):
+        self.every = max(1, every)
+        self._counts = {}
+        self._lock = threading.Lock()
+
+    def allow(self, key: str) -> bool:
+        with self._lock:
+            count = self._counts.get(key, 0)
+            self._counts[key] = count + 1
+        return count % self.every == 0
+
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+
+_traceback_formatter = logging.Formatter()
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """큐가 가득 차면 대기하지 않고 레코드를 버리는 QueueHandler"""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 기본 구현은 traceback을 메시지에 합치므로, 메시지와 traceback을 따로 보존
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _traceback_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """출력 시점의 sys.stdout에 기록 (벤치마크의 stdout 리다이렉트와 호환)"""
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+class StructuredLogger(logging.LoggerAdapter):
+    """키워드 인자를 구조화 필드로, sample 키는 샘플링으로 처리하는 로거"""
+
+    def __init__(self, logger: logging.Logger):
+        super().__init__(logger, {})
+
+    def log(self, level, msg, *args, exc_info=None, stack_info=False, sample: Optional[str] = None, **fields):
+        if not self.isEnabledFor(level):
+            return
+        if sample is not None:
+            if not _sampler.allow(sample):
+                return
+            fields['sample_every'] = _sampler.every
+        self.logger.log(level, msg, *args, exc_info=exc_info, stack_info=stack_info,
+                        extra={'fields': fields}, stacklevel=3)
+
+
+_sampler = LogSampler()
+_state = {'handler': None, 'listener': None, 'queue_size': 0, 'formatter': None}
+_setup_lock = threading.Lock()
+
+
+def _start_listener():
+    log_queue = queue.Queue(maxsize=_state['queue_size'])
+    output = _StdoutHandler()
+    output.setFormatter(_state['formatter'])
+    listener = logging.handlers.QueueListener(log_queue, output, respect_handler_level=False)
+    listener.start()
+    _state['handler'].queue = log_queue
+    _state['listener'] = listener
+
+
+def _restart_listener_after_fork():
+    # gunicorn --preload: 마스터에서 시작한 리스너 스레드는 포크된 워커에 없으므로 워커에서 다시 시작
+    if _state['handler'] is not None:
+        _start_listener()
+
+
+def setup_logging(level: str = None, log_format: str = None, queue_size: int = None, sample_every: int = None):
+    """앱 로거(app.*) 설정. 여러 번 호출해도 한 번만 적용"""
+    from config.settings import settings
+
+    with _setup_lock:
+        if _state['handler'] is not None:
+            return
+
+        log_format = (log_format or settings.log_format).lower()
+        _state['formatter'] = JsonFormatter() if log_format == 'json' else TextFormatter()
+        _state['queue_size'] = queue_size if queue_size is not None else settings.log_queue_size
+        _sampler.every = max(1, sample_every or settings.log_sample_every)
+
+        root = logging.getLogger(ROOT_LOGGER_NAME)
+        root.setLevel((level or settings.log_level).upper())
+        root.propagate = False
+
+        _state['handler'] = NonBlockingQueueHandler(queue.Queue())
+        _start_listener()
+        root.addHandler(_state['handler'])
+
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=_restart_listener_after_fork)
+        atexit.register(shutdown_logging)
+
+
+def shutdown_logging():
+    """큐에 남은 로그를 모두 출력하고 리스너 종료"""
+    listener = _state['listener']
+    if listener is not None and listener._thread is not None:
+        listener.stop()
+
+
+def get_logger(name: str) -> StructuredLogger:
+    """app.* 네임스페이스의 구조화 로거"""
+    if name != ROOT_LOGGER_NAME and not name.startswith(ROOT_LOGGER_NAME + '.'):
+        name = f"{ROOT_LOGGER_NAME}.{name}"
+    return StructuredLogger(logging.getLogger(name))
+
+
+def logging_stats() -> Dict[str, Any]:
+    """로깅 큐/샘플링 상태 (디버그용)"""
+    handler = _state['handler']
+    return {
+        'configured': handler is not None,
+        'queued': handler.queue.qsize() if handler else 0,
+        'dropped': handler.dropped if handler else 0,
+        'sample_every': _sampler.every,
+        'sampled_keys': _sampler.counts()
+    }
@@ -0,0 +1,366 @@
+"""
+Prometheus 형식 메트릭 유틸리티
+
+외부 라이브러리 없이 카운터/게이지/히스토그램을 프로세스 메모리에 집계하고
+/metrics 엔드포인트에서 Prometheus 텍스트 포맷(0.0.4)으로 내보냅니다.
+gunicorn 워커가 여러 개면 워커별로 따로 집계되므로 스크랩 시 instance 라벨로 구분됩니다.
+
+사용 예:
+    PKL_INFERENCE_SECONDS.observe(0.003, outcome='success')
+    with COLLECTION_SECONDS.time(trigger='webhook'):
+        ...
+    @instrument(GPT_REQUEST_SECONDS, outcome=lambda result, error: 'success' if result else 'failed')
+    def call_gpt(...): ...
+"""
+
+import bisect
+import functools
+import math
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_NUMERIC_PATH_SEGMENT = re.compile(r'/\d+(?=/|$)')
+
+
+def normalize_endpoint(endpoint: str) -> str:
+    """라벨 카디널리티를 줄이기 위해 경로의 숫자 ID를 {id}로 치환"""
+    path = '/' + (endpoint or '').split('?', 1)[0].strip('/')
+    return _NUMERIC_PATH_SEGMENT.sub('/{id}', path).lstrip('/')
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label_value(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(labelnames: Iterable[str], labelvalues: Iterable, extra: Tuple = ()) -> str:
+    pairs = [f'{name}="{_escape_label_value(value)}"' for name, value in zip(labelnames, labelvalues)]
+    pairs.extend(f'{name}="{_escape_label_value(value)}"' for name, value in extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+class _Metric:
+    metric_type = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def _key(self, labels: Dict) -> Tuple:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} 라벨 불일치: {sorted(labels)} != {sorted(self.labelnames)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        """(이름 접미사, 라벨 문자열, 값) 목록"""
+        with self._lock:
+            items = sorted(self._values.items())
+        return [('', _format_labels(self.labelnames, key), value) for key, value in items]
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.metric_type}"]
+        lines.extend(f"{self.name}{suffix}{labels} {_format_value(value)}" for suffix, labels, value in self.samples())
+        return lines
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+    metric_type = 'counter'
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+
+class Gauge(_Metric):
+    """현재 값 게이지 (set_function으로 스크랩 시점에 계산할 수도 있음)"""
+    metric_type = 'gauge'
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._functions = {}
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels):
+        self.inc(-amount, **labels)
+
+    def set_function(self, func: Callable[[], Optional[float]], **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._functions[key] = func
+
+    @contextmanager
+    def track_inprogress(self, **labels):
+        self.inc(**labels)
+        try:
+            yield
+        finally:
+            self.dec(**labels)
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        with self._lock:
+            values = dict(self._values)
+            functions = dict(self._functions)
+        for key, func in functions.items():
+            try:
+                value = func()
+            except Exception:
+                value = None
+            if value is not None:
+                values[key] = float(value)
+        return [('', _format_labels(self.labelnames, key), value) for key, value in sorted(values.items())]
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램 (단위: 초)"""
+    metric_type = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                 buckets: Iterable[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = {'counts': [0] * (len(self.buckets) + 1), 'sum': 0.0, 'count': 0}
+            state['counts'][index] += 1
+            state['sum'] += value
+            state['count'] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started_at, **labels)
+
+    def snapshot(self, **labels) -> Dict:
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            return {'count': state['count'], 'sum': state['sum']} if state else {'count': 0, 'sum': 0.0}
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        with self._lock:
+            items = sorted((key, dict(state, counts=list(state['counts']))) for key, state in self._values.items())
+
+        samples = []
+        for key, state in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), state['counts']):
+                cumulative += count
+                labels = _format_labels(self.labelnames, key, extra=(('le', _format_value(bound)),))
+                samples.append(('_bucket', labels, cumulative))
+            labels = _format_labels(self.labelnames, key)
+            samples.append(('_sum', labels, state['sum']))
+            samples.append(('_count', labels, state['count']))
+        return samples
+
+
+class MetricsRegistry:
+    """메트릭 등록/출력"""
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                  buckets: Iterable[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = [self._metrics[name] for name in sorted(self._metrics)]
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+    def clear(self):
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.clear()
+
+
+def instrument(histogram: Histogram, counter: Counter = None,
+               outcome: Callable = None, **labels):
+    """함수 실행 시간을 histogram에, 호출 수를 counter에 기록하는 데코레이터
+
+    outcome(result, error)가 주어지면 반환값/예외로 outcome 라벨 값을 정합니다.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            started_at = time.perf_counter()
+            result, error = None, None
+            try:
+                result = func(*args, **kwargs)
+                return result
+            except Exception as e:
+                error = e
+                raise
+            finally:
+                metric_labels = dict(labels)
+                if outcome is not None:
+                    metric_labels['outcome'] = outcome(result, error)
+                histogram.observe(time.perf_counter() - started_at, **metric_labels)
+                if counter is not None:
+                    counter.inc(**metric_labels)
+        return wrapper
+    return decorator
+
+
+def result_outcome(result, error) -> str:
+    """반환값이 있으면 success, 없거나 예외면 failed/error"""
+    if error is not None:
+        return 'error'
+    return 'success' if result else 'failed'
+
+
+def hit_ratio(counter: Counter, **labels) -> Optional[float]:
+    """result=hit/miss 라벨을 가진 카운터의 적중률"""
+    hits = counter.value(result='hit', **labels)
+    misses = counter.value(result='miss', **labels)
+    total = hits + misses
+    return hits / total if total else None
+
+
+# 전역 레지스트리
+metrics = MetricsRegistry()
+
+# ===== 감정 분석 =====
+PKL_INFERENCE_SECONDS = metrics.histogram(
+    'review_pkl_inference_seconds', 'pkl 모델 리뷰 1건 분석 시간', ['outcome'],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0))
+GPT_REQUEST_SECONDS = metrics.histogram(
+    'review_gpt_request_seconds', 'GPT 분석 호출 시간', ['stage', 'outcome'])
+GPT_REQUESTS_TOTAL = metrics.counter(
+    'review_gpt_requests_total', 'GPT 분석 호출 수', ['stage', 'outcome'])
+GPT_REFINEMENTS_TOTAL = metrics.counter(
+    'review_gpt_refinements_total', '마감 시간을 넘겨 백그라운드에서 끝난 GPT 2차 분석 수', ['outcome'])
+GPT_ROUTING_TOTAL = metrics.counter(
+    'review_gpt_routing_total', 'GPT 2차 분석 라우팅 결정 수 (사유별 에스컬레이션, pkl_only, skipped_budget, skipped_latency)', ['decision'])
+GPT_TOKENS_TOTAL = metrics.counter(
+    'review_gpt_tokens_total', 'GPT 요청 토큰 사용량', ['kind'])
+INFERENCE_POOL_BATCH_SECONDS = metrics.histogram(
+    'review_inference_pool_batch_seconds', '추론 프로세스 풀 배치 처리 시간', ['outcome'])
+NEAR_DUPLICATE_TOTAL = metrics.counter(
+    'review_near_duplicate_total', '유사 중복 리뷰 클러스터 대응 수 (exact, similar, new)', ['match'])
+NEAR_DUPLICATE_REUSED_TOTAL = metrics.counter(
+    'review_near_duplicate_reused_total', '클러스터의 분석 결과를 재사용해 분석하지 않은 리뷰 수')
+REVIEW_SPAM_BURSTS_TOTAL = metrics.counter(
+    'review_spam_bursts_total', '같은 내용의 리뷰가 짧은 시간에 몰린 횟수 (리뷰 스팸 의심)')
+
+# ===== 카페24 API =====
+CAFE24_REQUEST_SECONDS = metrics.histogram(
+    'cafe24_request_seconds', '카페24 API 요청 시간 (재시도 포함 각 시도)', ['method', 'endpoint', 'status'])
+CAFE24_REQUESTS_TOTAL = metrics.counter(
+    'cafe24_requests_total', '카페24 API 요청 수', ['method', 'endpoint', 'status'])
+CAFE24_TOKEN_REFRESHES_TOTAL = metrics.counter(
+    'cafe24_token_refreshes_total', '카페24 액세스 토큰 갱신 수', ['outcome'])
+
+# ===== 웹훅 / 리뷰 수집 =====
+WEBHOOK_IN_FLIGHT = metrics.gauge(
+    'webhook_in_flight', '처리 중인 웹훅 요청 수 (동기 처리이므로 대기열 깊이와 같음)')
+WEBHOOK_REQUEST_SECONDS = metrics.histogram(
+    'webhook_request_seconds', '웹훅 요청 처리 시간', ['source', 'outcome'])
+WEBHOOK_DUPLICATES_TOTAL = metrics.counter(
+    'webhook_duplicates_total', '이미 받은 이벤트라 처리 없이 응답한 웹훅 수', ['source'])
+WEBHOOK_IDEMPOTENCY_KEYS = metrics.gauge(
+    'webhook_idempotency_keys', '중복 확인용으로 보관 중인 웹훅 이벤트 키 수')
+COLLECTION_SECONDS = metrics.histogram(
+    'review_collection_seconds', '신규 리뷰 수집/분석/알림 전체 시간', ['outcome'])
+COLLECTION_NEW_REVIEWS_TOTAL = metrics.counter(
+    'review_collection_new_reviews_total', '수집된 신규 리뷰 수')
+COLLECTION_COALESCED_TOTAL = metrics.counter(
+    'review_collection_coalesced_total', '이미 진행 중인 수집에 합쳐진 수집 요청 수')
+COLLECTION_PRIORITY_TOTAL = metrics.counter(
+    'review_collection_priority_total', '수집된 신규 리뷰의 처리 순서 분류 수', ['tier'])
+WORK_QUEUE_DEPTH = metrics.gauge(
+    'work_queue_depth', '백그라운드 우선순위 큐 대기 작업 수', ['queue'])
+WORK_QUEUE_WAIT_SECONDS = metrics.histogram(
+    'work_queue_wait_seconds', '백그라운드 우선순위 큐 대기 시간', ['queue'])
+ADMISSION_REJECTED_TOTAL = metrics.counter(
+    'admission_rejected_total', '처리 한도 초과로 429 응답한 요청 수', ['route'])
+ADMISSION_MODE = metrics.gauge(
+    'admission_mode', '웹훅 처리 모드 (0 정상, 1 저하)')
+
+# ===== 알림 =====
+NOTIFICATION_SEND_SECONDS = metrics.histogram(
+    'notification_send_seconds', '알림 채널별 전송 시간', ['channel', 'outcome'])
+NOTIFICATIONS_TOTAL = metrics.counter(
+    'notifications_total', '알림 채널별 전송 수', ['channel', 'outcome'])
+
+# ===== 회로 차단기 =====
+CIRCUIT_BREAKER_STATE = metrics.gauge(
+    'circuit_breaker_state', '의존성별 회로 상태 (0 닫힘, 1 반열림, 2 열림)', ['name'])
+CIRCUIT_BREAKER_TRANSITIONS_TOTAL = metrics.counter(
+    'circuit_breaker_transitions_total', '회로 상태 전환 수', ['name', 'state'])
+CIRCUIT_BREAKER_REJECTED_TOTAL = metrics.counter(
+    'circuit_breaker_rejected_total', '회로가 열려 호출하지 않고 바로 실패한 수', ['name'])
+
+# ===== 캐시 =====
+CACHE_REQUESTS_TOTAL = metrics.counter(
+    'cache_requests_total', '캐시 조회 수', ['cache', 'result'])
+CACHE_HIT_RATIO = metrics.gauge(
+    'cache_hit_ratio', '캐시 적중률 (프로세스 시작 이후)', ['cache'])
+for _cache in ('product_name', 'review_cache', 'review_boards', 'pkl_prediction'):
+    CACHE_HIT_RATIO.set_function(functools.partial(hit_ratio, CACHE_REQUESTS_TOTAL, cache=_cache), cache=_cache)
+
+# ===== 시작 / 준비 상태 =====
+STARTUP_SECONDS = metrics.gauge(
+    'app_startup_seconds', '프로세스 시작부터 단계 완료까지 걸린 시간', ['phase'])
+WARMUP_TASK_SECONDS = metrics.gauge(
+    'app_warmup_task_seconds', '워밍업 작업별 소요시간', ['task', 'outcome'])
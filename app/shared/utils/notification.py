@@ -4,10 +4,29 @@
 
 import json
 import os
-import requests
+import time
 from datetime import datetime
 from typing import List, Dict, Any
 from collections import deque
+from app.shared.utils.metrics import instrument, NOTIFICATION_SEND_SECONDS, NOTIFICATIONS_TOTAL
+from app.shared.utils.timing import stage
+from app.shared.utils.circuit_breaker import circuit_breakers
+from app.shared.utils.detection_lag import detection_lag_tracker
+from app.shared.utils.logger import get_logger
+from app.shared.utils.lazy_import import lazy_import
+
+requests = lazy_import('requests')
+log = get_logger(__name__)
+
+
+def _sent_outcome(result, error) -> str:
+    return 'success' if result and error is None else 'failed'
+
+
+def _is_dependency_failure(error) -> bool:
+    """연결 오류/타임아웃/5xx만 메시징 서비스 장애로 봄 (4xx는 요청 쪽 문제)"""
+    response = getattr(error, 'response', None)
+    return response is None or response.status_code >= 500
 
 
 class NotificationManager:
@@ -28,6 +47,12 @@ class NotificationManager:
         self.channel_talk_access_token = settings.channel_talk_access_key
         self.channel_talk_secret = settings.channel_talk_secret_key
         self.channel_talk_group_id = settings.channel_talk_group_id
+        self.channel_talk_api_base_url = settings.channel_talk_api_base_url
+        
+        # 전송 타임아웃 + 채널별 회로 차단기 (장애 중에는 기다리지 않고 바로 실패)
+        self.request_timeout = settings.messaging_request_timeout
+        self.kakao_breaker = circuit_breakers.get('kakao', settings.messaging_slow_call_seconds)
+        self.channel_talk_breaker = circuit_breakers.get('channel_talk', settings.messaging_slow_call_seconds)
         
     def add_notification(self, title: str, message: str, notification_type: str = "info", 
                         data: Dict[str, Any] = None) -> Dict[str, Any]:
@@ -154,7 +179,7 @@ class NotificationManager:
                 
                 return history[:limit]
         except Exception as e:
-            print(f"알림 기록 조회 실패: {e}")
+            log.error(f"알림 기록 조회 실패: {e}")
         
         return []
     
@@ -185,7 +210,7 @@ class NotificationManager:
                 json.dump(history, f, ensure_ascii=False, indent=2)
                 
         except Exception as e:
-            print(f"알림 기록 저장 실패: {e}")
+            log.error(f"알림 기록 저장 실패: {e}")
     
     def get_statistics(self) -> Dict[str, Any]:
         """알림 통계 정보"""
@@ -240,7 +265,7 @@ class NotificationManager:
             return filepath
             
         except Exception as e:
-            print(f"알림 내보내기 실패: {e}")
+            log.error(f"알림 내보내기 실패: {e}")
             return None
     
     def print_pending_notifications(self):
@@ -268,10 +293,11 @@ class NotificationManager:
             print()
 
 
+    @instrument(NOTIFICATION_SEND_SECONDS, NOTIFICATIONS_TOTAL, outcome=_sent_outcome, channel='kakao')
     def send_kakao_message(self, message: str, access_token: str = None) -> bool:
         """카카오톡 나에게 보내기"""
         if not access_token and not self.kakao_access_token:
-            print("⚠️ 카카오톡 액세스 토큰이 없습니다.")
+            log.warning("⚠️ 카카오톡 액세스 토큰이 없습니다.")
             return False
             
         token = access_token or self.kakao_access_token
@@ -296,23 +322,35 @@ class NotificationManager:
             "template_object": json.dumps(template)
         }
         
+        if not self.kakao_breaker.allow_request():
+            log.warning("⚡ 카카오톡 회로 차단 중 - 전송 생략", channel='kakao',
+                        retry_after_s=round(self.kakao_breaker.retry_after(), 1))
+            return False
+        
+        started_at = time.perf_counter()
         try:
-            response = requests.post(url, headers=headers, data=data)
+            with stage('kakao_send'):
+                response = requests.post(url, headers=headers, data=data, timeout=self.request_timeout)
             response.raise_for_status()
+            self.kakao_breaker.record_success(time.perf_counter() - started_at)
             
-            print("✅ 카카오톡 메시지 전송 성공")
+            log.info("✅ 카카오톡 메시지 전송 성공", channel='kakao')
             return True
             
         except requests.exceptions.RequestException as e:
-            print(f"❌ 카카오톡 메시지 전송 실패: {e}")
+            if _is_dependency_failure(e):
+                self.kakao_breaker.record_failure(time.perf_counter() - started_at)
+            else:
+                self.kakao_breaker.record_success(time.perf_counter() - started_at)
+            log.error(f"❌ 카카오톡 메시지 전송 실패: {e}", channel='kakao')
             if hasattr(e, 'response') and e.response:
                 try:
                     error_data = e.response.json()
                     error_msg = error_data.get('msg', str(e))
                     error_code = error_data.get('code', 'Unknown')
-                    print(f"카카오 API 에러 [{error_code}]: {error_msg}")
+                    log.error("카카오 API 에러", error_code=error_code, error_message=error_msg)
                 except:
-                    print(f"응답: {e.response.text}")
+                    log.error("응답 본문", response=e.response.text[:500])
             return False
     
     def get_kakao_auth_url(self) -> str:
@@ -356,8 +394,6 @@ class NotificationManager:
             response.raise_for_status()
             
             token_data = response.json()
-            print(f"🔍 카카오톡 토큰 응답: {token_data}")
-            
             access_token = token_data.get("access_token")
             refresh_token = token_data.get("refresh_token")
             expires_in = token_data.get("expires_in")
@@ -365,10 +401,7 @@ class NotificationManager:
             if access_token:
                 self.kakao_access_token = access_token
                 self.kakao_refresh_token = refresh_token  # 리프레시 토큰도 저장
-                print(f"✅ 카카오톡 토큰 발급 성공:")
-                print(f"   액세스 토큰: {access_token[:10]}...")
-                print(f"   리프레시 토큰: {'있음' if refresh_token else '없음'}")
-                print(f"   만료시간: {expires_in}초")
+                log.info("✅ 카카오톡 토큰 발급 성공", has_refresh_token=bool(refresh_token), expires_in=expires_in)
                 
                 # 토큰을 환경변수 파일에도 저장 (선택사항)
                 self._save_access_token_to_env(access_token)
@@ -376,14 +409,14 @@ class NotificationManager:
             return access_token
             
         except requests.exceptions.RequestException as e:
-            print(f"❌ 카카오톡 토큰 발급 실패: {e}")
+            log.error(f"❌ 카카오톡 토큰 발급 실패: {e}")
             if hasattr(e, 'response') and e.response:
                 try:
                     error_data = e.response.json()
                     error_msg = error_data.get('error_description', error_data.get('error', str(e)))
-                    print(f"카카오 OAuth 에러: {error_msg}")
+                    log.error("카카오 OAuth 에러", error_message=error_msg)
                 except:
-                    print(f"응답: {e.response.text}")
+                    log.error("응답 본문", response=e.response.text[:500])
             return None
     
     def _save_access_token_to_env(self, access_token: str):
@@ -413,15 +446,15 @@ class NotificationManager:
                 with open(env_path, 'w', encoding='utf-8') as f:
                     f.writelines(lines)
                 
-                print("✅ 카카오톡 액세스 토큰을 .env 파일에 저장했습니다.")
+                log.info("✅ 카카오톡 액세스 토큰을 .env 파일에 저장했습니다.")
                 
         except Exception as e:
-            print(f"⚠️ .env 파일 저장 실패: {e}")
+            log.warning(f"⚠️ .env 파일 저장 실패: {e}")
     
     def send_review_alert_to_kakao(self, new_reviews: List[Dict], negative_reviews: List[Dict]) -> bool:
         """부정 리뷰 알림을 카카오톡으로 전송"""
         if not self.kakao_access_token:
-            print("⚠️ 카카오톡 인증이 필요합니다.")
+            log.warning("⚠️ 카카오톡 인증이 필요합니다.")
             return False
             
         if not negative_reviews and not new_reviews:
@@ -453,20 +486,21 @@ class NotificationManager:
         
         return self.send_kakao_message(message)
     
+    @instrument(NOTIFICATION_SEND_SECONDS, NOTIFICATIONS_TOTAL, outcome=_sent_outcome, channel='channel_talk')
     def send_channel_talk_message(self, message: str, group_id: str = None) -> bool:
         """채널톡 팀 채팅 그룹에 메시지 전송"""
         if not self.channel_talk_access_token or not self.channel_talk_secret:
-            print("⚠️ 채널톡 인증 정보가 없습니다.")
+            log.warning("⚠️ 채널톡 인증 정보가 없습니다.")
             return False
         
         # 그룹 ID 사용 (환경변수 또는 파라미터)
         target_group_id = group_id or self.channel_talk_group_id
         if not target_group_id:
-            print("⚠️ 채널톡 그룹 ID가 없습니다.")
+            log.warning("⚠️ 채널톡 그룹 ID가 없습니다.")
             return False
         
         # 채널톡 팀 채팅 메시지 전송 API
-        url = f"https://api.channel.io/open/v5/groups/{target_group_id}/messages"
+        url = f"{self.channel_talk_api_base_url}/open/v5/groups/{target_group_id}/messages"
         
         headers = {
             "x-access-key": self.channel_talk_access_token,
@@ -484,36 +518,48 @@ class NotificationManager:
             ]
         }
         
+        if not self.channel_talk_breaker.allow_request():
+            log.warning("⚡ 채널톡 회로 차단 중 - 전송 생략", channel='channel_talk',
+                        retry_after_s=round(self.channel_talk_breaker.retry_after(), 1))
+            return False
+        
+        started_at = time.perf_counter()
         try:
-            response = requests.post(url, headers=headers, json=data)
+            with stage('channel_talk_send'):
+                response = requests.post(url, headers=headers, json=data, timeout=self.request_timeout)
             response.raise_for_status()
+            self.channel_talk_breaker.record_success(time.perf_counter() - started_at)
             
-            print(f"✅ 채널톡 메시지 전송 성공 (그룹 ID: {target_group_id})")
+            log.info("✅ 채널톡 메시지 전송 성공", channel='channel_talk', group_id=target_group_id)
             return True
             
         except requests.exceptions.RequestException as e:
-            print(f"❌ 채널톡 메시지 전송 실패: {e}")
+            if _is_dependency_failure(e):
+                self.channel_talk_breaker.record_failure(time.perf_counter() - started_at)
+            else:
+                self.channel_talk_breaker.record_success(time.perf_counter() - started_at)
+            log.error(f"❌ 채널톡 메시지 전송 실패: {e}", channel='channel_talk')
             if hasattr(e, 'response') and e.response:
                 try:
                     error_data = e.response.json()
                     error_msg = error_data.get('message', str(e))
                     error_code = error_data.get('code', 'Unknown')
-                    print(f"채널톡 API 에러 [{error_code}]: {error_msg}")
+                    log.error("채널톡 API 에러", error_code=error_code, error_message=error_msg)
                 except:
-                    print(f"응답: {e.response.text}")
+                    log.error("응답 본문", response=e.response.text[:500])
             return False
     
     def send_review_alert_to_channel_talk(self, new_reviews: List[Dict], negative_reviews: List[Dict], channel_id: str = None) -> bool:
         """부정 리뷰 알림을 채널톡으로 전송"""
         if not self.channel_talk_access_token:
-            print("⚠️ 채널톡 토큰이 없습니다. 환경변수에서 다시 로드 시도...")
+            log.warning("⚠️ 채널톡 토큰이 없습니다. 환경변수에서 다시 로드 시도...")
             from config.settings import settings
             self.channel_talk_access_token = settings.channel_talk_access_key
             self.channel_talk_secret = settings.channel_talk_secret_key
             self.channel_talk_group_id = settings.channel_talk_group_id
             
         if not self.channel_talk_access_token:
-            print("❌ 채널톡 인증이 필요합니다. CHANNEL_TALK_ACCESS_TOKEN 환경변수를 확인하세요.")
+            log.error("❌ 채널톡 인증이 필요합니다. CHANNEL_TALK_ACCESS_TOKEN 환경변수를 확인하세요.")
             return False
             
         if not negative_reviews and not new_reviews:
@@ -580,14 +626,16 @@ class NotificationManager:
         if notification_method in ["kakao", "both"]:
             if self.kakao_access_token:
                 results["kakao"] = self.send_review_alert_to_kakao(new_reviews, negative_reviews)
+                if results["kakao"]:
+                    detection_lag_tracker.record_delivery(negative_reviews, 'kakao')
             else:
                 results["kakao"] = False
-                print("⚠️ 카카오톡 토큰이 없어 전송하지 않습니다.")
+                log.warning("⚠️ 카카오톡 토큰이 없어 전송하지 않습니다.")
         
         if notification_method in ["channel_talk", "both"]:
             # 채널톡 토큰 재확인 및 재시도
             if not self.channel_talk_access_token:
-                print("⚠️ 채널톡 토큰이 없습니다. 환경변수에서 다시 로드 시도...")
+                log.warning("⚠️ 채널톡 토큰이 없습니다. 환경변수에서 다시 로드 시도...")
                 from config.settings import settings
                 self.channel_talk_access_token = settings.channel_talk_access_key
                 self.channel_talk_secret = settings.channel_talk_secret_key
@@ -595,9 +643,11 @@ class NotificationManager:
             
             if self.channel_talk_access_token:
                 results["channel_talk"] = self.send_review_alert_to_channel_talk(new_reviews, negative_reviews)
+                if results["channel_talk"]:
+                    detection_lag_tracker.record_delivery(negative_reviews, 'channel_talk')
             else:
                 results["channel_talk"] = False
-                print("❌ 채널톡 토큰을 찾을 수 없습니다. CHANNEL_TALK_ACCESS_TOKEN 환경변수를 확인하세요.")
+                log.error("❌ 채널톡 토큰을 찾을 수 없습니다. CHANNEL_TALK_ACCESS_TOKEN 환경변수를 확인하세요.")
         
         return results
 
@@ -611,10 +661,10 @@ class NotificationManager:
             self.channel_talk_group_id = settings.channel_talk_group_id
             
         if not self.channel_talk_access_token:
-            print("❌ 채널톡 토큰을 찾을 수 없습니다.")
+            log.error("❌ 채널톡 토큰을 찾을 수 없습니다.")
             return False
             
-        return self.send_message_to_channel_talk(message, group_id)
+        return self.send_channel_talk_message(message, group_id)
 
 
 # 전역 알림 관리자 인스턴스
@@ -0,0 +1,239 @@
+"""
+리뷰 로컬 전문 검색 인덱스 - 한글 문자 n-gram 역색인
+"""
+
+import itertools
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Set
+
+
+WHITESPACE_PATTERN = re.compile(r'\s+')
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+
+# 검색 결과/저장 시 유지할 리뷰 필드
+INDEXED_FIELDS = (
+    'board_no', 'board_name', 'article_no', 'product_no', 'product_name',
+    'title', 'content', 'writer', 'rating', 'created_date', 'view_count',
+    'sentiment', 'is_negative', 'is_positive', 'is_neutral', 'label',
+    'confidence', 'score', 'method'
+)
+
+
+def normalize_search_text(text: str) -> str:
+    """검색용 텍스트 정규화 (HTML 제거, 소문자, 공백 통일)"""
+    if not text:
+        return ''
+    text = HTML_TAG_PATTERN.sub(' ', str(text))
+    return WHITESPACE_PATTERN.sub(' ', text).strip().lower()
+
+
+def char_ngrams(token: str) -> Set[str]:
+    """단어 하나의 문자 1-gram/2-gram 집합 (단어 경계를 넘지 않음)"""
+    grams = set(token)
+    grams.update(token[i:i + 2] for i in range(len(token) - 1))
+    return grams
+
+
+class ReviewSearchIndex:
+    """리뷰 역색인
+
+    한국어는 형태소 분석 없이도 검색되도록 단어 내부의 문자 1/2-gram으로 색인합니다.
+    검색어의 2-gram 포스팅을 교집합한 뒤 원문 부분 문자열 일치로 최종 확인하므로
+    오탐 없이 "배송", "환불요청" 같은 부분 일치 검색을 카페24 호출 없이 처리합니다.
+    """
+
+    def __init__(self, max_documents: int = 20000):
+        self.max_documents = max_documents
+        self._documents = OrderedDict()   # doc_id -> 리뷰 데이터
+        self._texts = {}                  # doc_id -> 정규화된 검색 텍스트
+        self._postings = {}               # n-gram -> doc_id 집합
+        self._lock = threading.RLock()
+        self.dirty = False                # 마지막 저장/로드 이후 색인이 바뀌었는지
+
+    @staticmethod
+    def document_id(review: Dict) -> Optional[str]:
+        article_no = review.get('article_no')
+        if article_no in (None, ''):
+            return None
+        return f"{review.get('board_no', '')}:{article_no}"
+
+    def __len__(self):
+        return len(self._documents)
+
+    def _remove(self, doc_id: str):
+        text = self._texts.pop(doc_id, None)
+        self._documents.pop(doc_id, None)
+        if text is None:
+            return
+        for token in set(text.split(' ')):
+            for gram in char_ngrams(token):
+                postings = self._postings.get(gram)
+                if postings is not None:
+                    postings.discard(doc_id)
+                    if not postings:
+                        del self._postings[gram]
+
+    def add_review(self, review: Dict) -> bool:
+        """리뷰 1건 색인 (같은 리뷰는 최신 분석 결과로 교체)"""
+        doc_id = self.document_id(review)
+        if doc_id is None:
+            return False
+
+        document = {field: review.get(field) for field in INDEXED_FIELDS if field in review}
+        if 'sentiment' not in document:
+            document['sentiment'] = self._derive_sentiment(review)
+        text = normalize_search_text(f"{review.get('title', '')} {review.get('content', '')}")
+
+        with self._lock:
+            if doc_id in self._documents:
+                self._remove(doc_id)
+
+            self._documents[doc_id] = document
+            self._texts[doc_id] = text
+            for token in set(text.split(' ')):
+                for gram in char_ngrams(token):
+                    self._postings.setdefault(gram, set()).add(doc_id)
+
+            # 최대 문서 수 초과 시 가장 먼저 색인된 리뷰부터 제거
+            while len(self._documents) > self.max_documents:
+                self._remove(next(iter(self._documents)))
+            self.dirty = True
+
+        return True
+
+    def add_reviews(self, reviews: List[Dict]) -> int:
+        """리뷰 목록 색인, 색인된 건수 반환"""
+        return sum(1 for review in reviews if self.add_review(review))
+
+    def recent(self, limit: int) -> List[Dict]:
+        """가장 최근에 색인된 리뷰 limit건 (색인 순서대로)"""
+        with self._lock:
+            documents = list(itertools.islice(reversed(self._documents.values()), max(0, limit)))
+        return documents[::-1]
+
+    @staticmethod
+    def _derive_sentiment(review: Dict) -> Optional[str]:
+        if review.get('is_negative'):
+            return 'negative'
+        if review.get('is_positive'):
+            return 'positive'
+        if review.get('is_neutral'):
+            return 'neutral'
+        return None
+
+    def _candidates(self, term: str) -> Set[str]:
+        """검색어 1개에 대한 후보 문서 집합 (n-gram 포스팅 교집합)"""
+        grams = [term[i:i + 2] for i in range(len(term) - 1)] or [term]
+        # 짧은 포스팅부터 교집합해서 비용 최소화
+        postings = sorted((self._postings.get(gram, set()) for gram in grams), key=len)
+        if not postings or not postings[0]:
+            return set()
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates &= posting
+            if not candidates:
+                break
+        return candidates
+
+    def search(self, keyword: str = '', limit: int = 50, sentiment: str = None,
+               rating: int = None, min_rating: int = None, max_rating: int = None,
+               product_no: Any = None, start_date: str = None, end_date: str = None) -> List[Dict]:
+        """
+        키워드 + 필터 검색
+
+        Args:
+            keyword: 검색어 (공백으로 구분된 모든 단어를 포함하는 리뷰)
+            limit: 최대 결과 수
+            sentiment: negative / positive / neutral
+            rating, min_rating, max_rating: 평점 필터
+            product_no: 상품 번호
+            start_date, end_date: 작성일 범위 (YYYY-MM-DD)
+
+        Returns:
+            작성일 최신순 리뷰 목록
+        """
+        terms = [term for term in normalize_search_text(keyword).split(' ') if term]
+
+        with self._lock:
+            if terms:
+                doc_ids = None
+                for term in sorted(terms, key=len, reverse=True):
+                    candidates = self._candidates(term)
+                    doc_ids = candidates if doc_ids is None else doc_ids & candidates
+                    if not doc_ids:
+                        return []
+                # 2-gram 교집합은 순서를 보장하지 않으므로 원문 포함 여부로 최종 확인
+                doc_ids = [doc_id for doc_id in doc_ids
+                           if all(term in self._texts[doc_id] for term in terms)]
+            else:
+                doc_ids = list(self._documents)
+
+            results = []
+            for doc_id in doc_ids:
+                document = self._documents[doc_id]
+                if sentiment and document.get('sentiment') != sentiment:
+                    continue
+                if product_no not in (None, '') and str(document.get('product_no')) != str(product_no):
+                    continue
+                doc_rating = document.get('rating') or 0
+                try:
+                    doc_rating = int(doc_rating)
+                except (TypeError, ValueError):
+                    doc_rating = 0
+                if rating is not None and doc_rating != rating:
+                    continue
+                if min_rating is not None and doc_rating < min_rating:
+                    continue
+                if max_rating is not None and doc_rating > max_rating:
+                    continue
+                created_day = str(document.get('created_date') or '')[:10]
+                if start_date and created_day < start_date:
+                    continue
+                if end_date and created_day > end_date:
+                    continue
+                results.append(dict(document))
+
+        results.sort(key=lambda x: str(x.get('created_date') or ''), reverse=True)
+        return results[:limit]
+
+    def get_status(self) -> Dict[str, Any]:
+        """인덱스 상태 정보"""
+        with self._lock:
+            return {
+                'documents': len(self._documents),
+                'ngrams': len(self._postings),
+                'max_documents': self.max_documents
+            }
+
+    def save(self, filepath: str):
+        """색인된 리뷰 저장 (포스팅은 로드 시 재구성, 임시 파일에 쓴 뒤 교체)"""
+        with self._lock:
+            documents = list(self._documents.values())
+            self.dirty = False
+        temp_path = f"{filepath}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'documents': documents,
+                    'last_updated': datetime.now().isoformat(),
+                    'count': len(documents)
+                }, f, ensure_ascii=False)
+            os.replace(temp_path, filepath)
+        except Exception:
+            self.dirty = True  # 다음 저장 때 다시 시도
+            raise
+
+    def load(self, filepath: str) -> int:
+        """저장된 리뷰로 인덱스 재구성"""
+        if not os.path.exists(filepath):
+            return 0
+        with open(filepath, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        count = self.add_reviews(data.get('documents', []))
+        self.dirty = False
+        return count
@@ -0,0 +1,129 @@
+"""
+콜드 스타트 / 준비 상태 추적
+
+프로세스 시작 → 앱 로드 → 워밍업(모델, 카페24 토큰, 리뷰 게시판 목록, 리뷰 캐시) → 준비 완료까지의 시각을 기록합니다.
+워밍업은 포트를 연 뒤 백그라운드 스레드에서 작업별로 동시에 실행합니다 (gunicorn post_worker_init 훅 또는 /readyz 첫 호출).
+워밍업 작업이 실패해도(토큰 미발급 등) 준비 완료로 보고 작업별 결과만 기록합니다. 첫 요청은 기존처럼 지연 초기화합니다.
+
+    /healthz  프로세스 생존 확인 (항상 200)
+    /readyz   워밍업 완료 전에는 503, 완료 후 200 (단계별 시간 포함)
+"""
+
+import os
+import threading
+import time
+from typing import Callable, Dict, Any, Iterable, Optional, Tuple
+
+from app.shared.utils.metrics import STARTUP_SECONDS, WARMUP_TASK_SECONDS
+from app.shared.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+
+def _process_started_at() -> float:
+    """현재 프로세스 시작 시각 (epoch 초). /proc을 읽을 수 없으면 이 모듈 import 시각"""
+    try:
+        with open('/proc/self/stat', 'r') as f:
+            # 실행 파일 이름에 공백이 있을 수 있으므로 ')' 뒤부터 필드를 셈 (22번째 필드 = starttime)
+            start_ticks = int(f.read().rsplit(')', 1)[1].split()[19])
+        with open('/proc/uptime', 'r') as f:
+            uptime = float(f.read().split()[0])
+        age = uptime - start_ticks / os.sysconf('SC_CLK_TCK')
+        return time.time() - max(0.0, age)
+    except (OSError, ValueError, IndexError):
+        return time.time()
+
+
+class StartupTracker:
+    """프로세스 시작부터 준비 완료까지의 단계 시각과 워밍업 작업 결과"""
+
+    def __init__(self):
+        self.process_started_at = _process_started_at()
+        self.phases = {}  # 단계 → 프로세스 시작 후 경과 초
+        self._lock = threading.Lock()
+        self._reset_warmup()
+
+    def _reset_warmup(self):
+        self._pid = os.getpid()
+        self._thread = None
+        self._ready = threading.Event()
+        self.tasks = {}  # 작업 이름 → {'status', 'duration_ms', 'error'}
+
+    def _mark(self, phase: str):
+        elapsed = round(time.time() - self.process_started_at, 4)
+        self.phases[phase] = elapsed
+        STARTUP_SECONDS.set(elapsed, phase=phase)
+
+    def mark_app_loaded(self):
+        """앱 모듈 import 완료 (포트를 열 수 있는 시점)"""
+        self._mark('app_loaded')
+
+    def start_warmup(self, tasks: Iterable[Tuple[str, Callable[[], Any]]]) -> bool:
+        """워밍업을 백그라운드 스레드에서 시작. 프로세스당 한 번만 실행 (이미 시작했으면 False)"""
+        with self._lock:
+            if self._pid != os.getpid():
+                # --preload 마스터의 상태를 물려받은 포크된 워커: 워밍업은 워커에서 다시 시작
+                self._reset_warmup()
+            if self._thread is not None:
+                return False
+            tasks = list(tasks)
+            self.tasks = {name: {'status': 'pending'} for name, _ in tasks}
+            self._thread = threading.Thread(target=self._run, args=(tasks,), name='warmup', daemon=True)
+            self._mark('warmup_started')
+            self._thread.start()
+            return True
+
+    def _run(self, tasks):
+        log.info("🔥 워밍업 시작", tasks=[name for name, _ in tasks])
+        # 모델 로드(CPU)와 카페24 호출(I/O)이 겹치도록 작업마다 스레드를 두고 모두 끝나면 준비 완료
+        threads = [threading.Thread(target=self._run_task, args=(name, func), name=f"warmup-{name}", daemon=True)
+                   for name, func in tasks]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self._mark('ready')
+        self._ready.set()
+        log.info("✅ 워밍업 완료", ready_s=self.phases['ready'], tasks=self.tasks)
+
+    def _run_task(self, name: str, func: Callable[[], Any]):
+        self.tasks[name] = {'status': 'running'}
+        started_at = time.perf_counter()
+        try:
+            func()
+            result = {'status': 'ok'}
+        except Exception as e:
+            result = {'status': 'failed', 'error': type(e).__name__}
+            log.warning(f"⚠️ 워밍업 작업 실패: {name} ({e})")
+        duration = time.perf_counter() - started_at
+        result['duration_ms'] = round(duration * 1000, 2)
+        self.tasks[name] = result
+        WARMUP_TASK_SECONDS.set(duration, task=name, outcome=result['status'])
+
+    @property
+    def ready(self) -> bool:
+        return self._ready.is_set()
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        return self._ready.wait(timeout)
+
+    def status(self) -> Dict[str, Any]:
+        """준비 상태 (/readyz 응답)"""
+        if self.ready:
+            warmup = 'done'
+        elif self._thread is not None:
+            warmup = 'running'
+        else:
+            warmup = 'not_started'
+        return {
+            'ready': self.ready,
+            'warmup': warmup,
+            'uptime_s': round(time.time() - self.process_started_at, 3),
+            'phases_s': dict(self.phases),
+            'tasks': {name: dict(task) for name, task in self.tasks.items()}
+        }
+
+
+# 전역 인스턴스 (앱 import 시점에 생성되어 프로세스 시작 시각 기준으로 기록)
+startup_tracker = StartupTracker()
@@ -0,0 +1,191 @@
+"""
+단계별 소요시간 추적 유틸리티
+
+작업(operation) 하나를 trace_operation으로 감싸고, 그 안의 구간을 stage로 감싸면
+단계별 소요시간이 기록됩니다. 추적은 스레드별로 쌓이므로 중첩된 작업(예: 수집 → 배치 분석 → 단건 분석)의
+단계 시간은 바깥 작업에도 함께 누적되며, 단계 안의 단계는 "analysis/pkl_predict"처럼 경로로 기록됩니다.
+끝난 추적은 작업 종류별로 최근 N건을 보관하는 TimingStore에 저장되어 /debug/slow에서 조회할 수 있습니다.
+
+사용 예:
+    with trace_operation('review_collection', trigger='webhook') as trace:
+        with stage('cafe24_fetch'):
+            ...
+    trace.summary()  # {'total_ms': ..., 'stages': {'cafe24_fetch': ...}}
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+_local = threading.local()
+
+
+def _trace_stack() -> List['TimingTrace']:
+    if not hasattr(_local, 'traces'):
+        _local.traces = []
+        _local.stages = []
+    return _local.traces
+
+
+def _stage_stack() -> List[str]:
+    _trace_stack()
+    return _local.stages
+
+
+class TimingTrace:
+    """작업 1건의 단계별 소요시간"""
+
+    def __init__(self, operation: str, stage_depth: int = 0, **meta):
+        self.operation = operation
+        self.meta = meta
+        self.stage_depth = stage_depth  # 추적 시작 시점의 단계 깊이 (이 추적 기준 상대 경로 계산용)
+        self.stages = {}
+        self.started_at = time.perf_counter()
+        self.started_at_wall = datetime.now()
+        self.total_seconds = None
+
+    def add(self, stage_name: str, seconds: float):
+        self.stages[stage_name] = self.stages.get(stage_name, 0.0) + seconds
+
+    def finish(self):
+        if self.total_seconds is None:
+            self.total_seconds = time.perf_counter() - self.started_at
+        return self
+
+    @property
+    def elapsed_ms(self) -> float:
+        seconds = self.total_seconds if self.total_seconds is not None else time.perf_counter() - self.started_at
+        return round(seconds * 1000, 3)
+
+    def summary(self) -> Dict[str, Any]:
+        """분석 결과/API 응답에 붙이는 요약 (총 시간 + 단계별 시간)"""
+        return {
+            'total_ms': self.elapsed_ms,
+            'stages': {name: round(seconds * 1000, 3) for name, seconds in self.stages.items()}
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = self.summary()
+        data.update({
+            'operation': self.operation,
+            'started_at': self.started_at_wall.isoformat(),
+            'meta': self.meta
+        })
+        return data
+
+
+class TimingStore:
+    """최근 작업 추적 보관소 (작업 종류별 고정 크기, 스레드 안전)
+
+    단건 분석처럼 자주 일어나는 작업이 수집 같은 드문 작업의 기록을 밀어내지 않도록
+    작업 종류마다 최근 capacity건씩 따로 보관합니다.
+    """
+
+    def __init__(self, capacity: int = 200):
+        self.capacity = capacity
+        self._traces = {}
+        self._lock = threading.Lock()
+
+    def record(self, trace: TimingTrace):
+        data = trace.to_dict()
+        with self._lock:
+            traces = self._traces.get(trace.operation)
+            if traces is None:
+                traces = self._traces[trace.operation] = deque(maxlen=self.capacity)
+            traces.append(data)
+
+    def _snapshot(self, operation: str = None) -> List[Dict[str, Any]]:
+        with self._lock:
+            if operation:
+                return list(self._traces.get(operation, ()))
+            return [trace for traces in self._traces.values() for trace in traces]
+
+    def recent(self, limit: int = 50, operation: str = None) -> List[Dict[str, Any]]:
+        traces = sorted(self._snapshot(operation), key=lambda trace: trace['started_at'], reverse=True)
+        return traces[:limit]
+
+    def slowest(self, limit: int = 20, operation: str = None, min_ms: float = 0.0) -> List[Dict[str, Any]]:
+        """보관 중인 추적 중 총 소요시간이 긴 순서"""
+        traces = [trace for trace in self._snapshot(operation) if trace['total_ms'] >= min_ms]
+        traces.sort(key=lambda trace: trace['total_ms'], reverse=True)
+        return traces[:limit]
+
+    def operation_stats(self) -> Dict[str, Dict[str, Any]]:
+        """작업별 건수/평균/최대 소요시간과 단계별 평균 시간"""
+        stats = {}
+        for trace in self._snapshot():
+            entry = stats.setdefault(trace['operation'], {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'stages': {}})
+            entry['count'] += 1
+            entry['total_ms'] += trace['total_ms']
+            entry['max_ms'] = max(entry['max_ms'], trace['total_ms'])
+            for stage_name, ms in trace['stages'].items():
+                entry['stages'][stage_name] = entry['stages'].get(stage_name, 0.0) + ms
+
+        for entry in stats.values():
+            count = entry['count']
+            entry['mean_ms'] = round(entry.pop('total_ms') / count, 3)
+            entry['mean_stages_ms'] = {name: round(ms / count, 3) for name, ms in entry.pop('stages').items()}
+        return stats
+
+    def clear(self):
+        with self._lock:
+            self._traces.clear()
+
+    def __len__(self):
+        with self._lock:
+            return sum(len(traces) for traces in self._traces.values())
+
+
+def current_trace() -> Optional[TimingTrace]:
+    """현재 스레드에서 가장 안쪽의 진행 중인 추적"""
+    traces = _trace_stack()
+    return traces[-1] if traces else None
+
+
+@contextmanager
+def trace_operation(operation: str, store: TimingStore = None, **meta):
+    """작업 추적 시작. 끝나면 store(기본값: 전역 timing_store)에 저장"""
+    traces = _trace_stack()
+    trace = TimingTrace(operation, stage_depth=len(_stage_stack()), **meta)
+    traces.append(trace)
+    try:
+        yield trace
+    finally:
+        traces.remove(trace)
+        trace.finish()
+        (store or timing_store).record(trace)
+
+
+@contextmanager
+def stage(name: str):
+    """현재 진행 중인 모든 추적에 단계 소요시간 기록 (추적이 없으면 아무것도 하지 않음)"""
+    traces = _trace_stack()
+    if not traces:
+        yield
+        return
+
+    stages = _stage_stack()
+    stages.append(name)
+    path = list(stages)
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started_at
+        stages.pop()
+        for trace in list(traces):
+            relative_path = path[trace.stage_depth:]
+            if relative_path:
+                trace.add('/'.join(relative_path), elapsed)
+
+
+def _create_default_store() -> TimingStore:
+    from config.settings import settings
+    return TimingStore(settings.timing_store_capacity)
+
+
+# 전역 추적 보관소
+timing_store = _create_default_store()
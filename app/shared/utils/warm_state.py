@@ -0,0 +1,172 @@
+"""
+웜 스테이트 스냅샷
+
+새 인스턴스가 부팅 직후 카페24 API를 연달아 호출하지 않고 바로 쓸 수 있도록, 여러 곳에 흩어진 준비 상태
+(리뷰 게시판 목록, 상품명 캐시, 신규 리뷰 비교 기준인 리뷰 캐시, 최근 분석 결과)를 JSON 파일 하나로 주기적으로 저장하고
+부팅 시 요청을 받기 전에 복원합니다. 각 항목은 섹션 이름으로 등록한 (저장 함수, 복원 함수)가 담당하며,
+복원한 값은 원래의 만료 규칙(게시판 목록 캐시 시간 등)에 따라 필요할 때 다시 조회됩니다.
+
+- 내용이 바뀌었고 비어 있지 않은 경우에만 임시 파일에 쓰고 교체(os.replace)하므로 읽는 쪽이 쓰다 만 파일을 보지 않습니다.
+- WARM_STATE_MAX_AGE_SECONDS보다 오래되었거나 형식 버전이 다른 스냅샷은 복원하지 않습니다.
+- 토큰은 저장하지 않습니다 (기존 토큰 파일 사용).
+- 저장/복원 오류는 경고만 남기고 부팅과 요청 처리를 막지 않습니다.
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, Any, Optional
+
+from app.shared.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+
+def _has_content(value) -> bool:
+    """빈 컨테이너/None이 아닌 값이 하나라도 있는지 확인"""
+    if isinstance(value, dict):
+        return any(_has_content(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return len(value) > 0
+    return value is not None
+
+
+class WarmStateStore:
+    """섹션별 저장/복원 함수를 모아 스냅샷 파일 하나로 관리"""
+
+    def __init__(self, path: str, interval_seconds: float = 60.0, max_age_seconds: float = 86400.0):
+        self.path = path
+        self.interval_seconds = interval_seconds
+        self.max_age_seconds = max_age_seconds
+        self._sections = {}  # 섹션 이름 → (저장 함수, 복원 함수)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._pid = None
+        self._last_digest = None
+        self.last_saved_at = None
+        self.last_restore = None
+
+    def register(self, name: str, dump: Callable[[], Any], restore: Callable[[Any, float], Any]):
+        """섹션 등록. dump()는 JSON 직렬화 가능한 값, restore(값, 스냅샷 나이(초))는 복원 결과 요약을 반환"""
+        self._sections[name] = (dump, restore)
+
+    def snapshot(self) -> Dict[str, Any]:
+        sections = {}
+        for name, (dump, _) in self._sections.items():
+            try:
+                sections[name] = dump()
+            except Exception as e:
+                log.warning(f"⚠️ 웜 스테이트 섹션 저장 실패: {name} ({e})")
+        return sections
+
+    def save(self, force: bool = False) -> bool:
+        """스냅샷 저장 (직전 저장 이후 바뀐 내용이 없으면 건너뜀). 저장했으면 True"""
+        with self._lock:
+            sections = self.snapshot()
+            encoded = json.dumps(sections, ensure_ascii=False, sort_keys=True, default=str)
+            digest = hashlib.sha1(encoded.encode('utf-8')).hexdigest()
+            if not force and digest == self._last_digest:
+                return False
+            # 아직 준비된 상태가 없는 인스턴스(토큰 없음 등)가 공유 스냅샷을 빈 내용으로 덮어쓰지 않도록
+            if not _has_content(sections):
+                return False
+
+            saved_at = time.time()
+            temp_path = f"{self.path}.{os.getpid()}.tmp"
+            try:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    f.write(json.dumps({
+                        'version': SNAPSHOT_VERSION,
+                        'saved_at': saved_at,
+                        'saved_at_iso': datetime.fromtimestamp(saved_at).isoformat(),
+                        'sections': sections
+                    }, ensure_ascii=False, default=str))
+                os.replace(temp_path, self.path)
+            except OSError as e:
+                log.warning(f"⚠️ 웜 스테이트 저장 실패: {e}", path=self.path)
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+                return False
+
+            self._last_digest = digest
+            self.last_saved_at = saved_at
+            log.debug("💾 웜 스테이트 저장", path=self.path, bytes=len(encoded), sections=list(sections))
+            return True
+
+    def restore(self) -> Optional[Dict[str, Any]]:
+        """스냅샷을 읽어 등록된 섹션별로 복원. 복원하지 않았으면 None"""
+        if not os.path.exists(self.path):
+            log.info("웜 스테이트 스냅샷 없음 - 처음부터 준비", path=self.path)
+            return None
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            log.warning(f"⚠️ 웜 스테이트 읽기 실패: {e}", path=self.path)
+            return None
+
+        age_seconds = max(0.0, time.time() - float(data.get('saved_at', 0)))
+        if data.get('version') != SNAPSHOT_VERSION or age_seconds > self.max_age_seconds:
+            log.info("웜 스테이트 스냅샷이 오래되었거나 형식이 달라 무시", version=data.get('version'), age_s=round(age_seconds))
+            return None
+
+        results = {}
+        sections = data.get('sections') or {}
+        for name, (_, restore) in self._sections.items():
+            if name not in sections:
+                continue
+            try:
+                results[name] = restore(sections[name], age_seconds)
+            except Exception as e:
+                log.warning(f"⚠️ 웜 스테이트 섹션 복원 실패: {name} ({e})")
+                results[name] = None
+
+        self.last_restore = {'age_s': round(age_seconds, 1), 'sections': results}
+        log.info("♻️ 웜 스테이트 복원", age_s=round(age_seconds, 1), sections=results)
+        return results
+
+    def start(self) -> bool:
+        """주기적 저장 스레드 시작 (프로세스당 한 번, 포크된 워커에서는 다시 시작)"""
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid():
+                return False
+            self._pid = os.getpid()
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='warm-state', daemon=True)
+            self._thread.start()
+        atexit.register(self.stop)
+        return True
+
+    def _run(self):
+        while not self._stop.wait(self.interval_seconds):
+            self.save()
+
+    def stop(self):
+        """주기적 저장 중지 후 마지막 상태 저장"""
+        self._stop.set()
+        if self._thread is not None and self._pid == os.getpid():
+            self.save()
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            'path': self.path,
+            'interval_seconds': self.interval_seconds,
+            'max_age_seconds': self.max_age_seconds,
+            'sections': list(self._sections),
+            'saver_running': self._thread is not None and self._thread.is_alive() and self._pid == os.getpid(),
+            'last_saved_at': datetime.fromtimestamp(self.last_saved_at).isoformat() if self.last_saved_at else None,
+            'last_restore': self.last_restore
+        }
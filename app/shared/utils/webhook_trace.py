@@ -0,0 +1,96 @@
+"""
+웹훅 트레이스 기록 유틸리티
+
+수신한 카페24(event 90033)·채널톡 웹훅 페이로드를 JSONL 파일에 한 줄씩 기록합니다.
+기록된 트레이스는 benchmarks/webhook_replay.py로 같은 간격/배속으로 재생할 수 있습니다.
+
+트레이스 한 줄 형식:
+    {"ts": 1725159600.123, "source": "cafe24", "path": "/webhook/channel-talk", "payload": {...}}
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Dict, Any, Optional, List
+
+from app.shared.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+
+def detect_webhook_source(payload: Dict[str, Any]) -> str:
+    """페이로드 형태로 웹훅 출처 구분 (cafe24 / channel_talk / unknown)"""
+    if not isinstance(payload, dict):
+        return 'unknown'
+    if 'eventType' in payload:
+        return 'channel_talk'
+    if 'event_no' in payload or 'resource' in payload:
+        return 'cafe24'
+    return 'unknown'
+
+
+class WebhookTraceRecorder:
+    """웹훅 페이로드를 JSONL 트레이스 파일에 기록 (스레드 안전)"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.recorded = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.path)
+
+    def record(self, payload: Dict[str, Any], path: str = None, source: str = None) -> bool:
+        """페이로드 1건 기록. 기록 실패가 웹훅 처리를 막지 않도록 예외는 삼킴"""
+        if not self.enabled:
+            return False
+
+        entry = {
+            'ts': time.time(),
+            'source': source or detect_webhook_source(payload),
+            'path': path,
+            'payload': payload
+        }
+        try:
+            line = json.dumps(entry, ensure_ascii=False)
+            with self._lock:
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.write(line + '\n')
+                self.recorded += 1
+            return True
+        except Exception as e:
+            log.warning(f"⚠️ 웹훅 트레이스 기록 실패: {e}", path=self.path)
+            return False
+
+
+def load_trace(path: str) -> List[Dict[str, Any]]:
+    """트레이스 파일 로드 (ts 오름차순, 깨진 줄은 건너뜀)"""
+    entries = []
+    if not os.path.exists(path):
+        return entries
+
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(entry, dict) and isinstance(entry.get('payload'), dict):
+                entries.append(entry)
+
+    entries.sort(key=lambda entry: entry.get('ts', 0))
+    return entries
+
+
+def _create_default_recorder() -> WebhookTraceRecorder:
+    from config.settings import settings
+    return WebhookTraceRecorder(settings.webhook_trace_file)
+
+
+# 전역 트레이스 기록기 (WEBHOOK_TRACE_FILE 미설정 시 비활성)
+webhook_trace_recorder = _create_default_recorder()
@@ -0,0 +1,97 @@
+"""
+우선순위 작업 큐
+
+먼저 처리해야 할 작업(부정일 가능성이 높은 리뷰 등)이 나중에 들어와도 대기 중인 작업보다 먼저 실행되도록,
+우선순위(작을수록 먼저)와 들어온 순서로 정렬하는 힙 위에서 백그라운드 워커 스레드가 작업을 꺼내 실행합니다.
+
+- 워커 스레드는 첫 작업이 들어올 때 시작합니다 (포크된 gunicorn 워커에서는 다시 시작).
+- 작업 예외는 로그만 남기고 다음 작업을 계속 처리합니다.
+- 대기 작업 수와 대기 시간은 work_queue_depth{queue}, work_queue_wait_seconds{queue} 지표로 확인합니다.
+"""
+
+import heapq
+import itertools
+import os
+import threading
+import time
+from typing import Callable, Dict, Any
+
+from app.shared.utils.logger import get_logger
+from app.shared.utils.metrics import WORK_QUEUE_DEPTH, WORK_QUEUE_WAIT_SECONDS
+
+log = get_logger(__name__)
+
+
+class PriorityWorkQueue:
+    """우선순위(작을수록 먼저) 순서로 작업을 실행하는 백그라운드 큐"""
+
+    def __init__(self, name: str, workers: int = 1):
+        self.name = name
+        self.workers = max(1, workers)
+        self._heap = []  # (우선순위, 순번, 들어온 시각, 함수, 인자, 키워드 인자)
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._threads = []
+        self._pid = None
+        self._active = 0
+        self.completed = 0
+        self.failed = 0
+
+    def submit(self, priority: float, func: Callable, *args, **kwargs):
+        with self._condition:
+            self._start_workers()
+            heapq.heappush(self._heap, (priority, next(self._sequence), time.perf_counter(), func, args, kwargs))
+            WORK_QUEUE_DEPTH.set(len(self._heap), queue=self.name)
+            self._condition.notify_all()  # join()으로 기다리는 스레드도 같은 조건 변수를 쓰므로 모두 깨움
+
+    def _start_workers(self):
+        """조건 변수 락 안에서 호출"""
+        if self._threads and self._pid == os.getpid():
+            return
+        self._pid = os.getpid()
+        self._threads = []
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._run, name=f'{self.name}-{i}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._heap:
+                    self._condition.wait()
+                priority, _, queued_at, func, args, kwargs = heapq.heappop(self._heap)
+                WORK_QUEUE_DEPTH.set(len(self._heap), queue=self.name)
+                self._active += 1
+            WORK_QUEUE_WAIT_SECONDS.observe(time.perf_counter() - queued_at, queue=self.name)
+            try:
+                func(*args, **kwargs)
+                self.completed += 1
+            except Exception as e:
+                self.failed += 1
+                log.exception(f"❌ 백그라운드 작업 실패: {e}", queue=self.name, priority=priority)
+            finally:
+                with self._condition:
+                    self._active -= 1
+                    self._condition.notify_all()
+
+    def join(self, timeout: float = None) -> bool:
+        """대기 중인 작업과 실행 중인 작업이 모두 끝날 때까지 대기. 시간 안에 끝나면 True"""
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        with self._condition:
+            while self._heap or self._active:
+                remaining = deadline - time.monotonic() if deadline is not None else None
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+            return True
+
+    def status(self) -> Dict[str, Any]:
+        with self._condition:
+            return {
+                'workers': self.workers,
+                'pending': len(self._heap),
+                'active': self._active,
+                'completed': self.completed,
+                'failed': self.failed
+            }
@@ -0,0 +1,3 @@
+"""
+성능 벤치마크 모음 (배포 전 실행 결과 비교용, 도커 이미지에는 포함되지 않음)
+"""
@@ -0,0 +1,303 @@
+"""
+ReviewAnalyzer 처리량 벤치마크
+
+사용법:
+    python -m benchmarks.analysis_pipeline --corpus-size 2000 --batch-sizes 1,10,50,200 --output bench.json
+
+측정 항목:
+    - clean_text / _analyze_with_pkl 호출당 지연시간 (pkl 예측 메모 없이 / 메모에 있는 텍스트)
+    - analyze_single_review 반복 호출 vs analyze_reviews_batch
+    - 평점-감정 충돌 비율 (GPT 2차 분석 대상 비율)
+    - 배치 크기별 analyze_reviews_batch 지연시간 (p50/p95/p99), 초당 리뷰 수
+    - (--inference-pool-workers) 전체 코퍼스 1차 추론: 현재 프로세스 vs 추론 프로세스 풀,
+      추론 중 다른 스레드의 1ms sleep 지연 (GIL 점유로 요청 스레드가 멈추는 정도)
+    - 최대 RSS
+
+결과는 JSON으로 출력되며 --output 지정 시 파일로도 저장됩니다.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import List, Dict, Any, Callable
+
+from benchmarks.corpus import generate_corpus
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """정렬된 값 목록의 백분위수 (선형 보간)"""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * pct / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def summarize_latencies(latencies: List[float], items: int = None) -> Dict[str, Any]:
+    """지연시간(초) 목록을 ms 단위 요약으로 변환"""
+    values = sorted(latencies)
+    total = sum(values)
+    items = items if items is not None else len(values)
+    return {
+        'calls': len(values),
+        'items': items,
+        'total_s': round(total, 6),
+        'mean_ms': round(total / len(values) * 1000, 4) if values else 0,
+        'p50_ms': round(percentile(values, 50) * 1000, 4),
+        'p95_ms': round(percentile(values, 95) * 1000, 4),
+        'p99_ms': round(percentile(values, 99) * 1000, 4),
+        'max_ms': round(values[-1] * 1000, 4) if values else 0,
+        'items_per_sec': round(items / total, 2) if total > 0 else None
+    }
+
+
+def peak_rss_mb() -> float:
+    """프로세스 최대 RSS (MB)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 byte 단위
+    if sys.platform == 'darwin':
+        return round(peak / (1024 * 1024), 2)
+    return round(peak / 1024, 2)
+
+
+@contextlib.contextmanager
+def quiet(enabled: bool = True):
+    """측정 중 분석기의 print 출력을 버림 (터미널 I/O가 측정값을 왜곡하지 않도록)"""
+    if not enabled:
+        yield
+        return
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def time_calls(func: Callable, args_list: List[tuple], repeat: int = 1) -> List[float]:
+    """각 인자 조합으로 func를 호출하며 호출별 소요시간(초) 기록"""
+    latencies = []
+    for _ in range(repeat):
+        for args in args_list:
+            started_at = time.perf_counter()
+            func(*args)
+            latencies.append(time.perf_counter() - started_at)
+    return latencies
+
+
+class ThreadStallProbe:
+    """다른 요청 스레드 대용: 1ms씩 sleep하며 실제로 깨어나기까지 걸린 시간 기록"""
+
+    def __init__(self, interval: float = 0.001):
+        self.interval = interval
+        self.delays = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.is_set():
+            started_at = time.perf_counter()
+            time.sleep(self.interval)
+            self.delays.append(time.perf_counter() - started_at - self.interval)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+    def summary(self) -> Dict[str, Any]:
+        stats = summarize_latencies(self.delays)
+        return {'samples': stats['calls'], 'p50_ms': stats['p50_ms'], 'p99_ms': stats['p99_ms'], 'max_ms': stats['max_ms']}
+
+
+def compare_inference_pool(analyzer, texts: List[str], repeat: int) -> Dict[str, Any]:
+    """같은 텍스트를 현재 프로세스와 추론 프로세스 풀에서 추론한 시간, 다른 스레드 지연, 결과 차이"""
+    import numpy as np
+
+    clean_texts = [text for text in (analyzer.clean_text(text) for text in texts) if text]
+    pool = analyzer.inference_pool
+    started_at = time.perf_counter()
+    pool.start()
+    pool_start_s = time.perf_counter() - started_at
+
+    comparison = {'texts': len(clean_texts), 'workers': pool.workers, 'pool_start_s': round(pool_start_s, 4)}
+    outputs = {}
+    for name, predict in (('in_process', analyzer._predict_pkl_probabilities), ('pool', pool.predict_probabilities)):
+        latencies = []
+        with ThreadStallProbe() as probe:
+            for _ in range(repeat):
+                started_at = time.perf_counter()
+                outputs[name] = predict(clean_texts)
+                latencies.append(time.perf_counter() - started_at)
+        comparison[name] = summarize_latencies(latencies, items=len(clean_texts) * repeat)
+        comparison[name]['other_thread_stall'] = probe.summary()
+    comparison['max_abs_diff'] = float(np.max(np.abs(outputs['in_process'] - outputs['pool'])))
+    return comparison
+
+
+def review_text(review: Dict) -> str:
+    return review.get('content', '') or review.get('text', '') or review.get('title', '')
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'],
+                                       stderr=subprocess.DEVNULL).decode().strip()
+    except Exception:
+        return None
+
+
+def run_benchmark(corpus_size: int, batch_sizes: List[int], seed: int, repeat: int,
+                  enable_gpt: bool, silence: bool, backend: str = None,
+                  inference_pool_workers: int = None) -> Dict[str, Any]:
+    from app.infrastructure.external.openai.review_analyzer import ReviewAnalyzer
+    from config.settings import settings
+
+    if backend:
+        settings.sentiment_backend = backend
+    # 배치 크기별 측정은 현재 프로세스 추론 기준 (풀은 아래 비교에서만 사용)
+    settings.inference_pool_enabled = inference_pool_workers is not None
+    if inference_pool_workers is not None:
+        settings.inference_pool_workers = inference_pool_workers
+        settings.inference_pool_min_batch = corpus_size + 1
+
+    rss_before_model = peak_rss_mb()
+    with quiet(silence):
+        started_at = time.perf_counter()
+        analyzer = ReviewAnalyzer(enable_gpt=enable_gpt)
+        model_load_s = time.perf_counter() - started_at
+
+    if analyzer.pkl_model is None:
+        raise RuntimeError("pkl 모델을 로드하지 못했습니다. 저장소 루트에서 실행하세요.")
+
+    corpus = generate_corpus(corpus_size, seed=seed)
+    texts = [(review_text(review),) for review in corpus]
+    results = {}
+
+    with quiet(silence):
+        # 워밍업 (지연 초기화/캐시 영향 제거)
+        for review in corpus[:20]:
+            analyzer.analyze_single_review(review_text(review), review.get('rating'))
+
+        results['clean_text'] = summarize_latencies(time_calls(analyzer.clean_text, texts, repeat))
+        cache = analyzer.prediction_cache
+        cache_enabled, cache.enabled = cache.enabled, False
+        results['analyze_with_pkl'] = summarize_latencies(time_calls(analyzer._analyze_with_pkl, texts, repeat))
+        cache.enabled = cache_enabled
+        if cache_enabled:
+            for (text,) in texts:
+                analyzer._analyze_with_pkl(text)
+            results['analyze_with_pkl_memoized'] = summarize_latencies(
+                time_calls(analyzer._analyze_with_pkl, texts, repeat))
+
+        # 충돌 비율 (pkl 판단과 평점이 어긋나 GPT 2차 분석 대상이 되는 비율)
+        conflicts = {}
+        agreement = 0
+        for review in corpus:
+            pkl_result = analyzer._analyze_with_pkl(review_text(review))
+            if not pkl_result:
+                continue
+            if pkl_result.get('sentiment') == review['expected_sentiment']:
+                agreement += 1
+            conflict_type = analyzer.detect_conflict(pkl_result, review.get('rating'))
+            if conflict_type:
+                conflicts[conflict_type] = conflicts.get(conflict_type, 0) + 1
+        conflict_total = sum(conflicts.values())
+        results['conflicts'] = {
+            'total': conflict_total,
+            'rate': round(conflict_total / len(corpus), 4),
+            'by_type': conflicts,
+            'pkl_agreement_with_corpus_label': round(agreement / len(corpus), 4)
+        }
+
+        # 단건 반복 vs 배치
+        single_args = [(review_text(review), review.get('rating')) for review in corpus]
+        results['single_vs_batch'] = {
+            'analyze_single_review': summarize_latencies(time_calls(analyzer.analyze_single_review, single_args, repeat)),
+            'analyze_reviews_batch': summarize_latencies(
+                time_calls(analyzer.analyze_reviews_batch, [(corpus,)], repeat),
+                items=len(corpus) * repeat
+            )
+        }
+
+        # 배치 크기별 end-to-end 지연시간
+        by_batch_size = {}
+        for batch_size in batch_sizes:
+            batches = [(corpus[i:i + batch_size],) for i in range(0, len(corpus) - batch_size + 1, batch_size)]
+            if not batches:
+                continue
+            latencies = time_calls(analyzer.analyze_reviews_batch, batches, repeat)
+            by_batch_size[str(batch_size)] = summarize_latencies(latencies, items=len(batches) * batch_size * repeat)
+        results['analyze_reviews_batch'] = by_batch_size
+
+        if inference_pool_workers is not None:
+            if analyzer.inference_pool is None:
+                raise RuntimeError("추론 프로세스 풀은 워커가 2개 이상일 때만 사용합니다 (--inference-pool-workers 2 이상)")
+            results['inference_pool'] = compare_inference_pool(analyzer, [text for (text,) in texts], repeat)
+            analyzer.inference_pool.shutdown()
+
+        results['pkl_prediction_cache'] = analyzer.prediction_cache.status()
+
+    return {
+        'benchmark': 'analysis_pipeline',
+        'timestamp': datetime.now().isoformat(),
+        'git_revision': git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'params': {
+            'corpus_size': corpus_size,
+            'batch_sizes': batch_sizes,
+            'seed': seed,
+            'repeat': repeat,
+            'gpt_enabled': enable_gpt,
+            'backend': analyzer.pkl_backend,
+            'inference_pool_workers': inference_pool_workers
+        },
+        'model_load_s': round(model_load_s, 4),
+        'results': results,
+        'memory': {
+            'peak_rss_mb_before_model': rss_before_model,
+            'peak_rss_mb': peak_rss_mb()
+        }
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='ReviewAnalyzer 처리량 벤치마크')
+    parser.add_argument('--corpus-size', type=int, default=1000, help='합성 리뷰 수')
+    parser.add_argument('--batch-sizes', default='1,10,50,200', help='쉼표로 구분한 배치 크기 목록')
+    parser.add_argument('--seed', type=int, default=42, help='코퍼스 생성 시드')
+    parser.add_argument('--repeat', type=int, default=1, help='측정 반복 횟수')
+    parser.add_argument('--with-gpt', action='store_true',
+                        help='충돌 시 GPT 2차 분석 포함 (OPENAI_API_KEY 필요, 실제 과금 발생)')
+    parser.add_argument('--backend', choices=['auto', 'numpy', 'sklearn'],
+                        help='1차 분석 추론 엔진 (기본값: SENTIMENT_BACKEND)')
+    parser.add_argument('--inference-pool-workers', type=int,
+                        help='전체 코퍼스 1차 추론을 이 워커 수의 추론 프로세스 풀과 비교 (2 이상)')
+    parser.add_argument('--verbose', action='store_true', help='분석기 로그 출력')
+    parser.add_argument('--output', help='결과 JSON 저장 경로')
+    args = parser.parse_args(argv)
+
+    batch_sizes = [int(size) for size in args.batch_sizes.split(',') if size.strip()]
+    report = run_benchmark(args.corpus_size, batch_sizes, args.seed, args.repeat,
+                           enable_gpt=args.with_gpt, silence=not args.verbose, backend=args.backend,
+                           inference_pool_workers=args.inference_pool_workers)
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output)
+    print(output)
+
+
+if __name__ == '__main__':
+    main()
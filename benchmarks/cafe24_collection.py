@@ -0,0 +1,114 @@
+"""
+카페24 리뷰 수집 벤치마크 (로컬 스탠드인 서버 사용)
+
+스탠드인 서버를 프로세스 내부에서 띄우고 Cafe24OAuth / Cafe24ReviewAPI를 그 주소로 연결해
+수집 경로(게시판 조회, 최신 리뷰, 상품별 리뷰, 검색, 상품 정보)의 지연시간과 API 호출 수,
+429 재시도 동작을 측정합니다.
+
+사용법:
+    python -m benchmarks.cafe24_collection --latency-ms 80 --jitter-ms 30 \
+        --latency-distribution uniform --error-rate-429 0.05 --rate-limit-delay 0.1 --output cafe24.json
+"""
+
+import json
+import os
+import tempfile
+import time
+from datetime import datetime
+from typing import Dict, Any, Callable
+
+from benchmarks.analysis_pipeline import summarize_latencies, quiet, git_revision, peak_rss_mb
+from benchmarks.standins import BackgroundServer
+from benchmarks.standins.cafe24_api import create_app, build_arg_parser, standin_from_args
+
+
+def measure(name: str, func: Callable, repeat: int, standin) -> Dict[str, Any]:
+    """작업을 repeat회 실행하며 지연시간과 스탠드인 호출 수 기록"""
+    standin.reset_stats()
+    latencies = []
+    errors = 0
+    items = 0
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        try:
+            result = func()
+            items += len(result) if isinstance(result, (list, dict)) else 1
+        except Exception:
+            errors += 1
+        latencies.append(time.perf_counter() - started_at)
+
+    summary = summarize_latencies(latencies, items=items)
+    summary.update({
+        'errors': errors,
+        'api_requests': standin.stats['requests'],
+        'api_throttled': standin.stats['throttled'],
+        'api_injected_429': standin.stats['injected_429']
+    })
+    return summary
+
+
+def run_benchmark(args) -> Dict[str, Any]:
+    from app.infrastructure.auth.cafe24_oauth import Cafe24OAuth
+    from app.infrastructure.external.cafe24.cafe24_reviews import Cafe24ReviewAPI
+
+    standin = standin_from_args(args)
+    results = {}
+
+    with BackgroundServer(create_app(standin)) as server, tempfile.TemporaryDirectory() as tmpdir, quiet(not args.verbose):
+        oauth = Cafe24OAuth('standin-client', 'standin-secret', 'standin',
+                            'http://127.0.0.1/callback', base_url=f"{server.url}/api/v2")
+        oauth.token_file = os.path.join(tmpdir, 'cafe24_tokens_standin.json')
+
+        results['oauth_token'] = measure('oauth_token', lambda: oauth.get_access_token('standin-code'), 1, standin)
+
+        review_api = Cafe24ReviewAPI(oauth)
+        if args.rate_limit_delay is not None:
+            review_api.rate_limit_delay = args.rate_limit_delay
+
+        results['get_review_boards'] = measure('get_review_boards', review_api.get_review_boards, args.repeat, standin)
+        results['get_latest_reviews'] = measure(
+            'get_latest_reviews', lambda: review_api.get_latest_reviews(days=7, limit=args.limit), args.repeat, standin)
+        results['search_reviews'] = measure(
+            'search_reviews', lambda: review_api.search_reviews(args.keyword, limit=args.limit), args.repeat, standin)
+        results['get_product_reviews'] = measure(
+            'get_product_reviews', lambda: review_api.get_product_reviews(limit=args.limit), args.repeat, standin)
+        results['get_product_info'] = measure(
+            'get_product_info', lambda: [review_api.get_product_info(no) for no in range(1, 11)], args.repeat, standin)
+
+    return {
+        'benchmark': 'cafe24_collection',
+        'timestamp': datetime.now().isoformat(),
+        'git_revision': git_revision(),
+        'params': {
+            'standin': standin.to_dict(),
+            'rate_limit_delay': review_api.rate_limit_delay,
+            'max_retries': review_api.max_retries,
+            'limit': args.limit,
+            'repeat': args.repeat
+        },
+        'results': results,
+        'memory': {'peak_rss_mb': peak_rss_mb()}
+    }
+
+
+def main(argv=None):
+    parser = build_arg_parser()
+    parser.description = '카페24 리뷰 수집 벤치마크 (로컬 스탠드인 서버 사용)'
+    parser.add_argument('--rate-limit-delay', type=float, default=None,
+                        help='Cafe24ReviewAPI 호출 간격 재정의 (기본값: CAFE24_RATE_LIMIT_DELAY)')
+    parser.add_argument('--limit', type=int, default=50, help='작업별 조회 리뷰 수')
+    parser.add_argument('--keyword', default='배송', help='search_reviews 검색어')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--verbose', action='store_true')
+    parser.add_argument('--output', help='결과 JSON 저장 경로')
+    args = parser.parse_args(argv)
+
+    output = json.dumps(run_benchmark(args), ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output)
+    print(output)
+
+
+if __name__ == '__main__':
+    main()
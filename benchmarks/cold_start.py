@@ -0,0 +1,194 @@
+"""
+콜드 스타트 벤치마크 (gunicorn 실행부터 /healthz, /readyz 응답까지)
+
+Dockerfile과 같은 gunicorn.conf.py로 앱을 새 프로세스에서 실행하고, 프로세스 생성 시점부터
+/healthz가 처음 200을 반환하는 시각(포트 열림)과 /readyz가 200을 반환하는 시각(워밍업 완료)을 측정합니다.
+카페24·OpenAI·채널톡 스탠드인 서버를 함께 띄우고 실행마다 새 작업 디렉토리(토큰 파일 + 모델 링크만 있는
+컨테이너 첫 시작 상태)를 사용합니다. /readyz 응답의 앱 내부 단계별 시간(phases_s, tasks)도 함께 기록합니다.
+--warm-state를 주면 측정 전에 한 번 실행해 종료 시 저장된 웜 스테이트 스냅샷을 만들고, 측정 실행마다 작업 디렉토리에
+복사해 스냅샷 복원 후 부팅(공유 볼륨에 스냅샷이 있는 새 인스턴스)을 측정합니다.
+
+사용법:
+    python -m benchmarks.cold_start --runs 5 --output cold_start.json
+    python -m benchmarks.cold_start --runs 3 --rate-limit-delay 0.1 --no-warmup
+    python -m benchmarks.cold_start --runs 5 --warm-state
+"""
+
+import argparse
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import ExitStack
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+import requests
+
+from benchmarks.analysis_pipeline import summarize_latencies, git_revision
+from benchmarks.standins import BackgroundServer, LatencyModel
+from benchmarks.standins import cafe24_api, openai_api, channel_talk_api
+from benchmarks.webhook_replay import REPO_ROOT, MODEL_FILES, issue_standin_token, standin_environment
+
+
+WARM_STATE_FILE = 'warm_state.json'
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def prepare_workdir(workdir: str, cafe24_url: str, warm_state: Optional[str] = None):
+    """컨테이너 첫 시작 상태: 토큰 파일과 모델 파일(+ 웜 스테이트 스냅샷)만 있는 작업 디렉토리"""
+    for model_file in MODEL_FILES:
+        if os.path.exists(os.path.join(REPO_ROOT, model_file)):
+            os.symlink(os.path.join(REPO_ROOT, model_file), os.path.join(workdir, model_file))
+    issue_standin_token(cafe24_url, workdir)
+    if warm_state:
+        shutil.copy(warm_state, os.path.join(workdir, WARM_STATE_FILE))
+
+
+def wait_until(url: str, deadline: float, poll_interval: float) -> Optional[requests.Response]:
+    """url이 200을 반환할 때까지 폴링 (마감 시각을 넘기면 None)"""
+    while time.perf_counter() < deadline:
+        try:
+            response = requests.get(url, timeout=1)
+            if response.status_code == 200:
+                return response
+        except requests.RequestException:
+            pass
+        time.sleep(poll_interval)
+    return None
+
+
+def measure_cold_start(env: Dict[str, str], workdir: str, timeout: float, poll_interval: float) -> Dict[str, Any]:
+    """gunicorn 1회 실행: 프로세스 생성부터 healthz/readyz까지의 시간"""
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    command = [sys.executable, '-m', 'gunicorn', '--config', os.path.join(REPO_ROOT, 'gunicorn.conf.py'),
+               '--pythonpath', REPO_ROOT, '--bind', f"127.0.0.1:{port}"]
+
+    with open(os.path.join(workdir, 'gunicorn.log'), 'w') as log_file:
+        started_at = time.perf_counter()
+        process = subprocess.Popen(command, cwd=workdir, env=env, stdout=log_file, stderr=subprocess.STDOUT)
+        try:
+            deadline = started_at + timeout
+            healthy = wait_until(f"{base_url}/healthz", deadline, poll_interval)
+            healthy_at = time.perf_counter()
+            ready = wait_until(f"{base_url}/readyz", deadline, poll_interval) if healthy else None
+            ready_at = time.perf_counter()
+        finally:
+            process.terminate()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+
+    if ready is None:
+        with open(os.path.join(workdir, 'gunicorn.log'), 'r') as f:
+            tail = f.read()[-2000:]
+        raise RuntimeError(f"{timeout}초 안에 준비되지 않았습니다 (healthz={'ok' if healthy else 'fail'}):\n{tail}")
+
+    return {
+        'healthy_s': round(healthy_at - started_at, 4),
+        'ready_s': round(ready_at - started_at, 4),
+        'app': ready.json()
+    }
+
+
+def run_benchmark(args) -> Dict[str, Any]:
+    cafe24_standin = cafe24_api.Cafe24StandIn(
+        reviews=args.initial_reviews, seed=args.seed,
+        latency=LatencyModel('uniform', args.cafe24_latency_ms, args.cafe24_latency_ms / 3, seed=args.seed))
+    openai_standin = openai_api.OpenAIStandIn(seed=args.seed)
+    channel_talk_standin = channel_talk_api.ChannelTalkStandIn(seed=args.seed)
+
+    runs = []
+    with ExitStack() as stack:
+        cafe24_server = stack.enter_context(BackgroundServer(cafe24_api.create_app(cafe24_standin)))
+        openai_server = stack.enter_context(BackgroundServer(openai_api.create_app(openai_standin)))
+        channel_talk_server = stack.enter_context(BackgroundServer(channel_talk_api.create_app(channel_talk_standin)))
+
+        env = dict(os.environ)
+        env.update(standin_environment(cafe24_server.url, openai_server.url, channel_talk_server.url,
+                                       args.rate_limit_delay))
+        env.update({
+            'CAFE24_REDIRECT_URI': 'http://127.0.0.1/callback',
+            'LOG_LEVEL': 'WARNING',
+            'WARMUP_ENABLED': 'false' if args.no_warmup else 'true',
+            'WARM_STATE_ENABLED': 'true' if args.warm_state else 'false',
+            'WARM_STATE_PATH': WARM_STATE_FILE
+        })
+
+        warm_state = None
+        if args.warm_state:
+            # 스냅샷 준비 실행: 워밍업이 끝난 뒤 종료하면 마지막 상태가 저장됨
+            snapshot_dir = stack.enter_context(tempfile.TemporaryDirectory())
+            prepare_workdir(snapshot_dir, cafe24_server.url)
+            measure_cold_start(env, snapshot_dir, args.timeout, args.poll_interval)
+            warm_state = os.path.join(snapshot_dir, WARM_STATE_FILE)
+            if not os.path.exists(warm_state):
+                raise RuntimeError("준비 실행에서 웜 스테이트 스냅샷이 저장되지 않았습니다")
+
+        for _ in range(args.runs):
+            with tempfile.TemporaryDirectory() as workdir:
+                prepare_workdir(workdir, cafe24_server.url, warm_state)
+                cafe24_standin.reset_stats()
+                run = measure_cold_start(env, workdir, args.timeout, args.poll_interval)
+                run['cafe24_requests'] = cafe24_standin.stats['requests']
+                runs.append(run)
+
+    return {
+        'benchmark': 'cold_start',
+        'timestamp': datetime.now().isoformat(),
+        'git_revision': git_revision(),
+        'params': {
+            'runs': args.runs,
+            'warmup': not args.no_warmup,
+            'warm_state': args.warm_state,
+            'rate_limit_delay': args.rate_limit_delay,
+            'cafe24_latency_ms': args.cafe24_latency_ms
+        },
+        'results': {
+            'healthy': summarize_latencies([run['healthy_s'] for run in runs]),
+            'ready': summarize_latencies([run['ready_s'] for run in runs]),
+            'runs': runs
+        }
+    }
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description='콜드 스타트 벤치마크 (gunicorn → /healthz, /readyz)')
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--timeout', type=float, default=60.0, help='실행당 준비 대기 시간(초)')
+    parser.add_argument('--poll-interval', type=float, default=0.01, help='healthz/readyz 폴링 간격(초)')
+    parser.add_argument('--no-warmup', action='store_true', help='WARMUP_ENABLED=false로 실행 (첫 요청이 초기화 비용 부담)')
+    parser.add_argument('--warm-state', action='store_true',
+                        help='준비 실행으로 만든 웜 스테이트 스냅샷을 복원한 상태로 측정')
+    parser.add_argument('--rate-limit-delay', type=float, default=None,
+                        help='Cafe24ReviewAPI 호출 간격 재정의 (기본값: CAFE24_RATE_LIMIT_DELAY)')
+    parser.add_argument('--initial-reviews', type=int, default=200, help='카페24 스탠드인 초기 리뷰 수')
+    parser.add_argument('--cafe24-latency-ms', type=float, default=80.0)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help='결과 JSON 저장 경로')
+    return parser
+
+
+def main(argv=None):
+    args = build_arg_parser().parse_args(argv)
+    output = json.dumps(run_benchmark(args), ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output)
+    print(output)
+
+
+if __name__ == '__main__':
+    main()
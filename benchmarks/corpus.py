@@ -0,0 +1,107 @@
+"""
+합성 한국어 리뷰 코퍼스 생성기
+
+카페24 get_latest_reviews()가 반환하는 리뷰와 같은 형태의 리뷰를 시드 기반으로
+재현 가능하게 생성합니다. 평점은 문장 감정과 대체로 일치하지만, 일부는 의도적으로
+어긋나게 만들어 GPT 2차 분석(충돌) 경로도 측정되도록 합니다.
+"""
+
+import random
+from datetime import datetime, timedelta
+from typing import List, Dict
+
+
+PRODUCT_WORDS = ['티셔츠', '원피스', '바지', '니트', '가디건', '셔츠', '자켓', '코트', '스커트', '양말']
+
+POSITIVE_PHRASES = [
+    '배송 빨라요', '품질 좋아요', '사이즈 딱 맞아요', '색상이 예뻐요', '재질이 부드러워요',
+    '가격 대비 만족합니다', '또 구매할게요', '선물했는데 좋아하네요', '핏이 너무 예뻐요',
+    '포장이 꼼꼼해요', '생각보다 훨씬 좋네요', '강력 추천합니다'
+]
+
+NEGATIVE_PHRASES = [
+    '배송이 너무 늦어요', '품질이 별로예요', '사이즈가 안 맞아요', '색상이 사진이랑 달라요',
+    '실밥이 다 터져 있어요', '냄새가 심해요', '환불 요청합니다', '다시는 안 삽니다',
+    '한 번 빨았더니 줄었어요', '불량품이 왔어요', '교환도 안 해주네요', '가격에 비해 실망입니다'
+]
+
+NEUTRAL_PHRASES = [
+    '평범해요', '그냥 그래요', '보통입니다', '사진이랑 비슷해요', '무난하게 입을만해요',
+    '아직 안 입어봤어요', '배송은 보통이에요'
+]
+
+INTENSIFIERS = ['', '', '진짜 ', '너무 ', '정말 ', '완전 ']
+ENDINGS = ['', '', '!', '!!', '~', '.', ' ㅎㅎ', ' ㅠㅠ']
+TITLES = {
+    'positive': ['만족해요', '좋아요', '최고', '재구매 의사 있어요'],
+    'negative': ['실망', '별로예요', '불만족', '환불 원해요'],
+    'neutral': ['후기', '보통', '그럭저럭']
+}
+
+# 감정별 평점 분포 (일부는 의도적으로 감정과 어긋남)
+RATING_WEIGHTS = {
+    'positive': [2, 2, 4, 22, 70],
+    'negative': [45, 30, 15, 6, 4],
+    'neutral': [5, 15, 45, 25, 10]
+}
+
+SENTIMENT_WEIGHTS = {'positive': 65, 'negative': 20, 'neutral': 15}
+
+# 복붙/템플릿 리뷰 비율 (실제 쇼핑몰처럼 짧은 리뷰가 반복됨)
+TEMPLATE_RATIO = 0.2
+TEMPLATE_REVIEWS = ['배송 빨라요 좋아요', '좋아요', '잘 받았습니다', '만족합니다', '별로예요']
+
+
+def _sentence(rng: random.Random, phrases: List[str]) -> str:
+    return f"{rng.choice(INTENSIFIERS)}{rng.choice(phrases)}{rng.choice(ENDINGS)}"
+
+
+def generate_review(rng: random.Random, article_no: int, created_at: datetime) -> Dict:
+    """합성 리뷰 1건 생성"""
+    sentiment = rng.choices(list(SENTIMENT_WEIGHTS), weights=list(SENTIMENT_WEIGHTS.values()))[0]
+    phrases = {
+        'positive': POSITIVE_PHRASES,
+        'negative': NEGATIVE_PHRASES,
+        'neutral': NEUTRAL_PHRASES
+    }[sentiment]
+
+    if rng.random() < TEMPLATE_RATIO:
+        content = rng.choice(TEMPLATE_REVIEWS)
+    else:
+        sentences = [_sentence(rng, phrases) for _ in range(rng.randint(1, 4))]
+        # 긍정 리뷰에도 가끔 아쉬운 점이 섞이도록
+        if sentiment == 'positive' and rng.random() < 0.15:
+            sentences.append(f"다만 {_sentence(rng, NEGATIVE_PHRASES)}")
+        content = f"{rng.choice(PRODUCT_WORDS)} " + '<br>'.join(sentences) if rng.random() < 0.2 else ' '.join(sentences)
+
+    return {
+        'board_no': 4,
+        'board_name': '상품 사용후기',
+        'article_no': article_no,
+        'product_no': rng.randint(1, 50),
+        'title': rng.choice(TITLES[sentiment]),
+        'content': content,
+        'writer': f"고객{rng.randint(1000, 9999)}",
+        'rating': rng.choices([1, 2, 3, 4, 5], weights=RATING_WEIGHTS[sentiment])[0],
+        'created_date': created_at.strftime('%Y-%m-%dT%H:%M:%S+09:00'),
+        'view_count': rng.randint(0, 300),
+        'expected_sentiment': sentiment
+    }
+
+
+def generate_corpus(size: int = 1000, seed: int = 42, now: datetime = None,
+                    max_gap_seconds: int = 1800) -> List[Dict]:
+    """최신순으로 정렬된 합성 리뷰 목록 생성
+
+    Args:
+        now: 가장 최신 리뷰의 기준 시각 (기본값은 고정 시각이라 결과가 항상 같음)
+        max_gap_seconds: 연속된 리뷰 사이의 최대 작성 간격
+    """
+    rng = random.Random(seed)
+    now = now or datetime(2025, 9, 1, 12, 0, 0)
+    reviews = []
+    created_at = now
+    for i in range(size):
+        created_at -= timedelta(seconds=rng.randint(min(30, max_gap_seconds), max_gap_seconds))
+        reviews.append(generate_review(rng, 100000 - i, created_at))
+    return reviews
@@ -0,0 +1,202 @@
+"""
+GPT 2차 분석(충돌 해소) 경로 벤치마크 (로컬 OpenAI 스탠드인 서버 사용)
+
+합성 코퍼스에서 pkl 판단과 평점이 충돌하는 리뷰만 골라 analyze_single_review를 호출하고,
+GPT 지연시간 분포·오류율·잘못된 응답 비율에 따른 지연시간, 2차 분석 성공률, 동시성별 처리량을 측정합니다.
+--pack-sizes를 주면 같은 리뷰를 --burst-size건씩 analyze_reviews_batch로 분석하며 GPT_PACK_SIZE별
+GPT 요청 수, 프롬프트 토큰 수, 배치 지연시간을 비교합니다 (1 = 리뷰마다 요청).
+--routing-policies를 주면 충돌 여부와 관계없는 코퍼스 리뷰 --routing-reviews건을 일괄 분석하며 라우팅 정책/시간당
+예산별 라우팅 결정 수, GPT 요청 수, 토큰 수, 배치 지연시간을 비교합니다.
+
+사용법:
+    python -m benchmarks.second_stage --latency-ms 900 --sigma 0.6 --error-rate 0.02 \
+        --malformed-rate 0.05 --concurrency 1,4,8 --output second_stage.json
+    python -m benchmarks.second_stage --latency-ms 900 --malformed-rate 0.05 --pack-sizes 1,4,8 --burst-size 20
+    python -m benchmarks.second_stage --latency-ms 300 --concurrency '' --routing-policies conflict,adaptive:0,adaptive:50
+"""
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Any, List
+
+from benchmarks.analysis_pipeline import summarize_latencies, quiet, git_revision, peak_rss_mb, review_text
+from benchmarks.corpus import generate_corpus
+from benchmarks.standins import BackgroundServer
+from benchmarks.standins.openai_api import create_app, build_arg_parser, standin_from_args
+
+
+def find_conflicting_reviews(analyzer, corpus: List[Dict], limit: int) -> List[Dict]:
+    """pkl 판단과 평점이 충돌하는 리뷰 선별"""
+    conflicting = []
+    for review in corpus:
+        pkl_result = analyzer._analyze_with_pkl(review_text(review))
+        if pkl_result and analyzer.detect_conflict(pkl_result, review.get('rating')):
+            conflicting.append(review)
+            if len(conflicting) >= limit:
+                break
+    return conflicting
+
+
+def run_concurrency_level(analyzer, reviews: List[Dict], concurrency: int) -> Dict[str, Any]:
+    latencies = []
+    outcomes = {}
+
+    def analyze(review):
+        started_at = time.perf_counter()
+        result = analyzer.analyze_single_review(review_text(review), review.get('rating'))
+        return time.perf_counter() - started_at, result
+
+    started_at = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for latency, result in executor.map(analyze, reviews):
+            latencies.append(latency)
+            method = result.get('method', 'unknown')
+            outcomes[method] = outcomes.get(method, 0) + 1
+    wall_s = time.perf_counter() - started_at
+
+    summary = summarize_latencies(latencies)
+    summary.update({
+        'concurrency': concurrency,
+        'wall_s': round(wall_s, 4),
+        'throughput_per_sec': round(len(reviews) / wall_s, 2) if wall_s > 0 else None,
+        'outcomes': outcomes,
+        'gpt_resolved_rate': round(outcomes.get('gpt-4o-mini-2nd', 0) / len(reviews), 4) if reviews else 0
+    })
+    return summary
+
+
+def run_batch_level(analyzer, reviews: List[Dict], burst_size: int) -> Dict[str, Any]:
+    """burst_size건씩 analyze_reviews_batch 호출 (수집 버스트/백필 경로)"""
+    latencies = []
+    outcomes = {}
+    packed = 0
+    for start in range(0, len(reviews), burst_size):
+        burst = reviews[start:start + burst_size]
+        started_at = time.perf_counter()
+        results = analyzer.analyze_reviews_batch(burst)
+        latencies.append(time.perf_counter() - started_at)
+        for result in results:
+            method = result.get('method', 'unknown')
+            outcomes[method] = outcomes.get(method, 0) + 1
+            packed += 1 if result.get('packed') else 0
+
+    summary = summarize_latencies(latencies, items=len(reviews))
+    summary.update({
+        'burst_size': burst_size,
+        'outcomes': outcomes,
+        'packed_results': packed,
+        'gpt_resolved_rate': round(outcomes.get('gpt-4o-mini-2nd', 0) / len(reviews), 4) if reviews else 0
+    })
+    return summary
+
+
+def run_routing_level(analyzer, reviews: List[Dict], burst_size: int) -> Dict[str, Any]:
+    """현재 라우팅 정책으로 burst_size건씩 일괄 분석하고 라우팅 결정 수를 함께 기록"""
+    from app.shared.utils.metrics import GPT_ROUTING_TOTAL
+
+    before = {labels: value for _, labels, value in GPT_ROUTING_TOTAL.samples()}
+    summary = run_batch_level(analyzer, reviews, burst_size)
+    summary['decisions'] = {labels: int(value - before.get(labels, 0))
+                            for _, labels, value in GPT_ROUTING_TOTAL.samples() if value - before.get(labels, 0)}
+    summary['policy'] = analyzer.routing_policy.status()
+    return summary
+
+
+def run_benchmark(args) -> Dict[str, Any]:
+    from config.settings import settings
+    from app.infrastructure.external.openai.review_analyzer import ReviewAnalyzer
+    from app.infrastructure.external.openai.routing_policy import create_routing_policy
+
+    standin = standin_from_args(args)
+    results = {}
+
+    with BackgroundServer(create_app(standin)) as server, quiet(not args.verbose):
+        settings.openai_base_url = f"{server.url}/v1"
+        settings.openai_max_retries = args.client_max_retries
+        settings.openai_timeout = args.client_timeout
+
+        analyzer = ReviewAnalyzer(enable_gpt=True)
+        if analyzer.pkl_model is None:
+            raise RuntimeError("pkl 모델을 로드하지 못했습니다. 저장소 루트에서 실행하세요.")
+
+        corpus = generate_corpus(args.corpus_size, seed=args.seed)
+        reviews = find_conflicting_reviews(analyzer, corpus, args.reviews)
+
+        for concurrency in args.concurrency:
+            standin.reset_stats()
+            level = run_concurrency_level(analyzer, reviews, concurrency)
+            level['standin'] = dict(standin.stats)
+            results[str(concurrency)] = level
+
+        if args.pack_sizes:
+            batch_results = {}
+            for pack_size in args.pack_sizes:
+                settings.gpt_pack_size = pack_size
+                standin.reset_stats()
+                level = run_batch_level(analyzer, reviews, args.burst_size)
+                level['standin'] = dict(standin.stats)
+                batch_results[str(pack_size)] = level
+            results['batch_by_pack_size'] = batch_results
+
+        if args.routing_policies:
+            routing_results = {}
+            routing_reviews = corpus[:args.routing_reviews]
+            for entry in args.routing_policies:
+                policy, _, budget = entry.partition(':')
+                settings.gpt_routing_policy = policy
+                settings.gpt_hourly_budget = int(budget or 0)
+                analyzer.routing_policy = create_routing_policy(settings)
+                standin.reset_stats()
+                level = run_routing_level(analyzer, routing_reviews, args.burst_size)
+                level['standin'] = dict(standin.stats)
+                routing_results[entry] = level
+            results['batch_by_routing_policy'] = routing_results
+
+    return {
+        'benchmark': 'second_stage',
+        'timestamp': datetime.now().isoformat(),
+        'git_revision': git_revision(),
+        'params': {
+            'standin': standin.to_dict(),
+            'conflicting_reviews': len(reviews),
+            'corpus_size': args.corpus_size,
+            'client_max_retries': args.client_max_retries,
+            'client_timeout': args.client_timeout,
+            'burst_size': args.burst_size
+        },
+        'results': results,
+        'memory': {'peak_rss_mb': peak_rss_mb()}
+    }
+
+
+def main(argv=None):
+    parser = build_arg_parser()
+    parser.description = 'GPT 2차 분석 경로 벤치마크 (로컬 OpenAI 스탠드인 서버 사용)'
+    parser.add_argument('--corpus-size', type=int, default=2000)
+    parser.add_argument('--reviews', type=int, default=100, help='측정할 충돌 리뷰 수')
+    parser.add_argument('--concurrency', default='1,4', help='쉼표로 구분한 동시 요청 수 목록')
+    parser.add_argument('--pack-sizes', default='', help='쉼표로 구분한 GPT_PACK_SIZE 목록 (일괄 분석 비교, 예: 1,4,8)')
+    parser.add_argument('--burst-size', type=int, default=20, help='일괄 분석 비교에서 analyze_reviews_batch 한 번에 넘길 리뷰 수')
+    parser.add_argument('--routing-policies', default='',
+                        help="쉼표로 구분한 '정책[:시간당 예산]' 목록 (예: conflict,adaptive:0,adaptive:50)")
+    parser.add_argument('--routing-reviews', type=int, default=400, help='라우팅 정책 비교에 사용할 코퍼스 리뷰 수')
+    parser.add_argument('--client-max-retries', type=int, default=2, help='OpenAI 클라이언트 재시도 횟수')
+    parser.add_argument('--client-timeout', type=float, default=30.0, help='OpenAI 클라이언트 타임아웃(초)')
+    parser.add_argument('--verbose', action='store_true')
+    parser.add_argument('--output', help='결과 JSON 저장 경로')
+    args = parser.parse_args(argv)
+    args.concurrency = [int(level) for level in args.concurrency.split(',') if level.strip()]
+    args.pack_sizes = [int(size) for size in args.pack_sizes.split(',') if size.strip()]
+    args.routing_policies = [entry.strip() for entry in args.routing_policies.split(',') if entry.strip()]
+
+    output = json.dumps(run_benchmark(args), ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output)
+    print(output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+외부 API 로컬 스탠드인 서버 (부하/지연 테스트용)
+"""
+
+import logging
+import random
+import threading
+import time
+
+from werkzeug.serving import make_server
+
+
+class LatencyModel:
+    """응답 지연 분포 (fixed / uniform / lognormal)"""
+
+    def __init__(self, distribution: str = 'fixed', latency_ms: float = 0.0,
+                 jitter_ms: float = 0.0, sigma: float = 0.5, seed: int = None):
+        self.distribution = distribution
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.sigma = sigma
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def sample_ms(self) -> float:
+        with self._lock:
+            if self.distribution == 'uniform':
+                return max(0.0, self._rng.uniform(self.latency_ms - self.jitter_ms, self.latency_ms + self.jitter_ms))
+            if self.distribution == 'lognormal' and self.latency_ms > 0:
+                # latency_ms를 중앙값으로 하는 로그정규 분포 (긴 꼬리 지연 재현)
+                return self._rng.lognormvariate(0, self.sigma) * self.latency_ms
+            return self.latency_ms
+
+    def sleep(self):
+        delay_ms = self.sample_ms()
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000)
+
+    def to_dict(self):
+        return {
+            'distribution': self.distribution,
+            'latency_ms': self.latency_ms,
+            'jitter_ms': self.jitter_ms,
+            'sigma': self.sigma
+        }
+
+
+class BackgroundServer:
+    """Flask 앱을 별도 스레드에서 실행 (벤치마크 프로세스 내부 구동용)"""
+
+    def __init__(self, app, host: str = '127.0.0.1', port: int = 0, quiet: bool = True):
+        if quiet:
+            # 요청마다 찍히는 werkzeug 접근 로그 비활성화
+            logging.getLogger('werkzeug').setLevel(logging.ERROR)
+        self._server = make_server(host, port, app, threaded=True)
+        self.host = host
+        self.port = self._server.server_port
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._thread.join(timeout=5)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
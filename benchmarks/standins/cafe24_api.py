@@ -0,0 +1,310 @@
+"""
+카페24 Admin API 로컬 스탠드인 서버
+
+Cafe24ReviewAPI / Cafe24OAuth가 사용하는 엔드포인트만 구현합니다.
+    POST /api/v2/oauth/token
+    GET  /api/v2/admin/boards
+    GET  /api/v2/admin/boards/<board_no>/articles
+    GET  /api/v2/admin/boards/<board_no>/articles/<article_no>
+    GET  /api/v2/admin/products
+    GET  /api/v2/admin/products/<product_no>
+
+지연시간 분포, 페이지네이션(limit 최대 100), X-Api-Call-Limit 헤더(leaky bucket),
+429 응답 주입을 설정할 수 있습니다. 제어용 엔드포인트는 /_standin/ 아래에 있습니다.
+
+사용법:
+    python -m benchmarks.standins.cafe24_api --port 8081 --latency-ms 80 --jitter-ms 40 --error-rate-429 0.02
+    export CAFE24_API_BASE_URL=http://127.0.0.1:8081/api/v2
+"""
+
+import argparse
+import random
+import secrets
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, List
+
+from flask import Flask, jsonify, request
+
+from benchmarks.corpus import generate_corpus, PRODUCT_WORDS
+from benchmarks.standins import LatencyModel
+
+REVIEW_BOARDS = [
+    {'board_no': 4, 'board_name': '상품 사용후기', 'board_type': 'review'},
+    {'board_no': 6, 'board_name': '구매 리뷰', 'board_type': 'review'}
+]
+OTHER_BOARDS = [
+    {'board_no': 1, 'board_name': '공지사항', 'board_type': 'notice'},
+    {'board_no': 5, 'board_name': '상품 Q&A', 'board_type': 'qna'}
+]
+
+MAX_LIMIT = 100
+
+
+class Cafe24StandIn:
+    """스탠드인 서버 상태 (게시글 데이터, 호출 한도 버킷, 호출 통계)"""
+
+    def __init__(self, reviews: int = 500, products: int = 50, seed: int = 42,
+                 latency: LatencyModel = None, bucket_size: int = 40, leak_per_second: float = 2.0,
+                 error_rate_429: float = 0.0, retry_after: float = 1.0):
+        self.latency = latency or LatencyModel()
+        self.bucket_size = bucket_size
+        self.leak_per_second = leak_per_second
+        self.error_rate_429 = error_rate_429
+        self.retry_after = retry_after
+
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._bucket_level = 0.0
+        self._bucket_updated_at = time.monotonic()
+
+        self.products = {
+            product_no: {
+                'product_no': product_no,
+                'product_name': f"{PRODUCT_WORDS[product_no % len(PRODUCT_WORDS)]} {product_no}호",
+                'price': f"{(product_no % 9 + 1) * 10000}.00",
+                'display': 'T',
+                'selling': 'T'
+            } for product_no in range(1, products + 1)
+        }
+
+        # 게시판별 게시글 (article_no 내림차순 = 최신순)
+        self.articles = {board['board_no']: [] for board in REVIEW_BOARDS + OTHER_BOARDS}
+        for i, review in enumerate(generate_corpus(reviews, seed=seed, now=datetime.now())):
+            board = REVIEW_BOARDS[i % len(REVIEW_BOARDS)]
+            self.articles[board['board_no']].append(self._to_article(review, board['board_no']))
+        self._next_article_no = max((a['article_no'] for arts in self.articles.values() for a in arts), default=100000) + 1
+
+        self.reset_stats()
+
+    def _to_article(self, review: Dict, board_no: int) -> Dict:
+        return {
+            'board_no': board_no,
+            'article_no': review['article_no'],
+            'product_no': review['product_no'],
+            'title': review['title'],
+            'content': review['content'],
+            'writer': review['writer'],
+            'rating': review['rating'],
+            'created_date': review['created_date'],
+            'updated_date': review['created_date'],
+            'view_count': review['view_count']
+        }
+
+    def reset_stats(self):
+        with self._lock:
+            self.stats = {
+                'requests': 0,
+                'throttled': 0,
+                'injected_429': 0,
+                'by_endpoint': {},
+                'started_at': datetime.now().isoformat()
+            }
+
+    def add_article(self, board_no: int = None, **fields) -> Dict:
+        """신규 리뷰 게시글 추가 (웹훅 재생 시 '새 리뷰 등록' 재현용)"""
+        board_no = board_no or REVIEW_BOARDS[0]['board_no']
+        with self._lock:
+            article_no = self._next_article_no
+            self._next_article_no += 1
+        # 카페24와 같이 KST 기준 시각 (컨테이너가 UTC여도 감지 지연 계산이 맞도록)
+        now = datetime.now(timezone(timedelta(hours=9))).strftime('%Y-%m-%dT%H:%M:%S+09:00')
+        article = {
+            'board_no': board_no,
+            'article_no': article_no,
+            'product_no': fields.get('product_no', self._rng.randint(1, len(self.products))),
+            'title': fields.get('title', '후기'),
+            'content': fields.get('content', ''),
+            'writer': fields.get('writer', '고객'),
+            'rating': fields.get('rating', 5),
+            'created_date': fields.get('created_date', now),
+            'updated_date': now,
+            'view_count': 0
+        }
+        with self._lock:
+            self.articles.setdefault(board_no, []).insert(0, article)
+        return article
+
+    def admit(self, endpoint: str):
+        """호출 한도 버킷 갱신. 한도 초과/주입 시 429 응답 튜플 반환"""
+        with self._lock:
+            now = time.monotonic()
+            leaked = (now - self._bucket_updated_at) * self.leak_per_second
+            self._bucket_level = max(0.0, self._bucket_level - leaked)
+            self._bucket_updated_at = now
+
+            self.stats['requests'] += 1
+            endpoint_stats = self.stats['by_endpoint'].setdefault(endpoint, {'requests': 0, 'throttled': 0})
+            endpoint_stats['requests'] += 1
+
+            throttled = self._bucket_level + 1 > self.bucket_size
+            injected = not throttled and self.error_rate_429 > 0 and self._rng.random() < self.error_rate_429
+            if throttled or injected:
+                self.stats['throttled' if throttled else 'injected_429'] += 1
+                endpoint_stats['throttled'] += 1
+                return False, int(self._bucket_level)
+
+            self._bucket_level += 1
+            return True, int(round(self._bucket_level))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'latency': self.latency.to_dict(),
+            'bucket_size': self.bucket_size,
+            'leak_per_second': self.leak_per_second,
+            'error_rate_429': self.error_rate_429,
+            'retry_after': self.retry_after,
+            'articles': {board_no: len(articles) for board_no, articles in self.articles.items()},
+            'products': len(self.products)
+        }
+
+
+def _paginate(items: List[Dict]) -> List[Dict]:
+    limit = min(request.args.get('limit', 10, type=int), MAX_LIMIT)
+    offset = request.args.get('offset', 0, type=int)
+    return items[offset:offset + limit]
+
+
+def create_app(standin: Cafe24StandIn = None) -> Flask:
+    """스탠드인 Flask 앱 생성"""
+    standin = standin or Cafe24StandIn()
+    app = Flask(__name__)
+    app.config['standin'] = standin
+
+    def respond(endpoint: str, payload_func):
+        standin.latency.sleep()
+        admitted, level = standin.admit(endpoint)
+        headers = {'X-Api-Call-Limit': f"{level}/{standin.bucket_size}"}
+        if not admitted:
+            headers['Retry-After'] = str(standin.retry_after)
+            return jsonify({'error': {'code': 429, 'message': 'Too Many Requests'}}), 429, headers
+        payload = payload_func()
+        if isinstance(payload, tuple):
+            return jsonify(payload[0]), payload[1], headers
+        return jsonify(payload), 200, headers
+
+    @app.route('/api/v2/oauth/token', methods=['POST'])
+    def oauth_token():
+        def payload():
+            grant_type = request.form.get('grant_type')
+            if grant_type not in ('authorization_code', 'refresh_token'):
+                return {'error': 'unsupported_grant_type'}, 400
+            return {
+                'access_token': secrets.token_urlsafe(16),
+                'refresh_token': secrets.token_urlsafe(16),
+                'expires_at': datetime.now().isoformat(),
+                'scopes': ['mall.read_community', 'mall.read_product'],
+                'mall_id': 'standin'
+            }
+        return respond('oauth/token', payload)
+
+    @app.route('/api/v2/admin/boards')
+    def boards():
+        return respond('admin/boards', lambda: {'boards': REVIEW_BOARDS + OTHER_BOARDS})
+
+    @app.route('/api/v2/admin/boards/<int:board_no>/articles')
+    def board_articles(board_no):
+        def payload():
+            if board_no not in standin.articles:
+                return {'error': {'code': 404, 'message': 'Not Found'}}, 404
+            articles = standin.articles[board_no]
+            start_date = request.args.get('created_start_date')
+            end_date = request.args.get('created_end_date')
+            keyword = request.args.get('search_keyword')
+            if start_date:
+                articles = [a for a in articles if a['created_date'][:10] >= start_date]
+            if end_date:
+                articles = [a for a in articles if a['created_date'][:10] <= end_date]
+            if keyword:
+                articles = [a for a in articles if keyword in a['content'] or keyword in a['title']]
+            return {'articles': _paginate(articles)}
+        return respond('admin/boards/articles', payload)
+
+    @app.route('/api/v2/admin/boards/<int:board_no>/articles/<int:article_no>')
+    def article_detail(board_no, article_no):
+        def payload():
+            for article in standin.articles.get(board_no, []):
+                if article['article_no'] == article_no:
+                    return {'article': article}
+            return {'error': {'code': 404, 'message': 'Not Found'}}, 404
+        return respond('admin/boards/articles/detail', payload)
+
+    @app.route('/api/v2/admin/products')
+    def products():
+        return respond('admin/products', lambda: {'products': _paginate(list(standin.products.values()))})
+
+    @app.route('/api/v2/admin/products/<int:product_no>')
+    def product_detail(product_no):
+        def payload():
+            product = standin.products.get(product_no)
+            if not product:
+                return {'error': {'code': 404, 'message': 'Not Found'}}, 404
+            return {'product': product}
+        return respond('admin/products/detail', payload)
+
+    # ===== 스탠드인 제어용 엔드포인트 =====
+
+    @app.route('/_standin/stats')
+    def stats():
+        return jsonify({'stats': standin.stats, 'config': standin.to_dict()})
+
+    @app.route('/_standin/reset', methods=['POST'])
+    def reset():
+        standin.reset_stats()
+        return jsonify({'status': 'reset'})
+
+    @app.route('/_standin/config', methods=['POST'])
+    def configure():
+        data = request.json or {}
+        for key in ('distribution', 'latency_ms', 'jitter_ms', 'sigma'):
+            if key in data:
+                setattr(standin.latency, key, data[key])
+        for key in ('bucket_size', 'leak_per_second', 'error_rate_429', 'retry_after'):
+            if key in data:
+                setattr(standin, key, data[key])
+        return jsonify(standin.to_dict())
+
+    @app.route('/_standin/articles', methods=['POST'])
+    def add_article():
+        data = request.json or {}
+        return jsonify({'article': standin.add_article(**data)}), 201
+
+    return app
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description='카페24 Admin API 스탠드인 서버')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8081)
+    parser.add_argument('--reviews', type=int, default=500, help='초기 리뷰 게시글 수')
+    parser.add_argument('--products', type=int, default=50, help='상품 수')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--latency-distribution', default='fixed', choices=['fixed', 'uniform', 'lognormal'])
+    parser.add_argument('--latency-ms', type=float, default=0.0)
+    parser.add_argument('--jitter-ms', type=float, default=0.0)
+    parser.add_argument('--bucket-size', type=int, default=40, help='호출 한도 버킷 크기')
+    parser.add_argument('--leak-per-second', type=float, default=2.0, help='초당 버킷 감소량')
+    parser.add_argument('--error-rate-429', type=float, default=0.0, help='429 응답 주입 비율')
+    parser.add_argument('--retry-after', type=float, default=1.0)
+    return parser
+
+
+def standin_from_args(args) -> Cafe24StandIn:
+    return Cafe24StandIn(
+        reviews=args.reviews,
+        products=args.products,
+        seed=args.seed,
+        latency=LatencyModel(args.latency_distribution, args.latency_ms, args.jitter_ms, seed=args.seed),
+        bucket_size=args.bucket_size,
+        leak_per_second=args.leak_per_second,
+        error_rate_429=args.error_rate_429,
+        retry_after=args.retry_after
+    )
+
+
+if __name__ == '__main__':
+    args = build_arg_parser().parse_args()
+    app = create_app(standin_from_args(args))
+    print(f"카페24 스탠드인 서버: http://{args.host}:{args.port}/api/v2")
+    app.run(host=args.host, port=args.port, threaded=True)
@@ -0,0 +1,176 @@
+"""
+채널톡 Open API 로컬 스탠드인 서버
+
+NotificationManager.send_channel_talk_message가 사용하는 팀 채팅 메시지 전송만 구현합니다.
+    POST /open/v5/groups/<group_id>/messages
+
+받은 메시지를 보관해 알림 수와 중복 알림(같은 리뷰 제목/내용으로 두 번 이상 발송)을 집계하며,
+지연시간 분포와 오류(500) 비율을 설정할 수 있습니다.
+
+사용법:
+    python -m benchmarks.standins.channel_talk_api --port 8083 --latency-ms 120
+    export CHANNEL_TALK_API_BASE_URL=http://127.0.0.1:8083
+"""
+
+import argparse
+import random
+import re
+import threading
+import uuid
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Any, List
+
+from flask import Flask, jsonify, request
+
+from benchmarks.standins import LatencyModel
+
+# 리뷰 알림 메시지의 "제목: ..." 줄 (send_review_alert_to_channel_talk 형식)
+TITLE_LINE_PATTERN = re.compile(r'^제목: (.+)$', re.M)
+# 검토 필요 알림의 "📝 내용: ..." 줄 (trigger_review_collection 형식)
+CONTENT_LINE_PATTERN = re.compile(r'^📝 내용: (.+)$', re.M)
+
+
+def extract_review_keys(message: str) -> List[str]:
+    """알림 메시지에 포함된 리뷰 식별 문자열 목록 (중복 알림 집계용)"""
+    keys = [f"title:{title.strip()}" for title in TITLE_LINE_PATTERN.findall(message)]
+    keys.extend(f"content:{content.strip()}" for content in CONTENT_LINE_PATTERN.findall(message))
+    return keys
+
+
+class ChannelTalkStandIn:
+    """스탠드인 서버 상태 (수신 메시지, 오류/지연 설정)"""
+
+    def __init__(self, latency: LatencyModel = None, error_rate: float = 0.0,
+                 max_messages: int = 10000, seed: int = 42):
+        self.latency = latency or LatencyModel()
+        self.error_rate = error_rate
+        self.max_messages = max_messages
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self):
+        with self._lock:
+            self.messages = []
+            self.stats = {
+                'requests': 0,
+                'errors_500': 0,
+                'delivered': 0,
+                'started_at': datetime.now().isoformat()
+            }
+
+    def receive(self, group_id: str, body: Dict[str, Any]):
+        """메시지 1건 수신. 오류 주입 시 None 반환"""
+        with self._lock:
+            self.stats['requests'] += 1
+            if self.error_rate > 0 and self._rng.random() < self.error_rate:
+                self.stats['errors_500'] += 1
+                return None
+
+            text = '\n'.join(block.get('value', '') for block in body.get('blocks', []) if isinstance(block, dict))
+            message = {
+                'id': uuid.uuid4().hex[:16],
+                'group_id': group_id,
+                'text': text,
+                'received_at': datetime.now().isoformat()
+            }
+            self.stats['delivered'] += 1
+            if len(self.messages) < self.max_messages:
+                self.messages.append(message)
+            return message
+
+    def alert_summary(self) -> Dict[str, Any]:
+        """수신 메시지 기준 알림 수/중복 알림 집계"""
+        with self._lock:
+            messages = list(self.messages)
+
+        key_counts = Counter(key for message in messages for key in extract_review_keys(message['text']))
+        duplicated = {key: count for key, count in key_counts.items() if count > 1}
+        return {
+            'messages': len(messages),
+            'reviews_alerted': len(key_counts),
+            'duplicate_alerts': sum(count - 1 for count in duplicated.values()),
+            'duplicated_reviews': len(duplicated)
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'latency': self.latency.to_dict(),
+            'error_rate': self.error_rate
+        }
+
+
+def create_app(standin: ChannelTalkStandIn = None) -> Flask:
+    """스탠드인 Flask 앱 생성"""
+    standin = standin or ChannelTalkStandIn()
+    app = Flask(__name__)
+    app.config['standin'] = standin
+
+    @app.route('/open/v5/groups/<group_id>/messages', methods=['POST'])
+    def send_group_message(group_id):
+        if not request.headers.get('x-access-key') or not request.headers.get('x-access-secret'):
+            return jsonify({'code': 'unauthorized', 'message': 'missing access key'}), 401
+
+        standin.latency.sleep()
+        message = standin.receive(group_id, request.json or {})
+        if message is None:
+            return jsonify({'code': 'internal_error', 'message': 'standin internal error'}), 500
+
+        return jsonify({'message': {'id': message['id'], 'chatId': group_id, 'chatType': 'group'}})
+
+    # ===== 스탠드인 제어용 엔드포인트 =====
+
+    @app.route('/_standin/stats')
+    def stats():
+        return jsonify({'stats': standin.stats, 'alerts': standin.alert_summary(), 'config': standin.to_dict()})
+
+    @app.route('/_standin/messages')
+    def messages():
+        limit = request.args.get('limit', 50, type=int)
+        return jsonify({'messages': standin.messages[-limit:]})
+
+    @app.route('/_standin/reset', methods=['POST'])
+    def reset():
+        standin.reset_stats()
+        return jsonify({'status': 'reset'})
+
+    @app.route('/_standin/config', methods=['POST'])
+    def configure():
+        data = request.json or {}
+        for key in ('distribution', 'latency_ms', 'jitter_ms', 'sigma'):
+            if key in data:
+                setattr(standin.latency, key, data[key])
+        if 'error_rate' in data:
+            standin.error_rate = data['error_rate']
+        return jsonify(standin.to_dict())
+
+    return app
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description='채널톡 Open API 스탠드인 서버')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8083)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--latency-distribution', default='uniform', choices=['fixed', 'uniform', 'lognormal'])
+    parser.add_argument('--latency-ms', type=float, default=100.0, help='지연시간 (lognormal은 중앙값)')
+    parser.add_argument('--jitter-ms', type=float, default=30.0, help='uniform 분포의 ± 범위')
+    parser.add_argument('--sigma', type=float, default=0.5, help='lognormal 분포의 꼬리 두께')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='HTTP 500 응답 비율')
+    return parser
+
+
+def standin_from_args(args) -> ChannelTalkStandIn:
+    return ChannelTalkStandIn(
+        latency=LatencyModel(args.latency_distribution, args.latency_ms, args.jitter_ms, args.sigma, seed=args.seed),
+        error_rate=args.error_rate,
+        seed=args.seed
+    )
+
+
+if __name__ == '__main__':
+    args = build_arg_parser().parse_args()
+    app = create_app(standin_from_args(args))
+    print(f"채널톡 스탠드인 서버: http://{args.host}:{args.port}")
+    app.run(host=args.host, port=args.port, threaded=True)
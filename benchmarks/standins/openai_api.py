@@ -0,0 +1,296 @@
+"""
+OpenAI Chat Completions 로컬 스탠드인 서버
+
+ReviewAnalyzer._analyze_with_gpt가 사용하는 POST /v1/chat/completions만 구현합니다.
+프롬프트의 리뷰 내용을 간단한 키워드 규칙으로 판정해 스키마에 맞는 감정 JSON을 돌려주며,
+지연시간 분포, 오류(500/429) 비율, 잘못된 응답(JSON 아님/필드 누락/잘못된 값) 비율을 설정할 수 있습니다.
+묶음 2차 분석 프롬프트("리뷰 목록 (JSON):" 뒤의 배열)에는 id별 판정 JSON 배열로 답하며, 잘못된 응답은
+전체 형식 오류 또는 일부 항목 누락/잘못된 값으로 만듭니다.
+
+사용법:
+    python -m benchmarks.standins.openai_api --port 8082 --latency-distribution lognormal --latency-ms 900 \
+        --error-rate 0.02 --malformed-rate 0.05
+    export OPENAI_BASE_URL=http://127.0.0.1:8082/v1
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
+
+from flask import Flask, jsonify, request
+
+from benchmarks.corpus import POSITIVE_PHRASES, NEGATIVE_PHRASES, NEUTRAL_PHRASES
+from benchmarks.standins import LatencyModel
+
+REVIEW_TEXT_PATTERN = re.compile(r'리뷰 내용:\s*"(.*?)"\s*$', re.S | re.M)
+PACKED_REVIEWS_PATTERN = re.compile(r'리뷰 목록 \(JSON\):\s*\n(\[.*\])\s*$', re.M)
+
+NEGATIVE_CUES = {word for phrase in NEGATIVE_PHRASES for word in phrase.split() if len(word) >= 2} | {
+    '최악', '실망', '환불', '불량', '별로', '반품', '비추'
+}
+POSITIVE_CUES = {word for phrase in POSITIVE_PHRASES for word in phrase.split() if len(word) >= 2} | {
+    '만족', '최고', '추천', '좋아요', '예뻐요'
+}
+NEUTRAL_CUES = {word for phrase in NEUTRAL_PHRASES for word in phrase.split() if len(word) >= 2}
+
+MALFORMED_KINDS = ('not_json', 'missing_sentiment', 'invalid_sentiment', 'code_fence', 'truncated')
+PACKED_MALFORMED_KINDS = ('not_json', 'truncated', 'missing_item', 'invalid_item')
+
+
+def judge_sentiment(review_text: str) -> Tuple[str, float]:
+    """리뷰 텍스트에 대한 결정적 감정 판정"""
+    negative = sum(1 for cue in NEGATIVE_CUES if cue in review_text)
+    positive = sum(1 for cue in POSITIVE_CUES if cue in review_text)
+    neutral = sum(1 for cue in NEUTRAL_CUES if cue in review_text)
+
+    if negative > positive and negative >= neutral:
+        return 'negative', min(0.95, 0.6 + 0.1 * (negative - positive))
+    if positive > negative and positive >= neutral:
+        return 'positive', min(0.95, 0.6 + 0.1 * (positive - negative))
+    return 'neutral', 0.55
+
+
+def estimate_tokens(text: str) -> int:
+    """토큰 수 근사치 (한글은 글자당 약 1토큰)"""
+    return max(1, len(text))
+
+
+class OpenAIStandIn:
+    """스탠드인 서버 상태 (오류/지연 설정, 호출 통계)"""
+
+    def __init__(self, latency: LatencyModel = None, error_rate: float = 0.0,
+                 rate_limit_rate: float = 0.0, malformed_rate: float = 0.0, seed: int = 42):
+        self.latency = latency or LatencyModel()
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.malformed_rate = malformed_rate
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self):
+        with self._lock:
+            self.stats = {
+                'requests': 0,
+                'errors_500': 0,
+                'errors_429': 0,
+                'malformed': 0,
+                'packed_requests': 0,
+                'packed_reviews': 0,
+                'prompt_tokens': 0,
+                'completion_tokens': 0,
+                'started_at': datetime.now().isoformat()
+            }
+
+    def roll(self) -> str:
+        """이번 요청의 결과 유형 결정 (ok / error_500 / error_429 / malformed)"""
+        with self._lock:
+            self.stats['requests'] += 1
+            value = self._rng.random()
+            if value < self.error_rate:
+                self.stats['errors_500'] += 1
+                return 'error_500'
+            value -= self.error_rate
+            if value < self.rate_limit_rate:
+                self.stats['errors_429'] += 1
+                return 'error_429'
+            value -= self.rate_limit_rate
+            if value < self.malformed_rate:
+                self.stats['malformed'] += 1
+                return 'malformed'
+            return 'ok'
+
+    def malformed_content(self, verdict: Dict[str, Any]) -> str:
+        with self._lock:
+            kind = self._rng.choice(MALFORMED_KINDS)
+        if kind == 'not_json':
+            return f"이 리뷰는 {verdict['sentiment']}로 보입니다."
+        if kind == 'missing_sentiment':
+            return json.dumps({'confidence': verdict['confidence'], 'reasoning': verdict['reasoning']}, ensure_ascii=False)
+        if kind == 'invalid_sentiment':
+            return json.dumps(dict(verdict, sentiment='mixed'), ensure_ascii=False)
+        if kind == 'code_fence':
+            return f"```json\n{json.dumps(verdict, ensure_ascii=False)}\n```"
+        return json.dumps(verdict, ensure_ascii=False)[:-8]
+
+    def malformed_packed_content(self, verdicts: List[Dict[str, Any]]) -> str:
+        """묶음 응답 오류: 전체 형식 오류 또는 항목 하나 누락/잘못된 값"""
+        with self._lock:
+            kind = self._rng.choice(PACKED_MALFORMED_KINDS)
+            index = self._rng.randrange(len(verdicts))
+        if kind == 'not_json':
+            return "리뷰들을 분석한 결과입니다."
+        if kind == 'truncated':
+            return json.dumps(verdicts, ensure_ascii=False)[:-8]
+        if kind == 'missing_item':
+            return json.dumps(verdicts[:index] + verdicts[index + 1:], ensure_ascii=False)
+        broken = [dict(verdict, sentiment='mixed') if i == index else verdict for i, verdict in enumerate(verdicts)]
+        return json.dumps(broken, ensure_ascii=False)
+
+    def record_packed(self, reviews: int):
+        with self._lock:
+            self.stats['packed_requests'] += 1
+            self.stats['packed_reviews'] += reviews
+
+    def record_tokens(self, prompt_tokens: int, completion_tokens: int):
+        with self._lock:
+            self.stats['prompt_tokens'] += prompt_tokens
+            self.stats['completion_tokens'] += completion_tokens
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'latency': self.latency.to_dict(),
+            'error_rate': self.error_rate,
+            'rate_limit_rate': self.rate_limit_rate,
+            'malformed_rate': self.malformed_rate
+        }
+
+
+def build_verdict(prompt: str) -> Dict[str, Any]:
+    match = REVIEW_TEXT_PATTERN.search(prompt)
+    review_text = match.group(1) if match else prompt
+    sentiment, confidence = judge_sentiment(review_text)
+    return {
+        'sentiment': sentiment,
+        'confidence': round(confidence, 2),
+        'reasoning': f"스탠드인 판정: {sentiment}"
+    }
+
+
+def parse_packed_reviews(prompt: str) -> Optional[List[Dict[str, Any]]]:
+    """묶음 2차 분석 프롬프트면 리뷰 목록, 아니면 None"""
+    match = PACKED_REVIEWS_PATTERN.search(prompt)
+    if not match:
+        return None
+    try:
+        reviews = json.loads(match.group(1))
+    except json.JSONDecodeError:
+        return None
+    return reviews if isinstance(reviews, list) and reviews else None
+
+
+def build_packed_verdicts(reviews: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    verdicts = []
+    for review in reviews:
+        sentiment, confidence = judge_sentiment(str(review.get('text', '')))
+        verdicts.append({
+            'id': review.get('id'),
+            'sentiment': sentiment,
+            'confidence': round(confidence, 2),
+            'reasoning': f"스탠드인 판정: {sentiment}"
+        })
+    return verdicts
+
+
+def create_app(standin: OpenAIStandIn = None) -> Flask:
+    """스탠드인 Flask 앱 생성"""
+    standin = standin or OpenAIStandIn()
+    app = Flask(__name__)
+    app.config['standin'] = standin
+
+    @app.route('/v1/chat/completions', methods=['POST'])
+    def chat_completions():
+        body = request.json or {}
+        messages = body.get('messages', [])
+        prompt = next((m.get('content', '') for m in reversed(messages) if m.get('role') == 'user'), '')
+
+        standin.latency.sleep()
+        outcome = standin.roll()
+
+        if outcome == 'error_500':
+            return jsonify({'error': {'message': 'standin internal error', 'type': 'server_error'}}), 500
+        if outcome == 'error_429':
+            return jsonify({'error': {'message': 'standin rate limit', 'type': 'rate_limit_error'}}), 429, {'Retry-After': '1'}
+
+        packed_reviews = parse_packed_reviews(prompt)
+        if packed_reviews is not None:
+            standin.record_packed(len(packed_reviews))
+            verdicts = build_packed_verdicts(packed_reviews)
+            content = (standin.malformed_packed_content(verdicts) if outcome == 'malformed'
+                       else json.dumps(verdicts, ensure_ascii=False))
+        else:
+            verdict = build_verdict(prompt)
+            content = standin.malformed_content(verdict) if outcome == 'malformed' else json.dumps(verdict, ensure_ascii=False)
+
+        prompt_tokens = sum(estimate_tokens(m.get('content', '')) for m in messages)
+        completion_tokens = estimate_tokens(content)
+        standin.record_tokens(prompt_tokens, completion_tokens)
+
+        return jsonify({
+            'id': f"chatcmpl-{uuid.uuid4().hex[:24]}",
+            'object': 'chat.completion',
+            'created': int(time.time()),
+            'model': body.get('model', 'gpt-4o-mini'),
+            'choices': [{
+                'index': 0,
+                'message': {'role': 'assistant', 'content': content},
+                'finish_reason': 'stop'
+            }],
+            'usage': {
+                'prompt_tokens': prompt_tokens,
+                'completion_tokens': completion_tokens,
+                'total_tokens': prompt_tokens + completion_tokens
+            }
+        })
+
+    # ===== 스탠드인 제어용 엔드포인트 =====
+
+    @app.route('/_standin/stats')
+    def stats():
+        return jsonify({'stats': standin.stats, 'config': standin.to_dict()})
+
+    @app.route('/_standin/reset', methods=['POST'])
+    def reset():
+        standin.reset_stats()
+        return jsonify({'status': 'reset'})
+
+    @app.route('/_standin/config', methods=['POST'])
+    def configure():
+        data = request.json or {}
+        for key in ('distribution', 'latency_ms', 'jitter_ms', 'sigma'):
+            if key in data:
+                setattr(standin.latency, key, data[key])
+        for key in ('error_rate', 'rate_limit_rate', 'malformed_rate'):
+            if key in data:
+                setattr(standin, key, data[key])
+        return jsonify(standin.to_dict())
+
+    return app
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description='OpenAI Chat Completions 스탠드인 서버')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8082)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--latency-distribution', default='lognormal', choices=['fixed', 'uniform', 'lognormal'])
+    parser.add_argument('--latency-ms', type=float, default=800.0, help='지연시간 (lognormal은 중앙값)')
+    parser.add_argument('--jitter-ms', type=float, default=0.0, help='uniform 분포의 ± 범위')
+    parser.add_argument('--sigma', type=float, default=0.5, help='lognormal 분포의 꼬리 두께')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='HTTP 500 응답 비율')
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0, help='HTTP 429 응답 비율')
+    parser.add_argument('--malformed-rate', type=float, default=0.0, help='잘못된 형식의 응답 비율')
+    return parser
+
+
+def standin_from_args(args) -> OpenAIStandIn:
+    return OpenAIStandIn(
+        latency=LatencyModel(args.latency_distribution, args.latency_ms, args.jitter_ms, args.sigma, seed=args.seed),
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        malformed_rate=args.malformed_rate,
+        seed=args.seed
+    )
+
+
+if __name__ == '__main__':
+    args = build_arg_parser().parse_args()
+    app = create_app(standin_from_args(args))
+    print(f"OpenAI 스탠드인 서버: http://{args.host}:{args.port}/v1")
+    app.run(host=args.host, port=args.port, threaded=True)
@@ -0,0 +1,591 @@
+"""
+웹훅 부하 테스트 (트레이스 재생)
+
+WEBHOOK_TRACE_FILE로 기록한 카페24(event 90033)·채널톡 웹훅 트레이스를, 또는 합성 트레이스를
+Flask 앱에 설정한 속도로 재생합니다. 카페24·OpenAI·채널톡 스탠드인 서버를 함께 띄우고,
+카페24 이벤트마다 스탠드인에 새 리뷰 게시글을 먼저 등록한 뒤 웹훅을 보냅니다.
+
+측정 항목:
+    - 웹훅 응답 지연시간 (출처별, 상태 코드/처리 결과별 건수)
+    - 리뷰 수집(trigger_review_collection) 지연시간 (inprocess 모드)
+    - 채널톡 알림 수와 중복 알림 수
+    - 누락/중복 처리된 리뷰 수 (inprocess 모드)
+
+모드:
+    inprocess  앱을 이 프로세스에서 띄움. --server-threads로 gunicorn 스레드 수를 흉내냄
+    http       이미 실행 중인 앱(--target-url)에 재생. 스탠드인은 고정 포트로 띄우고,
+               앱은 출력되는 환경변수로 스탠드인을 바라보도록 실행해야 함
+
+사용법:
+    # 합성 트레이스 생성 (초당 5건, 20건씩 몰리는 버스트)
+    python -m benchmarks.webhook_replay --synthesize 300 --rate 5 --burst-size 20 --write-trace trace.jsonl
+
+    # 기록된 트레이스를 3배속으로 재생 (gunicorn --threads 4 가정)
+    python -m benchmarks.webhook_replay --trace trace.jsonl --speed 3 --server-threads 4 --output replay.json
+
+    # 실행 중인 gunicorn 앱에 재생
+    python -m benchmarks.webhook_replay --mode http --target-url http://127.0.0.1:8000 --trace trace.jsonl
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
+
+import requests
+
+from benchmarks.analysis_pipeline import summarize_latencies, quiet, git_revision, peak_rss_mb
+from benchmarks.corpus import generate_corpus
+from benchmarks.standins import BackgroundServer, LatencyModel
+from benchmarks.standins import cafe24_api, openai_api, channel_talk_api
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODEL_FILES = ('final_svm_sentiment_model.pkl', 'final_svm_sentiment_model_npy', 'final_svm_sentiment_model.npz')
+WEBHOOK_PATH = '/webhook/channel-talk'
+STANDIN_MALL_ID = 'standin'
+STANDIN_GROUP_ID = 'standin-group'
+
+
+# ===== 트레이스 =====
+
+def cafe24_payload(review: Dict) -> Dict[str, Any]:
+    """카페24 게시판 글 등록(event 90033) 웹훅 페이로드"""
+    return {
+        'event_no': 90033,
+        'resource': {
+            'mall_id': STANDIN_MALL_ID,
+            'board_no': review['board_no'],
+            'article_no': review['article_no'],
+            'product_no': review['product_no'],
+            'title': review['title'],
+            'content': review['content'],
+            'writer': review['writer'],
+            'rating': review['rating'],
+            'created_date': review['created_date']
+        }
+    }
+
+
+def channel_talk_payload(review: Dict) -> Dict[str, Any]:
+    """채널톡 review.created 웹훅 페이로드"""
+    return {
+        'eventType': 'review.created',
+        'data': {
+            'content': review['content'],
+            'author': {'name': review['writer']},
+            'rating': review['rating'],
+            'product': {'name': f"상품{review['product_no']}"},
+            'createdAt': review['created_date']
+        }
+    }
+
+
+def synthesize_trace(events: int, rate: float, seed: int = 42, channel_talk_ratio: float = 0.1,
+                     burst_size: int = 1, redelivery_ratio: float = 0.0,
+                     redelivery_delay: float = 2.0) -> List[Dict[str, Any]]:
+    """합성 트레이스 생성 (포아송 도착, burst_size건씩 같은 시각에 도착)
+
+    redelivery_ratio 비율의 이벤트는 같은 페이로드를 0.5~redelivery_delay*1.5초 뒤 한 번 더 보냄 (타임아웃 재전송 흉내)
+    """
+    rng = random.Random(seed)
+    entries = []
+    ts = 0.0
+    for i, review in enumerate(reversed(generate_corpus(events, seed=seed))):
+        if i % max(1, burst_size) == 0 and i > 0:
+            ts += rng.expovariate(rate) if rate > 0 else 0.0
+        if rng.random() < channel_talk_ratio:
+            source, payload = 'channel_talk', channel_talk_payload(review)
+        else:
+            source, payload = 'cafe24', cafe24_payload(review)
+        entries.append({'ts': round(ts, 4), 'source': source, 'path': WEBHOOK_PATH, 'payload': payload})
+
+    if redelivery_ratio > 0:
+        # 재전송 여부는 별도 난수열로 정함 (같은 seed면 원래 이벤트 트레이스는 그대로)
+        redelivery_rng = random.Random(seed + 1)
+        redeliveries = [
+            dict(entry, ts=round(entry['ts'] + redelivery_rng.uniform(0.5, redelivery_delay * 1.5), 4))
+            for entry in entries if redelivery_rng.random() < redelivery_ratio
+        ]
+        entries = sorted(entries + redeliveries, key=lambda entry: entry['ts'])
+    return entries
+
+
+def write_trace(entries: List[Dict[str, Any]], path: str):
+    with open(path, 'w', encoding='utf-8') as f:
+        for entry in entries:
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+
+
+def schedule_offsets(entries: List[Dict[str, Any]], speed: float = 1.0, rate: float = None) -> List[float]:
+    """각 이벤트의 전송 시각 (재생 시작 기준 초). rate가 있으면 기록된 간격 대신 고정 간격 사용"""
+    if rate:
+        return [i / rate for i in range(len(entries))]
+    if not entries:
+        return []
+    first_ts = entries[0].get('ts', 0)
+    speed = speed if speed > 0 else 1.0
+    return [max(0.0, (entry.get('ts', first_ts) - first_ts) / speed) for entry in entries]
+
+
+# ===== 앱 계측 (inprocess 모드) =====
+
+class ThreadLimitedApp:
+    """동시에 처리하는 요청 수를 제한하는 WSGI 래퍼 (gunicorn --threads 흉내)"""
+
+    def __init__(self, wsgi_app, threads: int):
+        self.wsgi_app = wsgi_app
+        self._slots = threading.BoundedSemaphore(max(1, threads))
+
+    def __call__(self, environ, start_response):
+        with self._slots:
+            return list(self.wsgi_app(environ, start_response))
+
+
+class ReplayInstrumentation:
+    """리뷰 수집 지연시간과 리뷰별 처리 횟수 기록"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.collection_latencies = []
+        self.collection_failures = 0
+        self.processed_articles = Counter()
+
+    def wrap_collection(self, func):
+        """수집 한 번(실행 중 합쳐진 요청 포함)의 소요시간 기록 (수집은 웹훅 요청 밖의 수집 작업 스레드에서 실행)"""
+        def timed_collection(*args, **kwargs):
+            started_at = time.perf_counter()
+            succeeded = False
+            try:
+                succeeded = bool(func(*args, **kwargs))
+                return succeeded
+            finally:
+                with self._lock:
+                    self.collection_latencies.append(time.perf_counter() - started_at)
+                    if not succeeded:
+                        self.collection_failures += 1
+        return timed_collection
+
+    def wrap_find_new_reviews(self, func):
+        def counting_find_new_reviews(*args, **kwargs):
+            new_reviews = func(*args, **kwargs)
+            with self._lock:
+                for review in new_reviews or []:
+                    self.processed_articles[str(review.get('article_no'))] += 1
+            return new_reviews
+        return counting_find_new_reviews
+
+
+def load_app_module():
+    """app.py 로드 (app/ 패키지와 이름이 겹쳐 파일 경로로 직접 로드)"""
+    spec = importlib.util.spec_from_file_location('app_main', os.path.join(REPO_ROOT, 'app.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def configure_settings(settings, cafe24_url: str, openai_url: str, channel_talk_url: str, args):
+    """앱이 스탠드인 서버를 바라보도록 설정 (앱 모듈 import 전에 호출해야 함)"""
+    settings.cafe24_client_id = 'standin-client'
+    settings.cafe24_client_secret = 'standin-secret'
+    settings.cafe24_id = STANDIN_MALL_ID
+    settings.cafe24_redirect_uri = 'http://127.0.0.1/callback'
+    settings.cafe24_api_base_url = f"{cafe24_url}/api/v2"
+    if args.rate_limit_delay is not None:
+        settings.cafe24_rate_limit_delay = args.rate_limit_delay
+    settings.openai_api_key = 'standin-key'
+    settings.openai_base_url = f"{openai_url}/v1"
+    settings.channel_talk_access_key = 'standin-access-key'
+    settings.channel_talk_secret_key = 'standin-secret'
+    settings.channel_talk_group_id = STANDIN_GROUP_ID
+    settings.channel_talk_api_base_url = channel_talk_url
+    settings.notification_method = 'channel_talk'
+    settings.webhook_trace_file = None
+    settings.webhook_channel_talk_dispatch = True  # 채널톡 이벤트도 실제 채널톡 핸들러로 처리
+    settings.gunicorn_threads = args.server_threads  # 수락 제어 한도 계산 기준
+
+
+def issue_standin_token(cafe24_url: str, token_dir: str):
+    """스탠드인에서 OAuth 토큰을 받아 앱이 읽는 토큰 파일로 저장"""
+    from app.infrastructure.auth.cafe24_oauth import Cafe24OAuth
+
+    oauth = Cafe24OAuth('standin-client', 'standin-secret', STANDIN_MALL_ID,
+                        'http://127.0.0.1/callback', base_url=f"{cafe24_url}/api/v2")
+    oauth.token_file = os.path.join(token_dir, f"cafe24_tokens_{STANDIN_MALL_ID}.json")
+    oauth.get_access_token('standin-code')
+
+
+@contextmanager
+def working_directory(path: str):
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield path
+    finally:
+        os.chdir(previous)
+
+
+def start_inprocess_app(server_threads: int, instrumentation: ReplayInstrumentation, cafe24_url: str):
+    """앱 로드, 토큰 발급, Review API/캐시 초기화 후 스레드 제한 WSGI 앱, 알림 서비스, 리뷰 서비스 반환"""
+    issue_standin_token(cafe24_url, os.getcwd())
+
+    app_module = load_app_module()
+    app_module.init_oauth_client()
+    review_api = app_module.init_cafe24_client()
+    if review_api is None:
+        raise RuntimeError("스탠드인으로 Review API를 초기화하지 못했습니다.")
+
+    # 운영 시작 시와 같이 최신 리뷰 캐시를 채운 상태에서 재생 시작
+    app_module.load_review_cache()
+    app_module.initialize_review_cache()
+
+    app_module.find_new_reviews = instrumentation.wrap_find_new_reviews(app_module.find_new_reviews)
+    alert_service = app_module.alert_service
+    alert_service._run_collection = instrumentation.wrap_collection(alert_service._run_collection)
+    return ThreadLimitedApp(app_module.app.wsgi_app, server_threads), alert_service, app_module.review_service
+
+
+# ===== 재생 =====
+
+def prepare_event(entry: Dict[str, Any], seq: int, cafe24_standin) -> Tuple[Dict[str, Any], Optional[int]]:
+    """카페24 이벤트면 스탠드인에 새 게시글을 등록하고 article_no를 바꾼 페이로드 반환"""
+    payload = json.loads(json.dumps(entry['payload']))
+    if entry.get('source') != 'cafe24' or not isinstance(payload.get('resource'), dict):
+        return payload, None
+
+    resource = payload['resource']
+    review_boards = {board['board_no'] for board in cafe24_api.REVIEW_BOARDS}
+    # 작성 시각은 재생 시점으로 둠 (기록 당시 날짜면 최근 N일 조회에서 빠짐)
+    fields = {
+        key: resource[key] for key in ('product_no', 'content', 'writer', 'rating')
+        if resource.get(key) is not None
+    }
+    if isinstance(fields.get('writer'), dict):
+        fields['writer'] = fields['writer'].get('name', '고객')
+    # 제목에 재생 순번을 붙여 알림 메시지에서 리뷰를 구분할 수 있게 함
+    fields['title'] = f"{resource.get('title') or '후기'} [replay-{seq}]"
+
+    article = cafe24_standin.add_article(
+        board_no=resource.get('board_no') if resource.get('board_no') in review_boards else None, **fields)
+    resource['article_no'] = article['article_no']
+    resource['board_no'] = article['board_no']
+    return payload, article['article_no']
+
+
+def replay(entries: List[Dict[str, Any]], offsets: List[float], target_url: str, cafe24_standin,
+           concurrency: int, timeout: float) -> Dict[str, Any]:
+    """스케줄에 맞춰 웹훅 전송. 응답 지연시간과 처리 결과 수집"""
+    lock = threading.Lock()
+    records = []
+    expected_articles = []
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=concurrency, pool_maxsize=concurrency)
+    session.mount('http://', adapter)
+    # 같은 원본 페이로드(재전송)는 처음 준비한 페이로드를 그대로 다시 보냄 (스탠드인에 게시글을 또 등록하지 않음)
+    from app.shared.utils.idempotency import webhook_event_key
+    prepared = {}
+
+    def prepare(seq: int, entry: Dict[str, Any]) -> Tuple[Dict[str, Any], Optional[int]]:
+        key = webhook_event_key(entry['payload'], entry.get('source'))
+        with lock:
+            slot = prepared.get(key)
+            first = slot is None
+            if first:
+                slot = prepared[key] = {'ready': threading.Event(), 'payload': entry['payload']}
+        if not first:
+            slot['ready'].wait()
+            return slot['payload'], None
+        try:
+            slot['payload'], article_no = prepare_event(entry, seq, cafe24_standin)
+        finally:
+            slot['ready'].set()
+        return slot['payload'], article_no
+
+    def send(seq: int, entry: Dict[str, Any], scheduled_at: float):
+        payload, article_no = prepare(seq, entry)
+        started_at = time.perf_counter()
+        record = {
+            'source': entry.get('source', 'unknown'),
+            'send_lag_s': started_at - scheduled_at
+        }
+        try:
+            response = session.post(f"{target_url}{entry.get('path') or WEBHOOK_PATH}", json=payload, timeout=timeout)
+            record['status_code'] = response.status_code
+            try:
+                record['outcome'] = response.json().get('status', 'unknown')
+            except ValueError:
+                record['outcome'] = 'invalid_json'
+        except requests.RequestException as e:
+            record['status_code'] = None
+            record['outcome'] = type(e).__name__
+        record['latency_s'] = time.perf_counter() - started_at
+
+        with lock:
+            records.append(record)
+            if article_no is not None:
+                expected_articles.append(str(article_no))
+
+    replay_started_at = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for seq, (entry, offset) in enumerate(zip(entries, offsets)):
+            scheduled_at = replay_started_at + offset
+            delay = scheduled_at - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            executor.submit(send, seq, entry, scheduled_at)
+    wall_s = time.perf_counter() - replay_started_at
+
+    return {'records': records, 'expected_articles': expected_articles, 'wall_s': wall_s}
+
+
+def summarize_replay(replayed: Dict[str, Any], offsets: List[float]) -> Dict[str, Any]:
+    records = replayed['records']
+    by_source = {}
+    for source in sorted({record['source'] for record in records}):
+        source_records = [record for record in records if record['source'] == source]
+        by_source[source] = summarize_latencies([record['latency_s'] for record in source_records])
+
+    summary = summarize_latencies([record['latency_s'] for record in records])
+    summary.update({
+        'events': len(records),
+        'offered_rate_per_sec': round(len(offsets) / offsets[-1], 2) if offsets and offsets[-1] > 0 else None,
+        'wall_s': round(replayed['wall_s'], 4),
+        'max_send_lag_ms': round(max((record['send_lag_s'] for record in records), default=0) * 1000, 3),
+        'status_codes': dict(Counter(str(record['status_code']) for record in records)),
+        'outcomes': dict(Counter(record['outcome'] for record in records)),
+        'by_source': by_source
+    })
+    return summary
+
+
+def summarize_work(expected_articles: List[str], instrumentation: ReplayInstrumentation) -> Dict[str, Any]:
+    """재생한 신규 리뷰 중 수집되지 않은(누락) / 두 번 이상 수집된(중복) 리뷰 집계"""
+    processed = instrumentation.processed_articles
+    expected = set(expected_articles)
+    duplicated = {article_no: count for article_no, count in processed.items() if count > 1}
+    return {
+        'expected_reviews': len(expected),
+        'processed_reviews': sum(1 for article_no in expected if processed.get(article_no)),
+        'dropped_reviews': len(expected - set(processed)),
+        'duplicated_reviews': len(duplicated),
+        'duplicate_analyses': sum(count - 1 for count in duplicated.values()),
+        'unexpected_reviews': len(set(processed) - expected)
+    }
+
+
+def run_benchmark(args) -> Dict[str, Any]:
+    from config.settings import settings
+    from app.shared.utils.webhook_trace import load_trace
+
+    if args.trace:
+        entries = load_trace(args.trace)
+        trace_source = args.trace
+    else:
+        entries = synthesize_trace(args.synthesize, args.rate or 2.0, seed=args.seed,
+                                   channel_talk_ratio=args.channel_talk_ratio, burst_size=args.burst_size,
+                                   redelivery_ratio=args.redelivery_ratio)
+        trace_source = 'synthetic'
+    if args.max_events:
+        entries = entries[:args.max_events]
+    offsets = schedule_offsets(entries, speed=args.speed, rate=args.rate if args.trace else None)
+
+    cafe24_standin = cafe24_api.Cafe24StandIn(
+        reviews=args.initial_reviews, seed=args.seed,
+        latency=LatencyModel('uniform', args.cafe24_latency_ms, args.cafe24_latency_ms / 3, seed=args.seed),
+        bucket_size=args.cafe24_bucket_size, leak_per_second=args.cafe24_leak_per_second)
+    openai_standin = openai_api.OpenAIStandIn(
+        latency=LatencyModel('lognormal', args.openai_latency_ms, sigma=0.5, seed=args.seed),
+        error_rate=args.openai_error_rate, seed=args.seed)
+    channel_talk_standin = channel_talk_api.ChannelTalkStandIn(
+        latency=LatencyModel('uniform', args.channel_talk_latency_ms, args.channel_talk_latency_ms / 3, seed=args.seed),
+        error_rate=args.channel_talk_error_rate, seed=args.seed)
+
+    http_mode = args.mode == 'http'
+    instrumentation = ReplayInstrumentation()
+
+    with ExitStack() as stack:
+        cafe24_server = stack.enter_context(BackgroundServer(
+            cafe24_api.create_app(cafe24_standin), port=args.cafe24_port if http_mode else 0))
+        openai_server = stack.enter_context(BackgroundServer(
+            openai_api.create_app(openai_standin), port=args.openai_port if http_mode else 0))
+        channel_talk_server = stack.enter_context(BackgroundServer(
+            channel_talk_api.create_app(channel_talk_standin), port=args.channel_talk_port if http_mode else 0))
+
+        if http_mode:
+            issue_standin_token(cafe24_server.url, args.app_dir)
+            print_app_environment(cafe24_server.url, openai_server.url, channel_talk_server.url, args)
+            wait_for_target(args.target_url, args.wait_timeout)
+            target_url = args.target_url.rstrip('/')
+        else:
+            stack.enter_context(quiet(not args.verbose))
+            workdir = stack.enter_context(tempfile.TemporaryDirectory())
+            stack.enter_context(working_directory(workdir))
+            for model_file in MODEL_FILES:
+                if os.path.exists(os.path.join(REPO_ROOT, model_file)):
+                    os.symlink(os.path.join(REPO_ROOT, model_file), os.path.join(workdir, model_file))
+            configure_settings(settings, cafe24_server.url, openai_server.url, channel_talk_server.url, args)
+            wsgi_app, alert_service, review_service = start_inprocess_app(args.server_threads, instrumentation, cafe24_server.url)
+            target_url = stack.enter_context(BackgroundServer(wsgi_app)).url
+
+        cafe24_standin.reset_stats()
+        openai_standin.reset_stats()
+        channel_talk_standin.reset_stats()
+        if not http_mode:
+            from app.shared.utils.detection_lag import detection_lag_tracker
+            detection_lag_tracker.clear()
+
+        replayed = replay(entries, offsets, target_url, cafe24_standin, args.concurrency, args.timeout)
+        if not http_mode:
+            # 백그라운드 분석, GPT 2차 분석 후속 알림, 저하 모드에서 모아 둔 알림을 스탠드인이 살아 있을 때 마저 처리
+            alert_service.wait_for_background(args.timeout, review_analyzer=review_service.review_analyzer)
+            alert_service.flush_digest()
+            review_service.flush_search_index()  # 임시 작업 디렉토리가 지워지기 전에 저장
+
+    results = {
+        'webhook': summarize_replay(replayed, offsets),
+        'alerts': channel_talk_standin.alert_summary(),
+        'standins': {
+            'cafe24': dict(cafe24_standin.stats),
+            'openai': dict(openai_standin.stats),
+            'channel_talk': dict(channel_talk_standin.stats)
+        }
+    }
+    if not http_mode:
+        results['collection'] = summarize_latencies(instrumentation.collection_latencies)
+        results['collection']['failures'] = instrumentation.collection_failures
+        results['work'] = summarize_work(replayed['expected_articles'], instrumentation)
+        results['detection_lag'] = detection_lag_tracker.percentiles()
+
+    return {
+        'benchmark': 'webhook_replay',
+        'timestamp': datetime.now().isoformat(),
+        'git_revision': git_revision(),
+        'params': {
+            'mode': args.mode,
+            'trace': trace_source,
+            'events': len(entries),
+            'speed': args.speed,
+            'rate': args.rate,
+            'server_threads': None if http_mode else args.server_threads,
+            'concurrency': args.concurrency,
+            'rate_limit_delay': settings.cafe24_rate_limit_delay if not http_mode else args.rate_limit_delay,
+            'standins': {
+                'cafe24': cafe24_standin.to_dict(),
+                'openai': openai_standin.to_dict(),
+                'channel_talk': channel_talk_standin.to_dict()
+            }
+        },
+        'results': results,
+        'memory': {'peak_rss_mb': peak_rss_mb()}
+    }
+
+
+def standin_environment(cafe24_url: str, openai_url: str, channel_talk_url: str,
+                        rate_limit_delay: Optional[float] = None) -> Dict[str, str]:
+    """앱을 스탠드인 서버에 연결하기 위한 환경변수"""
+    env = {
+        'CAFE24_CLIENT_ID': 'standin-client',
+        'CAFE24_CLIENT_SECRET': 'standin-secret',
+        'CAFE24_ID': STANDIN_MALL_ID,
+        'CAFE24_API_BASE_URL': f"{cafe24_url}/api/v2",
+        'OPENAI_API_KEY': 'standin-key',
+        'OPENAI_BASE_URL': f"{openai_url}/v1",
+        'CHANNEL_TALK_ACCESS_TOKEN': 'standin-access-key',
+        'CHANNEL_TALK_SECRET': 'standin-secret',
+        'CHANNEL_TALK_GROUP_ID': STANDIN_GROUP_ID,
+        'CHANNEL_TALK_API_BASE_URL': channel_talk_url,
+        'NOTIFICATION_METHOD': 'channel_talk',
+        'WEBHOOK_CHANNEL_TALK_DISPATCH': 'true'
+    }
+    if rate_limit_delay is not None:
+        env['CAFE24_RATE_LIMIT_DELAY'] = str(rate_limit_delay)
+    return env
+
+
+def print_app_environment(cafe24_url: str, openai_url: str, channel_talk_url: str, args):
+    """http 모드: 앱을 스탠드인에 연결하기 위한 환경변수 안내"""
+    env = standin_environment(cafe24_url, openai_url, channel_talk_url, args.rate_limit_delay)
+    print(f"# 스탠드인 준비 완료. 앱을 {os.path.abspath(args.app_dir)}에서 아래 환경변수로 실행하세요:")
+    for key, value in env.items():
+        print(f"export {key}={value}")
+
+
+def wait_for_target(target_url: str, timeout: float):
+    """http 모드: 대상 앱이 응답할 때까지 대기"""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            requests.get(target_url, timeout=2)
+            return
+        except requests.RequestException:
+            if time.monotonic() >= deadline:
+                raise RuntimeError(f"대상 앱에 연결할 수 없습니다: {target_url}")
+            time.sleep(1)
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description='웹훅 부하 테스트 (트레이스 재생)')
+    parser.add_argument('--mode', choices=['inprocess', 'http'], default='inprocess')
+    parser.add_argument('--trace', help='재생할 트레이스 파일 (WEBHOOK_TRACE_FILE 형식). 없으면 합성 트레이스 사용')
+    parser.add_argument('--synthesize', type=int, default=100, help='합성 트레이스 이벤트 수')
+    parser.add_argument('--write-trace', help='합성 트레이스를 파일로 저장만 하고 종료')
+    parser.add_argument('--channel-talk-ratio', type=float, default=0.1, help='합성 트레이스의 채널톡 이벤트 비율')
+    parser.add_argument('--burst-size', type=int, default=1, help='합성 트레이스에서 동시에 도착하는 이벤트 수')
+    parser.add_argument('--redelivery-ratio', type=float, default=0.0,
+                        help='합성 트레이스에서 같은 웹훅을 한 번 더 보내는 이벤트 비율 (타임아웃 재전송)')
+    parser.add_argument('--max-events', type=int, default=None)
+    parser.add_argument('--speed', type=float, default=1.0, help='기록된 간격 대비 재생 배속')
+    parser.add_argument('--rate', type=float, default=None, help='초당 이벤트 수 (기록된 간격 대신 고정 간격으로 재생)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--concurrency', type=int, default=32, help='웹훅을 보내는 클라이언트 스레드 수')
+    parser.add_argument('--server-threads', type=int, default=4, help='inprocess 모드 동시 처리 요청 수 (gunicorn --threads)')
+    parser.add_argument('--timeout', type=float, default=120.0, help='웹훅 요청 타임아웃(초)')
+    parser.add_argument('--rate-limit-delay', type=float, default=None,
+                        help='Cafe24ReviewAPI 호출 간격 재정의 (기본값: CAFE24_RATE_LIMIT_DELAY)')
+    parser.add_argument('--initial-reviews', type=int, default=200, help='카페24 스탠드인 초기 리뷰 수')
+    parser.add_argument('--cafe24-latency-ms', type=float, default=80.0)
+    parser.add_argument('--cafe24-bucket-size', type=int, default=40)
+    parser.add_argument('--cafe24-leak-per-second', type=float, default=2.0)
+    parser.add_argument('--openai-latency-ms', type=float, default=800.0)
+    parser.add_argument('--openai-error-rate', type=float, default=0.0)
+    parser.add_argument('--channel-talk-latency-ms', type=float, default=100.0)
+    parser.add_argument('--channel-talk-error-rate', type=float, default=0.0)
+    parser.add_argument('--target-url', default='http://127.0.0.1:8000', help='http 모드 대상 앱 주소')
+    parser.add_argument('--app-dir', default='.', help='http 모드에서 스탠드인 토큰 파일을 쓸 앱 실행 디렉토리')
+    parser.add_argument('--cafe24-port', type=int, default=8081)
+    parser.add_argument('--openai-port', type=int, default=8082)
+    parser.add_argument('--channel-talk-port', type=int, default=8083)
+    parser.add_argument('--wait-timeout', type=float, default=120.0, help='http 모드 대상 앱 대기 시간(초)')
+    parser.add_argument('--verbose', action='store_true')
+    parser.add_argument('--output', help='결과 JSON 저장 경로')
+    return parser
+
+
+def main(argv=None):
+    args = build_arg_parser().parse_args(argv)
+
+    if args.write_trace:
+        entries = synthesize_trace(args.synthesize, args.rate or 2.0, seed=args.seed,
+                                   channel_talk_ratio=args.channel_talk_ratio, burst_size=args.burst_size,
+                                   redelivery_ratio=args.redelivery_ratio)
+        write_trace(entries, args.write_trace)
+        print(f"합성 트레이스 {len(entries)}건 저장: {args.write_trace}")
+        return
+
+    output = json.dumps(run_benchmark(args), ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output)
+    print(output)
+
+
+if __name__ == '__main__':
+    main()
@@ -11,6 +11,13 @@ class Settings:
         self.cafe24_id = os.getenv("CAFE24_ID")
         self.cafe24_password = os.getenv("CAFE24_PASSWORD")
         self.cafe24_redirect_uri = os.getenv("CAFE24_REDIRECT_URI")
+        # 로컬 스탠드인 서버 등으로 API 주소를 바꿀 때 사용 (예: http://127.0.0.1:8081/api/v2, {mall_id} 치환 지원)
+        self.cafe24_api_base_url = os.getenv("CAFE24_API_BASE_URL")
+        self.cafe24_rate_limit_delay = float(os.getenv("CAFE24_RATE_LIMIT_DELAY", "0.5"))
+        self.cafe24_max_retries = int(os.getenv("CAFE24_MAX_RETRIES", "2"))
+        self.cafe24_board_cache_seconds = float(os.getenv("CAFE24_BOARD_CACHE_SECONDS", "600"))  # 리뷰 게시판 목록 캐시 (0이면 매번 조회)
+        self.cafe24_request_timeout = float(os.getenv("CAFE24_REQUEST_TIMEOUT", "10"))  # 카페24 API 요청 타임아웃(초)
+        self.cafe24_slow_call_seconds = float(os.getenv("CAFE24_SLOW_CALL_SECONDS", "5"))  # 회로 차단기 느린 호출 기준
 
         # API Keys
         self.SERVICE_KEY = os.getenv("SERVICE_KEY")
@@ -18,11 +25,83 @@ class Settings:
         self.kakao_api_key = os.getenv("KAKAO_API_KEY")
         self.kakao_access_token = os.getenv("KAKAO_ACCESS_TOKEN")
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
+        # 로컬 스탠드인 서버 등으로 OpenAI API 주소를 바꿀 때 사용 (예: http://127.0.0.1:8082/v1)
+        self.openai_base_url = os.getenv("OPENAI_BASE_URL")
+        self.openai_timeout = float(os.getenv("OPENAI_TIMEOUT", "30"))
+        self.openai_max_retries = int(os.getenv("OPENAI_MAX_RETRIES", "2"))
+        self.openai_slow_call_seconds = float(os.getenv("OPENAI_SLOW_CALL_SECONDS", "15"))  # 회로 차단기 느린 호출 기준
+        # 일괄 분석에서 충돌 리뷰를 GPT 요청 하나에 묶는 최대 건수 (1이면 리뷰마다 요청)
+        self.gpt_pack_size = int(os.getenv("GPT_PACK_SIZE", "8"))
+        # 웹훅/수집 경로에서 GPT 2차 분석을 기다리는 최대 시간(초). 넘으면 1차 결과를 임시로 쓰고 백그라운드에서 마저 분석 (0이면 끝까지 대기)
+        self.gpt_deadline_seconds = float(os.getenv("GPT_DEADLINE_SECONDS", "3"))
+        self.gpt_refine_workers = int(os.getenv("GPT_REFINE_WORKERS", "4"))  # 마감 시간이 있는 GPT 2차 분석 동시 실행 수
+        # GPT 2차 분석 라우팅 정책 ('adaptive', 'conflict' 또는 '모듈:클래스')
+        self.gpt_routing_policy = os.getenv("GPT_ROUTING_POLICY", "adaptive")
+        self.gpt_hourly_budget = int(os.getenv("GPT_HOURLY_BUDGET", "600"))  # 시간당 GPT로 재분석할 최대 리뷰 수 (0이면 무제한)
+        self.gpt_low_margin_threshold = float(os.getenv("GPT_LOW_MARGIN_THRESHOLD", "0.1"))  # pkl 상위 두 클래스 확률 차이가 이보다 작으면 재분석
+        self.gpt_min_text_length = int(os.getenv("GPT_MIN_TEXT_LENGTH", "10"))  # 확신 부족 재분석 최소 글자 수
+        self.gpt_low_margin_budget_share = float(os.getenv("GPT_LOW_MARGIN_BUDGET_SHARE", "0.5"))  # 확신 부족 리뷰가 쓸 수 있는 예산 비율
+        self.gpt_latency_slo_seconds = float(os.getenv("GPT_LATENCY_SLO_SECONDS", "10"))  # 최근 GPT 호출 p90이 넘으면 pkl만 사용 (0이면 사용 안 함)
+        self.gpt_latency_slo_cooldown_seconds = float(os.getenv("GPT_LATENCY_SLO_COOLDOWN_SECONDS", "60"))
+
+        # 1차 감정 분석 모델 추론 엔진
+        # auto: NumPy 모델(npy 디렉토리 또는 .npz)이 있으면 사용, 없으면 sklearn pkl / numpy: NumPy 모델 우선 / sklearn: pkl만 사용
+        self.sentiment_backend = os.getenv("SENTIMENT_BACKEND", "auto").lower()
+        self.sentiment_pkl_path = os.getenv("SENTIMENT_PKL_PATH", "final_svm_sentiment_model.pkl")
+        self.sentiment_numpy_model_path = os.getenv("SENTIMENT_NUMPY_MODEL_PATH", "final_svm_sentiment_model_npy")  # npy 디렉토리는 mmap으로 워커 간 공유
+        
+        # 큰 배치/백필의 1차 분석을 자식 프로세스들에 나눠 추론 (요청 스레드가 GIL을 오래 잡지 않도록)
+        self.inference_pool_enabled = os.getenv("INFERENCE_POOL_ENABLED", "true").lower() == "true"
+        self.inference_pool_workers = int(os.getenv("INFERENCE_POOL_WORKERS", "0"))  # 0이면 CPU 수, 2 미만이면 사용 안 함
+        self.inference_pool_min_batch = int(os.getenv("INFERENCE_POOL_MIN_BATCH", "512"))  # 이 건수 이상 배치만 풀 사용
+        self.review_backfill_max_reviews = int(os.getenv("REVIEW_BACKFILL_MAX_REVIEWS", "2000"))  # /api/reviews/backfill 한 번에 분석할 최대 리뷰 수
+        self.inference_pool_start_method = os.getenv("INFERENCE_POOL_START_METHOD", "spawn")  # spawn, forkserver, fork
+
+        # pkl 1차 분석 예측 메모 (전처리한 텍스트가 같으면 TF-IDF/SVM 계산 없이 기억해 둔 확률 사용, 모델이 바뀌면 초기화)
+        self.pkl_cache_enabled = os.getenv("PKL_CACHE_ENABLED", "true").lower() == "true"
+        self.pkl_cache_max_entries = int(os.getenv("PKL_CACHE_MAX_ENTRIES", "10000"))
+        self.pkl_cache_max_text_length = int(os.getenv("PKL_CACHE_MAX_TEXT_LENGTH", "300"))  # 이보다 긴 텍스트는 저장 안 함
+        self.pkl_model_reload_check_seconds = float(os.getenv("PKL_MODEL_RELOAD_CHECK_SECONDS", "30"))  # 모델 파일 변경 확인 주기, 0이면 확인 안 함
+
+        # 유사 중복 리뷰 (복사/템플릿 리뷰는 같은 클러스터의 분석 결과 재사용, 같은 내용이 몰리면 리뷰 스팸으로 기록)
+        self.near_duplicate_enabled = os.getenv("NEAR_DUPLICATE_ENABLED", "true").lower() == "true"
+        self.near_duplicate_threshold = float(os.getenv("NEAR_DUPLICATE_THRESHOLD", "0.85"))  # MinHash 추정 Jaccard 유사도 기준
+        self.near_duplicate_max_clusters = int(os.getenv("NEAR_DUPLICATE_MAX_CLUSTERS", "5000"))
+        self.review_spam_burst_window_seconds = float(os.getenv("REVIEW_SPAM_BURST_WINDOW_SECONDS", "600"))
+        self.review_spam_burst_threshold = int(os.getenv("REVIEW_SPAM_BURST_THRESHOLD", "5"))  # 0이면 스팸 몰림 판단 안 함
 
         # Channel Talk 설정
         self.channel_talk_access_key = os.getenv("CHANNEL_TALK_ACCESS_TOKEN")
         self.channel_talk_secret_key = os.getenv("CHANNEL_TALK_SECRET")
         self.channel_talk_group_id = os.getenv("CHANNEL_TALK_GROUP_ID")
+        # 로컬 스탠드인 서버 등으로 채널톡 API 주소를 바꿀 때 사용 (예: http://127.0.0.1:8083)
+        self.channel_talk_api_base_url = os.getenv("CHANNEL_TALK_API_BASE_URL", "https://api.channel.io").rstrip('/')
+        self.messaging_request_timeout = float(os.getenv("MESSAGING_REQUEST_TIMEOUT", "10"))  # 채널톡/카카오톡 전송 타임아웃(초)
+        self.messaging_slow_call_seconds = float(os.getenv("MESSAGING_SLOW_CALL_SECONDS", "5"))  # 회로 차단기 느린 호출 기준
+
+        # 외부 의존성 회로 차단기 (최근 CIRCUIT_BREAKER_WINDOW건 중 실패율/느린 호출 비율이 기준을 넘으면 일정 시간 바로 실패)
+        self.circuit_breaker_enabled = os.getenv("CIRCUIT_BREAKER_ENABLED", "true").lower() == "true"
+        self.circuit_breaker_window = int(os.getenv("CIRCUIT_BREAKER_WINDOW", "20"))
+        self.circuit_breaker_min_calls = int(os.getenv("CIRCUIT_BREAKER_MIN_CALLS", "5"))  # 이 건수가 쌓여야 판단
+        self.circuit_breaker_failure_rate = float(os.getenv("CIRCUIT_BREAKER_FAILURE_RATE", "0.5"))
+        self.circuit_breaker_slow_call_rate = float(os.getenv("CIRCUIT_BREAKER_SLOW_CALL_RATE", "0.8"))
+        self.circuit_breaker_open_seconds = float(os.getenv("CIRCUIT_BREAKER_OPEN_SECONDS", "30"))  # 열린 뒤 시험 호출까지 대기
+        self.circuit_breaker_half_open_calls = int(os.getenv("CIRCUIT_BREAKER_HALF_OPEN_CALLS", "1"))  # 반열림 상태 시험 호출 수
+
+        # 신규 리뷰 처리 순서 (부정 가능성이 높은 리뷰를 먼저 분석/알림, 나머지는 백그라운드 큐)
+        self.review_priority_enabled = os.getenv("REVIEW_PRIORITY_ENABLED", "true").lower() == "true"
+        self.review_priority_threshold = float(os.getenv("REVIEW_PRIORITY_THRESHOLD", "0.4"))  # 1~2점이거나 pkl 부정 확률이 이 이상이면 먼저 처리
+        self.review_background_workers = int(os.getenv("REVIEW_BACKGROUND_WORKERS", "1"))  # 백그라운드 분석 스레드 수
+
+        # 웹훅 수락 제어 (처리 중인 웹훅 수로 포화/저하 모드 판단)
+        self.gunicorn_threads = int(os.getenv("GUNICORN_THREADS", "4"))
+        self.admission_enabled = os.getenv("ADMISSION_ENABLED", "true").lower() == "true"
+        self.admission_max_in_flight = int(os.getenv("ADMISSION_MAX_IN_FLIGHT", "0"))  # 이 이상이면 429 (0이면 GUNICORN_THREADS - 1)
+        self.admission_degrade_in_flight = int(os.getenv("ADMISSION_DEGRADE_IN_FLIGHT", "0"))  # 이 이상이면 저하 모드 (0이면 처리 한도와 같음)
+        self.admission_degrade_after_seconds = float(os.getenv("ADMISSION_DEGRADE_AFTER_SECONDS", "1"))  # 저하 기준 이상이 이만큼 이어지면 저하 모드
+        self.admission_degrade_hold_seconds = float(os.getenv("ADMISSION_DEGRADE_HOLD_SECONDS", "15"))  # 압력이 내려간 뒤 저하 모드 유지 시간
+        self.admission_retry_after_seconds = float(os.getenv("ADMISSION_RETRY_AFTER_SECONDS", "2"))  # 429 응답의 Retry-After
+        self.admission_digest_seconds = float(os.getenv("ADMISSION_DIGEST_SECONDS", "30"))  # 저하 모드 수집 알림을 모아 보내는 간격
 
         
         # 모니터링 설정
@@ -30,6 +109,59 @@ class Settings:
         self.max_reviews_per_check = int(os.getenv("MAX_REVIEWS_PER_CHECK", "50"))
         self.notification_enabled = os.getenv("NOTIFICATION_ENABLED", "false").lower() == "true"
         self.notification_method = os.getenv("NOTIFICATION_METHOD", "both")  # kakao, channel_talk, both
+
+        # 부정 키워드 추적 설정
+        self.keyword_tracker_capacity = int(os.getenv("KEYWORD_TRACKER_CAPACITY", "200"))
+        self.keyword_tracker_bucket_seconds = int(os.getenv("KEYWORD_TRACKER_BUCKET_SECONDS", "3600"))
+        self.keyword_tracker_max_buckets = int(os.getenv("KEYWORD_TRACKER_MAX_BUCKETS", "168"))  # 1시간 x 7일
+
+        # 이미 수집한 리뷰 집합 (보관 기간 = 구간 길이 x 구간 수, 키 수가 넘으면 오래된 구간부터 삭제)
+        self.known_reviews_bucket_seconds = int(os.getenv("KNOWN_REVIEWS_BUCKET_SECONDS", "86400"))
+        self.known_reviews_max_buckets = int(os.getenv("KNOWN_REVIEWS_MAX_BUCKETS", "30"))  # 1일 x 30일
+        self.known_reviews_max_keys = int(os.getenv("KNOWN_REVIEWS_MAX_KEYS", "200000"))
+
+        # 로컬 리뷰 검색 인덱스 설정
+        self.search_index_max_documents = int(os.getenv("SEARCH_INDEX_MAX_DOCUMENTS", "20000"))
+        self.search_index_save_delay_seconds = float(os.getenv("SEARCH_INDEX_SAVE_DELAY_SECONDS", "30"))  # 변경분을 모아 저장, 0이면 바로 저장
+
+        # 웹훅 트레이스 기록 (설정 시 수신한 웹훅 페이로드를 JSONL로 저장, 부하 테스트 재생용)
+        self.webhook_trace_file = os.getenv("WEBHOOK_TRACE_FILE")
+        # eventType이 있는 채널톡 페이로드를 채널톡 핸들러로 처리 (기본은 기존대로 모두 카페24 핸들러, 재생 벤치마크는 켬)
+        self.webhook_channel_talk_dispatch = os.getenv("WEBHOOK_CHANNEL_TALK_DISPATCH", "false").lower() == "true"
+
+        # 웹훅 중복 수신 처리 (타임아웃 재전송 등 같은 이벤트는 처리 없이 바로 응답)
+        self.webhook_idempotency_enabled = os.getenv("WEBHOOK_IDEMPOTENCY_ENABLED", "true").lower() == "true"
+        self.webhook_idempotency_ttl_seconds = float(os.getenv("WEBHOOK_IDEMPOTENCY_TTL_SECONDS", "3600"))  # 이벤트 키 보관 시간
+        self.webhook_idempotency_max_keys = int(os.getenv("WEBHOOK_IDEMPOTENCY_MAX_KEYS", "10000"))  # 넘으면 오래된 키부터 삭제
+
+        # Prometheus 메트릭 (/metrics)
+        self.metrics_enabled = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+
+        # 단계별 소요시간 추적 (/debug/slow)
+        self.timing_store_capacity = int(os.getenv("TIMING_STORE_CAPACITY", "200"))  # 작업 종류별 보관 건수
+        self.timing_debug = os.getenv("TIMING_DEBUG", "false").lower() == "true"  # API 응답에 단계별 시간 포함
+
+        # 로깅 (요청 스레드 밖에서 출력하는 큐 기반 구조화 로그)
+        self.log_level = os.getenv("LOG_LEVEL", "INFO")
+        self.log_format = os.getenv("LOG_FORMAT", "json")  # json (Cloud Logging) 또는 text
+        self.log_queue_size = int(os.getenv("LOG_QUEUE_SIZE", "10000"))  # 가득 차면 새 로그는 버림
+        self.log_sample_every = int(os.getenv("LOG_SAMPLE_EVERY", "100"))  # 대량 로그는 N건 중 1건만 기록
+
+        # 리뷰 감지 지연 추적 (/api/detection-lag)
+        self.detection_lag_window = int(os.getenv("DETECTION_LAG_WINDOW", "1000"))  # 구간별 백분위수 계산 표본 수
+        self.detection_lag_max_reviews = int(os.getenv("DETECTION_LAG_MAX_REVIEWS", "500"))  # 리뷰별 기록 보관 건수
+        
+        # 콜드 스타트 워밍업 (포트를 연 뒤 백그라운드에서 모델/토큰/게시판 목록/리뷰 캐시 준비, /readyz)
+        self.warmup_enabled = os.getenv("WARMUP_ENABLED", "true").lower() == "true"
+        
+        # 웜 스테이트 스냅샷 (게시판 목록, 상품명, 리뷰 캐시, 최근 분석 결과를 주기적으로 저장하고 부팅 시 복원)
+        # 여러 Cloud Run 인스턴스가 공유하려면 WARM_STATE_PATH를 Cloud Storage 볼륨 마운트 경로로 지정
+        self.warm_state_enabled = os.getenv("WARM_STATE_ENABLED", "true").lower() == "true"
+        self.warm_state_path = os.getenv("WARM_STATE_PATH", "warm_state.json")
+        self.warm_state_interval_seconds = float(os.getenv("WARM_STATE_INTERVAL_SECONDS", "60"))  # 변경된 경우에만 저장
+        self.warm_state_max_age_seconds = float(os.getenv("WARM_STATE_MAX_AGE_SECONDS", "86400"))  # 이보다 오래된 스냅샷은 무시
+        self.warm_state_cursor_max_age_seconds = float(os.getenv("WARM_STATE_CURSOR_MAX_AGE_SECONDS", "3600"))  # 리뷰 캐시 복원 한도
+        self.warm_state_recent_reviews = int(os.getenv("WARM_STATE_RECENT_REVIEWS", "200"))  # 저장할 최근 분석 리뷰 수
         
         # 앱 설정
         self.debug = os.getenv("DEBUG", "false").lower() == "true"
@@ -0,0 +1,27 @@
+"""
+Gunicorn 설정 (Dockerfile CMD: gunicorn --config gunicorn.conf.py)
+
+--preload로 마스터에서 앱을 import한 뒤 워커를 포크합니다. 모델/토큰/리뷰 게시판 목록/리뷰 캐시는
+워커가 뜬 직후 post_worker_init 훅에서 백그라운드 워밍업으로 준비하므로, 포트는 앱 import가 끝나는 즉시 열리고
+/readyz는 워밍업이 끝나면 200을 반환합니다.
+"""
+
+import os
+
+wsgi_app = 'wsgi:app'
+bind = f":{os.environ.get('PORT', '8080')}"
+
+# 메모리 최적화: 워커 1개 + 스레드
+workers = int(os.environ.get('GUNICORN_WORKERS', '1'))
+threads = int(os.environ.get('GUNICORN_THREADS', '4'))
+timeout = 0
+max_requests = 1000
+max_requests_jitter = 100
+preload_app = True
+
+
+def post_worker_init(worker):
+    """워커가 요청을 받기 시작할 때 백그라운드 워밍업 시작 (워커마다 한 번)"""
+    start_warmup = worker.wsgi.config.get('start_warmup')
+    if start_warmup:
+        start_warmup()
@@ -0,0 +1,40 @@
+import time
+
+from app.shared.utils.admission import AdmissionController
+
+
+def test_rejects_over_max_in_flight_until_a_request_leaves():
+    controller = AdmissionController(max_in_flight=2, degrade_in_flight=2, degrade_hold_seconds=60)
+    assert controller.try_enter() and controller.try_enter()
+    assert not controller.try_enter()
+    assert controller.rejected == 1
+    assert controller.degraded  # 거절이 있으면 바로 저하 모드
+    controller.leave()
+    assert controller.try_enter()
+    assert controller.in_flight == 2
+
+
+def test_degrades_only_after_sustained_pressure_and_holds():
+    controller = AdmissionController(max_in_flight=10, degrade_in_flight=2, degrade_after_seconds=0.05,
+                                     degrade_hold_seconds=0.1)
+    controller.try_enter()
+    controller.try_enter()
+    assert not controller.degraded  # 짧은 몰림은 저하 모드로 바꾸지 않음
+    time.sleep(0.06)
+    assert controller.degraded
+
+    controller.leave()
+    assert controller.degraded  # 압력이 내려가도 hold 동안 유지
+    time.sleep(0.11)
+    assert not controller.degraded
+
+
+def test_retry_after_is_a_positive_integer():
+    assert AdmissionController(1, 1, retry_after_seconds=0.2).retry_after() == 1
+    assert AdmissionController(1, 1, retry_after_seconds=2.6).retry_after() == 3
+
+
+def test_disabled_controller_admits_everything():
+    controller = AdmissionController(max_in_flight=1, degrade_in_flight=1, enabled=False)
+    assert all(controller.try_enter() for _ in range(5))
+    assert not controller.degraded
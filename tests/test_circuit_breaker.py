@@ -0,0 +1,76 @@
+import time
+
+import pytest
+
+from app.shared.utils.circuit_breaker import CircuitBreaker, CircuitOpenError, CLOSED, HALF_OPEN, OPEN
+
+
+def make_breaker(**kwargs):
+    options = dict(window=4, min_calls=4, failure_rate=0.5, open_seconds=0.05, half_open_calls=1)
+    options.update(kwargs)
+    return CircuitBreaker('test', **options)
+
+
+def trip(breaker):
+    for _ in range(2):
+        breaker.record_success()
+    for _ in range(2):
+        breaker.record_failure()
+
+
+def test_stays_closed_until_min_calls_then_opens_on_failure_rate():
+    breaker = make_breaker()
+    for _ in range(3):
+        breaker.record_failure()
+    assert breaker.state == CLOSED  # min_calls 전에는 판단하지 않음
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert breaker.trips == 1
+
+
+def test_open_rejects_without_calling_until_open_seconds():
+    breaker = make_breaker()
+    trip(breaker)
+    assert not breaker.allow_request()
+    assert breaker.rejected == 1
+    assert 0 < breaker.retry_after() <= 0.05
+    with pytest.raises(CircuitOpenError):
+        with breaker.guard():
+            pytest.fail('열린 회로에서 호출함')
+
+
+def test_half_open_allows_one_probe_and_closes_on_success():
+    breaker = make_breaker()
+    trip(breaker)
+    time.sleep(0.06)
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow_request()
+    assert not breaker.allow_request()  # 시험 호출 자리는 하나
+    breaker.record_success()
+    assert breaker.state == CLOSED
+
+
+def test_half_open_probe_failure_reopens():
+    breaker = make_breaker()
+    trip(breaker)
+    time.sleep(0.06)
+    with pytest.raises(RuntimeError):
+        with breaker.guard():
+            raise RuntimeError('still down')
+    assert breaker.state == OPEN
+    assert breaker.trips == 2
+
+
+def test_slow_successful_calls_trip_the_breaker():
+    breaker = make_breaker(slow_call_seconds=1.0, slow_call_rate=0.75)
+    for _ in range(3):
+        breaker.record_success(seconds=2.0)
+    breaker.record_success(seconds=0.1)
+    assert breaker.state == OPEN
+
+
+def test_disabled_breaker_never_opens():
+    breaker = make_breaker(enabled=False)
+    trip(breaker)
+    assert breaker.allow_request()
+    assert breaker.state == CLOSED
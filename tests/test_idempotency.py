@@ -0,0 +1,58 @@
+import time
+
+from app.shared.utils.idempotency import (
+    IdempotencyStore, webhook_event_key, mark_current_event, hand_off_current_event, clear_current_event
+)
+
+
+def test_claim_rejects_duplicate_until_released():
+    store = IdempotencyStore(ttl_seconds=60)
+    assert store.claim('cafe24:1')
+    assert not store.claim('cafe24:1')  # 처리 중
+    store.release('cafe24:1')
+    assert store.claim('cafe24:1')  # 실패 후 재전송은 다시 처리
+    assert store.duplicates == 1
+
+
+def test_completed_key_stays_duplicate_until_ttl():
+    store = IdempotencyStore(ttl_seconds=0.05)
+    assert store.claim('cafe24:1')
+    store.complete('cafe24:1')
+    assert not store.claim('cafe24:1')
+    assert store.status()['processing'] == 0
+    time.sleep(0.06)
+    assert store.claim('cafe24:1')
+
+
+def test_oldest_key_evicted_over_max_keys():
+    store = IdempotencyStore(ttl_seconds=60, max_keys=2)
+    for key in ('a', 'b', 'c'):
+        assert store.claim(key)
+    assert store.evicted == 1
+    assert store.claim('a')
+    assert not store.claim('c')
+
+
+def test_disabled_store_and_missing_key_always_claim():
+    assert IdempotencyStore(enabled=False).claim('a')
+    store = IdempotencyStore()
+    assert store.claim(None) and store.claim(None)
+    assert store.status()['keys'] == 0
+
+
+def test_event_key_prefers_event_id_then_cafe24_resource():
+    assert webhook_event_key({'data': {'event_id': 'e1'}}, 'channel_talk') == 'channel_talk:id:e1'
+    payload = {'event_no': 90033, 'resource': {'mall_id': 'm', 'board_no': 4, 'article_no': 7}}
+    assert webhook_event_key(payload, 'cafe24') == 'cafe24:90033:m:4:7'
+    assert webhook_event_key({'a': 1}) == webhook_event_key({'a': 1})
+    assert webhook_event_key(['not', 'a', 'dict']) is None
+
+
+def test_hand_off_moves_current_event_key_to_the_taker():
+    mark_current_event('cafe24:1')
+    assert hand_off_current_event() == 'cafe24:1'
+    assert clear_current_event() is None  # 넘겨준 키는 웹훅 처리 함수가 다시 표시하지 않음
+
+    mark_current_event('cafe24:2')
+    assert clear_current_event() == 'cafe24:2'
+    assert hand_off_current_event() is None
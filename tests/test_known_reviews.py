@@ -0,0 +1,72 @@
+import json
+
+import pytest
+
+from app.shared.utils.known_reviews import KnownReviewSet, review_key
+from app.core.services.review_service import ReviewService
+
+DAY = 86400
+
+
+def test_review_key_packs_board_and_article_numbers():
+    assert review_key({'board_no': 4, 'article_no': 7}) == (4 << 32) | 7
+    assert review_key({'article_no': 7}) == 7
+    assert review_key({'board_no': 4}) is None
+    assert review_key({'article_no': 'abc'}) == review_key({'article_no': 'abc'})
+
+
+def test_add_reports_only_new_keys_and_expires_old_buckets():
+    known = KnownReviewSet(bucket_seconds=DAY, max_buckets=2)
+    assert known.add_reviews([{'article_no': 1}, {'article_no': 2}], timestamp=0) == 2
+    assert known.add_reviews([{'article_no': 2}, {'article_no': 3}], timestamp=DAY) == 1
+    assert {'article_no': 1} in known
+
+    known.add_reviews([], timestamp=2 * DAY)  # 0일차 구간이 보관 기간을 벗어남
+    assert {'article_no': 1} not in known
+    assert {'article_no': 2} in known  # 1일차 구간으로 옮겨져 남음
+    assert len(known) == 2
+
+
+def test_max_keys_drops_oldest_bucket():
+    known = KnownReviewSet(bucket_seconds=DAY, max_buckets=30, max_keys=2)
+    known.add_reviews([{'article_no': 1}], timestamp=0)
+    known.add_reviews([{'article_no': 2}, {'article_no': 3}], timestamp=DAY)
+    assert {'article_no': 1} not in known
+    assert len(known) == 2
+
+
+def test_binary_round_trip(tmp_path):
+    known = KnownReviewSet()
+    known.add_reviews({'board_no': 4, 'article_no': n} for n in range(100))
+    path = str(tmp_path / 'known_reviews.bin')
+    known.save(path)
+
+    restored = KnownReviewSet()
+    assert restored.load(path) == 100
+    assert {'board_no': 4, 'article_no': 42} in restored
+    assert not restored.dirty
+
+    with pytest.raises(ValueError):
+        KnownReviewSet().load_bytes(b'JSON' + bytes(12))
+
+
+def test_review_service_migrates_legacy_json_to_binary(tmp_path):
+    service = ReviewService()
+    service.DATA_FILE = str(tmp_path / 'known_reviews.bin')
+    service.LEGACY_DATA_FILE = str(tmp_path / 'known_reviews.json')
+    with open(service.LEGACY_DATA_FILE, 'w', encoding='utf-8') as f:
+        json.dump({'reviews': [{'board_no': 4, 'article_no': 1}, 2, '3']}, f)
+
+    service.load_known_reviews()
+    assert len(service.known_reviews) == 3
+    assert {'board_no': 4, 'article_no': 1} in service.known_reviews
+    assert {'article_no': 2} in service.known_reviews
+    assert (tmp_path / 'known_reviews.bin').exists()
+
+    # 다음 로드부터는 바이너리 파일을 읽음
+    (tmp_path / 'known_reviews.json').unlink()
+    reloaded = ReviewService()
+    reloaded.DATA_FILE = service.DATA_FILE
+    reloaded.LEGACY_DATA_FILE = service.LEGACY_DATA_FILE
+    reloaded.load_known_reviews()
+    assert len(reloaded.known_reviews) == 3
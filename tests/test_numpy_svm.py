@@ -0,0 +1,33 @@
+import os
+
+import numpy as np
+import pytest
+
+from app.infrastructure.ml.inference_pool import predict_probabilities
+from app.infrastructure.ml.numpy_svm import NumpySvmModel, VERIFICATION_TEXTS, export_pipeline
+
+PKL_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'final_svm_sentiment_model.pkl')
+
+joblib = pytest.importorskip('joblib')
+pytest.importorskip('sklearn')
+pytestmark = pytest.mark.skipif(not os.path.exists(PKL_PATH), reason='pkl 모델 파일 없음')
+
+TEXTS = VERIFICATION_TEXTS + ['배송 빨라요', '좋아요 좋아요 좋아요', '품질이 별로고 냄새가 나요', 'HTML <b>태그</b> 포함']
+
+
+@pytest.fixture(scope='module')
+def pipeline():
+    return joblib.load(PKL_PATH)
+
+
+@pytest.mark.parametrize('output_format', ['npy', 'npz'])
+def test_exported_model_matches_pipeline(tmp_path, pipeline, output_format):
+    summary = export_pipeline(PKL_PATH, str(tmp_path / 'model'), output_format)
+    model = NumpySvmModel.load(summary['output'])
+
+    assert summary['max_score_diff'] <= 1e-9
+    assert model.memory_mapped == (output_format == 'npy')
+    np.testing.assert_allclose(model.decision_function(TEXTS),
+                               np.atleast_2d(pipeline.decision_function(TEXTS)), atol=1e-9)
+    assert np.array_equal(model.predict(TEXTS), pipeline.predict(TEXTS))
+    np.testing.assert_allclose(predict_probabilities(model, TEXTS), predict_probabilities(pipeline, TEXTS), atol=1e-9)
@@ -0,0 +1,55 @@
+import numpy as np
+
+from app.infrastructure.ml.prediction_cache import PredictionCache, model_version
+
+
+def probabilities(value):
+    return np.array([[value, 1 - value]])
+
+
+def test_evicts_least_recently_used_entry():
+    cache = PredictionCache(max_entries=2)
+    cache.store(['a'], probabilities(0.1))
+    cache.store(['b'], probabilities(0.2))
+    cache.lookup(['a'])  # a를 최근 사용으로
+    cache.store(['c'], probabilities(0.3))
+
+    found = cache.lookup(['a', 'b', 'c'])
+    assert found[1] is None
+    assert found[0][0] == 0.1 and found[2][0] == 0.3
+    assert cache.evicted == 1
+
+
+def test_stored_rows_are_read_only_and_long_texts_skipped():
+    cache = PredictionCache(max_text_length=3)
+    cache.store(['abc', 'abcd'], np.vstack([probabilities(0.1), probabilities(0.2)]))
+    short, long = cache.lookup(['abc', 'abcd'])
+    assert long is None
+    assert not short.flags.writeable
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_model_version_change_clears_entries():
+    cache = PredictionCache()
+    cache.set_model_version('numpy:1')
+    cache.store(['a'], probabilities(0.1))
+    cache.set_model_version('numpy:1')
+    assert cache.lookup(['a'])[0] is not None
+    cache.set_model_version('numpy:2')
+    assert cache.lookup(['a'])[0] is None
+    assert cache.invalidations == 1
+
+
+def test_model_version_follows_file_size_and_mtime(tmp_path):
+    path = tmp_path / 'model.pkl'
+    path.write_bytes(b'v1')
+    before = model_version('sklearn', str(path))
+    path.write_bytes(b'v2-longer')
+    assert model_version('sklearn', str(path)) != before
+    assert model_version('numpy', str(path)).startswith('numpy:')
+
+
+def test_disabled_cache_never_hits():
+    cache = PredictionCache(enabled=False)
+    cache.store(['a'], probabilities(0.1))
+    assert cache.lookup(['a']) == [None]
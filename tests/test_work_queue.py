@@ -0,0 +1,46 @@
+import threading
+
+from app.shared.utils.work_queue import PriorityWorkQueue
+
+
+def test_runs_lower_priority_first_and_in_submit_order_for_ties():
+    queue = PriorityWorkQueue('test_order', workers=1)
+    started, release = threading.Event(), threading.Event()
+    order = []
+
+    def block():
+        started.set()
+        release.wait(5)
+
+    queue.submit(0, block)
+    assert started.wait(5)
+    for priority, name in ((2, 'low'), (1, 'first'), (0, 'high'), (1, 'second')):
+        queue.submit(priority, order.append, name)
+    release.set()
+
+    assert queue.join(timeout=5)
+    assert order == ['high', 'first', 'second', 'low']
+    assert queue.status()['completed'] == 5
+
+
+def test_failed_job_is_counted_and_does_not_stop_the_worker():
+    queue = PriorityWorkQueue('test_failure', workers=1)
+    done = []
+    queue.submit(0, lambda: 1 / 0)
+    queue.submit(1, done.append, 'after')
+
+    assert queue.join(timeout=5)
+    status = queue.status()
+    assert (status['failed'], status['completed']) == (1, 1)
+    assert done == ['after']
+
+
+def test_join_times_out_while_a_job_is_running():
+    queue = PriorityWorkQueue('test_join', workers=1)
+    release = threading.Event()
+    queue.submit(0, release.wait, 5)
+
+    assert not queue.join(timeout=0.05)
+    release.set()
+    assert queue.join(timeout=5)
+    assert queue.status()['active'] == 0
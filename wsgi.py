@@ -0,0 +1,18 @@
+"""
+WSGI 진입점 (gunicorn wsgi:app)
+
+저장소 루트의 app.py는 app/ 패키지와 이름이 겹쳐 `gunicorn app:app`으로는 패키지가 import되므로,
+app.py를 파일 경로로 직접 로드해 Flask 앱을 노출합니다.
+"""
+
+import importlib.util
+import os
+import sys
+
+_spec = importlib.util.spec_from_file_location(
+    'app_main', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'app.py'))
+app_main = importlib.util.module_from_spec(_spec)
+sys.modules['app_main'] = app_main
+_spec.loader.exec_module(app_main)
+
+app = app_main.app